@@ -0,0 +1,49 @@
+# SPDX-License-Identifier: MIT
+"""순수 Python 핫패스 마이크로벤치마크. 비Windows에서도 tests.uia_sim 대역으로 실행.
+
+    python -m benchmarks                   # 실행 + 기준선 있으면 비교 (저하 시 exit 2)
+    python -m benchmarks --save-baseline   # 현재 결과를 기준선으로 저장
+
+벤치마크 모듈은 import 시 runner.benchmark로 등록됨.
+"""
+
+import sys
+from pathlib import Path
+
+_ROOT = Path(__file__).parent.parent
+for _path in (str(_ROOT / "src"), str(_ROOT)):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+from tests.uia_sim import install_platform_modules  # noqa: E402
+
+install_platform_modules()
+
+from . import bench_detector, bench_pipeline  # noqa: E402,F401
+from .runner import (  # noqa: E402
+    BenchReport,
+    BenchResult,
+    Comparison,
+    benchmark,
+    compare,
+    default_baseline_path,
+    load_baseline,
+    measure,
+    registered,
+    run,
+    save_baseline,
+)
+
+__all__ = [
+    "BenchReport",
+    "BenchResult",
+    "Comparison",
+    "benchmark",
+    "compare",
+    "default_baseline_path",
+    "load_baseline",
+    "measure",
+    "registered",
+    "run",
+    "save_baseline",
+]
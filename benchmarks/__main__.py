@@ -0,0 +1,89 @@
+# SPDX-License-Identifier: MIT
+"""벤치마크 실행 + 기준선 비교.
+
+사용법:
+    uv run python -m benchmarks
+    uv run python -m benchmarks --save-baseline
+    uv run python -m benchmarks --filter coalescer --repeats 15
+    uv run python -m benchmarks --baseline benchmarks/baselines/ci.json --threshold 30
+
+종료 코드: 0 정상, 2 임계값 초과 저하 (analyze_profile compare와 같음)
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+from kakaotalk_a11y_client.config import PERF_COMPARISON_THRESHOLD_PCT
+
+from . import runner
+
+
+def _print_result(result: runner.BenchResult) -> None:
+    spread = result.stdev_ns / result.median_ns * 100 if result.median_ns else 0.0
+    print(f"  {result.name:<40} {runner.format_ns(result.min_ns):>10}/op  "
+          f"(중앙값 {runner.format_ns(result.median_ns)} ±{spread:.1f}%, loops={result.loops:,})")
+
+
+def _print_comparison(comparisons: list[runner.Comparison], threshold: float) -> None:
+    print(f"\n=== 기준선 비교 (임계값 ±{threshold}%) ===\n")
+    for c in comparisons:
+        change = f"{c.change_pct:+.1f}%" if c.change_pct is not None else ""
+        mark = {runner.REGRESSED: "!!", runner.IMPROVED: "++"}.get(c.verdict, "  ")
+        print(f"{mark} {c.name:<40} {runner.format_ns(c.base_ns):>10} → "
+              f"{runner.format_ns(c.current_ns):>10}  {change:>8}  {c.verdict}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="핫패스 마이크로벤치마크")
+    parser.add_argument("--filter", default="", help="이름에 이 문자열이 든 벤치마크만")
+    parser.add_argument("--repeats", type=int, default=runner.DEFAULT_REPEATS, help="반복 횟수")
+    parser.add_argument("--baseline", type=Path, default=None,
+                        help="기준선 JSON (기본: benchmarks/baselines/<os>-<arch>-<python>.json)")
+    parser.add_argument("--save-baseline", action="store_true", help="결과를 기준선으로 저장")
+    parser.add_argument("--threshold", type=float, default=PERF_COMPARISON_THRESHOLD_PCT,
+                        help=f"저하 판정 임계값 %% (기본 {PERF_COMPARISON_THRESHOLD_PCT})")
+    parser.add_argument("--list", action="store_true", help="벤치마크 목록만 출력")
+    args = parser.parse_args(argv)
+
+    benchmarks = runner.registered(args.filter)
+    if args.list:
+        for bench in benchmarks:
+            print(f"  {bench.name:<40} {bench.description}")
+        return 0
+    if not benchmarks:
+        print(f"일치하는 벤치마크 없음: {args.filter!r}")
+        return 1
+
+    # 프로파일러 미설정 시 경고가 lastResort로 stderr에 쏟아짐
+    logging.getLogger("uia_profiler").addHandler(logging.NullHandler())
+
+    print(f"=== 마이크로벤치마크 ({len(benchmarks)}개, repeats={args.repeats}) ===\n")
+    report = runner.run(benchmarks, args.repeats, on_result=_print_result)
+    for name, reason in report.skipped.items():
+        print(f"  {name:<40} 건너뜀: {reason}")
+
+    baseline_path = args.baseline or runner.default_baseline_path()
+    if args.save_baseline:
+        runner.save_baseline(report, baseline_path)
+        print(f"\n기준선 저장: {baseline_path}")
+        return 0
+    if not baseline_path.exists():
+        print(f"\n기준선 없음: {baseline_path} (--save-baseline으로 생성)")
+        return 0
+
+    baseline = runner.load_baseline(baseline_path)
+    if args.filter:
+        baseline = {k: v for k, v in baseline.items() if args.filter in k}
+    comparisons = runner.compare(baseline, report.results, args.threshold)
+    _print_comparison(comparisons, args.threshold)
+    regressed = [c.name for c in comparisons if c.verdict == runner.REGRESSED]
+    if regressed:
+        print(f"\n저하 {len(regressed)}개: {', '.join(regressed)}")
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,370 @@
+# SPDX-License-Identifier: MIT
+"""이모지 템플릿 매칭. 합성 화면 + 합성/실제 템플릿 (고정 시드).
+
+legacy_detect_emojis: 이전 구현 (템플릿별 BGR 전체 매칭 + np.where 전체 순회 + 템플릿별 NMS).
+같은 화면에서 정답 위치 대비 정확도가 같고 지연만 줄었는지 비교용.
+"""
+
+import cv2
+import numpy as np
+
+from kakaotalk_a11y_client.config import CV_NMS_THRESHOLD, CV_TEMPLATE_SCALES, DEFAULT_DPI, MATCH_THRESHOLD
+
+from .runner import benchmark
+
+SCREEN_SIZE = (120, 600)   # (h, w) 채팅 메시지 한 줄 영역
+TEMPLATE_SIZE = 24
+TEMPLATE_COUNT = 6
+PLACED = 4                 # 화면에 붙일 템플릿 수
+SEED = 41
+
+CHAT_SIZE = (1000, 800)    # (h, w) 최대화에 가까운 채팅방 창
+CHAT_ROWS = 12             # 말풍선 줄 수 (줄마다 이모지 0~2개)
+POS_TOLERANCE = 3          # 정답 중심과 허용 오차 (px)
+
+
+def synthetic_scene(
+    size: tuple[int, int] = SCREEN_SIZE,
+    template_count: int = TEMPLATE_COUNT,
+    placed: int = PLACED,
+    seed: int = SEED,
+) -> tuple[np.ndarray, dict]:
+    """(BGR 화면, load_templates() 형식 템플릿) 반환. 앞 placed개 템플릿을 화면에 붙임."""
+    rng = np.random.default_rng(seed)
+    height, width = size
+    image = rng.integers(200, 256, size=(height, width, 3), dtype=np.uint8)  # 밝은 말풍선 배경
+    templates = {}
+    for emoji_id in range(1, template_count + 1):
+        template = rng.integers(0, 256, size=(TEMPLATE_SIZE, TEMPLATE_SIZE, 3), dtype=np.uint8)
+        templates[emoji_id] = (f"emoji{emoji_id}", template)
+    step = width // (placed + 1)
+    top = (height - TEMPLATE_SIZE) // 2
+    for i in range(placed):
+        left = step * (i + 1) - TEMPLATE_SIZE // 2
+        image[top:top + TEMPLATE_SIZE, left:left + TEMPLATE_SIZE] = templates[i + 1][1]
+    return image, templates
+
+
+@benchmark("detector.detect_emojis", group="detector")
+def bench_detect_emojis():
+    """600x120 화면, 템플릿 6개 중 4개 일치."""
+    from kakaotalk_a11y_client.detector import detect_emojis
+
+    image, templates = synthetic_scene()
+    found = detect_emojis(image, templates, MATCH_THRESHOLD)
+    if len(found) != PLACED:
+        raise RuntimeError(f"expected {PLACED} detections, got {len(found)}")
+    return lambda: detect_emojis(image, templates, MATCH_THRESHOLD)
+
+
+def chat_screenshot(
+    size: tuple[int, int] = CHAT_SIZE,
+    rows: int = CHAT_ROWS,
+    seed: int = SEED,
+) -> tuple[np.ndarray, dict, list[tuple[int, tuple[int, int]]]]:
+    """실제 이모지 PNG로 채팅 화면 합성. (BGR 화면, 템플릿, [(id, 정답 중심)]) 반환.
+
+    배경(하늘색) + 말풍선(흰/노랑) + 글자 같은 잡음 + 이모지. 템플릿 없으면 FileNotFoundError.
+    """
+    image, templates, truth, _ = chat_scene(size, rows, seed)
+    return image, templates, truth
+
+
+def chat_scene(
+    size: tuple[int, int] = CHAT_SIZE,
+    rows: int = CHAT_ROWS,
+    seed: int = SEED,
+    scale: float = 1.0,
+) -> tuple[np.ndarray, dict, list[tuple[int, tuple[int, int]]], list[tuple[int, int, int, int]]]:
+    """chat_screenshot + 말풍선 사각형 목록 (left, top, right, bottom, 화면 = 창 좌표).
+
+    scale: 화면 배율. 이모지를 INTER_LINEAR로 키워 붙임 (피라미드와 다른 보간 = 실제 렌더링 차이 흉내).
+    반환 템플릿은 원본 (100%).
+    """
+    from kakaotalk_a11y_client.detector import load_templates
+
+    templates = load_templates()
+    if not templates:
+        raise FileNotFoundError("emoji templates not found")
+    rendered = templates
+    if scale != 1.0:
+        rendered = {
+            emoji_id: (name, cv2.resize(template, None, fx=scale, fy=scale, interpolation=cv2.INTER_LINEAR))
+            for emoji_id, (name, template) in templates.items()
+        }
+    rng = np.random.default_rng(seed)
+    height, width = size
+    image = np.empty((height, width, 3), dtype=np.uint8)
+    image[:] = (224, 206, 186)  # 카카오톡 기본 배경
+    ids = sorted(templates)
+    truth = []
+    bubbles = []
+    row_height = height // rows
+    for row in range(rows):
+        top = row * row_height + 8
+        mine = row % 2 == 1
+        bubble_w = int(rng.integers(240, width // 2))
+        left = width - bubble_w - 20 if mine else 70
+        color = (84, 229, 254) if mine else (255, 255, 255)
+        cv2.rectangle(image, (left, top), (left + bubble_w, top + row_height - 16), color, -1)
+        bubbles.append((left, top, left + bubble_w + 1, top + row_height - 15))
+        # 글자 대신 짧은 획 (잡음 후보)
+        for _ in range(int(rng.integers(10, 30))):
+            x = int(rng.integers(left + 8, left + bubble_w - 8))
+            y = int(rng.integers(top + 8, top + row_height - 24))
+            cv2.line(image, (x, y), (x + int(rng.integers(2, 8)), y + int(rng.integers(0, 8))), (40, 40, 40), 1)
+        cursor = left + 12
+        for _ in range(int(rng.integers(0, 3))):
+            emoji_id = ids[int(rng.integers(len(ids)))]
+            template = rendered[emoji_id][1]
+            th, tw = template.shape[:2]
+            y = top + (row_height - 16 - th) // 2
+            x = cursor + int(rng.integers(0, 40))
+            if x + tw > left + bubble_w - 4:
+                break
+            image[y:y + th, x:x + tw] = template
+            truth.append((emoji_id, (x + tw // 2, y + th // 2)))
+            cursor = x + tw + 8
+    return image, templates, truth, bubbles
+
+
+def score_detections(found: list[dict], truth: list[tuple[int, tuple[int, int]]],
+                     tolerance: int = POS_TOLERANCE) -> tuple[float, float]:
+    """정답 대비 (precision, recall). id 같고 중심이 tolerance 이내면 일치."""
+    remaining = list(truth)
+    hits = 0
+    for d in found:
+        for i, (emoji_id, (tx, ty)) in enumerate(remaining):
+            if d["id"] == emoji_id and abs(d["pos"][0] - tx) <= tolerance and abs(d["pos"][1] - ty) <= tolerance:
+                hits += 1
+                del remaining[i]
+                break
+    precision = hits / len(found) if found else 1.0
+    recall = hits / len(truth) if truth else 1.0
+    return precision, recall
+
+
+def legacy_detect_emojis(image: np.ndarray, templates: dict, threshold: float = MATCH_THRESHOLD) -> list[dict]:
+    """이전 detect_emojis (비교 기준)."""
+    results = []
+    for emoji_id, (name, template) in templates.items():
+        h, w = template.shape[:2]
+        result = cv2.matchTemplate(image, template, cv2.TM_CCOEFF_NORMED)
+        locations = np.where(result >= threshold)
+        boxes, confidences = [], []
+        for pt in zip(*locations[::-1]):
+            boxes.append([int(pt[0]), int(pt[1]), w, h])
+            confidences.append(float(result[pt[1], pt[0]]))
+        if not boxes:
+            continue
+        indices = cv2.dnn.NMSBoxes(boxes, confidences, threshold, CV_NMS_THRESHOLD)
+        for i in np.array(indices).flatten():
+            x, y, w, h = boxes[i]
+            results.append({"id": emoji_id, "name": name, "pos": (x + w // 2, y + h // 2),
+                            "confidence": confidences[i]})
+    results.sort(key=lambda x: x["pos"][0])
+    return results
+
+
+def _checked_chat_screenshot(detect) -> tuple[np.ndarray, object]:
+    image, templates, truth = chat_screenshot()
+    precision, recall = score_detections(detect(image, templates), truth)
+    if (precision, recall) != (1.0, 1.0):
+        raise RuntimeError(f"accuracy dropped: precision={precision:.2f} recall={recall:.2f}")
+    return image, templates
+
+
+@benchmark("detector.chat_screenshot_legacy", group="detector")
+def bench_chat_screenshot_legacy():
+    """800x1000 채팅 화면, 실제 템플릿 4개. 이전 구현."""
+    image, templates = _checked_chat_screenshot(legacy_detect_emojis)
+    return lambda: legacy_detect_emojis(image, templates)
+
+
+@benchmark("detector.chat_screenshot", group="detector")
+def bench_chat_screenshot():
+    """같은 화면, 전처리 템플릿 (TemplateSet 재사용)."""
+    from kakaotalk_a11y_client.detector import detect_emojis, prepare_templates
+
+    image, templates = _checked_chat_screenshot(detect_emojis)
+    prepared = prepare_templates(templates)
+    return lambda: detect_emojis(image, prepared)
+
+
+def _bubble_crops(image: np.ndarray, bubbles: list, truth: list) -> tuple[list, list]:
+    """이모지 있는 말풍선 중 가운데 것을 포커스로 보고 bubble_regions ROI 잘라냄. (crops, ROI 안 정답)"""
+    from types import SimpleNamespace
+
+    from kakaotalk_a11y_client.scan_regions import bubble_regions
+
+    def contains(rect, pos):
+        return rect[0] <= pos[0] < rect[2] and rect[1] <= pos[1] < rect[3]
+
+    with_emoji = [b for b in bubbles if any(contains(b, pos) for _, pos in truth)]
+    left, top, right, bottom = with_emoji[len(with_emoji) // 2]
+    focused = SimpleNamespace(BoundingRectangle=SimpleNamespace(left=left, top=top, right=right, bottom=bottom))
+    height, width = image.shape[:2]
+    regions = bubble_regions((0, 0, width, height), focused)
+    crops = [((x1, y1), image[y1:y2, x1:x2]) for x1, y1, x2, y2 in regions]
+    expected = [t for t in truth if any(contains(r, t[1]) for r in regions)]
+    return crops, expected
+
+
+@benchmark("detector.chat_screenshot_roi", group="detector")
+def bench_chat_screenshot_roi():
+    """같은 화면, 포커스 말풍선 주변 ROI만 (SCAN_MODE=focused)."""
+    from kakaotalk_a11y_client.detector import detect_emojis_in_regions, prepare_templates
+
+    image, templates, truth, bubbles = chat_scene()
+    prepared = prepare_templates(templates)
+    crops, expected = _bubble_crops(image, bubbles, truth)
+    precision, recall = score_detections(detect_emojis_in_regions(crops, prepared), expected)
+    if not expected or (precision, recall) != (1.0, 1.0):
+        raise RuntimeError(f"ROI accuracy dropped: precision={precision:.2f} recall={recall:.2f}")
+    return lambda: detect_emojis_in_regions(crops, prepared)
+
+
+def _register_scale_benchmarks():
+    """배율별 스캔 지연. warm = 창별 기억 배율 1개만, cold = DPI 96 추정에서 출발."""
+    from kakaotalk_a11y_client.detector import detect_emojis_multiscale, prepare_pyramid
+
+    def scene(scale: float):
+        image, templates, truth, _ = chat_scene(scale=scale)
+        pyramid = prepare_pyramid(templates)
+        crops = [((0, 0), image)]
+        precision, recall = score_detections(detect_emojis_multiscale(crops, pyramid, 1), truth)
+        if (precision, recall) != (1.0, 1.0):
+            raise RuntimeError(f"x{scale:g} accuracy: precision={precision:.2f} recall={recall:.2f}")
+        if pyramid.last_scale(1) != scale:
+            raise RuntimeError(f"x{scale:g} matched at x{pyramid.last_scale(1)}")
+        return crops, pyramid
+
+    for scale in CV_TEMPLATE_SCALES:
+        @benchmark(f"detector.scale_x{scale:g}", group="detector")
+        def bench_warm(scale=scale):
+            crops, pyramid = scene(scale)
+            return lambda: detect_emojis_multiscale(crops, pyramid, 1, DEFAULT_DPI)
+        bench_warm.__doc__ = f"800x1000, {scale:g}배 화면. 기억된 배율 1개만 매칭."
+
+    cold_scale = CV_TEMPLATE_SCALES[len(CV_TEMPLATE_SCALES) // 2]
+
+    @benchmark(f"detector.scale_x{cold_scale:g}_cold", group="detector")
+    def bench_cold():
+        """기억 없음 + DPI 96 추정: 1배부터 가까운 배율순으로 시도."""
+        crops, pyramid = scene(cold_scale)
+
+        def run():
+            pyramid.forget(1)
+            return detect_emojis_multiscale(crops, pyramid, 1, DEFAULT_DPI)
+        return run
+
+
+_register_scale_benchmarks()
+
+
+def _tile_scene():
+    from kakaotalk_a11y_client.detector import prepare_templates
+    from kakaotalk_a11y_client.tile_cache import TileCache
+
+    image, templates, truth, _ = chat_scene()
+    prepared = prepare_templates(templates)
+    return image, prepared, truth, TileCache()
+
+
+def _checked_tiles(image, prepared, truth, cache):
+    from kakaotalk_a11y_client.detector import detect_emojis_in_regions
+
+    precision, recall = score_detections(detect_emojis_in_regions([((0, 0), image)], prepared, tile_cache=cache), truth)
+    if (precision, recall) != (1.0, 1.0):
+        raise RuntimeError(f"tile accuracy: precision={precision:.2f} recall={recall:.2f}")
+
+
+@benchmark("detector.tile_cache_cold", group="detector")
+def bench_tile_cache_cold():
+    """800x1000 화면, 타일 캐시 비움 (첫 스캔: 타일 겹침만큼 비쌈)."""
+    from kakaotalk_a11y_client.detector import detect_emojis_in_regions
+
+    image, prepared, truth, cache = _tile_scene()
+    _checked_tiles(image, prepared, truth, cache)
+
+    def run():
+        cache.clear()
+        return detect_emojis_in_regions([((0, 0), image)], prepared, tile_cache=cache)
+    return run
+
+
+@benchmark("detector.tile_cache_rescan", group="detector")
+def bench_tile_cache_rescan():
+    """같은 화면 재스캔 (모든 타일 적중, 해시 + NMS만)."""
+    from kakaotalk_a11y_client.detector import detect_emojis_in_regions
+
+    image, prepared, truth, cache = _tile_scene()
+    _checked_tiles(image, prepared, truth, cache)
+    return lambda: detect_emojis_in_regions([((0, 0), image)], prepared, tile_cache=cache)
+
+
+@benchmark("detector.tile_cache_partial", group="detector")
+def bench_tile_cache_partial():
+    """재스캔마다 작은 영역(새 메시지 흉내) 하나가 바뀜 → 그 주변 타일만 다시 매칭."""
+    from kakaotalk_a11y_client.detector import detect_emojis_in_regions
+
+    image, prepared, truth, cache = _tile_scene()
+    _checked_tiles(image, prepared, truth, cache)
+    image = image.copy()
+    counter = iter(range(1, 1 << 62))
+
+    def run():
+        image[900:910, 100:140] = next(counter) % 251
+        return detect_emojis_in_regions([((0, 0), image)], prepared, tile_cache=cache)
+    return run
+
+
+PARALLEL_SIZE = (2160, 1600)   # (h, w) 4K 세로 모니터에 최대화한 창
+PARALLEL_ROWS = 26
+PARALLEL_WORKERS = (1, 2, 4, 8)
+
+
+def _register_parallel_benchmarks():
+    """워커 수별 병렬 매칭 지연 (1 = 직렬). 템플릿 단위(창 전체) / 타일 단위(타일 캐시 cold)."""
+    from kakaotalk_a11y_client.detect_engine import DetectionEngine
+    from kakaotalk_a11y_client.detector import detect_emojis, detect_emojis_in_regions, prepare_templates
+    from kakaotalk_a11y_client.tile_cache import TileCache
+
+    def scene(engine: DetectionEngine):
+        image, templates, truth, _ = chat_scene(PARALLEL_SIZE, PARALLEL_ROWS)
+        prepared = prepare_templates(templates)
+        crops = [((0, 0), image)]
+        serial = detect_emojis(image, prepared)
+        found = detect_emojis_in_regions(crops, prepared, job=engine.start_job())
+        if found != serial or score_detections(found, truth) != (1.0, 1.0):
+            raise RuntimeError(f"{engine.workers} workers: result differs from serial")
+        return crops, prepared
+
+    for workers in PARALLEL_WORKERS:
+        @benchmark(f"detector.parallel_w{workers}", group="detector")
+        def bench_templates(workers=workers):
+            engine = DetectionEngine(workers)
+            try:
+                crops, prepared = scene(engine)
+                yield lambda: detect_emojis_in_regions(crops, prepared, job=engine.start_job())
+            finally:
+                engine.shutdown()
+        bench_templates.__doc__ = f"1600x2160 창 전체, 템플릿 단위 {workers}워커."
+
+        @benchmark(f"detector.parallel_tiles_w{workers}", group="detector")
+        def bench_tiles(workers=workers):
+            engine = DetectionEngine(workers)
+            try:
+                crops, prepared = scene(engine)
+                cache = TileCache()
+
+                def run():
+                    cache.clear()
+                    return detect_emojis_in_regions(crops, prepared, tile_cache=cache, job=engine.start_job())
+                yield run
+            finally:
+                engine.shutdown()
+        bench_tiles.__doc__ = f"1600x2160 창 전체, 타일 캐시 cold, 타일 단위 {workers}워커."
+
+
+_register_parallel_benchmarks()
@@ -0,0 +1,210 @@
+# SPDX-License-Identifier: MIT
+"""이벤트 파이프라인 순수 Python 핫패스. tests.uia_sim 대역 위에서 측정."""
+
+import itertools
+import time
+from types import SimpleNamespace
+
+from tests.uia_sim import SimElement, SimKakaoTalk
+
+from kakaotalk_a11y_client import window_finder
+from kakaotalk_a11y_client.utils.event_coalescer import EventCoalescer
+from kakaotalk_a11y_client.utils.uia_cache import UIACache
+from kakaotalk_a11y_client.utils.uia_events import FocusEvent
+from kakaotalk_a11y_client.utils.uia_utils import SmartListFilter
+
+from .runner import benchmark
+
+COALESCER_KEYS = 32      # 빠른 포커스 이동 중 서로 다른 요소 수
+COALESCER_BATCH = 64     # flush 1회 이벤트 수
+LIST_SIZE = 1000         # 긴 채팅방 메시지 목록
+SPARSE_LIST_SIZE = 5000  # 가상화로 대부분 비어 있는 목록
+HWND_COUNT = 300         # CACHE_HWND_CLASS_MAX_SIZE(200) 초과 → 축출 발생
+
+
+def _stopped_coalescer() -> EventCoalescer:
+    """flush 스레드 없이 add/_flush만 재는 coalescer. 스레드 스케줄링 잡음 제거."""
+    coalescer = EventCoalescer(lambda event: None, flush_interval=60.0)
+    coalescer._running = False
+    with coalescer._condition:
+        coalescer._condition.notify()
+    coalescer._thread.join(timeout=1.0)
+    return coalescer
+
+
+@benchmark("coalescer.add", group="pipeline")
+def bench_coalescer_add():
+    """같은 키 덮어쓰기 포함 배치 경로 add()."""
+    coalescer = _stopped_coalescer()
+    keys = itertools.cycle([(i, "focus") for i in range(COALESCER_KEYS)])
+    return lambda: coalescer.add(next(keys), None)
+
+
+@benchmark("coalescer.add_flush_64", group="pipeline")
+def bench_coalescer_flush():
+    """서로 다른 키 64개 add 후 flush 1회."""
+    coalescer = _stopped_coalescer()
+    keys = [(i, "focus") for i in range(COALESCER_BATCH)]
+
+    def run():
+        for key in keys:
+            coalescer.add(key, key)
+        coalescer._flush()
+    return run
+
+
+def _full_cache() -> UIACache:
+    cache = UIACache(default_ttl=60.0)
+    for i in range(UIACache.MAX_SIZE):
+        cache.set(f"key{i}", i)
+    return cache
+
+
+@benchmark("uia_cache.get_hit", group="pipeline")
+def bench_cache_get():
+    """가득 찬 캐시 적중."""
+    cache = _full_cache()
+    keys = itertools.cycle([f"key{i}" for i in range(UIACache.MAX_SIZE)])
+    return lambda: cache.get(next(keys))
+
+
+@benchmark("uia_cache.set_evict", group="pipeline")
+def bench_cache_set():
+    """가득 찬 캐시에 새 키 → LRU 축출."""
+    cache = _full_cache()
+    serial = itertools.count(UIACache.MAX_SIZE)
+    return lambda: cache.set(f"key{next(serial)}", 0)
+
+
+def _message_list(size: int, valid_every: int = 1) -> SimElement:
+    parent = SimElement("메시지", "ListControl")
+    for i in range(size):
+        name = f"홍길동, 메시지 {i}, 오후 3:{i % 60:02d}" if i % valid_every == 0 else ""
+        parent.append(name, "ListItemControl")
+    return parent
+
+
+@benchmark("list_filter.1000", group="pipeline")
+def bench_filter_dense():
+    """메시지 1000개 목록, 기본 max_items=100."""
+    parent = _message_list(LIST_SIZE)
+    list_filter = SmartListFilter()
+    return lambda: list_filter.filter_list_items(parent)
+
+
+@benchmark("list_filter.sparse_5000", group="pipeline")
+def bench_filter_sparse():
+    """5000개 중 10개마다 하나만 이름 있음, 전부 훑음."""
+    parent = _message_list(SPARSE_LIST_SIZE, valid_every=10)
+    list_filter = SmartListFilter()
+    return lambda: list_filter.filter_list_items(parent, max_items=SPARSE_LIST_SIZE)
+
+
+def _focus_service(sim: SimKakaoTalk):
+    from kakaotalk_a11y_client.focus_monitor import FocusMonitorService
+
+    nothing = SimpleNamespace()
+    service = FocusMonitorService(
+        mode_manager=SimpleNamespace(in_navigation_mode=True),
+        message_monitor=nothing,
+        chat_navigator=SimpleNamespace(current_focused_item=None),
+        hotkey_manager=nothing,
+        uia_adapter=sim.adapter,
+        speak_callback=lambda text: None,
+    )
+    service._running = True
+    return service
+
+
+@benchmark("focus_service.on_focus_event", group="pipeline")
+def bench_on_focus_event():
+    """ListItem 포커스 → 디스패치 → 중복 체크 → 정규화 → 발화 콜백."""
+    sim = SimKakaoTalk(friends=5, chats=5)
+    room = sim.open_chat_room("홍길동", messages=20)
+    with sim.installed():
+        service = _focus_service(sim)
+        events = itertools.cycle([FocusEvent(item, time.time(), "event")
+                                  for item in room.messages[-2:]])
+        yield lambda: service._on_focus_event(next(events))
+
+
+@benchmark("focus_service.is_duplicate.runtime_id", group="pipeline")
+def bench_duplicate_runtime_id():
+    """RuntimeId 있는 요소 번갈아 (매번 새 포커스)."""
+    sim = SimKakaoTalk(friends=5, chats=5)
+    service = _focus_service(sim)
+    controls = itertools.cycle([SimpleNamespace(RuntimeId=(7, 1, i)) for i in range(2)])
+    return lambda: service._is_duplicate_focus(next(controls), "메시지")
+
+
+@benchmark("focus_service.is_duplicate.name", group="pipeline")
+def bench_duplicate_name():
+    """RuntimeId 없음 → Name+시간 폴백."""
+    sim = SimKakaoTalk(friends=5, chats=5)
+    service = _focus_service(sim)
+    pairs = itertools.cycle([(SimpleNamespace(), f"메시지 {i}") for i in range(2)])
+
+    def run():
+        control, name = next(pairs)
+        return service._is_duplicate_focus(control, name)
+    return run
+
+
+def _hwnd_windows(sim: SimKakaoTalk) -> list[int]:
+    # 카카오톡/외부 앱 창 반반
+    return [sim.windows.create_window("EVA_ChildWindow" if i % 2 else "Chrome_WidgetWin_1").hwnd
+            for i in range(HWND_COUNT)]
+
+
+@benchmark("hwnd_cached.hit", group="pipeline")
+def bench_hwnd_hit():
+    """캐시에 있는 hwnd만."""
+    sim = SimKakaoTalk(friends=5, chats=5)
+    hwnds = _hwnd_windows(sim)[:100]
+    with sim.installed():
+        for hwnd in hwnds:
+            window_finder.is_kakaotalk_hwnd_cached(hwnd)
+        cycle = itertools.cycle(hwnds)
+        yield lambda: window_finder.is_kakaotalk_hwnd_cached(next(cycle))
+
+
+@benchmark("hwnd_cached.churn", group="pipeline")
+def bench_hwnd_churn():
+    """캐시 한도보다 많은 hwnd 순환 → 미스 + GetClassName + 축출 섞임."""
+    sim = SimKakaoTalk(friends=5, chats=5)
+    hwnds = _hwnd_windows(sim)
+    with sim.installed():
+        cycle = itertools.cycle(hwnds)
+        yield lambda: window_finder.is_kakaotalk_hwnd_cached(next(cycle))
+
+
+def _traced_event(sample_every: int):
+    """begin → 단계 4개 mark → finish. 포커스 이벤트 1건의 추적 비용."""
+    from kakaotalk_a11y_client.utils.latency_tracer import STAGES, LatencyTracer
+
+    tracer = LatencyTracer(sample_every=sample_every)
+
+    def run():
+        tracer.begin()
+        for stage in STAGES:
+            tracer.mark(stage)
+        tracer.finish()
+    return run
+
+
+@benchmark("latency_tracer.event_off", group="pipeline")
+def bench_tracer_off():
+    """샘플링 끔 (sample_every=0)."""
+    return _traced_event(0)
+
+
+@benchmark("latency_tracer.event_sampled_64", group="pipeline")
+def bench_tracer_sampled():
+    """기본 샘플링 (64번째마다)."""
+    return _traced_event(64)
+
+
+@benchmark("latency_tracer.event_every", group="pipeline")
+def bench_tracer_every():
+    """모든 이벤트 추적 (sample_every=1)."""
+    return _traced_event(1)
@@ -0,0 +1,235 @@
+# SPDX-License-Identifier: MIT
+"""벤치마크 등록/측정/기준선 비교.
+
+    @benchmark("coalescer.add", group="pipeline")
+    def bench_add():
+        coalescer = EventCoalescer(...)      # 준비 (측정 안 함)
+        return lambda: coalescer.add(...)    # 측정 대상 1회 동작
+
+정리가 필요하면 pytest fixture처럼 yield로 넘기면 측정 후 나머지를 실행.
+
+측정: timeit autorange처럼 1회 반복이 MIN_REPEAT_SECS 이상 되도록 loops를 정하고
+repeats번 반복해서 ns/op 기록. 비교는 최솟값 기준 (timeit 관례, 다른 프로세스/스케줄링
+잡음은 느려지는 쪽으로만 섞임). PERF_COMPARISON_THRESHOLD_PCT 이상 느려지면 regressed.
+"""
+
+import gc
+import inspect
+import json
+import platform
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Optional
+
+from kakaotalk_a11y_client.config import PERF_COMPARISON_THRESHOLD_PCT
+
+BASELINE_DIR = Path(__file__).parent / "baselines"
+
+DEFAULT_REPEATS = 7
+MIN_REPEAT_SECS = 0.1      # 반복 1회 최소 시간 (타이머 해상도 대비)
+MAX_LOOPS = 1_000_000
+
+IMPROVED = "improved"
+REGRESSED = "regressed"
+UNCHANGED = "unchanged"
+NEW = "new"
+REMOVED = "removed"
+
+
+@dataclass
+class Benchmark:
+    name: str
+    setup: Callable[[], object]  # 측정 대상 함수 반환 (또는 yield)
+    group: str = ""
+    description: str = ""
+
+
+@dataclass
+class BenchResult:
+    name: str
+    median_ns: float
+    min_ns: float
+    max_ns: float
+    stdev_ns: float
+    loops: int
+    repeats: int
+
+    @classmethod
+    def from_samples(cls, name: str, samples_ns: list[float], loops: int) -> "BenchResult":
+        return cls(
+            name=name,
+            median_ns=statistics.median(samples_ns),
+            min_ns=min(samples_ns),
+            max_ns=max(samples_ns),
+            stdev_ns=statistics.stdev(samples_ns) if len(samples_ns) > 1 else 0.0,
+            loops=loops,
+            repeats=len(samples_ns),
+        )
+
+
+@dataclass
+class Comparison:
+    name: str
+    base_ns: Optional[float]
+    current_ns: Optional[float]
+    change_pct: Optional[float]
+    verdict: str
+
+
+@dataclass
+class BenchReport:
+    results: dict[str, BenchResult] = field(default_factory=dict)
+    skipped: dict[str, str] = field(default_factory=dict)  # 이름 → 사유
+
+
+_registry: dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, group: str = "", description: str = ""):
+    """벤치마크 등록 데코레이터. 함수는 준비 후 측정할 callable을 반환."""
+    def decorator(setup: Callable[[], object]):
+        if name in _registry:
+            raise ValueError(f"duplicate benchmark: {name}")
+        _registry[name] = Benchmark(name, setup, group, description or (setup.__doc__ or "").strip())
+        return setup
+    return decorator
+
+
+def registered(pattern: str = "") -> list[Benchmark]:
+    """이름에 pattern이 들어간 벤치마크 (등록 순서)."""
+    return [b for b in _registry.values() if pattern in b.name]
+
+
+def _calibrate(func: Callable[[], object]) -> int:
+    loops = 1
+    while loops < MAX_LOOPS:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        if time.perf_counter() - start >= MIN_REPEAT_SECS:
+            break
+        loops *= 2
+    return min(loops, MAX_LOOPS)
+
+
+def measure(name: str, func: Callable[[], object], repeats: int = DEFAULT_REPEATS,
+            loops: Optional[int] = None) -> BenchResult:
+    """func 호출당 ns. GC는 측정 중 끔 (timeit과 같음)."""
+    loops = loops or _calibrate(func)
+    samples = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeats):
+            start = time.perf_counter_ns()
+            for _ in range(loops):
+                func()
+            samples.append((time.perf_counter_ns() - start) / loops)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return BenchResult.from_samples(name, samples, loops)
+
+
+def run(benchmarks: list[Benchmark], repeats: int = DEFAULT_REPEATS,
+        on_result: Optional[Callable[[BenchResult], None]] = None) -> BenchReport:
+    """등록 벤치마크 실행. 준비 단계 예외는 skipped로 기록하고 계속."""
+    report = BenchReport()
+    for bench in benchmarks:
+        teardown = None
+        try:
+            func = bench.setup()
+            if inspect.isgenerator(func):
+                teardown, func = func, next(func)
+        except Exception as e:
+            report.skipped[bench.name] = f"{type(e).__name__}: {e}"
+            continue
+        try:
+            result = measure(bench.name, func, repeats)
+        finally:
+            if teardown is not None:
+                teardown.close()
+        report.results[bench.name] = result
+        if on_result:
+            on_result(result)
+    return report
+
+
+# === 기준선 ===
+
+def environment() -> dict:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def default_baseline_path() -> Path:
+    """기계/인터프리터별 기준선 파일. 다른 환경 숫자와 섞이지 않게."""
+    system = platform.system().lower() or "unknown"
+    python = f"py{sys.version_info.major}{sys.version_info.minor}"
+    return BASELINE_DIR / f"{system}-{platform.machine().lower()}-{python}.json"
+
+
+def save_baseline(report: BenchReport, path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "environment": environment(),
+        "results": {name: asdict(result) for name, result in report.results.items()},
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    return path
+
+
+def load_baseline(path: Path) -> dict[str, BenchResult]:
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return {name: BenchResult(**fields) for name, fields in data.get("results", {}).items()}
+
+
+def compare(
+    baseline: dict[str, BenchResult],
+    current: dict[str, BenchResult],
+    threshold_percent: float = PERF_COMPARISON_THRESHOLD_PCT,
+) -> list[Comparison]:
+    """최솟값 변화율로 분류. threshold_percent 이상 느려지면 regressed."""
+    comparisons = []
+    for name in list(baseline) + [n for n in current if n not in baseline]:
+        base = baseline.get(name)
+        curr = current.get(name)
+        if base is None:
+            comparisons.append(Comparison(name, None, curr.min_ns, None, NEW))
+            continue
+        if curr is None:
+            comparisons.append(Comparison(name, base.min_ns, None, None, REMOVED))
+            continue
+        if base.min_ns <= 0:
+            change = 0.0 if curr.min_ns <= 0 else float("inf")
+        else:
+            change = (curr.min_ns - base.min_ns) / base.min_ns * 100
+        if change >= threshold_percent:
+            verdict = REGRESSED
+        elif change <= -threshold_percent:
+            verdict = IMPROVED
+        else:
+            verdict = UNCHANGED
+        comparisons.append(Comparison(name, base.min_ns, curr.min_ns, change, verdict))
+    return comparisons
+
+
+def format_ns(ns: Optional[float]) -> str:
+    if ns is None:
+        return "-"
+    if ns >= 1e6:
+        return f"{ns / 1e6:.2f}ms"
+    if ns >= 1e3:
+        return f"{ns / 1e3:.2f}us"
+    return f"{ns:.0f}ns"
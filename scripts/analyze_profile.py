@@ -1,64 +1,171 @@
 #!/usr/bin/env python3
 """프로파일러 로그 분석 스크립트
 
-logs/*.log 파일들을 분석하여 성능 통계를 추출한다.
+logs/profile_*.log 파일(또는 UIAProfiler.save_report JSON)을 분석하여 성능 통계를 추출한다.
+
+- 스트리밍 파싱: 작업별 온라인 평균/분산 + 로그 버킷 히스토그램 (메모리 일정)
+- 파일 여러 개는 프로세스 풀로 병렬 파싱 후 병합
+- compare: 두 세션의 작업별 분포를 Mann-Whitney U로 비교해 유의한 성능 저하 표시
 
 사용법:
     python scripts/analyze_profile.py
     python scripts/analyze_profile.py --filter context_menu
     python scripts/analyze_profile.py --time 10:00-10:30
     python scripts/analyze_profile.py --filter context_menu --time 10:00-10:30
+    python scripts/analyze_profile.py --input logs/report_20260301_101500.json
+    python scripts/analyze_profile.py compare logs/profile_A.log logs/profile_B.log
 """
 
 import argparse
+import json
+import math
+import os
 import re
 import sys
-from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime, time as dt_time
+from datetime import datetime, time as dt_time, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-import json
+from typing import Dict, Iterable, List, Optional, Tuple
+
+_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(_ROOT / "src"))
+sys.path.insert(0, str(_ROOT))
+
+from tests.uia_sim import install_platform_modules  # noqa: E402
+
+install_platform_modules()
+
+# UIAProfiler와 같은 버킷 (리포트 JSON 히스토그램을 그대로 병합)
+from kakaotalk_a11y_client.utils.profiler import LogHistogram  # noqa: E402
+
+SLOW_MS = 100.0
+
+# 시간 측정 패턴: "2025-12-30 21:08:58,194 | SLOW: operation took 123.4ms"
+# 또는 "2025-12-30 21:08:58,194 | operation: 123.4ms"
+_SLOW_PATTERN = re.compile(r"\| SLOW: (.+?) took (\d+\.?\d*)ms")
+_NORMAL_PATTERN = re.compile(r"\| ([^|]+?): (\d+\.?\d*)ms$")
+_TS_PATTERN = re.compile(r"(\d{4}-\d{2}-\d{2}) (\d{2}):(\d{2}):(\d{2}),\d+")
+# ListItems: total=11, empty=0 (0%), valid=11, took 3.4ms
+_LIST_PATTERN = re.compile(r"ListItems: total=(\d+), empty=(\d+) \((\d+)%\)")
+# 메뉴 찾기 성공: attempt=1
+_RETRY_PATTERN = re.compile(r"메뉴 찾기 성공: attempt=(\d+)")
+
+
+# =============================================================================
+# 스트리밍 통계
+# =============================================================================
 
 
 @dataclass
 class OperationStats:
-    """작업별 통계"""
+    """작업별 통계. 측정값 목록 없이 온라인 평균/분산(Welford) + 히스토그램."""
     name: str
-    times: List[float] = field(default_factory=list)
-    timestamps: List[datetime] = field(default_factory=list)
-
-    @property
-    def count(self) -> int:
-        return len(self.times)
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0                 # 편차 제곱합. 리포트 JSON 입력이면 NaN (분산 모름)
+    min_time: float = math.inf
+    max_time: float = 0.0
+    slow_count: int = 0
+    slow_total: float = 0.0
+    slow_max: float = 0.0
+    hist: LogHistogram = field(default_factory=LogHistogram)
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if value < self.min_time:
+            self.min_time = value
+        if value > self.max_time:
+            self.max_time = value
+        if value > SLOW_MS:
+            self.slow_count += 1
+            self.slow_total += value
+            if value > self.slow_max:
+                self.slow_max = value
+        self.hist.record(value)
+
+    def merge(self, other: "OperationStats") -> None:
+        """병렬 파싱 결과 병합 (Chan et al. 분산 합산)."""
+        if not other.count:
+            return
+        if not self.count:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+        else:
+            total = self.count + other.count
+            delta = other.mean - self.mean
+            self.m2 += other.m2 + delta * delta * self.count * other.count / total
+            self.mean += delta * other.count / total
+            self.count = total
+        self.min_time = min(self.min_time, other.min_time)
+        self.max_time = max(self.max_time, other.max_time)
+        self.slow_count += other.slow_count
+        self.slow_total += other.slow_total
+        self.slow_max = max(self.slow_max, other.slow_max)
+        self.hist.merge(other.hist)
 
     @property
     def avg(self) -> float:
-        return sum(self.times) / len(self.times) if self.times else 0
+        return self.mean
 
     @property
-    def min_time(self) -> float:
-        return min(self.times) if self.times else 0
+    def total(self) -> float:
+        return self.mean * self.count
 
     @property
-    def max_time(self) -> float:
-        return max(self.times) if self.times else 0
+    def std(self) -> float:
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
 
-    @property
-    def total(self) -> float:
-        return sum(self.times)
+    def percentile(self, pct: float) -> float:
+        if not self.count:
+            return 0.0
+        return min(max(self.hist.percentile(pct), self.min_time), self.max_time)
 
 
-def parse_timestamp(line: str) -> Optional[datetime]:
-    """로그 라인에서 타임스탬프 추출"""
-    # 형식: 2025-12-30 21:08:58,194 | ...
-    match = re.match(r"(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}),\d+", line)
-    if match:
-        try:
-            return datetime.strptime(match.group(1), "%Y-%m-%d %H:%M:%S")
-        except ValueError:
-            pass
-    return None
+@dataclass
+class SessionStats:
+    """파일 1개(또는 병합된 세션) 분석 결과."""
+    operations: Dict[str, OperationStats] = field(default_factory=dict)
+    # 시간대 "HH:MM-HH:MM" → [작업 수, 합계 ms, SLOW 수]
+    timeline: Dict[str, List[float]] = field(default_factory=dict)
+    list_calls: int = 0
+    list_empty_ratio_sum: int = 0
+    list_high_empty: int = 0
+    list_by_context: Dict[str, int] = field(default_factory=dict)
+    retry_attempts: Dict[int, int] = field(default_factory=dict)
+    files: int = 0
+    errors: List[str] = field(default_factory=list)
+
+    def operation(self, name: str) -> OperationStats:
+        op = self.operations.get(name)
+        if op is None:
+            op = self.operations[name] = OperationStats(name=name)
+        return op
+
+    def merge(self, other: "SessionStats") -> None:
+        for name, op in other.operations.items():
+            self.operation(name).merge(op)
+        for key, (count, total, slow) in other.timeline.items():
+            bucket = self.timeline.setdefault(key, [0, 0.0, 0])
+            bucket[0] += count
+            bucket[1] += total
+            bucket[2] += slow
+        self.list_calls += other.list_calls
+        self.list_empty_ratio_sum += other.list_empty_ratio_sum
+        self.list_high_empty += other.list_high_empty
+        for ctx, n in other.list_by_context.items():
+            self.list_by_context[ctx] = self.list_by_context.get(ctx, 0) + n
+        for attempt, n in other.retry_attempts.items():
+            self.retry_attempts[attempt] = self.retry_attempts.get(attempt, 0) + n
+        self.files += other.files
+        self.errors.extend(other.errors)
+
+
+# =============================================================================
+# 파싱
+# =============================================================================
 
 
 def parse_time_range(time_str: str) -> Optional[Tuple[dt_time, dt_time]]:
@@ -76,214 +183,216 @@ def parse_time_range(time_str: str) -> Optional[Tuple[dt_time, dt_time]]:
     return None
 
 
-def is_in_time_range(ts: datetime, time_range: Optional[Tuple[dt_time, dt_time]]) -> bool:
-    """타임스탬프가 시간 범위 내인지 확인"""
-    if not time_range:
-        return True
-    start, end = time_range
-    ts_time = ts.time()
-    return start <= ts_time <= end
+def _bucket_key(hour: int, minute: int, bucket_minutes: int) -> str:
+    start = datetime(2000, 1, 1, hour, (minute // bucket_minutes) * bucket_minutes)
+    end = start + timedelta(minutes=bucket_minutes)
+    return f"{start.strftime('%H:%M')}-{end.strftime('%H:%M')}"
 
 
-def parse_log_files(
-    log_dir: Path,
+def parse_log_file(
+    log_file: Path,
     filter_pattern: Optional[str] = None,
-    time_range: Optional[Tuple[dt_time, dt_time]] = None
-) -> Dict[str, OperationStats]:
-    """로그 파일들 파싱
-
-    Args:
-        log_dir: 로그 디렉토리 경로
-        filter_pattern: 작업명 필터 (부분 일치)
-        time_range: 시간 범위 필터 (start_time, end_time)
-    """
-    stats: Dict[str, OperationStats] = {}
+    time_range: Optional[Tuple[dt_time, dt_time]] = None,
+    bucket_minutes: int = 5,
+) -> SessionStats:
+    """로그 파일 1개 스트리밍 파싱 (한 번 읽으며 시간/ListItems/재시도 모두 수집)."""
+    session = SessionStats(files=1)
+    filter_lower = filter_pattern.lower() if filter_pattern else None
+    range_start = time_range[0].strftime("%H:%M:%S") if time_range else None
+    range_end = time_range[1].strftime("%H:%M:%S") if time_range else None
+    current_context = ""
+
+    try:
+        with open(log_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                ts = _TS_PATTERN.match(line)
+
+                # 시간 범위 필터 (HH:MM:SS 문자열 비교)
+                if ts and range_start is not None:
+                    clock = line[11:19]
+                    if not (range_start <= clock <= range_end):
+                        continue
 
-    # 시간 측정 패턴: "2025-12-30 21:08:58,194 | SLOW: operation took 123.4ms"
-    # 또는 "2025-12-30 21:08:58,194 | operation: 123.4ms"
-    slow_pattern = re.compile(r"\| SLOW: (.+?) took (\d+\.?\d*)ms")
-    normal_pattern = re.compile(r"\| ([^|]+?): (\d+\.?\d*)ms$")
+                # ListItems / 재시도 통계
+                if "context_menu" in line:
+                    current_context = "context_menu"
+                elif "find_all_descendants" in line:
+                    current_context = "chat_list"
+                if "ListItems:" in line:
+                    match = _LIST_PATTERN.search(line)
+                    if match:
+                        ratio = int(match.group(3))
+                        session.list_calls += 1
+                        session.list_empty_ratio_sum += ratio
+                        if ratio >= 80:
+                            session.list_high_empty += 1
+                        session.list_by_context[current_context] = (
+                            session.list_by_context.get(current_context, 0) + 1)
+                    continue
+                if "attempt=" in line:
+                    match = _RETRY_PATTERN.search(line)
+                    if match:
+                        attempt = int(match.group(1))
+                        session.retry_attempts[attempt] = session.retry_attempts.get(attempt, 0) + 1
+                    continue
+
+                # SLOW 패턴 먼저 시도
+                match = _SLOW_PATTERN.search(line) or _NORMAL_PATTERN.search(line)
+                if not match:
+                    continue
+                name = match.group(1).strip()
+                time_ms = float(match.group(2))
+
+                # 작업명 필터
+                if filter_lower and filter_lower not in name.lower():
+                    continue
+
+                session.operation(name).add(time_ms)
+                if ts:
+                    key = _bucket_key(int(ts.group(2)), int(ts.group(3)), bucket_minutes)
+                    bucket = session.timeline.setdefault(key, [0, 0.0, 0])
+                    bucket[0] += 1
+                    bucket[1] += time_ms
+                    if time_ms > SLOW_MS:
+                        bucket[2] += 1
+    except Exception as e:
+        session.errors.append(f"{log_file.name}: {e}")
+
+    return session
+
+
+def parse_report_json(path: Path, filter_pattern: Optional[str] = None) -> SessionStats:
+    """UIAProfiler.save_report JSON → SessionStats. 분산은 모름, 히스토그램 있으면 사용."""
+    session = SessionStats(files=1)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except Exception as e:
+        session.errors.append(f"{path.name}: {e}")
+        return session
+
+    filter_lower = filter_pattern.lower() if filter_pattern else None
+    for name, entry in data.items():
+        if filter_lower and filter_lower not in name.lower():
+            continue
+        count = int(entry.get('call_count', 0))
+        if not count:
+            continue
+        op = session.operation(name)
+        op.count = count
+        op.mean = float(entry.get('avg_time', 0.0))
+        op.m2 = math.nan
+        op.min_time = float(entry.get('min_time', 0.0))
+        op.max_time = float(entry.get('max_time', 0.0))
+        if entry.get('histogram'):
+            op.hist = LogHistogram.from_list(entry['histogram'])
+            op.slow_count = op.hist.count_at_least(SLOW_MS)
+            if op.slow_count:
+                op.slow_max = op.max_time
+                # 구간 중간값으로 근사
+                op.slow_total = sum(
+                    n * sum(op.hist.bucket_bounds(i)) / 2
+                    for i, n in op.hist.counts.items() if op.hist.bucket_bounds(i)[0] >= SLOW_MS
+                )
+    return session
+
+
+def collect_sources(paths: Iterable[Path]) -> List[Path]:
+    """디렉토리는 profile_*.log, 파일(.log/.json)은 그대로."""
+    sources: List[Path] = []
+    for path in paths:
+        if path.is_dir():
+            sources.extend(sorted(path.glob("profile_*.log")))
+        elif path.exists():
+            sources.append(path)
+        else:
+            print(f"입력 없음: {path}")
+    return sources
 
-    log_files = sorted(log_dir.glob("profile_*.log"))
-    print(f"분석할 로그 파일: {len(log_files)}개")
 
-    for log_file in log_files:
-        try:
-            with open(log_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    # 타임스탬프 추출
-                    ts = parse_timestamp(line)
+def _parse_source(args) -> SessionStats:
+    # 프로세스 풀 작업 단위 (최상위 함수여야 pickle 가능)
+    path, filter_pattern, time_range, bucket_minutes = args
+    if path.suffix == ".json":
+        return parse_report_json(path, filter_pattern)
+    return parse_log_file(path, filter_pattern, time_range, bucket_minutes)
 
-                    # 시간 범위 필터
-                    if ts and time_range and not is_in_time_range(ts, time_range):
-                        continue
 
-                    # SLOW 패턴 먼저 시도
-                    match = slow_pattern.search(line)
-                    if match:
-                        name = match.group(1).strip()
-                        time_ms = float(match.group(2))
-                    else:
-                        # 일반 패턴 시도
-                        match = normal_pattern.search(line)
-                        if match:
-                            name = match.group(1).strip()
-                            time_ms = float(match.group(2))
-                        else:
-                            continue
-
-                    # 작업명 필터
-                    if filter_pattern and filter_pattern.lower() not in name.lower():
-                        continue
+def parse_sources(
+    sources: List[Path],
+    filter_pattern: Optional[str] = None,
+    time_range: Optional[Tuple[dt_time, dt_time]] = None,
+    bucket_minutes: int = 5,
+    jobs: Optional[int] = None,
+) -> SessionStats:
+    """파일별 병렬 파싱 후 병합. jobs=1이면 현재 프로세스에서 순차 처리."""
+    jobs = jobs or os.cpu_count() or 1
+    tasks = [(path, filter_pattern, time_range, bucket_minutes) for path in sources]
+    session = SessionStats()
+
+    if jobs <= 1 or len(tasks) <= 1:
+        results = map(_parse_source, tasks)
+        for result in results:
+            session.merge(result)
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+            for result in pool.map(_parse_source, tasks):
+                session.merge(result)
 
-                    if name not in stats:
-                        stats[name] = OperationStats(name=name)
-                    stats[name].times.append(time_ms)
-                    if ts:
-                        stats[name].timestamps.append(ts)
-        except Exception as e:
-            print(f"오류 ({log_file.name}): {e}")
+    for error in session.errors:
+        print(f"오류 ({error})")
+    return session
 
-    return stats
 
+def parse_log_files(
+    log_dir: Path,
+    filter_pattern: Optional[str] = None,
+    time_range: Optional[Tuple[dt_time, dt_time]] = None,
+    bucket_minutes: int = 5,
+    jobs: Optional[int] = None,
+) -> SessionStats:
+    """로그 디렉토리의 profile_*.log 전체 파싱"""
+    sources = collect_sources([log_dir])
+    print(f"분석할 로그 파일: {len(sources)}개")
+    return parse_sources(sources, filter_pattern, time_range, bucket_minutes, jobs)
 
-def get_timeline_analysis(
-    stats: Dict[str, OperationStats],
-    bucket_minutes: int = 5
-) -> List[Dict]:
-    """시간대별 성능 분석
 
-    Args:
-        stats: 작업별 통계
-        bucket_minutes: 시간 버킷 크기 (분)
+def get_timeline_analysis(session: SessionStats) -> List[Dict]:
+    """시간대별 성능 분석
 
     Returns:
         [{'time': '10:00-10:05', 'avg_ms': 45.2, 'slow_count': 2, 'total_ops': 15}, ...]
     """
-    # 모든 측정값을 타임스탬프와 함께 수집
-    all_measurements: List[Tuple[datetime, float]] = []
-    for op in stats.values():
-        for i, t in enumerate(op.times):
-            if i < len(op.timestamps):
-                all_measurements.append((op.timestamps[i], t))
-
-    if not all_measurements:
-        return []
-
-    # 시간순 정렬
-    all_measurements.sort(key=lambda x: x[0])
-
-    # 버킷으로 그룹화
-    buckets: Dict[str, List[float]] = defaultdict(list)
-    for ts, time_ms in all_measurements:
-        # 버킷 시작 시간 계산
-        bucket_start_min = (ts.minute // bucket_minutes) * bucket_minutes
-        bucket_start = ts.replace(minute=bucket_start_min, second=0, microsecond=0)
-        bucket_end_min = bucket_start_min + bucket_minutes
-        if bucket_end_min >= 60:
-            bucket_end = bucket_start.replace(hour=bucket_start.hour + 1, minute=0)
-        else:
-            bucket_end = bucket_start.replace(minute=bucket_end_min)
-
-        bucket_key = f"{bucket_start.strftime('%H:%M')}-{bucket_end.strftime('%H:%M')}"
-        buckets[bucket_key].append(time_ms)
-
-    # 결과 생성
-    result = []
-    for time_range, times in sorted(buckets.items()):
-        slow_count = sum(1 for t in times if t > 100)
-        result.append({
-            "time": time_range,
-            "avg_ms": sum(times) / len(times),
-            "slow_count": slow_count,
-            "total_ops": len(times)
-        })
-
-    return result
-
-
-def parse_list_items(log_dir: Path) -> Dict[str, Dict]:
-    """ListItems 통계 파싱"""
-    list_stats = {
-        "total_calls": 0,
-        "empty_ratios": [],
-        "high_empty_count": 0,  # 80% 이상
-        "by_context": defaultdict(list),
-    }
-
-    # ListItems: total=11, empty=0 (0%), valid=11, took 3.4ms
-    pattern = re.compile(r"ListItems: total=(\d+), empty=(\d+) \((\d+)%\)")
-
-    for log_file in sorted(log_dir.glob("profile_*.log")):
-        try:
-            current_context = ""
-            with open(log_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    # 컨텍스트 추출 (context_menu.xxx 형태)
-                    if "context_menu" in line:
-                        current_context = "context_menu"
-                    elif "find_all_descendants" in line and "context_menu" not in line:
-                        current_context = "chat_list"
-
-                    match = pattern.search(line)
-                    if match:
-                        total = int(match.group(1))
-                        empty = int(match.group(2))
-                        ratio = int(match.group(3))
-
-                        list_stats["total_calls"] += 1
-                        list_stats["empty_ratios"].append(ratio)
-
-                        if ratio >= 80:
-                            list_stats["high_empty_count"] += 1
-
-                        list_stats["by_context"][current_context].append({
-                            "total": total,
-                            "empty": empty,
-                            "ratio": ratio
-                        })
-        except Exception:
-            pass
+    return [
+        {
+            "time": key,
+            "avg_ms": total / count if count else 0.0,
+            "slow_count": slow,
+            "total_ops": count,
+        }
+        for key, (count, total, slow) in sorted(session.timeline.items())
+    ]
 
-    return list_stats
 
+# =============================================================================
+# 리포트
+# =============================================================================
 
-def parse_retry_stats(log_dir: Path) -> Dict[str, Dict]:
-    """재시도 통계 파싱"""
-    retry_stats = {
-        "attempts": [],
-        "by_attempt": defaultdict(int),
-    }
 
-    # 메뉴 찾기 성공: attempt=1
-    pattern = re.compile(r"메뉴 찾기 성공: attempt=(\d+)")
+def _fmt_std(op: OperationStats) -> str:
+    return "-" if math.isnan(op.m2) else f"{op.std:.1f}"
 
-    for log_file in sorted(log_dir.glob("profile_*.log")):
-        try:
-            with open(log_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    match = pattern.search(line)
-                    if match:
-                        attempt = int(match.group(1))
-                        retry_stats["attempts"].append(attempt)
-                        retry_stats["by_attempt"][attempt] += 1
-        except Exception:
-            pass
 
-    return retry_stats
-
-
-def generate_report(stats: Dict[str, OperationStats],
-                   list_stats: Dict,
-                   retry_stats: Dict,
-                   timeline: Optional[List[Dict]] = None,
-                   filter_info: Optional[str] = None) -> str:
+def generate_report(session: SessionStats,
+                    timeline: Optional[List[Dict]] = None,
+                    filter_info: Optional[str] = None) -> str:
     """마크다운 리포트 생성"""
+    stats = session.operations
     lines = [
         "# 프로파일러 분석 결과",
         "",
         "## 측정 환경",
-        f"- 분석 로그 수: {len(list(Path('logs').glob('profile_*.log')))}개",
+        f"- 분석 파일 수: {session.files}개",
         f"- 총 작업 유형: {len(stats)}개",
     ]
 
@@ -294,16 +403,18 @@ def generate_report(stats: Dict[str, OperationStats],
         "",
         "## 병목 지점 Top 10 (평균 시간 기준)",
         "",
-        "| 순위 | 작업 | 호출수 | 평균(ms) | 최소(ms) | 최대(ms) |",
-        "|------|------|--------|----------|----------|----------|",
-    ]
+        "| 순위 | 작업 | 호출수 | 평균(ms) | 표준편차 | p50 | p90 | p99 | 최소(ms) | 최대(ms) |",
+        "|------|------|--------|----------|----------|-----|-----|-----|----------|----------|",
+    ])
 
     # 평균 시간 기준 정렬
     sorted_stats = sorted(stats.values(), key=lambda x: x.avg, reverse=True)
 
     for i, op in enumerate(sorted_stats[:10], 1):
         lines.append(
-            f"| {i} | {op.name} | {op.count} | {op.avg:.1f} | {op.min_time:.1f} | {op.max_time:.1f} |"
+            f"| {i} | {op.name} | {op.count} | {op.avg:.1f} | {_fmt_std(op)} | "
+            f"{op.percentile(50):.1f} | {op.percentile(90):.1f} | {op.percentile(99):.1f} | "
+            f"{op.min_time:.1f} | {op.max_time:.1f} |"
         )
 
     # SLOW 작업만 필터링
@@ -315,14 +426,11 @@ def generate_report(stats: Dict[str, OperationStats],
         "|------|----------|----------|----------|",
     ])
 
-    slow_ops = [(name, op) for name, op in stats.items()
-                if any(t > 100 for t in op.times)]
-    slow_ops.sort(key=lambda x: x[1].max_time, reverse=True)
-
-    for name, op in slow_ops[:10]:
-        slow_times = [t for t in op.times if t > 100]
+    slow_ops = sorted((op for op in stats.values() if op.slow_count),
+                      key=lambda op: op.slow_max, reverse=True)
+    for op in slow_ops[:10]:
         lines.append(
-            f"| {name} | {len(slow_times)} | {sum(slow_times)/len(slow_times):.1f} | {max(slow_times):.1f} |"
+            f"| {op.name} | {op.slow_count} | {op.slow_total / op.slow_count:.1f} | {op.slow_max:.1f} |"
         )
 
     # 빈 항목 통계
@@ -330,13 +438,16 @@ def generate_report(stats: Dict[str, OperationStats],
         "",
         "## 빈 항목(empty) 통계",
         "",
-        f"- 총 ListItems 호출: {list_stats['total_calls']}회",
-        f"- 80% 이상 빈 항목: {list_stats['high_empty_count']}회 ({list_stats['high_empty_count']/list_stats['total_calls']*100:.1f}%)" if list_stats['total_calls'] > 0 else "- 데이터 없음",
+        f"- 총 ListItems 호출: {session.list_calls}회",
     ])
-
-    if list_stats["empty_ratios"]:
-        avg_empty = sum(list_stats["empty_ratios"]) / len(list_stats["empty_ratios"])
-        lines.append(f"- 평균 빈 항목 비율: {avg_empty:.1f}%")
+    if session.list_calls:
+        lines.append(
+            f"- 80% 이상 빈 항목: {session.list_high_empty}회 "
+            f"({session.list_high_empty / session.list_calls * 100:.1f}%)"
+        )
+        lines.append(f"- 평균 빈 항목 비율: {session.list_empty_ratio_sum / session.list_calls:.1f}%")
+    else:
+        lines.append("- 데이터 없음")
 
     # 재시도 통계
     lines.extend([
@@ -345,16 +456,16 @@ def generate_report(stats: Dict[str, OperationStats],
         "",
     ])
 
-    if retry_stats["attempts"]:
-        avg_attempt = sum(retry_stats["attempts"]) / len(retry_stats["attempts"])
-        max_attempt = max(retry_stats["attempts"])
-        lines.append(f"- 총 시도: {len(retry_stats['attempts'])}회")
+    attempts_total = sum(session.retry_attempts.values())
+    if attempts_total:
+        avg_attempt = sum(a * n for a, n in session.retry_attempts.items()) / attempts_total
+        lines.append(f"- 총 시도: {attempts_total}회")
         lines.append(f"- 평균 재시도: {avg_attempt:.1f}회")
-        lines.append(f"- 최대 재시도: {max_attempt}회")
+        lines.append(f"- 최대 재시도: {max(session.retry_attempts)}회")
         lines.append("")
         lines.append("| 시도 횟수 | 발생 빈도 |")
         lines.append("|----------|----------|")
-        for attempt, count in sorted(retry_stats["by_attempt"].items()):
+        for attempt, count in sorted(session.retry_attempts.items()):
             lines.append(f"| {attempt} | {count} |")
     else:
         lines.append("- 데이터 없음")
@@ -390,12 +501,234 @@ def generate_report(stats: Dict[str, OperationStats],
         if "right_click" in top_slow.name:
             lines.append("3. **우클릭 대기 시간**: Windows API 응답 시간으로 개선 어려움 (정상)")
 
-    if list_stats["high_empty_count"] > list_stats["total_calls"] * 0.1:
-        lines.append(f"4. **가상 스크롤 최적화**: 빈 항목이 {list_stats['high_empty_count']/list_stats['total_calls']*100:.1f}%로 높음, SmartListFilter 튜닝 필요")
+    if session.list_calls and session.list_high_empty > session.list_calls * 0.1:
+        lines.append(f"4. **가상 스크롤 최적화**: 빈 항목이 {session.list_high_empty / session.list_calls * 100:.1f}%로 높음, SmartListFilter 튜닝 필요")
 
     return "\n".join(lines)
 
 
+# =============================================================================
+# 세션 비교
+# =============================================================================
+
+
+def mann_whitney(base: LogHistogram, curr: LogHistogram) -> Tuple[float, float]:
+    """버킷 히스토그램 기반 Mann-Whitney U (같은 버킷 = 동률, 정규 근사).
+
+    반환: (z, 양측 p). z > 0이면 curr가 더 느림.
+    """
+    n1, n2 = base.count, curr.count
+    if not n1 or not n2:
+        return 0.0, 1.0
+    u = 0.0           # curr > base 쌍 수 (동률 0.5)
+    base_below = 0
+    tie_term = 0
+    for i in sorted(set(base.counts) | set(curr.counts)):
+        a = base.counts.get(i, 0)
+        b = curr.counts.get(i, 0)
+        u += b * (base_below + 0.5 * a)
+        base_below += a
+        t = a + b
+        tie_term += t * t * t - t
+
+    n = n1 + n2
+    mu = n1 * n2 / 2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1))) if n > 1 else 0.0
+    if variance <= 0:
+        return 0.0, 1.0
+    z = (u - mu) / math.sqrt(variance)
+    return z, math.erfc(abs(z) / math.sqrt(2))
+
+
+@dataclass
+class OperationComparison:
+    name: str
+    base: OperationStats
+    curr: OperationStats
+    change_pct: float     # 중앙값 기준 변화율
+    z: float
+    p_value: float
+    verdict: str          # regressed / improved / unchanged / untested
+
+
+def compare_sessions(
+    base: SessionStats,
+    curr: SessionStats,
+    alpha: float = 0.01,
+    min_change_pct: float = 10.0,
+    min_samples: int = 20,
+) -> Tuple[List[OperationComparison], List[str], List[str]]:
+    """작업별 비교. 유의(p < alpha) + 중앙값 변화 min_change_pct 이상일 때만 저하/개선.
+
+    반환: (공통 작업 비교, 새 작업 이름, 사라진 작업 이름)
+    """
+    results = []
+    for name in sorted(set(base.operations) & set(curr.operations)):
+        b, c = base.operations[name], curr.operations[name]
+        b_med, c_med = b.percentile(50), c.percentile(50)
+        change = (c_med - b_med) / b_med * 100 if b_med > 0 else 0.0
+
+        if min(b.hist.count, c.hist.count) < min_samples:
+            z, p, verdict = 0.0, 1.0, "untested"
+        else:
+            z, p = mann_whitney(b.hist, c.hist)
+            if p < alpha and z > 0 and change >= min_change_pct:
+                verdict = "regressed"
+            elif p < alpha and z < 0 and change <= -min_change_pct:
+                verdict = "improved"
+            else:
+                verdict = "unchanged"
+        results.append(OperationComparison(name, b, c, change, z, p, verdict))
+
+    new_ops = sorted(set(curr.operations) - set(base.operations))
+    removed_ops = sorted(set(base.operations) - set(curr.operations))
+    return results, new_ops, removed_ops
+
+
+def generate_comparison_report(
+    results: List[OperationComparison],
+    new_ops: List[str],
+    removed_ops: List[str],
+    base_label: str,
+    curr_label: str,
+    alpha: float,
+    min_change_pct: float,
+) -> str:
+    lines = [
+        "# 프로파일 세션 비교",
+        "",
+        f"- 기준: {base_label}",
+        f"- 현재: {curr_label}",
+        f"- 검정: Mann-Whitney U (p < {alpha:g}), 중앙값 변화 ±{min_change_pct:g}% 이상",
+        "",
+    ]
+
+    sections = (
+        ("regressed", "## 성능 저하 (유의)"),
+        ("improved", "## 개선 (유의)"),
+        ("untested", "## 표본 부족 (검정 안 함)"),
+    )
+    for verdict, title in sections:
+        rows = [r for r in results if r.verdict == verdict]
+        if not rows:
+            continue
+        rows.sort(key=lambda r: -abs(r.change_pct))
+        lines.extend([
+            title,
+            "",
+            "| 작업 | 호출수 | p50 이전(ms) | p50 현재(ms) | p99 이전 | p99 현재 | 변화 | p |",
+            "|------|--------|--------------|--------------|----------|----------|------|---|",
+        ])
+        for r in rows:
+            lines.append(
+                f"| {r.name} | {r.base.count}→{r.curr.count} | {r.base.percentile(50):.2f} | "
+                f"{r.curr.percentile(50):.2f} | {r.base.percentile(99):.2f} | "
+                f"{r.curr.percentile(99):.2f} | {r.change_pct:+.1f}% | {r.p_value:.2g} |"
+            )
+        lines.append("")
+
+    unchanged = sum(1 for r in results if r.verdict == "unchanged")
+    if new_ops:
+        lines.extend(["## 새로 추가됨", "", *[f"- {name}" for name in new_ops], ""])
+    if removed_ops:
+        lines.extend(["## 삭제됨", "", *[f"- {name}" for name in removed_ops], ""])
+
+    lines.extend([
+        "## 요약",
+        "",
+        f"- 저하: {sum(1 for r in results if r.verdict == 'regressed')}개",
+        f"- 개선: {sum(1 for r in results if r.verdict == 'improved')}개",
+        f"- 변화 없음: {unchanged}개",
+        f"- 표본 부족: {sum(1 for r in results if r.verdict == 'untested')}개",
+        f"- 새로 추가: {len(new_ops)}개",
+        f"- 삭제됨: {len(removed_ops)}개",
+    ])
+    return "\n".join(lines)
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+
+def _save_report(report: str, filename: str) -> Path:
+    docs_dir = Path(__file__).parent.parent / "docs"
+    docs_dir.mkdir(exist_ok=True)
+    output_file = docs_dir / filename
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(report)
+    return output_file
+
+
+def run_analyze(args) -> int:
+    # 필터 정보 구성
+    filter_parts = []
+    if args.filter:
+        filter_parts.append(f"작업명='{args.filter}'")
+    if args.time:
+        filter_parts.append(f"시간={args.time}")
+    filter_info = ", ".join(filter_parts) if filter_parts else None
+
+    # 시간 범위 파싱
+    time_range = parse_time_range(args.time) if args.time else None
+    if args.time and not time_range:
+        print(f"시간 범위 형식 오류: {args.time} (예: 10:00-10:30)")
+        return 1
+
+    inputs = args.input or [Path(__file__).parent.parent / "logs"]
+    sources = collect_sources(inputs)
+    if not sources:
+        print(f"분석할 입력 없음: {', '.join(map(str, inputs))}")
+        return 1
+
+    print("=== 프로파일러 로그 분석 ===\n")
+    if filter_info:
+        print(f"필터: {filter_info}\n")
+
+    print(f"1. 파싱 ({len(sources)}개 파일, jobs={args.jobs or os.cpu_count()})...")
+    session = parse_sources(sources, args.filter, time_range, args.bucket, args.jobs)
+    print(f"   {len(session.operations)}개 작업 유형, ListItems {session.list_calls}회, "
+          f"메뉴 찾기 {sum(session.retry_attempts.values())}회")
+
+    timeline = get_timeline_analysis(session)
+    print(f"2. 시간대별 분석: {len(timeline)}개 시간대")
+
+    print("\n3. 리포트 생성...")
+    report = generate_report(session, timeline, filter_info)
+    output_file = _save_report(report, "PROFILER_ANALYSIS.md")
+
+    print(f"\n리포트 저장됨: {output_file}")
+    print("\n" + "=" * 50)
+    print(report)
+    return 0
+
+
+def run_compare(args) -> int:
+    base_sources = collect_sources([args.base])
+    curr_sources = collect_sources([args.current])
+    if not base_sources or not curr_sources:
+        print("비교할 입력 없음")
+        return 1
+
+    print("=== 프로파일 세션 비교 ===\n")
+    base = parse_sources(base_sources, args.filter, jobs=args.jobs)
+    curr = parse_sources(curr_sources, args.filter, jobs=args.jobs)
+
+    results, new_ops, removed_ops = compare_sessions(
+        base, curr, alpha=args.alpha, min_change_pct=args.min_change
+    )
+    report = generate_comparison_report(
+        results, new_ops, removed_ops, str(args.base), str(args.current),
+        args.alpha, args.min_change
+    )
+    output_file = _save_report(report, "PROFILER_COMPARISON.md")
+    print(report)
+    print(f"\n리포트 저장됨: {output_file}")
+
+    # 저하 있으면 실패 코드 (스크립트/CI 게이트용)
+    return 2 if any(r.verdict == "regressed" for r in results) else 0
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="프로파일러 로그 분석",
@@ -406,6 +739,8 @@ def main():
   python scripts/analyze_profile.py --filter context_menu
   python scripts/analyze_profile.py --time 10:00-10:30
   python scripts/analyze_profile.py --filter menu --time 09:00-12:00
+  python scripts/analyze_profile.py --input logs/report_20260301_101500.json
+  python scripts/analyze_profile.py compare logs/before logs/after
         """
     )
     parser.add_argument(
@@ -424,64 +759,31 @@ def main():
         default=5,
         help="시간대별 분석 버킷 크기 (분, 기본값: 5)"
     )
-    args = parser.parse_args()
-
-    log_dir = Path(__file__).parent.parent / "logs"
-
-    if not log_dir.exists():
-        print(f"로그 디렉토리 없음: {log_dir}")
-        sys.exit(1)
-
-    # 필터 정보 구성
-    filter_parts = []
-    if args.filter:
-        filter_parts.append(f"작업명='{args.filter}'")
-    if args.time:
-        filter_parts.append(f"시간={args.time}")
-    filter_info = ", ".join(filter_parts) if filter_parts else None
-
-    # 시간 범위 파싱
-    time_range = parse_time_range(args.time) if args.time else None
-    if args.time and not time_range:
-        print(f"시간 범위 형식 오류: {args.time} (예: 10:00-10:30)")
-        sys.exit(1)
-
-    print("=== 프로파일러 로그 분석 ===\n")
-    if filter_info:
-        print(f"필터: {filter_info}\n")
-
-    # 파싱
-    print("1. 작업별 시간 측정 파싱...")
-    stats = parse_log_files(log_dir, args.filter, time_range)
-    print(f"   {len(stats)}개 작업 유형 발견")
-
-    print("2. ListItems 통계 파싱...")
-    list_stats = parse_list_items(log_dir)
-    print(f"   {list_stats['total_calls']}회 호출")
-
-    print("3. 재시도 통계 파싱...")
-    retry_stats = parse_retry_stats(log_dir)
-    print(f"   {len(retry_stats['attempts'])}회 메뉴 찾기 기록")
-
-    print("4. 시간대별 분석...")
-    timeline = get_timeline_analysis(stats, args.bucket)
-    print(f"   {len(timeline)}개 시간대")
-
-    # 리포트 생성
-    print("\n5. 리포트 생성...")
-    report = generate_report(stats, list_stats, retry_stats, timeline, filter_info)
-
-    # 출력 및 저장
-    docs_dir = Path(__file__).parent.parent / "docs"
-    docs_dir.mkdir(exist_ok=True)
+    parser.add_argument(
+        "--input", "-i",
+        type=Path,
+        nargs="+",
+        help="입력 (디렉토리: profile_*.log, 파일: .log 또는 save_report .json). 기본: logs/"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=None,
+        help="병렬 파싱 프로세스 수 (기본: CPU 수, 1이면 순차)"
+    )
 
-    output_file = docs_dir / "PROFILER_ANALYSIS.md"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(report)
+    subparsers = parser.add_subparsers(dest="command")
+    compare = subparsers.add_parser("compare", help="두 세션 비교 (유의한 저하 표시)")
+    compare.add_argument("base", type=Path, help="기준 세션 (디렉토리/.log/.json)")
+    compare.add_argument("current", type=Path, help="현재 세션 (디렉토리/.log/.json)")
+    compare.add_argument("--alpha", type=float, default=0.01, help="유의수준 (기본 0.01)")
+    compare.add_argument("--min-change", type=float, default=10.0,
+                         help="저하/개선으로 볼 최소 중앙값 변화율 %% (기본 10)")
 
-    print(f"\n리포트 저장됨: {output_file}")
-    print("\n" + "=" * 50)
-    print(report)
+    args = parser.parse_args()
+    if args.command == "compare":
+        sys.exit(run_compare(args))
+    sys.exit(run_analyze(args))
 
 
 if __name__ == "__main__":
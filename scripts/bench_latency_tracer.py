@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""지연 추적 오버헤드 벤치마크
+
+begin/mark/finish 단계당 비용을 샘플링 꺼짐/켜짐으로 비교.
+꺼진 상태에서 단계당 1us 훨씬 아래여야 릴리즈 빌드에 켜둘 수 있음.
+
+사용법:
+    uv run python scripts/bench_latency_tracer.py
+    uv run python scripts/bench_latency_tracer.py --count 500000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from kakaotalk_a11y_client.utils.latency_tracer import LatencyTracer, STAGES  # noqa: E402
+
+
+def _run(label: str, tracer: LatencyTracer, count: int) -> None:
+    begin, mark, finish = tracer.begin, tracer.mark, tracer.finish
+    start = time.perf_counter()
+    for _ in range(count):
+        begin()
+        for stage in STAGES:
+            mark(stage)
+        finish()
+    elapsed = time.perf_counter() - start
+    # begin + 단계 mark + finish
+    calls = count * (len(STAGES) + 2)
+    print(f"  {label:<24} {elapsed / count * 1e6:>6.2f}us/event  "
+          f"{elapsed / calls * 1e9:>6.0f}ns/stage")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="지연 추적 오버헤드 벤치마크")
+    parser.add_argument("--count", type=int, default=200_000, help="이벤트 수")
+    args = parser.parse_args()
+
+    print(f"=== 지연 추적 오버헤드 (count={args.count:,}) ===\n")
+    _run("sampling off", LatencyTracer(sample_every=0), args.count)
+    _run("sample every 10", LatencyTracer(sample_every=10), args.count)
+    _run("sample every event", LatencyTracer(sample_every=1), args.count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""로그 writer 처리량 벤치마크 (lines/s)
+
+  - sync:    기존 방식. 호출 스레드에서 줄마다 print + write + flush
+  - batched: _LogWriter. 호출 스레드는 큐 추가만, writer 스레드가 배치 기록
+
+콘솔 출력은 os.devnull로, 파일은 임시 폴더의 회전 로그로 보냄.
+호출 스레드 기준(caller)과 마지막 줄이 디스크에 써질 때까지(end-to-end) 둘 다 측정.
+
+사용법:
+    uv run python scripts/bench_log_writer.py
+    uv run python scripts/bench_log_writer.py --lines 500000
+"""
+
+import argparse
+import contextlib
+import os
+import sys
+import tempfile
+import time
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from kakaotalk_a11y_client.config import LOG_FILE_MAX_BYTES, LOG_FILE_BACKUP_COUNT  # noqa: E402
+from kakaotalk_a11y_client.utils.debug import _LogWriter  # noqa: E402
+
+
+def _make_handler(directory: Path) -> RotatingFileHandler:
+    return RotatingFileHandler(
+        directory / "debug.log",
+        maxBytes=LOG_FILE_MAX_BYTES,
+        backupCount=LOG_FILE_BACKUP_COUNT,
+        encoding="utf-8",
+    )
+
+
+def _line(i: int) -> str:
+    return f"12:00:00 [TRACE:UIA_Focus] [PASS] ListItemControl: 김민지 오늘 회의 몇 시 #{i}"
+
+
+def bench_sync(handler: RotatingFileHandler, count: int) -> float:
+    """기존 Logger._log와 같은 동기 기록."""
+    start = time.perf_counter()
+    for i in range(count):
+        line = _line(i)
+        print(line)
+        handler.stream.write(f"{line}\n")
+        handler.flush()
+    return time.perf_counter() - start
+
+
+def bench_batched(handler: RotatingFileHandler, count: int) -> tuple[float, float, dict]:
+    writer = _LogWriter(handler, console=True)
+    start = time.perf_counter()
+    for i in range(count):
+        writer.write(_line(i))
+    caller = time.perf_counter() - start
+    writer.close()
+    total = time.perf_counter() - start
+    return caller, total, writer.get_stats()
+
+
+def _report(label: str, count: int, elapsed: float) -> None:
+    print(f"  {label:<28} {elapsed * 1000:>9.1f}ms  {count / elapsed:>12,.0f} lines/s",
+          file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로그 writer 처리량 벤치마크")
+    parser.add_argument("--lines", type=int, default=100_000, help="기록할 줄 수")
+    args = parser.parse_args()
+
+    print(f"=== 로그 writer 처리량 (lines={args.lines:,}) ===\n", file=sys.stderr)
+
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, "w", encoding="utf-8") as devnull:
+        with contextlib.redirect_stdout(devnull):
+            sync_dir = Path(tmp) / "sync"
+            sync_dir.mkdir()
+            handler = _make_handler(sync_dir)
+            sync_elapsed = bench_sync(handler, args.lines)
+            handler.close()
+
+            batched_dir = Path(tmp) / "batched"
+            batched_dir.mkdir()
+            handler = _make_handler(batched_dir)
+            caller, total, stats = bench_batched(handler, args.lines)
+            handler.close()
+
+    _report("sync (before)", args.lines, sync_elapsed)
+    _report("batched, caller thread", args.lines, caller)
+    # 큐 상한 초과분은 버려지므로 실제 기록된 줄 기준
+    _report("batched, end-to-end", stats["written"], total)
+    print(f"\n  writer: {stats}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""로깅 꺼짐 상태 오버헤드 벤치마크
+
+포커스 이벤트 1건이 거치는 로그 호출 패턴을 재현해서 비교:
+  - legacy: f-string 인자 + _log 안에서 레벨 체크 (기존 방식)
+  - lazy:   %-style 인자 + 비활성 레벨 no-op 바인딩 + trace_enabled 가드
+
+패턴 (이벤트 1건):
+  FocusMonitor._on_focus_event   [PASS] trace 1회 (Name 슬라이스)
+  is_focus_in_message_list       부모 단계마다 trace (ClassName/Name 조회)
+  _handle_list_item_focus        ListItem trace + _speak_item trace
+
+사용법:
+    uv run python scripts/bench_logging.py
+    uv run python scripts/bench_logging.py --count 200000 --depth 8
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from kakaotalk_a11y_client.utils.debug import Logger, LogLevel  # noqa: E402
+
+
+class LegacyLogger:
+    """기존 Logger와 같은 구조: 포맷 완료된 문자열을 받아 레벨 체크."""
+
+    def __init__(self, level: LogLevel):
+        self.level = level
+
+    def _log(self, level: LogLevel, msg: str) -> None:
+        if level >= self.level:
+            print(msg)
+
+    def trace(self, msg: str) -> None:
+        self._log(LogLevel.TRACE, msg)
+
+    def debug(self, msg: str) -> None:
+        self._log(LogLevel.DEBUG, msg)
+
+
+class FakeControl:
+    """UIA 속성 조회 비용 흉내 (property 접근)."""
+
+    def __init__(self, depth: int):
+        self._depth = depth
+
+    @property
+    def Name(self) -> str:
+        return "김민지 오늘 회의 몇 시에 시작해요? 오후 1:17 안 읽은 메시지 3개"
+
+    @property
+    def ClassName(self) -> str:
+        return "EVA_Window_Dblclk"
+
+    @property
+    def ControlTypeName(self) -> str:
+        return "ListItemControl"
+
+
+def legacy_event(log, control, depth):
+    control_type = control.ControlTypeName
+    name = control.Name or ""
+    log.trace(f"[PASS] {control_type}: {name[:20]}")
+    for i in range(depth):
+        try:
+            cls_name = control.ClassName
+            item_name = control.Name
+            log.trace(f"is_focus_in_message_list: depth={i}, ClassName={cls_name}, "
+                      f"Name={item_name[:20] if item_name else None}")
+        except Exception:
+            pass
+        if control.ClassName == "EVA_VH_ListControl_Dblclk":
+            break
+    log.trace(f"[이벤트] ListItem: {name[:30]}...")
+    log.trace(f"[{control_type}] {name[:50]}...")
+
+
+def lazy_event(log, control, depth):
+    control_type = control.ControlTypeName
+    name = control.Name or ""
+    log.trace("[PASS] %s: %.20s", control_type, name)
+    for i in range(depth):
+        cls_name = control.ClassName
+        if log.trace_enabled:
+            log.trace("is_focus_in_message_list: depth=%d, ClassName=%s, Name=%.20s",
+                      i, cls_name, control.Name)
+        if cls_name == "EVA_VH_ListControl_Dblclk":
+            break
+    log.trace("[이벤트] ListItem: %.30s...", name)
+    log.trace("[%s] %.50s...", control_type, name)
+
+
+def _run(label: str, func, log, count: int, depth: int) -> float:
+    control = FakeControl(depth)
+    start = time.perf_counter()
+    for _ in range(count):
+        func(log, control, depth)
+    elapsed = time.perf_counter() - start
+    per_event = elapsed / count * 1e6
+    print(f"  {label:<28} {elapsed * 1000:>9.1f}ms  {per_event:>6.2f}us/event")
+    return per_event
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로깅 오버헤드 벤치마크")
+    parser.add_argument("--count", type=int, default=100_000, help="포커스 이벤트 수")
+    parser.add_argument("--depth", type=int, default=6, help="is_focus_in_message_list 부모 탐색 단계")
+    args = parser.parse_args()
+
+    print(f"=== 포커스 파이프라인 로깅 오버헤드 (count={args.count:,}, depth={args.depth}, level=NONE) ===\n")
+
+    legacy = _run("legacy (f-string)", legacy_event, LegacyLogger(LogLevel.NONE), args.count, args.depth)
+    lazy = _run("lazy (no-op binding)", lazy_event, Logger("bench", LogLevel.NONE), args.count, args.depth)
+
+    print(f"\n  lazy가 {legacy / lazy:.1f}배 빠름 (이벤트당 {legacy - lazy:.2f}us 절약)")
+
+
+if __name__ == "__main__":
+    main()
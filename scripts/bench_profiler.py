@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""UIAProfiler measure() 오버헤드 벤치마크
+
+비활성/활성/중첩 컨텍스트 measure() 1회 비용과 멀티스레드 기록 처리량 측정.
+
+사용법:
+    uv run python scripts/bench_profiler.py
+    uv run python scripts/bench_profiler.py --count 500000 --threads 8
+"""
+
+import argparse
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from kakaotalk_a11y_client.utils.profiler import UIAProfiler  # noqa: E402
+
+
+def _loop(profiler: UIAProfiler, count: int, name: str = "op") -> None:
+    measure = profiler.measure
+    for _ in range(count):
+        with measure(name):
+            pass
+
+
+def _run(label: str, func, count: int) -> None:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<26} {elapsed * 1000:>9.1f}ms  {elapsed / count * 1e9:>8.0f}ns/measure")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="UIAProfiler 오버헤드 벤치마크")
+    parser.add_argument("--count", type=int, default=200_000, help="measure 호출 수")
+    parser.add_argument("--threads", type=int, default=4, help="동시 기록 스레드 수")
+    args = parser.parse_args()
+
+    print(f"=== UIAProfiler 벤치마크 (count={args.count:,}) ===\n")
+
+    disabled = UIAProfiler()
+    disabled.enabled = False
+    _run("disabled", lambda: _loop(disabled, args.count), args.count)
+
+    enabled = UIAProfiler()
+    _run("enabled", lambda: _loop(enabled, args.count), args.count)
+
+    def nested():
+        with enabled.context("refresh"), enabled.context("list"):
+            _loop(enabled, args.count, "GetChildren")
+    _run("enabled (nested context)", nested, args.count)
+
+    shared = UIAProfiler()
+    per_thread = args.count // args.threads
+
+    def threaded():
+        threads = [
+            threading.Thread(target=_loop, args=(shared, per_thread, f"op{i}"))
+            for i in range(args.threads)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    _run(f"enabled ({args.threads} threads)", threaded, per_thread * args.threads)
+
+    m = enabled.metrics["op"]
+    print(f"\n  op: {m.call_count:,} calls, " + ", ".join(
+        f"{k}={v * 1000:.2f}us" for k, v in m.percentiles().items()))
+
+
+if __name__ == "__main__":
+    main()
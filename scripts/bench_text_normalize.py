@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""발화 텍스트 정규화 처리량 벤치마크
+
+실제 채팅 목록/메시지와 비슷한 한국어 문자열 코퍼스를 생성해서
+기존 replace 체인과 normalize_speech_text(캐시 미스/히트)를 비교한다.
+
+사용법:
+    uv run python scripts/bench_text_normalize.py
+    uv run python scripts/bench_text_normalize.py --count 200000 --unique 2000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from kakaotalk_a11y_client.utils.text_normalizer import (  # noqa: E402
+    normalize_speech_text,
+    clear_normalize_cache,
+    get_normalize_cache_stats,
+)
+
+_NAMES = ["김민지", "이서준", "박지우", "최도윤", "정하은", "강시우", "조유나", "윤준호", "장서연", "임하준"]
+_BODIES = [
+    "오늘 회의 몇 시에 시작해요?",
+    "ㅋㅋㅋㅋㅋ 진짜 웃기다",
+    "사진을 보냈습니다.",
+    "(이모티콘)",
+    "(하트) 고마워요!",
+    "내일 점심 같이 드실 분\n12시 반에 로비에서 봬요",
+    "네\u00a0알겠습니다",
+    "파일: 2026_회의록_최종.hwp",
+    "링크 공유합니다 https://example.com/notice?id=1234",
+    "좋아요\u2764\ufe0f",
+    "\u2022 공지사항 확인 부탁드립니다",
+    "헐 대박 (놀람)",
+    "퇴근하겠습니다~~   수고하셨어요",
+    "저도 가능합니다\u200b",
+    "#샵검색 결과를 공유했습니다",
+]
+_TIMES = ["오전 9:05", "오전 11:42", "오후 1:17", "오후 6:30", "어제", "2월 3일"]
+
+
+def build_corpus(count: int, unique: int, seed: int = 42) -> list[str]:
+    """채팅 목록 항목 형식(이름, 본문, 시간, 안 읽은 수) 문자열 생성.
+
+    unique개의 서로 다른 문자열을 만들고 count개가 되도록 반복 샘플링.
+    """
+    rng = random.Random(seed)
+    pool = []
+    for i in range(unique):
+        name = rng.choice(_NAMES)
+        body = rng.choice(_BODIES)
+        when = rng.choice(_TIMES)
+        unread = rng.randint(0, 300)
+        # 항목마다 달라지도록 순번 포함
+        item = f"{name}\u00a0{body} {when} 안 읽은 메시지 {unread}개 #{i}"
+        if rng.random() < 0.3:
+            item = "\u2022 " + item
+        pool.append(item)
+    return [rng.choice(pool) for _ in range(count)]
+
+
+def _legacy(text: str) -> str:
+    return text.replace('\u2022', '').replace('\u00a0', ' ')
+
+
+def _run(label: str, func, corpus: list[str]) -> float:
+    start = time.perf_counter()
+    for text in corpus:
+        func(text)
+    elapsed = time.perf_counter() - start
+    rate = len(corpus) / elapsed if elapsed > 0 else float('inf')
+    print(f"  {label:<28} {elapsed * 1000:>9.1f}ms  {rate:>12,.0f} strings/s  "
+          f"{elapsed / len(corpus) * 1e6:>6.2f}us/string")
+    return rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description="발화 텍스트 정규화 벤치마크")
+    parser.add_argument("--count", type=int, default=100_000, help="처리할 문자열 수")
+    parser.add_argument("--unique", type=int, default=300, help="서로 다른 문자열 수")
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.count, args.unique)
+    all_unique = build_corpus(args.count, args.count, seed=7)
+
+    print(f"=== 텍스트 정규화 벤치마크 (count={args.count:,}, unique={args.unique:,}) ===\n")
+
+    _run("legacy replace chain", _legacy, corpus)
+
+    # 캐시 미스만 발생 (전부 다른 문자열)
+    clear_normalize_cache()
+    _run("normalize (all unique)", normalize_speech_text, all_unique)
+
+    # 실제 사용 패턴: 같은 항목 반복 포커스
+    clear_normalize_cache()
+    _run("normalize (repeating)", normalize_speech_text, corpus)
+
+    print(f"\n  캐시: {get_normalize_cache_stats()}")
+
+
+if __name__ == "__main__":
+    main()
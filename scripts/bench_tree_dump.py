@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""UIA 트리 덤프 벤치마크
+
+합성 UIA 트리(tests/uia_sim build_tree)로 기존 재귀 덤프(dump_tree_json + json.dumps)와
+스트리밍 덤프(캐시 1회 / live 폴백)를 비교한다.
+--call-us로 live COM 호출 1회 비용을 흉내낸다 (실제 카카오톡: 수십~수백us).
+
+사용법:
+    uv run python scripts/bench_tree_dump.py
+    uv run python scripts/bench_tree_dump.py --breadth 6 --depth 5 --call-us 50
+"""
+
+import argparse
+import io
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT))
+
+from kakaotalk_a11y_client.utils import uia_tree_dump  # noqa: E402
+from kakaotalk_a11y_client.utils.uia_tree_dump import (  # noqa: E402
+    dump_tree_json,
+    stream_tree_dump,
+)
+from tests.uia_sim import build_tree, dump_cache_request  # noqa: E402
+
+
+def _recursive(root, max_depth):
+    tree = dump_tree_json(root, max_depth=max_depth, include_coords=True)
+    return json.dumps(tree, ensure_ascii=False, indent=2)
+
+
+def _stream_cached(root, max_depth):
+    stream_tree_dump(root, io.StringIO(), max_depth=max_depth, include_coords=True,
+                     cache_request=dump_cache_request())
+
+
+def _stream_live(root, max_depth):
+    stream_tree_dump(root, io.StringIO(), max_depth=max_depth, include_coords=True)
+
+
+def _run(label: str, func, args) -> None:
+    root = build_tree(args.breadth, args.depth, args.call_us)
+    tracemalloc.start()
+    start = time.perf_counter()
+    func(root, args.depth)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    builds = root.counter.count("BuildUpdatedCache")
+    print(f"  {label:<22} {elapsed * 1000:>9.1f}ms  peak {peak / 1024:>9.1f}KB  "
+          f"live calls {root.counter.total - builds:>8,}  cache builds {builds}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="UIA 트리 덤프 벤치마크")
+    parser.add_argument("--breadth", type=int, default=5, help="노드당 자식 수")
+    parser.add_argument("--depth", type=int, default=5, help="트리 깊이")
+    parser.add_argument("--call-us", type=float, default=20.0, help="live 호출 1회 비용 (us)")
+    args = parser.parse_args()
+
+    nodes = sum(args.breadth ** d for d in range(args.depth + 1))
+    print(f"=== 트리 덤프 벤치마크 (nodes={nodes:,}, call={args.call_us:g}us) ===\n")
+
+    _run("recursive + dumps", _recursive, args)
+
+    # comtypes 없는 환경에서도 live 경로 측정
+    uia_tree_dump._get_thread_cache_request = lambda include_coords: None
+    _run("stream (live)", _stream_live, args)
+    _run("stream (cached)", _stream_cached, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""플라이트 레코더 덤프 디코더
+
+logs/flight_*.kfr 파일을 JSONL 또는 사람이 읽는 타임라인으로 변환한다.
+
+사용법:
+    python scripts/decode_flight_record.py logs/flight_error_20260301_101500.kfr
+    python scripts/decode_flight_record.py --format jsonl dump.kfr > events.jsonl
+    python scripts/decode_flight_record.py --decision pass --last 50 dump.kfr
+"""
+
+import argparse
+import json
+import sys
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from kakaotalk_a11y_client.utils.flight_recorder import decode_file  # noqa: E402
+
+
+def format_timeline(records: list[dict]) -> str:
+    """시각, 이전 레코드와 간격, 이벤트/결정, 단계 시간."""
+    lines = []
+    prev_ts = None
+    for r in records:
+        ts = r["timestamp"]
+        clock = datetime.fromtimestamp(ts).strftime("%H:%M:%S.%f")[:-3]
+        gap = f"+{(ts - prev_ts) * 1000:7.1f}ms" if prev_ts is not None else " " * 10
+        prev_ts = ts
+        timing = ""
+        if r["total_us"]:
+            timing = f"  filter={r['filter_us'] / 1000:.2f}ms total={r['total_us'] / 1000:.2f}ms"
+        lines.append(
+            f"{clock} {gap}  {r['event']:<9} {r['decision']:<11} "
+            f"{r['control_type']:<16} {r['runtime_id']:<8}{timing}".rstrip()
+        )
+    return "\n".join(lines)
+
+
+def format_summary(records: list[dict]) -> str:
+    decisions = Counter((r["event"], r["decision"]) for r in records)
+    lines = [f"records: {len(records)}"]
+    if records:
+        span = records[-1]["timestamp"] - records[0]["timestamp"]
+        lines.append(f"span: {span:.1f}s")
+    for (event, decision), count in decisions.most_common():
+        lines.append(f"  {event:<9} {decision:<11} {count}")
+    slow = sorted((r for r in records if r["total_us"]), key=lambda r: r["total_us"], reverse=True)[:5]
+    if slow:
+        lines.append("slowest:")
+        for r in slow:
+            lines.append(f"  seq={r['seq']} {r['control_type']} {r['total_us'] / 1000:.2f}ms")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="플라이트 레코더 덤프 디코더")
+    parser.add_argument("path", type=Path, help="flight_*.kfr 덤프 파일")
+    parser.add_argument("--format", choices=("timeline", "jsonl", "summary"),
+                        default="timeline", help="출력 형식 (기본: timeline)")
+    parser.add_argument("--event", help="이벤트 종류 필터 (focus, selection, structure)")
+    parser.add_argument("--decision", help="필터 결정 필터 (pass, debounce, hwnd, ...)")
+    parser.add_argument("--last", type=int, default=None, help="마지막 N개만")
+    args = parser.parse_args()
+
+    try:
+        records = list(decode_file(args.path))
+    except (OSError, ValueError) as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return 1
+
+    if args.event:
+        records = [r for r in records if r["event"] == args.event]
+    if args.decision:
+        records = [r for r in records if r["decision"] == args.decision]
+    if args.last:
+        records = records[-args.last:]
+
+    if args.format == "jsonl":
+        for r in records:
+            print(json.dumps(r, ensure_ascii=False))
+    elif args.format == "summary":
+        print(format_summary(records))
+    else:
+        print(format_timeline(records))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
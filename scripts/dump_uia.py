@@ -5,7 +5,7 @@
     uv run python scripts/dump_uia.py menu       # 메뉴 덤프 (7초 대기)
     uv run python scripts/dump_uia.py focus      # 현재 포커스 덤프
     uv run python scripts/dump_uia.py snapshot   # 현재 트리 JSON 스냅샷 저장
-    uv run python scripts/dump_uia.py compare <file1> <file2>  # 두 스냅샷 비교
+    uv run python scripts/dump_uia.py compare <file1> <file2>  # 두 스냅샷 비교 (.json/.jsonl)
 """
 import json
 import sys
@@ -17,9 +17,8 @@ import uiautomation as auto
 import pythoncom
 
 sys.path.insert(0, str(__file__).rsplit('scripts', 1)[0] + 'src')
-from kakaotalk_a11y_client.utils.uia_utils import (
-    dump_tree, dump_tree_json, compare_trees, format_tree_diff
-)
+from kakaotalk_a11y_client.utils.uia_utils import dump_tree, dump_tree_json
+from kakaotalk_a11y_client.utils.uia_tree_diff import diff_trees, format_tree_diff
 
 
 def dump_chat_list():
@@ -211,12 +210,8 @@ def compare_snapshots(file1: str, file2: str):
 
     print(f"비교: {path1.name} vs {path2.name}")
 
-    with open(path1, 'r', encoding='utf-8') as f:
-        tree1 = json.load(f)
-    with open(path2, 'r', encoding='utf-8') as f:
-        tree2 = json.load(f)
-
-    diff = compare_trees(tree1, tree2)
+    # 다른 세션 스냅샷은 RuntimeId가 달라서 경로 서명으로 매칭
+    diff = diff_trees(path1, path2, use_runtime_id=False)
     report = format_tree_diff(diff)
 
     print(report)
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""이벤트 기록 재생기
+
+--record-events로 남긴 JSONL을 헤드리스 시뮬레이터(tests/uia_sim) 위에서
+실제 FocusMonitorService/MessageMonitor 코드로 재생한다. 카카오톡 없이, 비Windows에서도 동작.
+
+속도를 여러 개 주면 차례로 재생해 비교 (지연/발화 수가 속도에 따라 어떻게 변하는지).
+
+사용법:
+    uv run kakaotalk-a11y --record-events logs/session.jsonl   # 기록
+    uv run python scripts/replay_events.py logs/session.jsonl
+    uv run python scripts/replay_events.py logs/session.jsonl --speed 1 --speed 4 --speed max
+    uv run python scripts/replay_events.py logs/session.jsonl --speed max --json logs/replay.json
+"""
+
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+
+_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(_ROOT / "src"))
+sys.path.insert(0, str(_ROOT))
+
+from tests.uia_sim import EventReplayer, install_platform_modules  # noqa: E402
+
+install_platform_modules()
+
+
+def parse_speed(value: str):
+    """'max'/'0'이면 None (지연 없이), 아니면 배속."""
+    if value.lower() in ("max", "0"):
+        return None
+    speed = float(value)
+    if speed <= 0:
+        raise argparse.ArgumentTypeError(f"invalid speed: {value}")
+    return speed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="이벤트 기록 재생기")
+    parser.add_argument("recording", type=Path, help="--record-events JSONL")
+    parser.add_argument("--speed", type=parse_speed, action="append",
+                        help="배속 (1, 4, max). 여러 번 지정 가능. 기본 1")
+    parser.add_argument("--json", type=Path, default=None, help="결과 JSON 저장 경로")
+    parser.add_argument("--utterances", type=int, default=0, help="발화 앞 N개 출력")
+    args = parser.parse_args()
+
+    try:
+        replayer = EventReplayer.from_file(args.recording)
+    except (OSError, ValueError) as e:
+        print(f"기록을 읽을 수 없음: {e}", file=sys.stderr)
+        return 1
+
+    # 프로파일러 미설정 시 경고가 lastResort로 stderr에 쏟아짐
+    logging.getLogger("uia_profiler").addHandler(logging.NullHandler())
+
+    reports = []
+    for speed in args.speed or [1.0]:
+        report = replayer.run(speed)
+        reports.append(report)
+        print(report.format())
+        for offset, text in report.utterances[:args.utterances]:
+            print(f"  {offset:8.3f}s  {text}")
+        print()
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        data = {"recording": str(args.recording), "runs": [r.to_dict() for r in reports]}
+        args.json.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"저장: {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""채팅 폭주 소크 테스트
+
+헤드리스 시뮬레이터(tests/uia_sim) 위 실제 파이프라인(폴링 스레드 포함)에 방 N개 × 분당 M개
+메시지, ChildrenBulkAdded 버스트, 포커스 이동, 컨텍스트 메뉴, 방 전환을 지정 시간 동안 가하고
+CPU/스레드/메모리(후반부 정상 상태 포함)/래퍼 보유량/큐 깊이/발화 지연을 예산과 비교한다. 카카오톡 없이, 비Windows에서도 동작.
+
+사용법:
+    uv run python scripts/soak_test.py
+    uv run python scripts/soak_test.py --duration 600 --rooms 20 --rate 60
+    uv run python scripts/soak_test.py --duration 60 --burst-every 2 --burst-size 100 --json logs/soak.json
+    uv run python scripts/soak_test.py --budget latency_p95_ms=500 --budget thread_starts_per_sec=none
+
+종료 코드: 0 통과, 2 예산 초과 (python -m benchmarks와 같음)
+"""
+
+import argparse
+import json
+import logging
+import sys
+from dataclasses import fields
+from pathlib import Path
+
+_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(_ROOT / "src"))
+sys.path.insert(0, str(_ROOT))
+
+from tests.uia_sim import install_platform_modules  # noqa: E402
+
+install_platform_modules()
+
+from tests.uia_sim.load import LoadBudget, LoadProfile, run_soak  # noqa: E402
+
+
+def parse_budget(items: list[str]) -> LoadBudget:
+    """NAME=VALUE 목록 → LoadBudget. VALUE가 none이면 검사 끔."""
+    budget = LoadBudget()
+    names = {f.name for f in fields(LoadBudget)}
+    for item in items:
+        name, _, value = item.partition("=")
+        if name not in names or not value:
+            raise SystemExit(f"잘못된 예산: {item!r} (가능: {', '.join(sorted(names))})")
+        setattr(budget, name, None if value.lower() == "none" else float(value))
+    return budget
+
+
+def main():
+    defaults = LoadProfile()
+    parser = argparse.ArgumentParser(description="채팅 폭주 소크 테스트")
+    parser.add_argument("--duration", type=float, default=defaults.duration, help="부하 시간 (초)")
+    parser.add_argument("--rooms", type=int, default=defaults.rooms, help="채팅방 수")
+    parser.add_argument("--rate", type=float, default=defaults.messages_per_min, help="방당 분당 메시지")
+    parser.add_argument("--burst-every", type=float, default=defaults.burst_every,
+                        help="ChildrenBulkAdded 버스트 주기 (초, 0이면 없음)")
+    parser.add_argument("--burst-size", type=int, default=defaults.burst_size, help="버스트 메시지 수")
+    parser.add_argument("--focus-rate", type=float, default=defaults.focus_per_sec, help="초당 포커스 이동")
+    parser.add_argument("--menu-every", type=float, default=defaults.menu_every,
+                        help="컨텍스트 메뉴 주기 (초, 0이면 없음)")
+    parser.add_argument("--switch-every", type=float, default=defaults.switch_every,
+                        help="활성 방 전환 주기 (초, 0이면 없음)")
+    parser.add_argument("--no-trace-memory", action="store_true",
+                        help="tracemalloc 끔 (CPU 수치 정확, 메모리 검사 생략)")
+    parser.add_argument("--no-track-wrappers", action="store_true",
+                        help="owner별 UIA 래퍼 보유량 추적 끔 (wrapper_suspects 검사 생략)")
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--budget", action="append", default=[], metavar="NAME=VALUE",
+                        help="예산 덮어쓰기 (여러 번 지정 가능, none이면 검사 끔)")
+    parser.add_argument("--json", type=Path, default=None, help="결과 JSON 저장 경로 (샘플 포함)")
+    args = parser.parse_args()
+
+    profile = LoadProfile(
+        duration=args.duration,
+        rooms=args.rooms,
+        messages_per_min=args.rate,
+        burst_every=args.burst_every,
+        burst_size=args.burst_size,
+        focus_per_sec=args.focus_rate,
+        menu_every=args.menu_every,
+        switch_every=args.switch_every,
+        trace_memory=not args.no_trace_memory,
+        track_wrappers=not args.no_track_wrappers,
+        seed=args.seed,
+    )
+    budget = parse_budget(args.budget)
+
+    # 프로파일러 미설정 시 경고가 lastResort로 stderr에 쏟아짐
+    logging.getLogger("uia_profiler").addHandler(logging.NullHandler())
+
+    print(f"소크 시작: {profile.duration:g}초, 방 {profile.rooms}개 × 분당 {profile.messages_per_min:g}개")
+    report = run_soak(profile, budget)
+    print(report.format())
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps(report.to_dict(), ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"\n저장: {args.json}")
+    return 0 if report.passed else 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
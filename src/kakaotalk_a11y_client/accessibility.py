@@ -1,10 +1,26 @@
 # SPDX-License-Identifier: MIT
 # Copyright 2025-2026 dnz3d4c
-"""접근성 출력 모듈 (accessible_output2)
+"""접근성 출력 모듈 (출력 백엔드 + 점자 채널)
 
-음성과 점자 모두 출력. NVDA → SAPI5 자동 fallback.
+음성과 점자 모두 출력. 기본 백엔드는 accessible_output2 (NVDA → SAPI5 자동 fallback).
+백엔드는 첫 출력 시 음성 워커 스레드에서 생성 (import만으로 스크린 리더 바인딩 안 만듦).
+음성은 음성 워커에서 순서대로, 점자는 별도 채널(워커 스레드)에서 최신 것만, 최소 간격 두고 출력.
 """
 
+import queue
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+
+from .config import (
+    BRAILLE_MIN_INTERVAL_SECS,
+    OUTPUT_BACKEND_CREATE_TIMEOUT_SECS,
+    OUTPUT_BACKEND_DEFAULT,
+)
+
+if TYPE_CHECKING:
+    from .output import OutputBackend
+
 # 로거는 지연 초기화 (순환 import 방지)
 _log = None
 
@@ -17,39 +33,320 @@ def _get_logger():
         _log = get_logger("Speech")
     return _log
 
-# accessible_output2 (NVDA/JAWS/SAPI5 등)
-_ao2_output = None
-try:
-    from accessible_output2.outputs.auto import Auto
 
-    _ao2_output = Auto()
-except ImportError:
-    pass
+class BrailleChannel:
+    """점자 전용 출력 채널. latest-wins + 최소 갱신 간격 (trailing edge).
+
+    submit()은 대기 텍스트만 바꾸고 즉시 반환 (음성 경로 블로킹 없음).
+    워커는 연속 출력의 첫 submit부터 min_interval을 기다린 뒤 마지막 텍스트만 기록.
+    덮어쓴 건 suppressed. stop() 후 submit은 무시 (start()로만 재시작).
+    """
+
+    def __init__(
+        self,
+        writer: Callable[[str], None],
+        min_interval: float = BRAILLE_MIN_INTERVAL_SECS,
+    ):
+        self._writer = writer
+        self._min_interval = min_interval
+        self._pending: Optional[str] = None
+        self._pending_since = 0.0  # 대기 텍스트가 처음 생긴 시각 (연속 출력 시작)
+        self._condition = threading.Condition()
+        self._last_write = 0.0
+        self._running = False
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+
+        self.submitted = 0
+        self.written = 0
+        self.suppressed = 0
+        self.errors = 0
+
+    def submit(self, text: str) -> None:
+        with self._condition:
+            if self._stopped:
+                return
+            if self._pending is not None:
+                self.suppressed += 1
+            else:
+                self._pending_since = time.monotonic()
+            self._pending = text
+            self.submitted += 1
+            if not self._running:
+                self._start_locked()
+            self._condition.notify()
+
+    def start(self) -> None:
+        """stop() 후 재시작."""
+        with self._condition:
+            self._stopped = False
+            if not self._running:
+                self._start_locked()
+
+    def _start_locked(self) -> None:
+        """첫 submit 시 워커 시작 (점자 안 쓰면 스레드도 안 만듦)."""
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._write_loop,
+            daemon=True,
+            name="BrailleChannel"
+        )
+        self._thread.start()
+
+    def _write_loop(self) -> None:
+        # 백엔드 braille()이 COM(NVDA 컨트롤러/SAPI) 호출. 지연 import (순환 import 방지)
+        from .utils.com_utils import com_thread
+        with com_thread():
+            self._drain()
+
+    def _drain(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._pending is not None or not self._running
+                )
+                # 연속 출력 시작(또는 마지막 기록)부터 최소 간격 대기.
+                # 그 사이 들어온 submit은 _pending을 덮어씀 → 마지막 것만 기록
+                deadline = max(self._pending_since, self._last_write) + self._min_interval
+                delay = deadline - time.monotonic()
+                while delay > 0 and self._running:
+                    self._condition.wait(delay)
+                    delay = deadline - time.monotonic()
+                if not self._running:
+                    return
+                text = self._pending
+                self._pending = None
+
+            # 락 해제 후 기록 (braille()이 느려도 submit 안 막힘)
+            try:
+                self._writer(text)
+                ok = True
+            except Exception as e:
+                ok = False
+                _get_logger().trace(f"braille write failed: {e}")
+            with self._condition:
+                if ok:
+                    self.written += 1
+                else:
+                    self.errors += 1
+                self._last_write = time.monotonic()
+
+    def stop(self) -> None:
+        with self._condition:
+            self._running = False
+            self._stopped = True
+            self._pending = None
+            self._condition.notify()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=0.5)
+        self._thread = None
+
+    def get_stats(self) -> dict:
+        with self._condition:
+            return {
+                "submitted": self.submitted,
+                "written": self.written,
+                "suppressed": self.suppressed,
+                "errors": self.errors,
+                "pending": self._pending is not None,
+            }
+
+
+class SpeechWorker:
+    """음성 출력 워커. 백엔드 생성과 speak() 호출을 COM 초기화된 한 스레드에서 실행.
+
+    SAPI5/JAWS 바인딩은 COM 객체라 만든 스레드(아파트)에서 불러야 함.
+    speak()를 부르는 스레드(포커스 이벤트, 핫키, GUI)가 제각각이라 여기로 모음.
+    작업은 FIFO, 첫 submit 시 스레드 시작 (출력 안 하면 스레드도 안 만듦).
+    """
+
+    def __init__(self):
+        self._queue: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, job: Callable[[], None]) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    daemon=True,
+                    name="SpeechWorker"
+                )
+                self._thread.start()
+        self._queue.put(job)
+
+    def call(self, func: Callable[[], Any], timeout: float) -> Any:
+        """func를 워커에서 실행하고 결과 반환. 시간 초과면 TimeoutError, 예외는 그대로 전달."""
+        if threading.current_thread() is self._thread:
+            return func()
+        done = threading.Event()
+        result: dict = {}
+
+        def job():
+            try:
+                result["value"] = func()
+            except Exception as e:
+                result["error"] = e
+            finally:
+                done.set()
+
+        self.submit(job)
+        if not done.wait(timeout):
+            raise TimeoutError(f"speech worker busy for {timeout}s")
+        if "error" in result:
+            raise result["error"]
+        return result["value"]
+
+    def _run(self) -> None:
+        # 지연 import (순환 import 방지)
+        from .utils.com_utils import com_thread
+        with com_thread():
+            while True:
+                job = self._queue.get()
+                try:
+                    job()
+                except Exception as e:
+                    _get_logger().trace(f"speech job failed: {e}")
+                finally:
+                    self._queue.task_done()
+
+    def wait_idle(self, timeout: float = 5.0) -> bool:
+        """넣은 작업이 모두 끝날 때까지 대기. 테스트/백엔드 교체용."""
+        if threading.current_thread() is self._thread:
+            return not self._queue.unfinished_tasks
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if not self._queue.unfinished_tasks:
+                return True
+            time.sleep(0.005)
+        return False
+
+
+_speech_worker = SpeechWorker()
+
+# 출력 백엔드 (지연 생성)
+_backend_name = OUTPUT_BACKEND_DEFAULT
+_backend_options: dict = {}
+_backend: Optional["OutputBackend"] = None
+_backend_failed = False  # 생성 실패 시 매 발화마다 재시도하지 않음
+_braille_channel: Optional[BrailleChannel] = None
+_backend_lock = threading.Lock()
+
+
+def _install_backend(backend: Optional["OutputBackend"]) -> None:
+    """백엔드 + 점자 채널 교체. _backend_lock 보유 상태에서 호출."""
+    global _backend, _braille_channel
+
+    if _braille_channel is not None:
+        _braille_channel.stop()
+        _braille_channel = None
+    if _backend is not None:
+        try:
+            _backend.close()
+        except Exception as e:
+            _get_logger().trace(f"output backend close failed: {e}")
+
+    _backend = backend
+    if backend is not None and backend.has_braille:
+        _braille_channel = BrailleChannel(backend.braille)
+
+
+def get_output_backend() -> Optional["OutputBackend"]:
+    """현재 출력 백엔드. 처음 호출 시 음성 워커에서 생성, 실패하면 None (로그 폴백)."""
+    global _backend_failed
+
+    if _backend is not None or _backend_failed:
+        return _backend
+
+    with _backend_lock:
+        if _backend is None and not _backend_failed:
+            from .output import create_backend
+            name, options = _backend_name, _backend_options
+            try:
+                backend = _speech_worker.call(
+                    lambda: create_backend(name, **options),
+                    OUTPUT_BACKEND_CREATE_TIMEOUT_SECS,
+                )
+            except TimeoutError as e:
+                # 실패로 확정하지 않음 (다음 발화에서 다시 확인)
+                _get_logger().warning(f"output backend '{name}' not ready: {e}")
+                return None
+            except Exception as e:
+                _backend_failed = True
+                _get_logger().warning(f"output backend '{name}' unavailable: {e}")
+                return None
+            _install_backend(backend)
+            _get_logger().debug(f"output backend: {name}")
+    return _backend
+
+
+def set_output_backend(
+    backend: Union[str, "OutputBackend"], **options
+) -> None:
+    """출력 백엔드 선택. 이름이면 다음 출력 시 지연 생성, 인스턴스면 즉시 교체.
+
+    이미 넣은 발화는 이전 백엔드로 마저 출력한 뒤 교체.
+    """
+    global _backend_name, _backend_options, _backend_failed
+
+    _speech_worker.wait_idle()
+    with _backend_lock:
+        _backend_failed = False
+        if isinstance(backend, str):
+            _backend_name = backend
+            _backend_options = options
+            _install_backend(None)
+        else:
+            _backend_name = backend.name
+            _backend_options = {}
+            _install_backend(backend)
+
+
+def get_braille_stats() -> dict:
+    """점자 채널 카운터 (submitted/written/suppressed/errors)."""
+    if _braille_channel is None:
+        return {}
+    return _braille_channel.get_stats()
+
+
+def wait_speech_idle(timeout: float = 5.0) -> bool:
+    """음성 워커에 넣은 발화가 모두 출력될 때까지 대기. 테스트/시뮬레이터용."""
+    return _speech_worker.wait_idle(timeout)
 
 
 def speak(text: str, interrupt: bool = False) -> bool:
-    """음성+점자 출력. interrupt=True면 음성만 (이전 발화 중단)."""
+    """음성+점자 출력 (음성 워커에 넣고 바로 반환). interrupt=True면 음성만 (이전 발화 중단).
+
+    백엔드가 없으면 로그 폴백 후 False.
+    """
     _get_logger().debug(f"text={text!r}, interrupt={interrupt}")
-    if _ao2_output is not None:
-        try:
-            if interrupt:
-                # 이전 발화 중단 필요 시 음성만
-                _ao2_output.speak(text, interrupt=True)
-                _get_logger().trace(f"speech only (interrupt): {text!r}")
-            else:
-                # 일반 출력: 음성 + 점자
-                # Note: Auto.output()은 braille()를 호출하지 않는 라이브러리 버그가 있어
-                # speak()와 braille()를 명시적으로 분리 호출
-                _ao2_output.speak(text)
-                _ao2_output.braille(text)
-                _get_logger().trace(f"speech + braille: {text!r}")
-            return True
-        except Exception:
-            pass
-
-    # fallback: 로그 출력 (스크린 리더 없음)
-    _get_logger().warning(f"TTS fallback (no screen reader): {text}")
-    return False
+    backend = get_output_backend()
+    if backend is None:
+        # fallback: 로그 출력 (스크린 리더 없음)
+        _get_logger().warning(f"TTS fallback (no screen reader): {text}")
+        return False
+
+    _speech_worker.submit(lambda: _speak_now(backend, text, interrupt))
+    return True
+
+
+def _speak_now(backend: "OutputBackend", text: str, interrupt: bool) -> None:
+    """음성 워커에서 실행. 실패하면 로그 폴백."""
+    try:
+        if interrupt:
+            # 이전 발화 중단 필요 시 음성만
+            backend.speak(text, interrupt=True)
+            _get_logger().trace(f"speech only (interrupt): {text!r}")
+        else:
+            # 일반 출력: 음성 + 점자 (점자는 별도 채널, 연속 출력 시 마지막 것만)
+            backend.speak(text)
+            channel = _braille_channel
+            if channel is not None:
+                channel.submit(text)
+            _get_logger().trace(f"speech + braille: {text!r}")
+    except Exception as e:
+        _get_logger().warning(f"TTS fallback (speak failed: {e}): {text}")
 
 
 def announce_scan_start() -> None:
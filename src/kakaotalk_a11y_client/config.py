@@ -107,6 +107,32 @@ TIMING_EVENT_PUMP_INTERVAL = 0.05         # 이벤트 펌프 폴링 간격
 TIMING_FOCUS_DEBOUNCE_SECS = 0.03        # FocusChanged 디바운싱 (30ms)
 TIMING_COALESCER_FLUSH_SECS = 0.02       # EventCoalescer 배치 간격 (20ms)
 
+# =============================================================================
+# 음성/점자 출력 설정
+# =============================================================================
+
+SPEECH_NORMALIZE_CACHE_SIZE = 512         # 정규화 결과 메모 캐시 크기
+BRAILLE_MIN_INTERVAL_SECS = 0.15          # 점자 디스플레이 최소 갱신 간격 (연속 출력 시 마지막 것만)
+OUTPUT_BACKEND_DEFAULT = "ao2"            # 출력 백엔드 (ao2, sapi, null, recording, jsonl)
+OUTPUT_BACKEND_CREATE_TIMEOUT_SECS = 5.0  # 음성 워커의 백엔드 생성 대기 (초과 시 이번 발화는 로그 폴백)
+OUTPUT_RECORDING_MAX_SIZE = 10000         # recording 백엔드 링 버퍼 크기
+
+# 카카오톡 텍스트 이모티콘 토큰 → 읽기용 표현
+SPEECH_TOKEN_EXPANSIONS = {
+    "(이모티콘)": "이모티콘",
+    "(하트)": "하트 이모티콘",
+    "(웃음)": "웃음 이모티콘",
+    "(굿)": "굿 이모티콘",
+    "(최고)": "최고 이모티콘",
+    "(축하)": "축하 이모티콘",
+    "(박수)": "박수 이모티콘",
+    "(눈물)": "눈물 이모티콘",
+    "(윙크)": "윙크 이모티콘",
+    "(부끄)": "부끄 이모티콘",
+    "(놀람)": "놀람 이모티콘",
+    "(감동)": "감동 이모티콘",
+}
+
 # =============================================================================
 # 캐시 설정
 # =============================================================================
@@ -115,15 +141,82 @@ CACHE_MESSAGE_LIST_TTL = 1.0              # 메시지 목록 캐시 TTL
 CACHE_HWND_CLASS_MAX_SIZE = 200           # hwnd→클래스 캐시 최대 크기
 CACHE_HWND_CLASS_EVICT_COUNT = 100        # 캐시 초과 시 제거할 항목 수
 
+# =============================================================================
+# 로깅 설정
+# =============================================================================
+
+LOG_FLUSH_INTERVAL_SECS = 0.1             # 로그 writer flush 주기
+LOG_FLUSH_BATCH_LINES = 256               # 이만큼 쌓이면 주기 전에 flush
+LOG_QUEUE_MAX_LINES = 20000               # 큐 상한. 초과분은 버리고 카운트 (호출 스레드 블로킹 없음)
+LOG_FILE_MAX_BYTES = 1_048_576            # debug.log 회전 크기 (1MB)
+LOG_FILE_BACKUP_COUNT = 3                 # debug.log, .1, .2, .3 (최대 4MB)
+
 # =============================================================================
 # 성능 프로파일러 설정
 # =============================================================================
 
 PERF_SLOW_THRESHOLD_MS = 100              # 느린 작업 경고 임계값 (ms)
 PERF_COMPARISON_THRESHOLD_PCT = 20.0      # 성능 비교 임계값 (%)
+PERF_RECENT_SAMPLES = 100                 # 작업별 최근 측정값 보관 수
+PERF_HISTOGRAM_SUB_BUCKETS = 16           # 2배 구간당 버킷 수 (상대 오차 약 3%)
+PERF_LOCK_STRIPES = 16                    # 기록 락 분할 수 (스레드 간 경합 완화)
+
+# 샘플링 프로파일러 (디버그 profile 단축키로 켜고 끔)
+SAMPLING_PROFILER_RATE_HZ = 100           # 초당 스택 샘플 수
+SAMPLING_PROFILER_MAX_DEPTH = 64          # 스택 최대 깊이 (안쪽 프레임부터)
+
+# 포커스→발화 지연 추적 (릴리즈 빌드에서도 켜둠, 드문 샘플링)
+LATENCY_TRACE_SAMPLE_EVERY = 64           # N번째 이벤트마다 추적 (0이면 끔, 1이면 전부)
+LATENCY_HISTOGRAM_BOUNDS_MS = (           # 히스토그램 버킷 상한 (ms)
+    0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000,
+)
+
+# 플라이트 레코더 (UIA 이벤트/필터 결정 링 버퍼, 항상 켜짐)
+FLIGHT_RECORDER_CAPACITY = 4096           # 레코드 수 (24바이트씩, 약 96KB)
+FLIGHT_RECORDER_SLOW_MS = 500             # 이벤트 처리 이 시간 초과 시 자동 덤프
+FLIGHT_RECORDER_DUMP_COOLDOWN_SECS = 60.0 # 같은 사유 덤프 최소 간격
+
+# 메트릭 엔드포인트 (--metrics-port로 켬, 기본 꺼짐)
+METRICS_HOST = "127.0.0.1"                # 로컬 전용 (외부 바인드 거부)
+METRICS_PREFIX = "kakaotalk_a11y"         # 메트릭 이름 접두사
+
+# UIA 래퍼 보유량/메모리 추적 (--track-wrappers로 켬, 기본 꺼짐)
+WRAPPER_TRACK_INTERVAL_SECS = 30.0        # 샘플 주기
+WRAPPER_LEAK_WINDOW = 10                  # 누수 판정에 쓰는 최근 샘플 수
+WRAPPER_LEAK_MIN_GROWTH = 50              # 창 안에서 줄지 않고 이만큼 늘면 누수 의심
+WRAPPER_TRACEMALLOC_FRAMES = 1            # tracemalloc 스택 깊이 (직접 켤 때)
+WRAPPER_TRACEMALLOC_TOP = 10              # 스냅샷 비교 증가 상위 항목 수
 
 # =============================================================================
 # OpenCV 설정
 # =============================================================================
 
 CV_NMS_THRESHOLD = 0.3                    # Non-Maximum Suppression 임계값
+CV_PREPROCESS_MODE = "gray"               # 전체 화면 탐색 전처리: gray, edge (Canny)
+CV_EDGE_THRESHOLDS = (50, 150)            # edge 모드 Canny 임계값
+CV_PREFILTER_MARGIN = 0.1                 # 전처리본 후보 임계값 = MATCH_THRESHOLD - 이 값
+CV_PEAK_RADIUS_RATIO = 0.5                # 국소 최대 탐색 반경 (템플릿 짧은 변 대비)
+CV_VERIFY_RADIUS = 2                      # 컬러 검증 시 후보 주변 탐색 (px)
+DEFAULT_DPI = 96                          # 템플릿을 크롭한 배율 (100%) 기준 DPI
+CV_TEMPLATE_SCALES = (1.0, 1.25, 1.5, 1.75, 2.0)  # 템플릿 피라미드 배율 (Windows 배율 설정)
+CV_SCALE_CACHE_MAX_WINDOWS = 32           # 창별 마지막 매칭 배율 기억 개수
+CV_SCALE_MAX_MISSES = 4                   # 기억된 배율만 시도해 연속 빈 결과 이 횟수면 잊고 전 배율 재탐색 (ROI + 창 전체 폴백 = 스캔당 2회)
+CV_SCALE_EMPTY_COOLDOWN_SECS = 30.0       # 전 배율 시도가 비면 이 시간 동안 같은 창/DPI는 DPI 배율만 시도
+CV_TILE_CACHE_ENABLED = False             # 같은 화면 재스캔 시 타일 후보 재사용. 첫 스캔은 더 느리고 스크롤하면 전부 무효 (선택)
+CV_TILE_SIZE = 256                        # 타일 캐시 격자 (px). ROI처럼 작은 영역은 타일 1개
+CV_TILE_HASH_STRIDE = 2                   # 타일 해시 샘플링 간격 (1이면 모든 픽셀)
+CV_TILE_CACHE_MAX = 2048                  # 타일 캐시 최대 항목 (LRU)
+CV_SCALE_ACCEPT_CONFIDENCE = 0.93         # 평균 신뢰도가 이 이상이면 그 배율로 확정 (이웃 배율도 0.8~0.9로 일부 걸림)
+CV_DETECT_WORKERS = 0                     # 병렬 매칭 스레드 수. 0이면 CPU 수 (최대 CV_DETECT_MAX_AUTO_WORKERS), 1이면 직렬
+CV_DETECT_MAX_AUTO_WORKERS = 4            # 자동 결정 시 상한 (UIA/TTS 스레드 몫 남김)
+
+# =============================================================================
+# 이모지 스캔 영역
+# =============================================================================
+
+SCAN_MODE = "full"                        # full: 창 전체, focused: 포커스 말풍선 주변, visible: + 주변 말풍선
+SCAN_ROI_PAD_X = 48                       # 말풍선 좌우 확장 (px, 공감 이모지가 옆에 붙음)
+SCAN_ROI_PAD_Y = 40                       # 말풍선 위아래 확장 (px, 아래에 붙는 공감 줄 포함)
+SCAN_ROI_MAX_BUBBLES = 8                  # visible 모드에서 포커스 앞뒤로 볼 말풍선 수
+SCAN_ROI_MIN_SIZE = 16                    # 창에 잘린 ROI가 이보다 작으면 버림 (px)
+SCAN_ROI_FALLBACK_ON_EMPTY = True         # ROI에서 못 찾으면 창 전체 재스캔
@@ -0,0 +1,134 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025-2026 dnz3d4c
+"""이모지 탐지 병렬 실행 + 취소
+
+cv2.matchTemplate는 GIL을 놓으므로 템플릿(창 전체)이나 바뀐 타일(타일 캐시) 단위로 스레드 풀에서
+동시에 매칭한다. 결과는 제출 순서대로 모아 NMS 입력 순서가 항상 같음 (워커 수와 무관하게 결정적).
+
+스캔 1회 = DetectJob. 새 스캔이 시작되거나 ESC가 오면 진행 중 job 취소 → 대기 중 작업은 실행 안 하고
+ScanCancelled. 이미 돌고 있는 matchTemplate 1회는 끝까지 감.
+
+풀을 쓰면 OpenCV 내부 스레드는 1개로 (워커 수 × cv2 스레드 수만큼 코어 과다 구독 방지).
+"""
+
+import os
+import threading
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from typing import Callable, Optional, Sequence, TypeVar
+
+import cv2
+
+from .config import CV_DETECT_MAX_AUTO_WORKERS, CV_DETECT_WORKERS
+from .utils.debug import get_logger
+
+log = get_logger("DetectEngine")
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class ScanCancelled(Exception):
+    """새 스캔 또는 ESC로 취소된 스캔."""
+
+
+def resolve_workers(workers: int = CV_DETECT_WORKERS) -> int:
+    """0이면 CPU 수 (최대 CV_DETECT_MAX_AUTO_WORKERS)."""
+    if workers > 0:
+        return workers
+    return max(1, min(os.cpu_count() or 1, CV_DETECT_MAX_AUTO_WORKERS))
+
+
+class DetectJob:
+    """스캔 1회의 작업 단위 실행기 + 취소 플래그. detector 함수에 job=으로 전달."""
+
+    def __init__(self, pool: Optional[ThreadPoolExecutor] = None):
+        self._pool = pool
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    def check(self) -> None:
+        """취소됐으면 ScanCancelled."""
+        if self._cancelled.is_set():
+            raise ScanCancelled()
+
+    def _run(self, func: Callable[[T], R], item: T) -> R:
+        self.check()
+        return func(item)
+
+    def map(self, func: Callable[[T], R], items: Sequence[T]) -> list[R]:
+        """items 순서대로 결과. 풀 없거나 1개면 호출 스레드에서 직접."""
+        self.check()
+        if self._pool is None or len(items) <= 1:
+            return [self._run(func, item) for item in items]
+        futures = [self._pool.submit(self._run, func, item) for item in items]
+        try:
+            return [future.result() for future in futures]
+        except (ScanCancelled, CancelledError):
+            # 종료(shutdown) 중 풀이 대기 작업을 버린 경우도 취소로 취급
+            for future in futures:
+                future.cancel()
+            raise ScanCancelled() from None
+
+
+class DetectionEngine:
+    """스레드 풀 + 진행 중 job 관리 (새 스캔이 이전 스캔 취소)."""
+
+    def __init__(self, workers: int = CV_DETECT_WORKERS):
+        self.workers = resolve_workers(workers)
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._active: Optional[DetectJob] = None
+        self._lock = threading.Lock()
+
+    def _get_pool(self) -> Optional[ThreadPoolExecutor]:
+        if self.workers <= 1:
+            return None
+        if self._pool is None:
+            # 프로세스 전역 설정. 병렬화는 풀이 담당
+            cv2.setNumThreads(1)
+            self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="emoji-detect")
+        return self._pool
+
+    def start_job(self) -> DetectJob:
+        """새 스캔 job. 진행 중 job은 취소."""
+        with self._lock:
+            if self._active is not None:
+                self._active.cancel()
+                log.debug("previous scan cancelled by new scan")
+            self._active = DetectJob(self._get_pool())
+            return self._active
+
+    def finish_job(self, job: DetectJob) -> None:
+        with self._lock:
+            if self._active is job:
+                self._active = None
+
+    def cancel(self) -> bool:
+        """진행 중 job 취소. 있었으면 True."""
+        with self._lock:
+            job, self._active = self._active, None
+        if job is None:
+            return False
+        job.cancel()
+        return True
+
+    @property
+    def busy(self) -> bool:
+        with self._lock:
+            return self._active is not None
+
+    def shutdown(self) -> None:
+        self.cancel()
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+# 이모지 스캔 공용 (main.on_scan / on_cancel)
+detect_engine = DetectionEngine()
@@ -1,14 +1,52 @@
 # SPDX-License-Identifier: MIT
 # Copyright 2025-2026 dnz3d4c
-"""이모지 탐지 모듈 (OpenCV 템플릿 매칭)"""
+"""이모지 탐지 모듈 (OpenCV 템플릿 매칭)
+
+1. 전체 화면은 전처리본(그레이, 선택적으로 에지)으로 1회 변환 후 템플릿별 matchTemplate
+2. 결과 맵에서 dilate 비교로 국소 최대만 후보 (임계값 - CV_PREFILTER_MARGIN 이상)
+3. 후보 주변 작은 패치만 컬러(BGR)로 다시 매칭해 신뢰도 확정 (그레이에선 하트/체크/엄지가
+   서로 0.85 안팎으로 비슷해서 컬러 검증 없이는 오탐)
+4. 모든 템플릿 결과를 합쳐 NumPy NMS 1회
+
+job (detect_engine.DetectJob)을 넘기면 템플릿/타일 단위 매칭을 스레드 풀에서 병렬 실행.
+결과는 템플릿 순서대로 합치므로 직렬과 같음. 배율 사이/작업 단위마다 취소 확인 (ScanCancelled).
+
+템플릿은 TemplateSet으로 전처리해 메모리에 둠 (prepare_templates / default_templates).
+배율(DPI)별 TemplateSet은 TemplatePyramid. 창 DPI에 가까운 배율부터, 창마다 마지막에 맞은 배율 우선.
+"""
+
+import itertools
+import threading
+import time
+from dataclasses import dataclass
+from typing import Iterator, Optional, Union
 
 import cv2
 import numpy as np
 import pyautogui
-from pathlib import Path
-from typing import Optional
 
-from .config import TEMPLATE_DIR, EMOJIS, MATCH_THRESHOLD, CV_NMS_THRESHOLD
+from .config import (
+    CV_EDGE_THRESHOLDS,
+    CV_NMS_THRESHOLD,
+    CV_PEAK_RADIUS_RATIO,
+    CV_PREFILTER_MARGIN,
+    CV_PREPROCESS_MODE,
+    CV_SCALE_ACCEPT_CONFIDENCE,
+    CV_SCALE_CACHE_MAX_WINDOWS,
+    CV_SCALE_EMPTY_COOLDOWN_SECS,
+    CV_SCALE_MAX_MISSES,
+    CV_TEMPLATE_SCALES,
+    CV_VERIFY_RADIUS,
+    DEFAULT_DPI,
+    EMOJIS,
+    MATCH_THRESHOLD,
+    TEMPLATE_DIR,
+)
+from .utils.debug import get_logger
+
+log = get_logger("Detector")
+
+PREPROCESS_MODES = ("gray", "edge")
 
 
 def capture_region(region: tuple[int, int, int, int]) -> np.ndarray:
@@ -41,65 +79,439 @@ def load_templates() -> dict[int, tuple[str, np.ndarray]]:
     return templates
 
 
-def detect_emojis(
-    image: np.ndarray,
-    templates: Optional[dict] = None,
-    threshold: float = MATCH_THRESHOLD,
-) -> list[dict]:
-    """템플릿 매칭 + NMS. 결과는 x좌표순 정렬."""
+# =============================================================================
+# 전처리 템플릿
+# =============================================================================
+
+
+def preprocess(image: np.ndarray, mode: str = CV_PREPROCESS_MODE) -> np.ndarray:
+    """BGR → 탐색용 단일 채널 (gray 또는 Canny edge)."""
+    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+    if mode == "edge":
+        low, high = CV_EDGE_THRESHOLDS
+        return cv2.Canny(gray, low, high)
+    return gray
+
+
+@dataclass(frozen=True)
+class PreparedTemplate:
+    emoji_id: int
+    name: str
+    color: np.ndarray   # BGR 원본 (후보 검증)
+    search: np.ndarray  # 전처리본 (전체 화면 탐색)
+
+    @property
+    def width(self) -> int:
+        return self.color.shape[1]
+
+    @property
+    def height(self) -> int:
+        return self.color.shape[0]
+
+
+class TemplateSet:
+    """전처리된 템플릿 묶음. 한 번 만들어 재사용 (스캔마다 디스크/변환 없음).
+
+    key: 생성 순 고유 번호 (id()와 달리 재사용 안 됨, 타일 캐시 키용).
+    """
+
+    _keys = itertools.count(1)
+
+    def __init__(self, templates: dict[int, tuple[str, np.ndarray]],
+                 mode: str = CV_PREPROCESS_MODE):
+        if mode not in PREPROCESS_MODES:
+            raise ValueError(f"unknown preprocess mode: {mode}")
+        self.key = next(TemplateSet._keys)
+        self.mode = mode
+        self.items = [
+            PreparedTemplate(emoji_id, name, template, preprocess(template, mode))
+            for emoji_id, (name, template) in templates.items()
+        ]
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self) -> Iterator[PreparedTemplate]:
+        return iter(self.items)
+
+    @property
+    def max_size(self) -> int:
+        """가장 큰 템플릿 변 길이 (타일 겹침 계산용)."""
+        return max((max(t.width, t.height) for t in self.items), default=0)
+
+
+TemplatesArg = Union[TemplateSet, dict, None]
+
+_default_templates: Optional[TemplateSet] = None
+_default_lock = threading.Lock()
+
+
+def prepare_templates(templates: Optional[dict] = None,
+                      mode: str = CV_PREPROCESS_MODE) -> TemplateSet:
+    """load_templates() 형식 dict → TemplateSet. None이면 디스크에서 로드."""
+    return TemplateSet(load_templates() if templates is None else templates, mode)
+
+
+def default_templates() -> TemplateSet:
+    """TEMPLATE_DIR 템플릿 (최초 1회 로드 후 메모리 상주)."""
+    global _default_templates
+    with _default_lock:
+        if _default_templates is None:
+            _default_templates = prepare_templates()
+        return _default_templates
+
+
+def _as_template_set(templates: TemplatesArg) -> TemplateSet:
     if templates is None:
-        templates = load_templates()
+        return default_templates()
+    if isinstance(templates, TemplateSet):
+        return templates
+    return TemplateSet(templates)
 
-    results = []
 
-    for emoji_id, (name, template) in templates.items():
-        # 템플릿 매칭
-        match_result = cv2.matchTemplate(image, template, cv2.TM_CCOEFF_NORMED)
+# =============================================================================
+# 배율별 템플릿 (DPI)
+# =============================================================================
 
-        # 임계값 이상인 위치 찾기
-        locations = np.where(match_result >= threshold)
 
-        # 중복 제거를 위한 NMS (Non-Maximum Suppression) 적용
+def scale_templates(templates: dict[int, tuple[str, np.ndarray]],
+                    scale: float) -> dict[int, tuple[str, np.ndarray]]:
+    """load_templates() 형식 dict를 scale배 리사이즈. 축소는 INTER_AREA, 확대는 INTER_CUBIC."""
+    if scale == 1.0:
+        return dict(templates)
+    interpolation = cv2.INTER_AREA if scale < 1.0 else cv2.INTER_CUBIC
+    scaled = {}
+    for emoji_id, (name, template) in templates.items():
         h, w = template.shape[:2]
-        boxes = []
-        confidences = []
-
-        for pt in zip(*locations[::-1]):  # (x, y) 형태로 변환
-            confidence = match_result[pt[1], pt[0]]
-            boxes.append([pt[0], pt[1], pt[0] + w, pt[1] + h])
-            confidences.append(float(confidence))
-
-        # NMS로 중복 제거
-        if boxes:
-            indices = cv2.dnn.NMSBoxes(
-                boxes, confidences, threshold, nms_threshold=CV_NMS_THRESHOLD
-            )
-
-            # OpenCV 버전에 따라 indices 형식이 다름
-            if len(indices) > 0:
-                indices = indices.flatten() if hasattr(indices, 'flatten') else indices
-
-            for idx in indices:
-                box = boxes[idx]
-                # 중앙 좌표 계산
-                center_x = (box[0] + box[2]) // 2
-                center_y = (box[1] + box[3]) // 2
-
-                results.append(
-                    {
-                        "id": emoji_id,
-                        "name": name,
-                        "pos": (center_x, center_y),
-                        "confidence": confidences[idx],
-                    }
-                )
+        size = (max(1, round(w * scale)), max(1, round(h * scale)))
+        scaled[emoji_id] = (name, cv2.resize(template, size, interpolation=interpolation))
+    return scaled
+
+
+class TemplatePyramid:
+    """배율별 TemplateSet (생성 시 전부 계산). 창별 마지막 매칭 배율 + 그때 DPI 기억.
+
+    전 배율을 시도해도 빈 창은 (DPI, 시각)으로 기억해 쿨다운 동안 DPI 배율만 시도.
+    """
+
+    def __init__(self, templates: dict[int, tuple[str, np.ndarray]],
+                 scales: tuple[float, ...] = CV_TEMPLATE_SCALES,
+                 mode: str = CV_PREPROCESS_MODE):
+        self.levels = {scale: TemplateSet(scale_templates(templates, scale), mode)
+                       for scale in sorted(set(scales))}
+        self._last_scale: dict[int, tuple[float, Optional[int]]] = {}  # 창 → (배율, DPI)
+        self._misses: dict[int, int] = {}
+        self._empty: dict[int, tuple[Optional[int], float]] = {}  # 창 → (DPI, 빈 결과 시각)
+        self.empty_cooldown = CV_SCALE_EMPTY_COOLDOWN_SECS
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """템플릿 수 (배율 하나 기준)."""
+        return len(next(iter(self.levels.values()))) if self.levels else 0
+
+    def __getitem__(self, scale: float) -> TemplateSet:
+        return self.levels[scale]
+
+    @property
+    def scales(self) -> list[float]:
+        return list(self.levels)
+
+    def scale_for_dpi(self, dpi: int) -> float:
+        """dpi / DEFAULT_DPI에 가장 가까운 배율."""
+        target = dpi / DEFAULT_DPI
+        return min(self.levels, key=lambda s: (abs(s - target), s))
+
+    def scan_order(self, window: int = 0, dpi: Optional[int] = None) -> list[float]:
+        """시도 순서. 창의 마지막 매칭 배율(없으면 DPI 배율) → 가까운 배율순."""
+        first = self.last_scale(window, dpi)
+        if first is None:
+            first = self.scale_for_dpi(dpi or DEFAULT_DPI)
+        return sorted(self.levels, key=lambda s: (abs(s - first), s))
+
+    def remember(self, window: int, scale: float, dpi: Optional[int] = None) -> None:
+        with self._lock:
+            self._last_scale.pop(window, None)
+            self._last_scale[window] = (scale, dpi)
+            self._misses.pop(window, None)
+            self._empty.pop(window, None)
+            while len(self._last_scale) > CV_SCALE_CACHE_MAX_WINDOWS:
+                evicted = next(iter(self._last_scale))
+                self._last_scale.pop(evicted)
+                self._misses.pop(evicted, None)
+
+    def forget(self, window: int) -> None:
+        with self._lock:
+            self._last_scale.pop(window, None)
+            self._misses.pop(window, None)
+            self._empty.pop(window, None)
+
+    def mark_empty(self, window: int, dpi: Optional[int] = None) -> None:
+        """전 배율 시도가 빈 결과. 쿨다운 동안 recently_empty()가 True."""
+        with self._lock:
+            self._empty.pop(window, None)
+            self._empty[window] = (dpi, time.monotonic())
+            while len(self._empty) > CV_SCALE_CACHE_MAX_WINDOWS:
+                self._empty.pop(next(iter(self._empty)))
+
+    def recently_empty(self, window: int, dpi: Optional[int] = None) -> bool:
+        """쿨다운 안에 같은 DPI로 전 배율 시도가 비었으면 True."""
+        with self._lock:
+            entry = self._empty.get(window)
+        if entry is None:
+            return False
+        empty_dpi, at = entry
+        if dpi is not None and empty_dpi is not None and dpi != empty_dpi:
+            return False
+        return time.monotonic() - at < self.empty_cooldown
+
+    def last_scale(self, window: int, dpi: Optional[int] = None) -> Optional[float]:
+        """기억된 배율. dpi를 주면 기억할 때와 DPI가 다르면 (배율 설정 변경) None."""
+        with self._lock:
+            entry = self._last_scale.get(window)
+        if entry is None:
+            return None
+        scale, remembered_dpi = entry
+        if dpi is not None and remembered_dpi is not None and dpi != remembered_dpi:
+            return None
+        return scale
+
+    def miss(self, window: int) -> bool:
+        """기억된 배율에서 빈 결과. CV_SCALE_MAX_MISSES번 연속이면 잊고 True (다음엔 전 배율 시도)."""
+        with self._lock:
+            misses = self._misses.get(window, 0) + 1
+            if misses < CV_SCALE_MAX_MISSES:
+                self._misses[window] = misses
+                return False
+            self._misses.pop(window, None)
+            self._last_scale.pop(window, None)
+            return True
+
+
+def prepare_pyramid(templates: Optional[dict] = None,
+                    scales: tuple[float, ...] = CV_TEMPLATE_SCALES,
+                    mode: str = CV_PREPROCESS_MODE) -> TemplatePyramid:
+    """load_templates() 형식 dict → TemplatePyramid. None이면 디스크에서 로드."""
+    return TemplatePyramid(load_templates() if templates is None else templates, scales, mode)
+
+
+# =============================================================================
+# 후보 탐색 / 검증 / NMS
+# =============================================================================
+
+
+def find_peaks(result: np.ndarray, threshold: float, radius: int) -> tuple[np.ndarray, np.ndarray]:
+    """threshold 이상인 국소 최대 (반경 radius 안 최댓값) 좌표. (ys, xs)"""
+    size = 2 * max(1, radius) + 1
+    dilated = cv2.dilate(result, cv2.getStructuringElement(cv2.MORPH_RECT, (size, size)))
+    return np.nonzero((result >= threshold) & (result >= dilated))
+
+
+def nms(boxes: np.ndarray, scores: np.ndarray, iou_threshold: float = CV_NMS_THRESHOLD) -> np.ndarray:
+    """NumPy greedy NMS. boxes: (N, 4) x1,y1,x2,y2 (x2/y2 제외). 남긴 인덱스 (점수 내림차순).
+
+    동점은 입력 순서 우선 (결과 결정적).
+    """
+    if len(boxes) == 0:
+        return np.empty(0, dtype=np.intp)
+    x1, y1, x2, y2 = (boxes[:, i].astype(np.float64) for i in range(4))
+    areas = (x2 - x1) * (y2 - y1)
+    order = np.lexsort((np.arange(len(scores)), -scores))
+    keep = []
+    while order.size:
+        i = order[0]
+        keep.append(i)
+        rest = order[1:]
+        w = np.clip(np.minimum(x2[i], x2[rest]) - np.maximum(x1[i], x1[rest]), 0, None)
+        h = np.clip(np.minimum(y2[i], y2[rest]) - np.maximum(y1[i], y1[rest]), 0, None)
+        inter = w * h
+        iou = inter / (areas[i] + areas[rest] - inter)
+        order = rest[iou <= iou_threshold]
+    return np.asarray(keep, dtype=np.intp)
+
+
+def _verify(image: np.ndarray, template: np.ndarray, x: int, y: int,
+            radius: int = CV_VERIFY_RADIUS) -> tuple[float, int, int]:
+    """후보 (x, y) 주변 패치만 컬러 매칭. (신뢰도, 보정된 x, y)"""
+    h, w = template.shape[:2]
+    x0, y0 = max(0, x - radius), max(0, y - radius)
+    x1 = min(image.shape[1], x + w + radius)
+    y1 = min(image.shape[0], y + h + radius)
+    result = cv2.matchTemplate(image[y0:y1, x0:x1], template, cv2.TM_CCOEFF_NORMED)
+    _, score, _, (dx, dy) = cv2.minMaxLoc(result)
+    return float(score), x0 + dx, y0 + dy
+
+
+def _match_template(image: np.ndarray, search_image: np.ndarray, template: PreparedTemplate,
+                    threshold: float) -> list[tuple[float, int, int]]:
+    """템플릿 1개: 전처리본 후보 → 컬러 검증. [(신뢰도, x, y)]"""
+    if template.height > search_image.shape[0] or template.width > search_image.shape[1]:
+        return []
+    result = cv2.matchTemplate(search_image, template.search, cv2.TM_CCOEFF_NORMED)
+    radius = int(min(template.width, template.height) * CV_PEAK_RADIUS_RATIO)
+    ys, xs = find_peaks(result, threshold - CV_PREFILTER_MARGIN, radius)
+    found = []
+    for y, x in zip(ys.tolist(), xs.tolist()):
+        score, vx, vy = _verify(image, template.color, x, y)
+        if score >= threshold:
+            found.append((score, vx, vy))
+    return found
+
+
+def match_all(image: np.ndarray, template_set: TemplateSet,
+              threshold: float = MATCH_THRESHOLD, job=None) -> list[tuple[int, float, int, int]]:
+    """image 1장 전체 템플릿 후보. [(template_set 내 인덱스, 신뢰도, x, y)] (NMS 전).
+
+    job: 있으면 템플릿별 matchTemplate을 job.map으로 병렬 (전처리는 1회).
+    """
+    if image.ndim == 3 and image.shape[2] == 4:
+        image = cv2.cvtColor(image, cv2.COLOR_BGRA2BGR)
+    search_image = preprocess(image, template_set.mode)
+    templates = template_set.items
+
+    def match(template: PreparedTemplate) -> list[tuple[float, int, int]]:
+        return _match_template(image, search_image, template, threshold)
+
+    per_template = job.map(match, templates) if job is not None else [match(t) for t in templates]
+    found = []
+    for index, matches in enumerate(per_template):
+        for score, x, y in matches:
+            found.append((index, score, x, y))
+    return found
+
+
+def _collect(image: np.ndarray, template_set: TemplateSet, threshold: float,
+             offset: tuple[int, int], boxes: list, scores: list, owners: list, job=None) -> None:
+    """image 1장 후보를 boxes/scores/owners에 추가. 좌표는 offset만큼 이동."""
+    add_candidates(template_set, match_all(image, template_set, threshold, job),
+                   offset, boxes, scores, owners)
+
+
+def add_candidates(template_set: TemplateSet, candidates: list[tuple[int, float, int, int]],
+                   offset: tuple[int, int], boxes: list, scores: list, owners: list) -> None:
+    """match_all 결과를 offset만큼 옮겨 NMS 입력에 추가."""
+    ox, oy = offset
+    for index, score, x, y in candidates:
+        template = template_set.items[index]
+        boxes.append((x + ox, y + oy, x + ox + template.width, y + oy + template.height))
+        scores.append(score)
+        owners.append(template)
+
+
+def _merge(boxes: list, scores: list, owners: list) -> list[dict]:
+    """전체 후보 NMS 1회 → 결과 dict. x좌표순 정렬."""
+    if not boxes:
+        return []
+
+    keep = nms(np.asarray(boxes), np.asarray(scores))
+    results = []
+    for idx in keep.tolist():
+        x1, y1, x2, y2 = boxes[idx]
+        template = owners[idx]
+        results.append(
+            {
+                "id": template.emoji_id,
+                "name": template.name,
+                "pos": ((x1 + x2) // 2, (y1 + y2) // 2),  # 중앙 좌표
+                "confidence": scores[idx],
+            }
+        )
 
     # x 좌표순 정렬 (왼쪽에서 오른쪽)
-    results.sort(key=lambda x: x["pos"][0])
+    results.sort(key=lambda x: (x["pos"][0], x["pos"][1]))
 
     return results
 
 
+def detect_emojis(
+    image: np.ndarray,
+    templates: TemplatesArg = None,
+    threshold: float = MATCH_THRESHOLD,
+) -> list[dict]:
+    """템플릿 매칭 + NMS. 결과는 x좌표순 정렬.
+
+    templates: TemplateSet (권장), load_templates() 형식 dict, None이면 default_templates().
+    """
+    template_set = _as_template_set(templates)
+    boxes, scores, owners = [], [], []
+    _collect(image, template_set, threshold, (0, 0), boxes, scores, owners)
+    return _merge(boxes, scores, owners)
+
+
+def detect_emojis_in_regions(
+    crops: list[tuple[tuple[int, int], np.ndarray]],
+    templates: TemplatesArg = None,
+    threshold: float = MATCH_THRESHOLD,
+    tile_cache=None,
+    job=None,
+) -> list[dict]:
+    """영역별 캡처 [(offset, image)]를 매칭 후 한 번에 NMS. pos는 offset 기준 좌표계.
+
+    offset은 보통 창 좌상단 기준 ROI 위치 → 결과를 detect_emojis(창 전체)와 같은 좌표로 씀.
+    tile_cache: TileCache면 바뀐 타일만 매칭, 나머지는 캐시된 후보를 합쳐 NMS.
+    job: DetectJob이면 병렬 매칭 + 취소 확인.
+    """
+    template_set = _as_template_set(templates)
+    collect = tile_cache.collect if tile_cache is not None else _collect
+    boxes, scores, owners = [], [], []
+    for offset, image in crops:
+        if job is not None:
+            job.check()
+        collect(image, template_set, threshold, offset, boxes, scores, owners, job)
+    return _merge(boxes, scores, owners)
+
+
+def detect_emojis_multiscale(
+    crops: list[tuple[tuple[int, int], np.ndarray]],
+    pyramid: TemplatePyramid,
+    window: int = 0,
+    dpi: Optional[int] = None,
+    threshold: float = MATCH_THRESHOLD,
+    tile_cache=None,
+    job=None,
+) -> list[dict]:
+    """배율별 detect_emojis_in_regions. 결과 배율은 창별로 기억.
+
+    기억된 배율이 있으면 그 배율만 매칭 (빈 결과 = 공감 이모지 없음, 보통의 경우).
+    CV_SCALE_MAX_MISSES번 연속 비거나 DPI가 바뀌면 잊고 다음 스캔부터 scan_order 전 배율 시도.
+    전 배율 시도가 비면 CV_SCALE_EMPTY_COOLDOWN_SECS 동안 같은 창/DPI는 DPI 배율만 시도
+    (이모지 없는 창에서 스캔마다 ROI + 창 전체 × 전 배율 매칭 방지).
+    전 배율 시도 시 평균 신뢰도 CV_SCALE_ACCEPT_CONFIDENCE 이상이면 즉시 확정.
+    이웃 배율은 일부 이모지만 낮은 신뢰도로 걸리므로, 확정 못 하면 전 배율 중 (개수, 평균 신뢰도) 최대.
+    """
+    remembered = pyramid.last_scale(window, dpi)
+    if remembered is not None:
+        scales = [remembered]
+    elif pyramid.recently_empty(window, dpi):
+        scales = [pyramid.scale_for_dpi(dpi or DEFAULT_DPI)]
+    else:
+        scales = pyramid.scan_order(window, dpi)
+    best: list[dict] = []
+    best_key = (0, 0.0)
+    best_scale = None
+    for scale in scales:
+        if job is not None:
+            job.check()
+        found = detect_emojis_in_regions(crops, pyramid[scale], threshold, tile_cache, job)
+        if not found:
+            continue
+        mean = sum(d["confidence"] for d in found) / len(found)
+        key = (len(found), mean)
+        if key > best_key:
+            best, best_key, best_scale = found, key, scale
+        if mean >= CV_SCALE_ACCEPT_CONFIDENCE:
+            break
+    if best_scale is not None:
+        if remembered != best_scale:
+            log.debug(f"emoji scale {best_scale:g} (window={window}, dpi={dpi})")
+        pyramid.remember(window, best_scale, dpi)
+    elif remembered is not None:
+        if pyramid.miss(window):
+            log.debug(f"emoji scale {remembered:g} missed {CV_SCALE_MAX_MISSES}x, widening (window={window})")
+    elif len(scales) > 1:
+        pyramid.mark_empty(window, dpi)
+    return best
+
+
 def format_detection_result(detections: list[dict]) -> str:
     """음성 출력용. 예: "하트, 엄지 발견. 1~2 숫자키로 선택" """
     if not detections:
@@ -38,6 +38,9 @@ from .config import (
 from .utils.uia_cache_request import get_focused_with_cache
 from .utils.uia_utils import is_focus_in_message_list
 from .utils.uia_events import FocusMonitor, FocusEvent
+from .utils.text_normalizer import normalize_speech_text
+from .utils.latency_tracer import latency_tracer
+from .utils.event_recorder import event_recorder
 from .utils.debug import get_logger
 
 if TYPE_CHECKING:
@@ -100,6 +103,7 @@ class FocusMonitorService:
 
         # 중복 로깅 방지 (모니터 루프용)
         self._last_trace_state: tuple = (None, None, None)  # (hwnd, is_chat, nav_mode)
+        self._recorded_fg_hwnd: Optional[int] = None  # 이벤트 기록용 마지막 포그라운드
 
         # 메뉴 핸들러 (싱글톤)
         self._menu_handler: MenuHandler = get_menu_handler()
@@ -162,8 +166,8 @@ class FocusMonitorService:
         except Exception as e:
             log.trace(f"exit_chat_room failed: {e}")
 
-    def start(self) -> None:
-        """FocusMonitor + 폴링 스레드 시작."""
+    def start(self, poll_thread: bool = True) -> None:
+        """FocusMonitor + 폴링 스레드 시작. poll_thread=False면 호출자가 _poll_once 구동 (재생기)."""
         self._running = True
 
         # ElementSelected → FocusEvent 콜백 설정 (NVDA gainFocus 패턴)
@@ -174,6 +178,9 @@ class FocusMonitorService:
         self._focus_monitor.start(on_focus_changed=self._on_focus_event)
         log.debug(f"FocusMonitor started (mode={self._focus_monitor.get_stats()['mode']})")
 
+        if not poll_thread:
+            return
+
         # 폴링 스레드 시작 (메뉴/채팅방 감지)
         self._thread = threading.Thread(
             target=self._monitor_loop,
@@ -257,24 +264,37 @@ class FocusMonitorService:
 
             # 이후 정상 포커스 모니터링
             while self._running:
-                sleep_interval = self._process_menu_state()
-                if sleep_interval:
-                    time.sleep(sleep_interval)
-                    continue
-
-                fg_hwnd = win32gui.GetForegroundWindow()
-                sleep_interval = self._process_kakaotalk_window(fg_hwnd)
-                if sleep_interval:
-                    time.sleep(sleep_interval)
-                    continue
-
-                self._process_chat_navigation(fg_hwnd)
-                last_cleanup = self._periodic_maintenance(last_cleanup)
-                time.sleep(TIMING_NORMAL_POLL_INTERVAL)
+                sleep_interval, last_cleanup = self._poll_once(last_cleanup)
+                time.sleep(sleep_interval)
         finally:
             # COM 해제
             self._uia.uninit_com()
 
+    def _poll_once(self, last_cleanup: float) -> tuple[float, float]:
+        """폴링 1회: 메뉴 → 카카오톡 창 → 채팅방. (대기 간격, last_cleanup) 반환."""
+        sleep_interval = self._process_menu_state()
+        if sleep_interval:
+            return sleep_interval, last_cleanup
+
+        fg_hwnd = win32gui.GetForegroundWindow()
+        if event_recorder.active and fg_hwnd != self._recorded_fg_hwnd:
+            self._record_foreground(fg_hwnd)
+        sleep_interval = self._process_kakaotalk_window(fg_hwnd)
+        if sleep_interval:
+            return sleep_interval, last_cleanup
+
+        self._process_chat_navigation(fg_hwnd)
+        return TIMING_NORMAL_POLL_INTERVAL, self._periodic_maintenance(last_cleanup)
+
+    def _record_foreground(self, fg_hwnd: int) -> None:
+        self._recorded_fg_hwnd = fg_hwnd
+        try:
+            class_name = win32gui.GetClassName(fg_hwnd) if fg_hwnd else ""
+            title = win32gui.GetWindowText(fg_hwnd) if fg_hwnd else ""
+        except Exception:
+            class_name, title = "", ""
+        event_recorder.record("foreground", hwnd=fg_hwnd or 0, class_name=class_name, title=title)
+
     def _process_menu_state(self) -> Optional[float]:
         """메뉴 창 감지 + 모드 전환. 메뉴 모드면 폴링 간격 반환, 아니면 None."""
         menu_hwnd = self._menu_handler.find_menu_window()
@@ -282,6 +302,7 @@ class FocusMonitorService:
         if menu_hwnd:
             # 메뉴 창 존재 → 메뉴 모드
             if not self._menu_handler.in_menu_mode:
+                event_recorder.record("menu_open", hwnd=menu_hwnd)
                 self._menu_handler.enter_menu_mode(menu_hwnd)
                 # MessageMonitor pause
                 if self._message_monitor and self._message_monitor.is_running():
@@ -291,6 +312,7 @@ class FocusMonitorService:
         else:
             # 메뉴 창 없음 → 메뉴 모드 즉시 종료
             if self._menu_handler.in_menu_mode:
+                event_recorder.record("menu_close")
                 self._menu_handler.exit_menu_mode()
                 # MessageMonitor resume
                 if self._message_monitor and self._message_monitor.is_running():
@@ -311,6 +333,7 @@ class FocusMonitorService:
                 self._exit_navigation_mode()
             # 메뉴 모드 종료
             if self._menu_handler.in_menu_mode:
+                event_recorder.record("menu_close")
                 self._menu_handler.exit_menu_mode()
                 if self._message_monitor and self._message_monitor.is_running():
                     self._message_monitor.resume()
@@ -326,7 +349,7 @@ class FocusMonitorService:
         is_chat = is_kakaotalk_chat_window(fg_hwnd)
         current_trace_state = (fg_hwnd, is_chat, self._mode_manager.in_navigation_mode)
         if current_trace_state != self._last_trace_state:
-            log.trace(f"focus monitor: hwnd={fg_hwnd}, is_chat={is_chat}, nav_mode={self._mode_manager.in_navigation_mode}")
+            log.trace("focus monitor: hwnd=%s, is_chat=%s, nav_mode=%s", *current_trace_state)
             self._last_trace_state = current_trace_state
         if is_chat:
             # 메뉴 모드일 때는 채팅방 진입 로직 스킵 (CPU 스파이크 방지)
@@ -380,7 +403,7 @@ class FocusMonitorService:
             control_type = event.control.ControlTypeName
             if control_type == 'ListItemControl':
                 if self._menu_handler.in_menu_mode:
-                    log.trace(f"[메뉴모드] {control_type} 이벤트 무시")
+                    log.trace("[메뉴모드] %s 이벤트 무시", control_type)
                     return
         except Exception as e:
             log.trace(f"menu mode check failed: {e}")
@@ -414,7 +437,7 @@ class FocusMonitorService:
         if ctx.name:
             self._speak_item(ctx.name, ctx.control_type)
             self._chat_navigator.current_focused_item = ctx.control
-            log.trace(f"[이벤트] ListItem: {ctx.name[:30]}...")
+            log.trace("[이벤트] ListItem: %.30s...", ctx.name)
 
     def _handle_menu_item_focus(self, ctx: FocusContext) -> None:
         """MenuItem 포커스: MenuHandler에 위임."""
@@ -486,7 +509,7 @@ class FocusMonitorService:
             and is_focus_in_message_list()):
             self._message_actions.activate()
 
-        self._speak(name)
+        self._speak_item(name, cached.control_type_name)
 
         # chat_navigator에 현재 항목 저장 (컨텍스트 메뉴용)
         self._chat_navigator.current_focused_item = cached
@@ -530,8 +553,8 @@ class FocusMonitorService:
                 self._last_focused_id = runtime_id
                 self._last_focused_name = name
 
-            self._speak(name)
-            log.trace(f"[이벤트] 마지막 메시지: {name[:30]}...")
+            self._speak_item(name, "ListItemControl")
+            log.trace("[이벤트] 마지막 메시지: %.30s...", name)
 
         except Exception as e:
             log.trace(f"failed to read last message: {e}")
@@ -561,15 +584,15 @@ class FocusMonitorService:
                 return False
 
     def _speak_item(self, name: str, control_type: str = "") -> None:
-        """특수문자 제거 후 음성+점자 출력."""
-        try:
-            log.trace(f"[{control_type}] {name[:50]}...")
-        except UnicodeEncodeError:
-            log.trace("(encoding error)")
+        """정규화(기호/공백/토큰) 후 음성+점자 출력."""
+        log.trace("[%s] %.50s...", control_type, name)
 
-        # 이모지 등 특수문자 제거 후 읽기
-        clean_name = name.replace('\u2022', '').replace('\u00a0', ' ')
+        clean_name = normalize_speech_text(name)
+        if not clean_name:
+            return
 
         # SpeakCallback으로 음성 출력
+        latency_tracer.mark("dispatch")
         self._speak(clean_name)
+        latency_tracer.mark("speak")
 
@@ -40,6 +40,7 @@ VK_1 = 0x31
 VK_2 = 0x32
 VK_3 = 0x33
 VK_4 = 0x34
+VK_ESCAPE = 0x1B
 
 
 def _get_modifiers(mod_list: list[str]) -> int:
@@ -97,6 +98,7 @@ class HotkeyManager:
         self._thread: Optional[threading.Thread] = None
         self._running = False
         self._selection_mode_active = False
+        self._scan_cancel_active = False
         self._thread_id: Optional[int] = None
         self._cleanup_event = threading.Event()
 
@@ -142,6 +144,36 @@ class HotkeyManager:
         )
         self._selection_mode_active = False
 
+    def enable_scan_cancel(self) -> None:
+        """스캔 중에만 ESC 핫키 등록 (진행 중 스캔 취소)."""
+        if self._scan_cancel_active:
+            return
+        if not self._thread_id:
+            return
+
+        ctypes.windll.user32.PostThreadMessageW(
+            self._thread_id,
+            win32con.WM_USER + 3,
+            0,
+            0,
+        )
+        self._scan_cancel_active = True
+
+    def disable_scan_cancel(self) -> None:
+        """ESC 핫키 해제 (다른 프로그램에 ESC 돌려줌)."""
+        if not self._scan_cancel_active:
+            return
+        if not self._thread_id:
+            return
+
+        ctypes.windll.user32.PostThreadMessageW(
+            self._thread_id,
+            win32con.WM_USER + 4,
+            0,
+            0,
+        )
+        self._scan_cancel_active = False
+
     def start(self) -> None:
         """메시지 루프 스레드 시작. RegisterHotKey는 루프 내에서 실행."""
         self._running = True
@@ -196,6 +228,12 @@ class HotkeyManager:
             elif msg.message == win32con.WM_USER + 2:
                 self._unregister_selection_hotkeys()
 
+            elif msg.message == win32con.WM_USER + 3:
+                user32.RegisterHotKey(None, HOTKEY_ID_CANCEL, 0, VK_ESCAPE)
+
+            elif msg.message == win32con.WM_USER + 4:
+                user32.UnregisterHotKey(None, HOTKEY_ID_CANCEL)
+
             elif msg.message == win32con.WM_USER + 10:
                 self._unregister_all_hotkeys()
                 self._cleanup_event.set()
@@ -220,6 +258,9 @@ class HotkeyManager:
         if self._selection_mode_active:
             self._unregister_selection_hotkeys()
             self._selection_mode_active = False
+        if self._scan_cancel_active:
+            user32.UnregisterHotKey(None, HOTKEY_ID_CANCEL)
+            self._scan_cancel_active = False
 
         user32.UnregisterHotKey(None, HOTKEY_ID_SCAN)
         user32.UnregisterHotKey(None, HOTKEY_ID_EXIT)
@@ -7,19 +7,41 @@ import atexit
 import signal
 import sys
 import time
+from contextlib import nullcontext
+from pathlib import Path
 from typing import Optional
 
-from .config import APP_DISPLAY_NAME, TIMING_TTS_READ_DELAY, TIMING_PROCESS_TERMINATION_WAIT
+from .config import (
+    APP_DISPLAY_NAME,
+    CV_TILE_CACHE_ENABLED,
+    DEFAULT_DPI,
+    TIMING_TTS_READ_DELAY,
+    TIMING_PROCESS_TERMINATION_WAIT,
+    OUTPUT_BACKEND_DEFAULT,
+    SCAN_MODE,
+    SCAN_ROI_FALLBACK_ON_EMPTY,
+    WRAPPER_TRACK_INTERVAL_SECS,
+)
 from .window_finder import (
     find_chat_window,
     get_client_rect,
+    get_window_dpi,
     check_kakaotalk_running,
     check_uia_available,
 )
-from .detector import capture_region, detect_emojis, load_templates, format_detection_result
+from .detector import (
+    capture_region,
+    detect_emojis_multiscale,
+    format_detection_result,
+    prepare_pyramid,
+)
+from .scan_regions import bubble_regions
+from .tile_cache import emoji_tile_cache
+from .detect_engine import ScanCancelled, detect_engine
 from .clicker import click_emoji
 from .accessibility import (
     speak,
+    set_output_backend,
     announce_scan_start,
     announce_scan_result,
     announce_cancel,
@@ -31,11 +53,13 @@ from .navigation import ChatRoomNavigator
 from .navigation.message_monitor import MessageMonitor
 from .mode_manager import ModeManager
 from .focus_monitor import FocusMonitorService
+from .output import BACKENDS
 from .message_actions import (
     MessageActionManager,
     MessageTextExtractor,
     CopyMessageAction,
 )
+from .utils.com_utils import com_thread
 from .utils.debug import get_logger, get_log_file_path
 
 log = get_logger("Main")
@@ -87,7 +111,7 @@ class EmojiClicker:
     def initialize(self) -> bool:
         """템플릿 로드 및 핫키 등록. 실패 시 False."""
         # 1. 템플릿 이미지 로드
-        self.templates = load_templates()
+        self.templates = prepare_pyramid()
         if not self.templates:
             announce_error("템플릿 이미지를 찾을 수 없습니다")
             return False
@@ -126,15 +150,27 @@ class EmojiClicker:
 
         self.current_window_offset = (rect[0], rect[1])
 
-        # 화면 캡처
+        # 이모지 탐지 (병렬 매칭, 타일 캐시 켜져 있으면 바뀌지 않은 타일은 이전 스캔 결과 재사용)
+        # 이전 스캔이 아직 돌고 있으면 취소. 스캔 중에는 ESC로 취소 가능
+        job = detect_engine.start_job()
+        self.hotkey_manager.enable_scan_cancel()
+        tile_scope = emoji_tile_cache.scan() if CV_TILE_CACHE_ENABLED else nullcontext()
         try:
-            image = capture_region(rect)
-        except Exception:
-            announce_error("화면 캡처 실패")
+            with tile_scope as tile_scan:
+                detections = self._detect(hwnd, rect, job, tile_scan)
+        except ScanCancelled:
+            log.debug("emoji scan cancelled")
             return
+        finally:
+            detect_engine.finish_job(job)
+            if not detect_engine.busy:
+                self.hotkey_manager.disable_scan_cancel()
+        if detections is None:
+            return
+        if tile_scan is not None:
+            log.debug(f"emoji scan: {tile_scan.stats.format()}")
 
-        # 이모지 탐지
-        self.current_detections = detect_emojis(image, self.templates)
+        self.current_detections = detections
 
         # 결과 알림
         result_text = format_detection_result(self.current_detections)
@@ -144,6 +180,53 @@ class EmojiClicker:
         if self.current_detections:
             self.mode_manager.enter_selection_mode(self.hotkey_manager)
 
+    def _detect(self, hwnd: int, rect: tuple[int, int, int, int], job=None,
+                tile_scan=None) -> Optional[list[dict]]:
+        """ROI → 창 전체 순으로 캡처/탐지. 캡처 실패 시 오류 알림 후 None. tile_scan: 이 스캔의 TileScan."""
+        # 창 DPI에 맞는 배율부터 (창별 마지막 매칭 배율 우선)
+        dpi = get_window_dpi(hwnd)
+
+        # 말풍선 주변만 캡처/탐지 (ROI 없거나 못 찾으면 창 전체)
+        regions = self._scan_regions(rect, dpi)
+        if regions:
+            try:
+                crops = [((roi[0] - rect[0], roi[1] - rect[1]), capture_region(roi)) for roi in regions]
+            except Exception:
+                announce_error("화면 캡처 실패")
+                return None
+            detections = detect_emojis_multiscale(crops, self.templates, hwnd, dpi,
+                                                  tile_cache=tile_scan, job=job)
+            if detections or not SCAN_ROI_FALLBACK_ON_EMPTY:
+                return detections
+            log.debug(f"no emoji in {len(regions)} ROIs, full window fallback")
+
+        # 화면 캡처
+        try:
+            image = capture_region(rect)
+        except Exception:
+            announce_error("화면 캡처 실패")
+            return None
+
+        return detect_emojis_multiscale([((0, 0), image)], self.templates, hwnd, dpi,
+                                        tile_cache=tile_scan, job=job)
+
+    def _scan_regions(self, rect: tuple[int, int, int, int], dpi: int) -> list[tuple[int, int, int, int]]:
+        """SCAN_MODE에 따른 ROI (화면 좌표). full이거나 포커스 정보 없으면 빈 목록.
+
+        핫키 스레드에서 호출. focused는 포커스 이벤트 때 저장한 사각형만 사용 (COM 호출 없음,
+        새 메시지로 목록이 밀리면 무효화돼 창 전체), visible은 말풍선 목록을 읽어야 하므로
+        COM 초기화 후 조회.
+        """
+        if SCAN_MODE == "full":
+            return []
+        scale = dpi / DEFAULT_DPI
+        if SCAN_MODE != "visible":
+            return bubble_regions(rect, self.chat_navigator.focused_rect, scale=scale)
+        with com_thread():
+            focused = self.chat_navigator.current_focused_item
+            messages = list(self.chat_navigator.messages)
+            return bubble_regions(rect, focused, messages, scale=scale)
+
     def on_number_key(self, number: int) -> None:
         """이모지 선택. 선택 모드 아니면 무시."""
         if not self.mode_manager.in_selection_mode:
@@ -167,7 +250,11 @@ class EmojiClicker:
         self._exit_selection_mode_internal()
 
     def on_cancel(self) -> None:
-        """선택 모드 취소. 선택 모드 아니면 무시."""
+        """진행 중 스캔 또는 선택 모드 취소. 둘 다 아니면 무시."""
+        if detect_engine.cancel():
+            self.hotkey_manager.disable_scan_cancel()
+            announce_cancel()
+            return
         if self.mode_manager.in_selection_mode:
             announce_cancel()
             self._exit_selection_mode_internal()
@@ -236,6 +323,9 @@ class EmojiClicker:
         # 3. hotkey_manager 정리
         self.hotkey_manager.cleanup()
 
+        # 4. 이모지 탐지 스레드 풀 정리
+        detect_engine.shutdown()
+
         speak("종료")
         time.sleep(TIMING_TTS_READ_DELAY)  # 스크린 리더가 읽을 시간 확보
         log.debug("cleanup completed")
@@ -316,6 +406,50 @@ def parse_args():
         help='콘솔 모드 실행 (--debug 필요, GUI 없이)'
     )
 
+    # 출력 백엔드
+    parser.add_argument(
+        '--output',
+        choices=sorted(BACKENDS),
+        default=OUTPUT_BACKEND_DEFAULT,
+        help=f'출력 백엔드 (기본: {OUTPUT_BACKEND_DEFAULT})'
+    )
+
+    parser.add_argument(
+        '--output-file',
+        default=None,
+        metavar='PATH',
+        help='--output jsonl 기록 파일 경로'
+    )
+
+    # 메트릭 엔드포인트
+    parser.add_argument(
+        '--metrics-port',
+        type=int,
+        default=None,
+        metavar='PORT',
+        help='127.0.0.1:PORT에 메트릭 엔드포인트 (/metrics OpenMetrics, /metrics.json). 0이면 임의 포트'
+    )
+
+    # 이벤트 기록 (scripts/replay_events.py로 재생)
+    parser.add_argument(
+        '--record-events',
+        default=None,
+        metavar='PATH',
+        help='포커스/구조/선택/포그라운드/메뉴 이벤트를 JSONL로 기록 (재생용)'
+    )
+
+    # UIA 래퍼 누수 추적
+    parser.add_argument(
+        '--track-wrappers',
+        nargs='?',
+        type=float,
+        const=WRAPPER_TRACK_INTERVAL_SECS,
+        default=None,
+        metavar='SECS',
+        help=f'UIA 래퍼 보유량(owner별) + tracemalloc 증가 주기 기록, 누수 의심 경고 '
+             f'(기본 {WRAPPER_TRACK_INTERVAL_SECS:g}초)'
+    )
+
     return parser.parse_args()
 
 
@@ -360,6 +494,10 @@ def main() -> int:
 
     args = parse_args()
 
+    if args.output != OUTPUT_BACKEND_DEFAULT:
+        options = {"path": args.output_file} if args.output == "jsonl" and args.output_file else {}
+        set_output_backend(args.output, **options)
+
     from .utils.debug_setup import setup_debug
     setup_debug(args)
 
@@ -368,6 +506,21 @@ def main() -> int:
 
     atexit.register(_cleanup_handler)
 
+    if args.metrics_port is not None:
+        from .utils.metrics import start_metrics_server, stop_metrics_server
+        if start_metrics_server(args.metrics_port):
+            atexit.register(stop_metrics_server)
+
+    if args.record_events:
+        from .utils.event_recorder import event_recorder
+        if event_recorder.start(Path(args.record_events)):
+            atexit.register(event_recorder.stop)
+
+    if args.track_wrappers is not None:
+        from .utils.wrapper_tracker import wrapper_tracker
+        if wrapper_tracker.start(args.track_wrappers):
+            atexit.register(wrapper_tracker.stop)
+
     _clicker_instance = EmojiClicker()
     if not _clicker_instance.initialize():
         return 1
@@ -3,11 +3,14 @@
 """채팅방 메시지 목록 관리. UIAAdapter 사용으로 UIA 직접 호출 제거."""
 
 import threading
+from operator import attrgetter
 from typing import Any, List, Optional, TYPE_CHECKING
 
 from ..config import KAKAO_MESSAGE_LIST_NAME, SEARCH_DEPTH_MESSAGE_LIST
+from ..scan_regions import Rect, element_rect
 from ..utils.debug_tools import debug_tools
 from ..utils.uia_cache import message_list_cache
+from ..utils.wrapper_tracker import wrapper_tracker
 
 if TYPE_CHECKING:
     from ..infrastructure.uia_adapter import UIAAdapter
@@ -31,6 +34,10 @@ class ChatRoomNavigator:
         self._is_active: bool = False
         self._hwnd: int = 0  # 캐시 키용 창 핸들
         self._current_focused_item: Optional[Any] = None  # 현재 포커스된 메시지 (컨텍스트 메뉴용)
+        self._focused_rect: Optional[Rect] = None  # 포커스 메시지 사각형 (이모지 스캔 ROI용)
+
+        wrapper_tracker.register("chat_room.messages", self, attrgetter("messages"))
+        wrapper_tracker.register("chat_room.focused_item", self, attrgetter("_current_focused_item"))
 
     @property
     def is_active(self) -> bool:
@@ -73,6 +80,7 @@ class ChatRoomNavigator:
             self.list_control = None
             self._hwnd = 0
             self._current_focused_item = None
+            self._focused_rect = None
             # COM 해제 (Adapter가 스레드별 관리)
             self._uia.uninit_com()
 
@@ -93,8 +101,22 @@ class ChatRoomNavigator:
 
     @current_focused_item.setter
     def current_focused_item(self, item: Optional[Any]):
+        """포커스 이벤트 스레드(COM 초기화됨)에서 호출. 사각형도 같이 저장."""
+        rect = element_rect(item)
         with self._lock:
             self._current_focused_item = item
+            self._focused_rect = rect
+
+    @property
+    def focused_rect(self) -> Optional[Rect]:
+        """포커스 이벤트 때 읽어 둔 포커스 메시지 사각형. COM 호출 없음 (핫키 스레드용)."""
+        with self._lock:
+            return self._focused_rect
+
+    def invalidate_focused_rect(self) -> None:
+        """새 메시지로 목록이 스크롤되면 저장한 사각형은 다른 말풍선을 가리킴. 다음 포커스까지 버림."""
+        with self._lock:
+            self._focused_rect = None
 
     def refresh_messages(self, use_cache: bool = True) -> bool:
         """메시지 목록 새로고침. hwnd 기반 TTL 캐시 사용."""
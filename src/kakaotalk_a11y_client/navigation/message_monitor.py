@@ -12,6 +12,7 @@ from ..config import (
     SEARCH_MAX_SECONDS_FALLBACK,
 )
 from ..utils.debug import get_logger
+from ..utils.text_normalizer import normalize_speech_text
 from ..utils.uia_utils import get_children_recursive
 from ..utils.uia_events import MessageListMonitor, MessageEvent, FocusEvent
 
@@ -134,6 +135,9 @@ class MessageMonitor:
         """새 메시지 감지 시 호출. 로드 후 TTS 발화."""
         log.debug(f"message event: new_count={event.new_count}, source={event.source}")
 
+        # 목록이 밀렸으므로 이모지 스캔 ROI 무효화 (스캔은 창 전체로)
+        self.chat_navigator.invalidate_focused_rect()
+
         if not self.chat_navigator.is_active:
             log.trace("chat room inactive, ignoring event")
             return
@@ -188,8 +192,8 @@ class MessageMonitor:
 
         # 모든 새 메시지 읽기
         for i, msg in enumerate(new_messages):
-            name = getattr(msg, 'Name', '') or ''
-            if not name.strip():
+            name = normalize_speech_text(getattr(msg, 'Name', '') or '')
+            if not name:
                 continue
 
             # 새 메시지는 interrupt=False (TTS 큐에 누적, 발화 끊김 방지)
@@ -197,11 +201,10 @@ class MessageMonitor:
             announced_count += 1
 
             # 메시지 내용 로깅 (30자 제한)
-            preview = name[:30] + "..." if len(name) > 30 else name
-            log.trace(f"speak: {preview}")
+            log.trace("speak: %.30s", name)
 
         if announced_count > 0:
-            log.debug(f"{announced_count} message(s) announced")
+            log.debug("%d message(s) announced", announced_count)
 
     def get_stats(self) -> dict:
         stats = {
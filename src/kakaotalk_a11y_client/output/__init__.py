@@ -0,0 +1,38 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025-2026 dnz3d4c
+"""출력 백엔드 모듈 (음성/점자)"""
+
+from .base import OutputBackend, NullBackend
+from .screen_reader import Ao2Backend, SapiBackend
+from .recording import RecordingBackend, JsonlBackend, Utterance
+
+# 이름 → 클래스 (시작 시 --output 값)
+BACKENDS: dict[str, type[OutputBackend]] = {
+    "ao2": Ao2Backend,
+    "sapi": SapiBackend,
+    "null": NullBackend,
+    "recording": RecordingBackend,
+    "jsonl": JsonlBackend,
+}
+
+
+def create_backend(name: str, **options) -> OutputBackend:
+    """이름으로 백엔드 생성. 모르는 이름이면 ValueError."""
+    try:
+        backend_cls = BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"unknown output backend: {name}") from None
+    return backend_cls(**options)
+
+
+__all__ = [
+    "OutputBackend",
+    "NullBackend",
+    "Ao2Backend",
+    "SapiBackend",
+    "RecordingBackend",
+    "JsonlBackend",
+    "Utterance",
+    "BACKENDS",
+    "create_backend",
+]
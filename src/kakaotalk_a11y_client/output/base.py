@@ -0,0 +1,38 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025-2026 dnz3d4c
+"""출력 백엔드 추상 베이스"""
+
+from abc import ABC, abstractmethod
+
+
+class OutputBackend(ABC):
+    """음성/점자 출력 백엔드 베이스 클래스.
+
+    예외를 던지면 accessibility.speak()가 로그 폴백으로 처리.
+    """
+
+    name = "base"
+    has_braille = True  # False면 점자 채널 생략
+
+    @abstractmethod
+    def speak(self, text: str, interrupt: bool = False) -> None:
+        """음성 출력. interrupt=True면 이전 발화 중단. 음성 워커 스레드에서 호출됨 (생성도 같은 스레드)."""
+        pass
+
+    def braille(self, text: str) -> None:
+        """점자 출력. 점자 채널 워커 스레드에서 호출됨."""
+        pass
+
+    def close(self) -> None:
+        """백엔드 교체/종료 시 정리."""
+        pass
+
+
+class NullBackend(OutputBackend):
+    """아무것도 출력하지 않음. 벤치마크/헤드리스 실행용."""
+
+    name = "null"
+    has_braille = False
+
+    def speak(self, text: str, interrupt: bool = False) -> None:
+        pass
@@ -0,0 +1,111 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025-2026 dnz3d4c
+"""기록 백엔드. 발화 순서/시각을 그대로 남겨 검증·벤치마크에 사용.
+
+Windows 없이도 동작 (Linux CI, 시뮬레이터).
+"""
+
+import itertools
+import json
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Optional
+
+from ..config import OUTPUT_RECORDING_MAX_SIZE
+from .base import OutputBackend
+
+
+@dataclass(frozen=True)
+class Utterance:
+    seq: int            # 전체 출력 순번 (speech/braille 공통)
+    timestamp: float    # time.time()
+    channel: str        # "speech" or "braille"
+    text: str
+    interrupt: bool = False
+
+
+class RecordingBackend(OutputBackend):
+    """링 버퍼에 출력 기록. max_size 초과 시 오래된 것부터 버림."""
+
+    name = "recording"
+
+    def __init__(self, max_size: int = OUTPUT_RECORDING_MAX_SIZE):
+        self._buffer: deque[Utterance] = deque(maxlen=max_size)
+        self._lock = threading.Lock()
+        self._seq = itertools.count(1)
+        self.total = 0
+
+    def _record(self, channel: str, text: str, interrupt: bool = False) -> None:
+        with self._lock:
+            self._buffer.append(
+                Utterance(next(self._seq), time.time(), channel, text, interrupt)
+            )
+            self.total += 1
+
+    def speak(self, text: str, interrupt: bool = False) -> None:
+        self._record("speech", text, interrupt)
+
+    def braille(self, text: str) -> None:
+        self._record("braille", text)
+
+    def utterances(self, channel: Optional[str] = None) -> list[Utterance]:
+        """기록 스냅샷 (순번 순)."""
+        with self._lock:
+            items = list(self._buffer)
+        if channel is not None:
+            items = [u for u in items if u.channel == channel]
+        return items
+
+    def texts(self, channel: str = "speech") -> list[str]:
+        return [u.text for u in self.utterances(channel)]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buffer.clear()
+            self.total = 0
+
+    @property
+    def dropped(self) -> int:
+        """링 버퍼에서 밀려난 수."""
+        with self._lock:
+            return self.total - len(self._buffer)
+
+
+class JsonlBackend(OutputBackend):
+    """출력 1건당 JSON 1줄로 파일 기록. 재생/분석용."""
+
+    name = "jsonl"
+
+    def __init__(self, path: Optional[Path] = None):
+        if path is None:
+            path = Path(f"utterances_{time.strftime('%Y%m%d_%H%M%S')}.jsonl")
+        self.path = Path(path)
+        self._file = open(self.path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+        self._seq = itertools.count(1)
+
+    def _write(self, channel: str, text: str, interrupt: bool = False) -> None:
+        with self._lock:
+            if self._file.closed:
+                return
+            record = Utterance(next(self._seq), time.time(), channel, text, interrupt)
+            self._file.write(json.dumps(asdict(record), ensure_ascii=False) + "\n")
+
+    def speak(self, text: str, interrupt: bool = False) -> None:
+        self._write("speech", text, interrupt)
+
+    def braille(self, text: str) -> None:
+        self._write("braille", text)
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._file.closed:
+                self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
@@ -0,0 +1,41 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025-2026 dnz3d4c
+"""스크린 리더 백엔드 (accessible_output2).
+
+accessible_output2는 생성 시점에 import. 모듈 import만으로는
+스크린 리더 바인딩(NVDA 컨트롤러 DLL, SAPI COM)을 만들지 않음.
+"""
+
+from .base import OutputBackend
+
+
+class Ao2Backend(OutputBackend):
+    """accessible_output2 Auto. NVDA/JAWS → SAPI5 자동 fallback."""
+
+    name = "ao2"
+
+    def __init__(self):
+        from accessible_output2.outputs.auto import Auto
+        self._output = Auto()
+
+    def speak(self, text: str, interrupt: bool = False) -> None:
+        # 음성만. Auto.output()은 braille()를 호출하지 않는 라이브러리 버그가 있어
+        # 점자는 accessibility 점자 채널이 braille()로 따로 출력
+        self._output.speak(text, interrupt=interrupt)
+
+    def braille(self, text: str) -> None:
+        self._output.braille(text)
+
+
+class SapiBackend(OutputBackend):
+    """SAPI5 음성만. 스크린 리더 없이 테스트할 때."""
+
+    name = "sapi"
+    has_braille = False
+
+    def __init__(self):
+        from accessible_output2.outputs.sapi5 import SAPI5
+        self._output = SAPI5()
+
+    def speak(self, text: str, interrupt: bool = False) -> None:
+        self._output.speak(text, interrupt=interrupt)
@@ -0,0 +1,148 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025-2026 dnz3d4c
+"""말풍선 주변 스캔 영역(ROI) 계산
+
+공감 이모지는 말풍선 옆/아래에만 붙으므로 창 전체 대신 포커스된 말풍선(선택적으로 보이는
+말풍선들) 주변만 캡처/매칭한다. 좌표는 화면 기준 (left, top, right, bottom),
+get_client_rect와 같은 형식. 사각형은 CacheRequest로 받아 둔 Cached 속성 우선.
+
+핫키 스레드에는 COM이 초기화돼 있지 않으므로, 포커스 말풍선 사각형은 포커스 이벤트 처리 시
+(ChatRoomNavigator.focused_rect) 미리 읽어 두고 여기엔 사각형 그대로 넘긴다.
+"""
+
+from typing import Any, Optional, Sequence
+
+from .config import (
+    SCAN_ROI_MAX_BUBBLES,
+    SCAN_ROI_MIN_SIZE,
+    SCAN_ROI_PAD_X,
+    SCAN_ROI_PAD_Y,
+)
+from .utils.debug import get_logger
+
+log = get_logger("ScanRegions")
+
+Rect = tuple[int, int, int, int]
+
+
+def element_rect(element: Any) -> Optional[Rect]:
+    """UIA 요소 사각형. CachedBoundingRectangle 우선, 없으면 live 조회. 실패/빈 영역은 None.
+
+    element: auto.Control, CachedFocusInfo(raw_element), IUIAutomationElement, 미리 읽은 Rect 모두 가능.
+    """
+    if element is None:
+        return None
+    if isinstance(element, tuple):
+        rect = element
+        return rect if rect[2] > rect[0] and rect[3] > rect[1] else None
+    raw = getattr(element, "raw_element", None) or element
+    try:
+        raw = element.Element  # auto.Control → IUIAutomationElement
+    except Exception:
+        pass
+    rect = None
+    for obj, name in ((raw, "CachedBoundingRectangle"), (element, "BoundingRectangle"),
+                      (raw, "CurrentBoundingRectangle")):
+        try:
+            rect = getattr(obj, name)
+            break
+        except Exception:
+            continue
+    if rect is None:
+        return None
+    try:
+        result = (int(rect.left), int(rect.top), int(rect.right), int(rect.bottom))
+    except Exception:
+        return None
+    if result[2] <= result[0] or result[3] <= result[1]:
+        return None
+    return result
+
+
+def expand(rect: Rect, pad_x: int = SCAN_ROI_PAD_X, pad_y: int = SCAN_ROI_PAD_Y) -> Rect:
+    left, top, right, bottom = rect
+    return (left - pad_x, top - pad_y, right + pad_x, bottom + pad_y)
+
+
+def clip(rect: Rect, bounds: Rect) -> Optional[Rect]:
+    """bounds 안으로 자름. 겹치지 않으면 None."""
+    left, top = max(rect[0], bounds[0]), max(rect[1], bounds[1])
+    right, bottom = min(rect[2], bounds[2]), min(rect[3], bounds[3])
+    if right <= left or bottom <= top:
+        return None
+    return (left, top, right, bottom)
+
+
+def _overlaps(a: Rect, b: Rect) -> bool:
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+def merge_rects(rects: Sequence[Rect]) -> list[Rect]:
+    """겹치는 사각형을 합집합 외접 사각형으로 병합 (같은 픽셀 중복 매칭 방지). top, left순."""
+    merged = list(rects)
+    changed = True
+    while changed:
+        changed = False
+        result: list[Rect] = []
+        for rect in merged:
+            for i, other in enumerate(result):
+                if _overlaps(rect, other):
+                    result[i] = (min(rect[0], other[0]), min(rect[1], other[1]),
+                                 max(rect[2], other[2]), max(rect[3], other[3]))
+                    changed = True
+                    break
+            else:
+                result.append(rect)
+        merged = result
+    return sorted(merged, key=lambda r: (r[1], r[0]))
+
+
+def _nearby_bubbles(messages: Sequence[Any], focused: Any, limit: int) -> list[Any]:
+    """포커스 항목 앞뒤로 limit개 (위치 모르면 목록 끝부분 = 최신 메시지)."""
+    if limit <= 0 or not messages:
+        return []
+    index = None
+    target = getattr(focused, "raw_element", None) or focused
+    for i, item in enumerate(messages):
+        if item is focused or item is target:
+            index = i
+            break
+    if index is None:
+        return list(messages[-limit:])
+    half = limit // 2
+    start = max(0, min(index - half, len(messages) - limit))
+    return [m for m in messages[start:start + limit + 1] if m is not focused]
+
+
+def bubble_regions(
+    window_rect: Rect,
+    focused: Any = None,
+    messages: Optional[Sequence[Any]] = None,
+    max_bubbles: int = SCAN_ROI_MAX_BUBBLES,
+    scale: float = 1.0,
+) -> list[Rect]:
+    """포커스 말풍선(+ 보이는 말풍선) 주변 ROI. 창 밖/너무 작은 영역 제외, 겹치면 병합.
+
+    scale: 화면 배율 (DPI / 96). 여백을 같은 비율로 넓힘.
+    빈 목록이면 호출자가 창 전체 스캔으로 폴백.
+    """
+    pad_x, pad_y = round(SCAN_ROI_PAD_X * scale), round(SCAN_ROI_PAD_Y * scale)
+    elements = [focused] if focused is not None else []
+    if messages:
+        elements.extend(_nearby_bubbles(messages, focused, max_bubbles))
+
+    rois = []
+    for element in elements:
+        rect = element_rect(element)
+        if rect is None:
+            continue
+        roi = clip(expand(rect, pad_x, pad_y), window_rect)
+        if roi is None:
+            continue
+        if roi[2] - roi[0] < SCAN_ROI_MIN_SIZE or roi[3] - roi[1] < SCAN_ROI_MIN_SIZE:
+            continue
+        rois.append(roi)
+
+    rois = merge_rects(rois)
+    log.trace(f"bubble ROIs: {len(rois)} from {len(elements)} elements")
+    return rois
@@ -0,0 +1,227 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025-2026 dnz3d4c
+"""이모지 탐지 타일 캐시 (같은 화면 반복 스캔)
+
+프레임을 CV_TILE_SIZE 격자로 나누고 타일마다 (간격 샘플링한 바이트) 해시를 키로 후보를 캐시.
+바뀐 타일만 다시 매칭하고, 캐시 후보와 합쳐 detector의 NMS 1회로 넘김.
+
+타일 창 = 담당 영역(core) + 앞쪽 여백(국소 최대/검증 반경) + 뒤쪽 겹침(가장 큰 템플릿).
+후보는 왼쪽 위 좌표가 core 안에 있을 때만 그 타일 소유 → 경계에 걸친 이모지도 한 타일이 찾음.
+해시: xxhash 있으면 xxh3_64, 없으면 hashlib.blake2b(8바이트).
+
+스캔별 통계는 scan()이 주는 TileScan에 모음. 스캔이 겹쳐도(detect_engine) 서로 안 섞임.
+첫 스캔은 타일 겹침만큼 느리고 채팅 스크롤은 모든 타일을 바꾸므로 기본은 꺼짐 (CV_TILE_CACHE_ENABLED).
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+import numpy as np
+
+from .config import (
+    CV_PEAK_RADIUS_RATIO,
+    CV_TILE_CACHE_MAX,
+    CV_TILE_HASH_STRIDE,
+    CV_TILE_SIZE,
+    CV_VERIFY_RADIUS,
+)
+from .detector import TemplateSet, add_candidates, match_all
+from .utils.metrics import counter, gauge, metrics_registry
+
+try:
+    import xxhash
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
+
+
+def tile_digest(tile: np.ndarray, stride: int = CV_TILE_HASH_STRIDE) -> int:
+    """타일 해시. stride 간격 픽셀만 (1이면 전체)."""
+    sample = np.ascontiguousarray(tile[::stride, ::stride] if stride > 1 else tile)
+    if HAS_XXHASH:
+        return xxhash.xxh3_64_intdigest(sample)
+    return int.from_bytes(hashlib.blake2b(sample, digest_size=8).digest(), "little")
+
+
+def tile_grid(height: int, width: int, tile: int, lead: int, overlap: int) -> list[tuple[int, int, int, int, int, int]]:
+    """[(창 x0, y0, x1, y1, core x 오프셋, core y 오프셋)]. core는 창 안에서 (오프셋, 오프셋+tile)."""
+    tiles = []
+    for y in range(0, height, tile):
+        wy0 = max(0, y - lead)
+        wy1 = min(height, y + tile + overlap)
+        for x in range(0, width, tile):
+            wx0 = max(0, x - lead)
+            wx1 = min(width, x + tile + overlap)
+            tiles.append((wx0, wy0, wx1, wy1, x - wx0, y - wy0))
+    return tiles
+
+
+@dataclass
+class TileScanStats:
+    """스캔 1회 (scan() 블록) 집계."""
+    tiles: int = 0
+    hits: int = 0
+    misses: int = 0
+    match_ms: float = 0.0
+    hash_ms: float = 0.0
+    saved_ms: float = 0.0   # 적중 타일을 처음 매칭할 때 걸린 시간 합 (다시 매칭했다면 걸렸을 시간 추정)
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.tiles if self.tiles else 0.0
+
+    def format(self) -> str:
+        return (f"tiles={self.tiles} hits={self.hits} ({self.hit_rate:.0%}) "
+                f"match={self.match_ms:.1f}ms hash={self.hash_ms:.1f}ms saved~{self.saved_ms:.1f}ms")
+
+
+class TileScan:
+    """스캔 1회 뷰. detect_emojis_in_regions(tile_cache=...)로 넘기면 이 스캔 통계에만 집계."""
+
+    def __init__(self, cache: "TileCache"):
+        self.cache = cache
+        self.stats = TileScanStats()
+
+    def collect(self, image: np.ndarray, template_set: TemplateSet, threshold: float,
+                offset: tuple[int, int], boxes: list, scores: list, owners: list, job=None) -> None:
+        self.cache.collect(image, template_set, threshold, offset, boxes, scores, owners, job, self.stats)
+
+
+class TileCache:
+    """타일 해시 → (후보, 매칭 시간) LRU. detect_emojis_in_regions(tile_cache=...)로 사용.
+
+    스캔별 통계가 필요하면 scan()의 TileScan을 tile_cache로 넘김.
+    """
+
+    def __init__(self, tile_size: int = CV_TILE_SIZE, max_entries: int = CV_TILE_CACHE_MAX,
+                 hash_stride: int = CV_TILE_HASH_STRIDE):
+        self.tile_size = tile_size
+        self.max_entries = max_entries
+        self.hash_stride = hash_stride
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.last_scan: Optional[TileScanStats] = None
+        self.totals = TileScanStats()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    @contextmanager
+    def scan(self) -> Iterator[TileScan]:
+        """스캔 1회 뷰. 블록 안에서 TileScan으로 한 collect를 집계 (배율 여러 개 시도 포함)."""
+        view = TileScan(self)
+        try:
+            yield view
+        finally:
+            self.last_scan = view.stats
+
+    def collect(self, image: np.ndarray, template_set: TemplateSet, threshold: float,
+                offset: tuple[int, int], boxes: list, scores: list, owners: list, job=None,
+                scan: Optional[TileScanStats] = None) -> None:
+        """detector._collect와 같은 시그니처. 타일별 캐시 후보 + 새 매칭 후보를 추가.
+
+        job: 있으면 바뀐 타일들을 job.map으로 병렬 매칭 (타일 안은 직렬). 후보는 타일 순서대로 추가.
+        scan: 이 호출을 집계할 스캔 통계 (TileScan이 넘김). 누적(totals)에는 항상 더함.
+        """
+        max_size = template_set.max_size
+        if not max_size:
+            return
+        lead = int(max_size * CV_PEAK_RADIUS_RATIO) + CV_VERIFY_RADIUS
+        overlap = max_size + lead
+        stats = TileScanStats()
+        tiles = []      # [(창 원점, 캐시 키, 후보 또는 None)]
+        misses = []     # [(tiles 인덱스, 창, core 오프셋)]
+        for wx0, wy0, wx1, wy1, cx, cy in tile_grid(image.shape[0], image.shape[1],
+                                                    self.tile_size, lead, overlap):
+            window = image[wy0:wy1, wx0:wx1]
+            start = time.perf_counter_ns()
+            key = (template_set.key, threshold, window.shape, cx, cy,
+                   tile_digest(window, self.hash_stride))
+            stats.hash_ms += (time.perf_counter_ns() - start) / 1e6
+            stats.tiles += 1
+
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+            if entry is not None:
+                candidates, match_ms = entry
+                stats.hits += 1
+                stats.saved_ms += match_ms
+            else:
+                stats.misses += 1
+                candidates = None
+                misses.append((len(tiles), window, cx, cy))
+            tiles.append(((wx0, wy0), key, candidates))
+
+        def match(miss: tuple) -> tuple[list, float]:
+            _, window, cx, cy = miss
+            start = time.perf_counter_ns()
+            candidates = [
+                c for c in match_all(window, template_set, threshold)
+                if cx <= c[2] < cx + self.tile_size and cy <= c[3] < cy + self.tile_size
+            ]
+            return candidates, (time.perf_counter_ns() - start) / 1e6
+
+        matched = job.map(match, misses) if job is not None else [match(m) for m in misses]
+        for (index, *_), (candidates, match_ms) in zip(misses, matched):
+            origin, key, _ = tiles[index]
+            tiles[index] = (origin, key, candidates)
+            stats.match_ms += match_ms
+            with self._lock:
+                self._entries[key] = (candidates, match_ms)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+        ox, oy = offset
+        for (wx0, wy0), _, candidates in tiles:
+            add_candidates(template_set, candidates, (ox + wx0, oy + wy0), boxes, scores, owners)
+
+        with self._lock:
+            _add_stats(self.totals, stats)
+        if scan is not None:
+            _add_stats(scan, stats)
+
+    def get_stats(self) -> dict:
+        return {
+            "size": len(self),
+            "tiles": self.totals.tiles,
+            "hits": self.totals.hits,
+            "hit_rate": f"{self.totals.hit_rate:.1%}",
+            "saved_ms": round(self.totals.saved_ms, 1),
+        }
+
+    def collect_metrics(self) -> list:
+        """메트릭 collector."""
+        totals = self.totals
+        return [
+            counter("emoji_tile_cache_hits", "Emoji tile cache hits.", totals.hits),
+            counter("emoji_tile_cache_misses", "Emoji tile cache misses.", totals.misses),
+            counter("emoji_tile_cache_saved_ms", "Estimated matching time saved by tile cache hits (ms).",
+                    round(totals.saved_ms, 3)),
+            gauge("emoji_tile_cache_entries", "Emoji tile cache entries.", len(self)),
+        ]
+
+
+def _add_stats(target: TileScanStats, stats: TileScanStats) -> None:
+    target.tiles += stats.tiles
+    target.hits += stats.hits
+    target.misses += stats.misses
+    target.match_ms += stats.match_ms
+    target.hash_ms += stats.hash_ms
+    target.saved_ms += stats.saved_ms
+
+
+# 이모지 스캔 공용 (main.on_scan, CV_TILE_CACHE_ENABLED일 때)
+emoji_tile_cache = TileCache()
+metrics_registry.register("emoji_tile_cache", emoji_tile_cache.collect_metrics)
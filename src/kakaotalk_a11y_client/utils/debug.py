@@ -1,13 +1,33 @@
 # SPDX-License-Identifier: MIT
 # Copyright 2025-2026 dnz3d4c
-"""Unified debug logging with rotation. Log file: <project>/logs/debug.log"""
+"""Unified debug logging with rotation. Log file: <project>/logs/debug.log
 
+Lazy formatting: log.trace("x=%s", x) or log.trace(lambda: f"...").
+Disabled levels are bound to a no-op, so the call costs one function call
+and no formatting. Guard expensive arguments with log.trace_enabled.
+
+Console/file output goes through a background writer thread (_LogWriter):
+callers only append to a queue, lines are written in batches.
+"""
+
+import atexit
 import os
+import threading
+import time
+from collections import deque
 from datetime import datetime
 from enum import IntEnum
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional, Union
+
+from ..config import (
+    LOG_FLUSH_INTERVAL_SECS,
+    LOG_FLUSH_BATCH_LINES,
+    LOG_QUEUE_MAX_LINES,
+    LOG_FILE_MAX_BYTES,
+    LOG_FILE_BACKUP_COUNT,
+)
 
 
 def _get_project_root() -> Path:
@@ -50,8 +70,8 @@ def _init_log_file() -> None:
         _log_file_path = logs_dir / "debug.log"
         _file_handler = RotatingFileHandler(
             _log_file_path,
-            maxBytes=1_048_576,  # 1MB
-            backupCount=3,       # debug.log, .1, .2, .3 (total 4MB max)
+            maxBytes=LOG_FILE_MAX_BYTES,
+            backupCount=LOG_FILE_BACKUP_COUNT,
             encoding='utf-8'
         )
         # Session start marker
@@ -61,54 +81,224 @@ def _init_log_file() -> None:
         _file_handler.flush()
     except Exception:
         _file_handler = None
+    if _writer is not None:
+        _writer.file_handler = _file_handler
+
+
+class _LogWriter:
+    """Background log writer. Batches lines to console and file.
+
+    - write() never blocks: full queue → line dropped and counted
+    - flush every flush_interval, or early once batch_lines are queued
+    - size-based rotation via RotatingFileHandler.doRollover()
+    - close() drains the queue (registered with atexit)
+    """
+
+    def __init__(
+        self,
+        file_handler: Optional[RotatingFileHandler],
+        console: bool = True,
+        flush_interval: float = LOG_FLUSH_INTERVAL_SECS,
+        batch_lines: int = LOG_FLUSH_BATCH_LINES,
+        max_lines: int = LOG_QUEUE_MAX_LINES,
+    ):
+        self.file_handler = file_handler
+        self.console = console
+        self._flush_interval = flush_interval
+        self._batch_lines = batch_lines
+        self._max_lines = max_lines
+        self._queue: deque[str] = deque()
+        self._condition = threading.Condition()
+        # queued lines ever accepted / lines written so far (flush waits for written to catch up)
+        self._queued_seq = 0
+        self._written_seq = 0
+        self._running = True
+        self.written = 0
+        self.dropped = 0
+        self._thread = threading.Thread(
+            target=self._write_loop,
+            daemon=True,
+            name="LogWriter"
+        )
+        self._thread.start()
+
+    def write(self, line: str) -> None:
+        with self._condition:
+            if len(self._queue) >= self._max_lines:
+                self.dropped += 1
+                return
+            self._queue.append(line)
+            self._queued_seq += 1
+            if len(self._queue) == self._batch_lines:
+                self._condition.notify_all()
+
+    def _write_loop(self) -> None:
+        while True:
+            with self._condition:
+                if self._running and len(self._queue) < self._batch_lines:
+                    self._condition.wait(self._flush_interval)
+                if not self._queue:
+                    if not self._running:
+                        return
+                    continue
+                lines = list(self._queue)
+                self._queue.clear()
+            self._write_batch(lines)
+            with self._condition:
+                self.written += len(lines)
+                self._written_seq += len(lines)
+                self._condition.notify_all()
+
+    def _write_batch(self, lines: list[str]) -> None:
+        text = "\n".join(lines) + "\n"
+
+        # Console output
+        if self.console:
+            try:
+                print(text, end="")
+            except UnicodeEncodeError:
+                # Handle Windows console encoding issues
+                print(''.join(c if ord(c) < 0x10000 else '?' for c in text), end="")
+            except Exception:
+                pass
+
+        # File output with rotation
+        handler = self.file_handler
+        if handler:
+            try:
+                stream = handler.stream
+                size = len(text.encode("utf-8"))
+                if handler.maxBytes > 0 and stream.tell() + size >= handler.maxBytes:
+                    handler.doRollover()
+                    stream = handler.stream
+                stream.write(text)
+                stream.flush()
+            except Exception:
+                pass
+
+    def flush(self, timeout: float = 1.0) -> bool:
+        """Wake the writer and wait until every line queued so far is written. False on timeout."""
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            target = self._queued_seq
+            self._condition.notify_all()
+            while self._written_seq < target:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._thread.is_alive():
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def close(self) -> None:
+        """Stop the thread after a final flush."""
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        if self._thread.is_alive():
+            self._thread.join(timeout=2.0)
+
+    def get_stats(self) -> dict:
+        with self._condition:
+            return {
+                "queued": len(self._queue),
+                "written": self.written,
+                "dropped": self.dropped,
+            }
+
+
+_writer: Optional[_LogWriter] = None
+_writer_lock = threading.Lock()
+
+
+def _get_writer() -> _LogWriter:
+    """Start the writer on first log line (no thread when logging is off)."""
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = _LogWriter(_file_handler)
+                atexit.register(_writer.close)
+    return _writer
 
 # Initialize log file only in debug mode
 if _global_level < LogLevel.NONE:
     _init_log_file()
 
 
+LogMessage = Union[str, Callable[[], str]]
+
+
+def _noop(msg: LogMessage = "", *args) -> None:
+    """Bound to disabled levels. No formatting, no level check."""
+    return None
+
+
+# (method name, level, enabled flag attribute)
+_LEVEL_METHODS = (
+    ("trace", LogLevel.TRACE, "trace_enabled"),
+    ("debug", LogLevel.DEBUG, "debug_enabled"),
+    ("info", LogLevel.INFO, "info_enabled"),
+    ("warning", LogLevel.WARNING, "warning_enabled"),
+    ("error", LogLevel.ERROR, "error_enabled"),
+)
+
+
 class Logger:
+    """Module logger.
+
+    Level methods are rebound per instance whenever the level changes:
+    enabled levels go to the real method, disabled ones to _noop.
+    """
 
     def __init__(self, name: str, level: Optional[LogLevel] = None):
         self.name = name
         self.level = level if level is not None else _global_level
 
-    def _log(self, level: LogLevel, msg: str) -> None:
-        if level >= self.level:
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            prefix = f"[{level.name}:{self.name}]"
-            line = f"{timestamp} {prefix} {msg}"
-
-            # Console output
-            try:
-                print(line)
-            except UnicodeEncodeError:
-                # Handle Windows console encoding issues
-                clean = ''.join(c if ord(c) < 0x10000 else '?' for c in msg)
-                print(f"{timestamp} {prefix} {clean}")
-
-            # File output with rotation
-            if _file_handler:
+    @property
+    def level(self) -> LogLevel:
+        return self._level
+
+    @level.setter
+    def level(self, level: LogLevel) -> None:
+        self._level = level
+        for method, method_level, flag in _LEVEL_METHODS:
+            enabled = method_level >= level
+            setattr(self, flag, enabled)
+            if enabled:
+                # instance attribute 제거 → class method 사용
+                self.__dict__.pop(method, None)
+            else:
+                setattr(self, method, _noop)
+
+    def isEnabledFor(self, level: LogLevel) -> bool:
+        return level >= self._level
+
+    def _log(self, level: LogLevel, msg: LogMessage, args: tuple = ()) -> None:
+        if level >= self._level:
+            if callable(msg):
+                msg = msg()
+            elif args:
                 try:
-                    _file_handler.stream.write(f"{line}\n")
-                    _file_handler.flush()
-                except Exception:
-                    pass
+                    msg = msg % args
+                except (TypeError, ValueError):
+                    msg = f"{msg} {args!r}"
+            timestamp = datetime.now().strftime("%H:%M:%S")
+            (_writer or _get_writer()).write(f"{timestamp} [{level.name}:{self.name}] {msg}")
 
-    def trace(self, msg: str) -> None:
-        self._log(LogLevel.TRACE, msg)
+    def trace(self, msg: LogMessage, *args) -> None:
+        self._log(LogLevel.TRACE, msg, args)
 
-    def debug(self, msg: str) -> None:
-        self._log(LogLevel.DEBUG, msg)
+    def debug(self, msg: LogMessage, *args) -> None:
+        self._log(LogLevel.DEBUG, msg, args)
 
-    def info(self, msg: str) -> None:
-        self._log(LogLevel.INFO, msg)
+    def info(self, msg: LogMessage, *args) -> None:
+        self._log(LogLevel.INFO, msg, args)
 
-    def warning(self, msg: str) -> None:
-        self._log(LogLevel.WARNING, msg)
+    def warning(self, msg: LogMessage, *args) -> None:
+        self._log(LogLevel.WARNING, msg, args)
 
-    def error(self, msg: str) -> None:
-        self._log(LogLevel.ERROR, msg)
+    def error(self, msg: LogMessage, *args) -> None:
+        self._log(LogLevel.ERROR, msg, args)
 
 
 # Logger cache
@@ -140,5 +330,18 @@ def is_trace_enabled() -> bool:
     return _global_level <= LogLevel.TRACE
 
 
+def flush_logs() -> None:
+    """Block until queued log lines are written."""
+    if _writer is not None:
+        _writer.flush()
+
+
+def get_log_writer_stats() -> dict:
+    """written/dropped/queued line counters."""
+    if _writer is None:
+        return {}
+    return _writer.get_stats()
+
+
 def get_log_file_path() -> Optional[str]:
     return str(_log_file_path) if _log_file_path else None
@@ -14,10 +14,13 @@ except ImportError:
 
 import pyautogui
 
-from ..accessibility import speak
+from ..accessibility import speak, get_braille_stats
 from .debug_config import debug_config
 from .debug_tools import debug_tools, KakaoNotFoundError
 from .profiler import profiler
+from .sampling_profiler import sampling_profiler
+from .latency_tracer import latency_tracer
+from .flight_recorder import flight_recorder
 from .event_monitor import EventMonitor, ConsoleFormatter
 from .debug import get_logger
 
@@ -51,6 +54,12 @@ def _format_hotkey_for_keyboard(config: dict) -> str:
 def _on_dump_now():
     print("[DEBUG] 덤프 시작...")
     speak("덤프 시작")
+
+    # 플라이트 레코더는 카카오톡 창 없어도 저장
+    flight_path = flight_recorder.dump("manual", force=True)
+    if flight_path:
+        print(f"[DEBUG] 플라이트 레코더 저장: {flight_path}")
+
     try:
         path = debug_tools.dump_to_file(filename_prefix='manual')
         print(f"[DEBUG] 덤프 완료: {path}")
@@ -79,6 +88,25 @@ def _on_show_profile():
         print("[DEBUG] 프로파일 리포트 완료 (저장 실패)")
         speak("프로파일 완료")
 
+    # 샘플링 프로파일러 토글 (켜기 → 다음 누를 때 끄고 collapsed stack 저장)
+    if not sampling_profiler.running:
+        sampling_profiler.reset()
+        sampling_profiler.start()
+        print(f"[DEBUG] 샘플링 프로파일러 시작 ({sampling_profiler.rate_hz:g}Hz)")
+        speak("샘플링 시작")
+        return
+
+    sampling_profiler.stop()
+    stats = sampling_profiler.get_stats()
+    print(f"[DEBUG] 샘플링 프로파일러 중지: {stats['ticks']}회, "
+          f"오버헤드 {stats['overhead_pct']:.2f}%, 스레드별 {stats['threads']}")
+    collapsed_path = sampling_profiler.write_collapsed()
+    if collapsed_path:
+        print(f"[DEBUG] collapsed stack 저장: {collapsed_path}")
+        speak(f"샘플링 중지, {collapsed_path.name}")
+    else:
+        speak("샘플링 중지")
+
 
 def _on_show_status():
     """현재 디버그 상태 요약 발화 (Ctrl+Shift+S)."""
@@ -94,6 +122,17 @@ def _on_show_status():
     else:
         status_parts.append("프로파일러 측정 없음")
 
+    # 포커스→발화 지연
+    status_parts.append(latency_tracer.get_summary())
+    latency_path = latency_tracer.save_json()
+    if latency_path:
+        print(f"[DEBUG] 지연 히스토그램 저장: {latency_path}")
+
+    # 점자 채널
+    braille = get_braille_stats()
+    if braille:
+        status_parts.append(f"점자 {braille['written']}회 출력, {braille['suppressed']}회 생략")
+
     status_text = ", ".join(status_parts)
     print(f"[DEBUG] 상태: {status_text}")
     speak(f"디버그 상태, {status_text}")
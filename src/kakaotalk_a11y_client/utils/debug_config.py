@@ -34,6 +34,11 @@ class DebugConfig:
     # 덤프 파일 관리
     max_dump_files: int = 50  # auto_* 최대 보관 (쌍 단위, 실제 파일 수는 2배)
     dump_cooldown_seconds: float = 60.0  # 동일 트리거 덤프 최소 간격(초)
+    auto_dump_max_depth: int = 6  # 자동 덤프 트리 깊이
+    auto_dump_max_nodes: int = 3000  # 자동 덤프 노드 상한
+    auto_dump_time_budget_seconds: float = 3.0  # 자동 덤프 1건 시간 상한
+    auto_dump_queue_size: int = 4  # 대기 중인 자동 덤프 최대 수 (초과분 버림)
+    auto_dump_keyframe_interval: int = 10  # 전체 덤프 주기 (사이는 직전 대비 델타, 1이면 항상 전체)
     max_profile_files: int = 10  # profile_*.log 최대 보관
 
     # 로깅 레벨
@@ -1,8 +1,14 @@
 # SPDX-License-Identifier: MIT
 # Copyright 2025-2026 dnz3d4c
-"""디버그 도구 통합 관리. 에러/느린 작업 발생 시 자동 덤프."""
+"""디버그 도구 통합 관리. 에러/느린 작업 발생 시 자동 덤프.
+
+자동 덤프는 AutoDumpWorker(전용 COM 스레드)에서 실행. 호출 스레드는 큐에 넣기만 함.
+연속 자동 덤프는 직전 덤프 대비 변경분(.delta.json)만 저장, 키프레임 주기로 전체 저장.
+"""
 
 import json
+import queue
+import threading
 import time
 import traceback
 from contextlib import contextmanager
@@ -12,24 +18,128 @@ from typing import Optional
 
 import uiautomation as auto
 
+from .com_utils import com_thread
+from .debug import get_logger
 from .debug_config import debug_config
 from .profiler import profiler
-from .uia_utils import dump_tree_json
+from .uia_tree_diff import NodeKeyer, TreeIndex, diff_index
+from .uia_tree_dump import DumpBudget, stream_tree_dump
+
+log = get_logger("DebugTools")
 
 
 class KakaoNotFoundError(Exception):
     pass
 
 
+def _is_keyframe(path: Path) -> bool:
+    """자동 덤프 전체 트리 파일 (델타/컨텍스트 제외)."""
+    return path.suffix == '.json' and not path.name.endswith(('.delta.json', '.context.json'))
+
+
+class AutoDumpWorker:
+    """자동 덤프 백그라운드 워커. 전용 COM 아파트 + bounded queue.
+
+    - submit()은 블로킹 없음. 큐가 차면 버리고 dropped 카운트
+    - 같은 트리거가 이미 대기/실행 중이면 무시 (dedupe)
+    - 첫 submit 시 스레드 시작
+    """
+
+    def __init__(self, handler, queue_size: int):
+        self._handler = handler
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._pending: set[str] = set()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.completed = 0
+        self.dropped = 0
+        self.deduped = 0
+
+    def submit(self, trigger: str, context: dict) -> bool:
+        with self._lock:
+            if trigger in self._pending:
+                self.deduped += 1
+                return False
+            try:
+                self._queue.put_nowait((trigger, context))
+            except queue.Full:
+                self.dropped += 1
+                return False
+            self._pending.add(trigger)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    daemon=True,
+                    name="AutoDumpWorker"
+                )
+                self._thread.start()
+        return True
+
+    def _run(self) -> None:
+        # UIA 호출용 COM 초기화 (호출 스레드 아파트와 분리)
+        with com_thread():
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    self._queue.task_done()
+                    return
+                trigger, context = item
+                try:
+                    self._handler(trigger, context)
+                except Exception as e:
+                    log.warning(f"auto dump failed ({trigger}): {e}")
+                finally:
+                    with self._lock:
+                        self._pending.discard(trigger)
+                    self.completed += 1
+                    self._queue.task_done()
+
+    def wait_idle(self, timeout: float = 5.0) -> bool:
+        """대기 중인 덤프가 모두 끝날 때까지 대기. 테스트/종료용."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if not self._queue.unfinished_tasks:
+                return True
+            time.sleep(0.01)
+        return False
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        try:
+            self._queue.put(None, timeout=1.0)
+        except queue.Full:
+            return
+        self._thread.join(timeout=2.0)
+        self._thread = None
+
+    def get_stats(self) -> dict:
+        return {
+            "queued": self._queue.qsize(),
+            "completed": self.completed,
+            "dropped": self.dropped,
+            "deduped": self.deduped,
+        }
+
+
 class DebugToolManager:
 
     def __init__(self):
         self._session_id = datetime.now().strftime('%Y%m%d_%H%M%S')
         self._session_start = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         self._dump_count = 0
+        self.last_dump_stats: dict = {}
+        # 직전 자동 덤프 (파일명, TreeIndex). 워커 스레드에서만 접근
+        self._prev_auto_snapshot: Optional[tuple[str, TreeIndex]] = None
+        self._auto_dump_seq = 0
         self._issues: list[dict] = []
+        self._issues_lock = threading.Lock()
         self._last_dump_times: dict[str, float] = {}
         self._cleanup_done = False
+        self._dump_worker = AutoDumpWorker(
+            self._write_auto_dump,
+            queue_size=debug_config.auto_dump_queue_size
+        )
 
     @contextmanager
     def debug_operation(
@@ -93,30 +203,31 @@ class DebugToolManager:
         self,
         filename_prefix: str = 'manual',
         include_coords: bool = True,
-        max_depth: int = 6
+        max_depth: int = 6,
+        budget: Optional[DumpBudget] = None
     ) -> Path:
-        """카카오톡 UIA 트리를 JSON 파일로 저장."""
-        kakao = self._find_kakao_window()
+        """카카오톡 UIA 트리를 JSON 파일로 저장. budget 지정 시 compact JSON.
 
-        tree = dump_tree_json(kakao, max_depth=max_depth, include_coords=include_coords)
+        하위 트리 캐시 1회 조회 후 노드 단위 스트리밍 (트리 전체를 메모리에 안 만듦).
+        """
+        kakao = self._find_kakao_window()
 
         timestamp = datetime.now().strftime('%H%M%S')
         filename = f'{filename_prefix}_{timestamp}.json'
         dump_path = debug_config.debug_output_dir / filename
 
-        dump_path.write_text(
-            json.dumps(tree, ensure_ascii=False, indent=2),
-            encoding='utf-8'
-        )
+        with open(dump_path, 'w', encoding='utf-8') as f:
+            self.last_dump_stats = stream_tree_dump(
+                kakao, f, fmt='json', max_depth=max_depth,
+                include_coords=include_coords, budget=budget,
+                indent=None if budget is not None else 2
+            )
 
         self._dump_count += 1
         return dump_path
 
     def _auto_dump(self, trigger: str, context: dict):
-        if not self._cleanup_done:
-            self._cleanup_done = True
-            self.cleanup_old_dumps()
-
+        """쿨다운 통과 시 워커에 덤프 요청. 호출 스레드는 블로킹 없음."""
         # 쿨다운 체크
         now = time.monotonic()
         cooldown = debug_config.dump_cooldown_seconds
@@ -125,14 +236,27 @@ class DebugToolManager:
             return
         self._last_dump_times[trigger] = now
 
+        self._dump_worker.submit(trigger, context)
+
+    def _write_auto_dump(self, trigger: str, context: dict):
+        """AutoDumpWorker 스레드에서 실행. 노드/시간 상한 적용."""
+        if not self._cleanup_done:
+            self._cleanup_done = True
+            self.cleanup_old_dumps()
+
         try:
             timestamp = datetime.now().strftime('%H%M%S')
             filename = f'auto_{trigger}_{timestamp}'
 
-            dump_path = self.dump_to_file(
-                filename_prefix=filename,
-                include_coords=True
+            budget = DumpBudget(
+                max_nodes=debug_config.auto_dump_max_nodes,
+                max_seconds=debug_config.auto_dump_time_budget_seconds
             )
+            dump_path, stats = self._write_auto_snapshot(filename, budget)
+            context = {**context, 'nodes': stats['nodes'], 'truncated': stats['truncated'],
+                       'cached': stats['cached'], 'elapsed_ms': stats['elapsed_ms']}
+            if 'delta' in stats:
+                context['delta'] = stats['delta']
 
             # 컨텍스트 정보도 저장
             context_path = dump_path.with_suffix('.context.json')
@@ -142,12 +266,13 @@ class DebugToolManager:
             )
 
             # 이슈 기록
-            self._issues.append({
-                'trigger': trigger,
-                'time': datetime.now().isoformat(),
-                'dump_path': str(dump_path),
-                **context
-            })
+            with self._issues_lock:
+                self._issues.append({
+                    'trigger': trigger,
+                    'time': datetime.now().isoformat(),
+                    'dump_path': str(dump_path),
+                    **context
+                })
 
             print(f"[DEBUG] 자동 덤프: {dump_path}")
         except KakaoNotFoundError:
@@ -155,8 +280,64 @@ class DebugToolManager:
         except Exception as e:
             print(f"[DEBUG] 자동 덤프 실패: {e}")
 
+    def _write_auto_snapshot(self, filename_prefix: str, budget: DumpBudget) -> tuple[Path, dict]:
+        """자동 덤프 1건 저장. 키프레임이면 전체 트리, 아니면 직전 덤프 대비 델타. 반환: (경로, 통계).
+
+        델타 파일의 base는 직전 덤프 파일명 (그것도 델타면 키프레임까지 거슬러 올라감).
+        budget으로 잘린 스냅샷은 diff하지 않고 (잘린 노드가 삭제/삽입으로 보임) 다음 base로도 안 씀.
+        통계는 반환값으로만 (last_dump_stats는 수동 덤프용, 핫키 스레드와 공유 안 함).
+        """
+        kakao = self._find_kakao_window()
+
+        output_dir = debug_config.debug_output_dir
+        interval = debug_config.auto_dump_keyframe_interval
+        prev = self._prev_auto_snapshot
+        keyframe = prev is None or interval <= 1 or self._auto_dump_seq % interval == 0
+
+        # 기록하면서 diff 인덱스 구성 (트리 텍스트/dict를 메모리에 안 만듦). 델타면 트리 기록 없음
+        index = TreeIndex()
+        keyer = NodeKeyer()
+
+        def on_node(node_id, parent_id, depth, props):
+            index.add(keyer(node_id, parent_id, props))
+
+        def dump(fp) -> dict:
+            return stream_tree_dump(
+                kakao, fp, fmt='json', max_depth=debug_config.auto_dump_max_depth,
+                include_coords=True, budget=budget, on_node=on_node
+            )
+
+        if keyframe:
+            dump_path = output_dir / f'{filename_prefix}.json'
+            with open(dump_path, 'w', encoding='utf-8') as f:
+                stats = dump(f)
+        else:
+            stats = dump(None)
+            prev_name, prev_index = prev
+            dump_path = output_dir / f'{filename_prefix}.delta.json'
+            if stats['truncated']:
+                # 잘린 트리와의 diff는 의미 없음. 부분 표시만 남김
+                record = {'base': prev_name, 'partial': True, 'new_nodes': stats['nodes']}
+                stats = {**stats, 'delta': '잘림 (비교 생략)'}
+            else:
+                diff = diff_index(prev_index, index.nodes())
+                record = {'base': prev_name, **diff.to_dict()}
+                stats = {**stats, 'delta': diff.summary()}
+            with open(dump_path, 'w', encoding='utf-8') as f:
+                json.dump(record, f, ensure_ascii=False, separators=(',', ':'))
+
+        self._auto_dump_seq += 1
+        # 잘린 인덱스는 base로 안 씀 → 다음 덤프는 키프레임
+        self._prev_auto_snapshot = None if stats['truncated'] else (dump_path.name, index)
+        self._dump_count += 1
+        return dump_path, stats
+
     def cleanup_old_dumps(self):
-        """오래된 auto_* 덤프 파일 정리."""
+        """오래된 auto_* 덤프 정리. 키프레임 + 뒤따르는 델타/컨텍스트 묶음(체인) 단위로 삭제.
+
+        델타는 앞 덤프를 base로 참조하므로 파일 단위로 지우면 남은 델타를 복원할 수 없음.
+        가장 오래된 체인부터 지우고, 최신 체인은 항상 남김.
+        """
         try:
             output_dir = debug_config.debug_output_dir
             if not output_dir.exists():
@@ -164,14 +345,26 @@ class DebugToolManager:
 
             dump_files = sorted(
                 output_dir.glob('auto_*'),
-                key=lambda p: p.stat().st_mtime
+                key=lambda p: (p.stat().st_mtime_ns, p.name)
             )
+            # 키프레임마다 새 체인. 첫 키프레임 앞 파일은 base가 이미 지워진 체인
+            chains: list[list[Path]] = [[]]
+            for path in dump_files:
+                if _is_keyframe(path) and chains[-1]:
+                    chains.append([])
+                chains[-1].append(path)
+
             max_files = debug_config.max_dump_files * 2
-            if len(dump_files) > max_files:
-                to_delete = dump_files[:-max_files]
-                for f in to_delete:
+            total = len(dump_files)
+            deleted = 0
+            while len(chains) > 1 and total > max_files:
+                chain = chains.pop(0)
+                for f in chain:
                     f.unlink()
-                print(f"[DEBUG] 오래된 덤프 {len(to_delete)}개 삭제")
+                total -= len(chain)
+                deleted += len(chain)
+            if deleted:
+                print(f"[DEBUG] 오래된 덤프 {deleted}개 삭제")
         except Exception:
             pass
 
@@ -211,6 +404,8 @@ class DebugToolManager:
             f'session_{self._session_id}_report.md'
         )
 
+        # 진행 중인 자동 덤프 마무리 대기
+        self._dump_worker.wait_idle(timeout=debug_config.auto_dump_time_budget_seconds)
         dump_list = self._format_dump_list()
         issues_text = self._format_issues()
 
@@ -250,11 +445,13 @@ class DebugToolManager:
             return "- 덤프 목록 로드 실패"
 
     def _format_issues(self) -> str:
-        if not self._issues:
+        with self._issues_lock:
+            issues = self._issues[-10:]  # 최근 10개
+        if not issues:
             return "- 발생한 문제 없음"
 
         lines = []
-        for issue in self._issues[-10:]:  # 최근 10개
+        for issue in issues:
             trigger = issue.get('trigger', 'unknown')
             time = issue.get('time', '')
             error = issue.get('error', '')
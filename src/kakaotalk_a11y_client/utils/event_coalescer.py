@@ -12,6 +12,7 @@ from collections import OrderedDict
 from typing import Any, Callable, Optional, Tuple
 
 from .debug import get_logger
+from .metrics import counter, gauge
 
 log = get_logger("EventCoalescer")
 
@@ -42,6 +43,14 @@ class EventCoalescer:
         self._callback = flush_callback
         self._interval = flush_interval
         self._running = True
+
+        # 메트릭용 누적 카운터 (증가는 _lock 안, 읽기는 락 없이)
+        self.immediate_count = 0   # 배치 우회
+        self.batched_count = 0     # 배치 큐 추가
+        self.coalesced_count = 0   # 같은 키 덮어씀
+        self.flushed_count = 0     # 배치에서 콜백 호출
+        self.error_count = 0       # 콜백 예외
+
         self._thread = threading.Thread(
             target=self._flush_loop,
             daemon=True,
@@ -60,16 +69,22 @@ class EventCoalescer:
         """
         if immediate:
             # 배치 큐 우회, 직접 콜백 (0ms 지연)
+            with self._lock:
+                self.immediate_count += 1
             try:
                 self._callback(event)
             except Exception as e:
+                with self._lock:
+                    self.error_count += 1
                 log.error(f"immediate callback error: {e}")
             return
 
         with self._condition:
+            self.batched_count += 1
             # 기존 키 있으면 삭제 후 끝에 추가 (순서 갱신)
             if key in self._pending:
                 del self._pending[key]
+                self.coalesced_count += 1
             self._pending[key] = event
             # 플러셔 스레드 깨우기 (NVDA condition_variable 패턴)
             if not self._needs_flush:
@@ -96,11 +111,7 @@ class EventCoalescer:
                 self._needs_flush = False
 
             # 락 해제 후 콜백 호출
-            for event in events:
-                try:
-                    self._callback(event)
-                except Exception as e:
-                    log.error(f"event callback error: {e}")
+            self._deliver(events)
 
     def _flush(self) -> None:
         """대기 중인 이벤트 일괄 처리. stop() 시 마지막 flush용."""
@@ -113,10 +124,18 @@ class EventCoalescer:
             self._needs_flush = False
 
         # 락 해제 후 콜백 호출
+        self._deliver(events)
+
+    def _deliver(self, events: list) -> None:
+        # 플러셔 스레드와 stop()의 마지막 flush가 겹칠 수 있음
+        with self._lock:
+            self.flushed_count += len(events)
         for event in events:
             try:
                 self._callback(event)
             except Exception as e:
+                with self._lock:
+                    self.error_count += 1
                 log.error(f"event callback error: {e}")
 
     def stop(self) -> None:
@@ -136,3 +155,20 @@ class EventCoalescer:
         """대기 중인 이벤트 수."""
         with self._condition:
             return len(self._pending)
+
+    def collect_metrics(self, owner: str) -> list:
+        """메트릭 collector. 락 안 잡음 (대기 수는 근사)."""
+        events = counter("coalescer_events", "EventCoalescer.add() calls by path.")
+        events.add(self.immediate_count, owner=owner, path="immediate")
+        events.add(self.batched_count, owner=owner, path="batched")
+        return [
+            events,
+            counter("coalescer_coalesced", "Pending events replaced by a newer one with the same key.",
+                    self.coalesced_count, owner=owner),
+            counter("coalescer_flushed", "Batched events delivered to the callback.",
+                    self.flushed_count, owner=owner),
+            counter("coalescer_callback_errors", "Callback exceptions.",
+                    self.error_count, owner=owner),
+            gauge("coalescer_pending", "Events waiting for the next flush.",
+                  len(self._pending), owner=owner),
+        ]
@@ -0,0 +1,208 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025-2026 dnz3d4c
+"""파이프라인 입력 이벤트 기록 (재생용 JSONL).
+
+플라이트 레코더는 필터 결정만 남기지만 이건 파이프라인이 읽는 입력 자체를 기록.
+tests/uia_sim 재생기(scripts/replay_events.py)가 시뮬레이터 위에서 그대로 다시 흘려보냄.
+
+기본 꺼짐 (--record-events PATH). 켜면 이벤트마다 요소 속성을 읽으므로 COM 왕복이 늘어남.
+파일 쓰기는 기록 스레드가 함 (COM 콜백 스레드는 큐에 넣기만).
+
+줄 형식 (첫 줄은 헤더):
+    {"format": "kakaotalk-a11y-events", "version": 1, "started": "..."}
+    {"t": 0.125, "kind": "focus", "control_type": "ListItemControl", "name": "...", ...}
+
+kind:
+    foreground  포그라운드 창 변경 (hwnd, class_name, title)
+    focus       FocusChanged 원본 sender (필터 전)
+    selection   ElementSelected sender
+    list        MessageListMonitor 시작 시 목록 (hwnd, names)
+    structure   StructureChanged (change_type)
+    messages    디바운스 flush에서 찾은 새 메시지 (names)
+    menu_open   메뉴 모드 진입 (hwnd)
+    menu_close  메뉴 모드 종료
+"""
+
+import json
+import queue
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional
+
+from .debug import get_logger
+from .metrics import counter, gauge, metrics_registry
+
+log = get_logger("EventRecorder")
+
+RECORDING_FORMAT = "kakaotalk-a11y-events"
+RECORDING_VERSION = 1
+
+KINDS = ("foreground", "focus", "selection", "list", "structure", "messages",
+         "menu_open", "menu_close")
+
+
+def element_fields(control) -> dict[str, Any]:
+    """재생에 필요한 요소 속성. 읽기 실패한 속성은 빈 값."""
+    fields: dict[str, Any] = {}
+    for key, attr in (("control_type", "ControlTypeName"), ("name", "Name"),
+                      ("class_name", "ClassName"), ("automation_id", "AutomationId"),
+                      ("hwnd", "NativeWindowHandle")):
+        try:
+            fields[key] = getattr(control, attr) or (0 if key == "hwnd" else "")
+        except Exception:
+            fields[key] = 0 if key == "hwnd" else ""
+    try:
+        fields["runtime_id"] = list(control.GetRuntimeId() or ())
+    except Exception:
+        fields["runtime_id"] = []
+    return fields
+
+
+def names_of(controls) -> list[str]:
+    names = []
+    for control in controls or ():
+        try:
+            names.append(control.Name or "")
+        except Exception:
+            names.append("")
+    return names
+
+
+class EventRecorder:
+    """JSONL 이벤트 기록기. 꺼져 있으면 호출부는 active 확인 1회로 끝남.
+
+    record()는 시각을 찍어 큐에 넣기만 하고, 직렬화/쓰기/flush는 기록 스레드
+    (FlightRecorder.dump_async와 같은 방식). 큐가 밀려 있으면 flush는 비었을 때 1회.
+    """
+
+    def __init__(self):
+        self._queue: Optional[queue.Queue] = None  # 기록 중일 때만. None = 종료 신호
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._start = 0.0
+        self.path: Optional[Path] = None
+        self.written = 0  # 기록 스레드만 갱신
+        self.errors = 0
+
+    @property
+    def active(self) -> bool:
+        return self._queue is not None
+
+    def start(self, path: Path) -> bool:
+        """기록 시작. 이미 기록 중이면 이전 파일 닫고 새로 시작."""
+        self.stop()
+        path = Path(path)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            f = open(path, "w", encoding="utf-8")
+            header = {"format": RECORDING_FORMAT, "version": RECORDING_VERSION,
+                      "started": datetime.now().isoformat()}
+            f.write(json.dumps(header, ensure_ascii=False) + "\n")
+        except OSError as e:
+            log.warning(f"event recording start failed: {e}")
+            return False
+        records: queue.Queue = queue.Queue()
+        thread = threading.Thread(
+            target=self._write_loop,
+            args=(f, records),
+            daemon=True,
+            name="EventRecorderWriter"
+        )
+        with self._lock:
+            self._queue = records
+            self._thread = thread
+            self._start = time.monotonic()
+            self.path = path
+            self.written = 0
+        thread.start()
+        log.info(f"event recording started: {path}")
+        return True
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """기록 종료. 큐에 남은 레코드를 다 쓰고 파일을 닫을 때까지 대기 (최대 timeout초)."""
+        with self._lock:
+            records, self._queue = self._queue, None
+            thread, self._thread = self._thread, None
+        if records is None:
+            return
+        records.put(None)
+        thread.join(timeout)
+        log.info(f"event recording stopped: {self.written} records")
+
+    def record(self, kind: str, **fields) -> None:
+        """레코드 1줄 (큐에 넣기만). fields 값은 넘긴 뒤 바꾸지 말 것."""
+        if self._queue is None:
+            return
+        data = {"t": 0.0, "kind": kind, **fields}
+        with self._lock:
+            # 시각과 큐 순서를 같은 락 안에서 → 파일 줄 순서 = 시간순
+            if self._queue is None:
+                return
+            data["t"] = round(time.monotonic() - self._start, 6)
+            self._queue.put(data)
+
+    def _write_loop(self, f, records: queue.Queue) -> None:
+        """기록 스레드. 쓰기 실패는 카운트만 (이벤트 처리 안 막음)."""
+        try:
+            while True:
+                data = records.get()
+                try:
+                    if data is None:
+                        return
+                    try:
+                        f.write(json.dumps(data, ensure_ascii=False) + "\n")
+                        self.written += 1
+                    except (OSError, TypeError, ValueError) as e:
+                        self.errors += 1
+                        log.trace(f"event record failed: {e}")
+                    if records.empty():
+                        try:
+                            f.flush()
+                        except OSError as e:
+                            log.trace(f"event record flush failed: {e}")
+                finally:
+                    records.task_done()
+        finally:
+            f.close()
+
+    def wait_idle(self, timeout: float = 5.0) -> bool:
+        """큐에 들어간 레코드가 모두 파일에 쓰일 때까지 대기. 테스트용."""
+        records = self._queue
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if records is None or not records.unfinished_tasks:
+                return True
+            time.sleep(0.01)
+        return False
+
+    def record_element(self, kind: str, control, **fields) -> None:
+        if self._queue is None:
+            return
+        self.record(kind, **element_fields(control), **fields)
+
+    def collect_metrics(self) -> list:
+        return [
+            gauge("event_recorder_active", "Event recording enabled.", self.active),
+            counter("event_recorder_records", "Event records written.", self.written),
+            counter("event_recorder_errors", "Event records that failed to write.", self.errors),
+        ]
+
+
+def read_recording(path: Path) -> tuple[dict, list[dict]]:
+    """(헤더, 레코드 목록). 형식이 다르면 ValueError."""
+    with open(path, "r", encoding="utf-8") as f:
+        lines = [line for line in f if line.strip()]
+    if not lines:
+        raise ValueError(f"empty recording: {path}")
+    header = json.loads(lines[0])
+    if header.get("format") != RECORDING_FORMAT:
+        raise ValueError(f"not an event recording: {path}")
+    if header.get("version", 0) > RECORDING_VERSION:
+        raise ValueError(f"unsupported recording version: {header.get('version')}")
+    return header, [json.loads(line) for line in lines[1:]]
+
+
+event_recorder = EventRecorder()
+metrics_registry.register("event_recorder", event_recorder.collect_metrics)
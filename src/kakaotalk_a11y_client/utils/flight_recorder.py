@@ -0,0 +1,280 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025-2026 dnz3d4c
+"""UIA 이벤트/필터 결정 플라이트 레코더.
+
+고정 크기 링 버퍼에 24바이트 바이너리 레코드만 기록 (항상 켜짐).
+덤프 시점: 이벤트 처리 에러, 디버그 덤프 단축키, 느린 이벤트(임계값 초과).
+에러/느린 이벤트 덤프는 COM 콜백 스레드에서 스냅샷만 잡고 파일 기록은 백그라운드 스레드.
+디코딩: scripts/decode_flight_record.py (JSONL / 타임라인).
+
+레코드: timestamp(double) | runtime_id 해시(uint32) | control type | event | decision
+        | filter_us(uint32) | total_us(uint32)
+"""
+
+import itertools
+import queue
+import struct
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, Optional
+
+from ..config import (
+    FLIGHT_RECORDER_CAPACITY,
+    FLIGHT_RECORDER_SLOW_MS,
+    FLIGHT_RECORDER_DUMP_COOLDOWN_SECS,
+)
+from .debug import get_logger
+from .metrics import counter, metrics_registry
+
+log = get_logger("FlightRecorder")
+
+MAGIC = b"KFR1"
+_HEADER = struct.Struct("<4sHHIQ")  # magic, version, record size, capacity, total written
+_RECORD = struct.Struct("<dIBBBxII")
+VERSION = 1
+
+# 코드 테이블. 순서 바꾸면 기존 덤프 해석이 달라지므로 끝에만 추가
+EVENT_TYPES = ("unknown", "focus", "selection", "structure")
+DECISIONS = (
+    "unknown",
+    "pass",         # coalescer로 전달
+    "debounce",     # 시간 디바운싱
+    "hwnd",         # 카카오톡 창 아님
+    "duplicate",    # 같은 RuntimeId
+    "control",      # Control 변환 실패
+    "chrome",       # Chrome_* 요소
+    "container",    # 컨테이너 타입
+    "placeholder",  # 안 그려진 메뉴 항목
+    "error",        # 처리 중 예외
+    "buffered",     # StructureChanged 버퍼링
+    "no_name",      # 이름/값 없음
+)
+CONTROL_TYPES = (
+    "",
+    "ListItemControl",
+    "MenuItemControl",
+    "ListControl",
+    "MenuControl",
+    "MenuBarControl",
+    "TabItemControl",
+    "ButtonControl",
+    "EditControl",
+    "TextControl",
+    "WindowControl",
+    "PaneControl",
+    "DocumentControl",
+    "CheckBoxControl",
+    "ComboBoxControl",
+    "TreeItemControl",
+    "HyperlinkControl",
+    "ImageControl",
+    "GroupControl",
+    "CustomControl",
+)
+
+_EVENT_CODES = {name: i for i, name in enumerate(EVENT_TYPES)}
+_DECISION_CODES = {name: i for i, name in enumerate(DECISIONS)}
+_CONTROL_CODES = {name: i for i, name in enumerate(CONTROL_TYPES)}
+_CONTROL_OTHER = 255  # 테이블에 없는 타입
+
+_UINT32_MAX = 0xFFFFFFFF
+
+
+def runtime_id_hash(runtime_id) -> int:
+    """RuntimeId 튜플 → uint32. 같은 요소 추적용 (충돌 무시)."""
+    return hash(runtime_id) & _UINT32_MAX if runtime_id else 0
+
+
+class FlightRecorder:
+    """고정 크기 바이너리 링 버퍼.
+
+    record()는 struct.pack_into 1회. 슬롯 예약은 락 없음 (itertools.count).
+    written/결정별 누적 수는 여러 COM 스레드의 read-modify-write라 짧은 락 안에서 갱신.
+    """
+
+    def __init__(
+        self,
+        capacity: int = FLIGHT_RECORDER_CAPACITY,
+        slow_ms: float = FLIGHT_RECORDER_SLOW_MS,
+        dump_cooldown: float = FLIGHT_RECORDER_DUMP_COOLDOWN_SECS,
+    ):
+        self.capacity = capacity
+        self._buffer = bytearray(capacity * _RECORD.size)
+        self._slots = itertools.count()
+        self._written = 0
+        # (event, decision)별 누적 수. 링 버퍼가 덮어써도 유지 (메트릭용)
+        self._decision_counts = [0] * (len(EVENT_TYPES) * len(DECISIONS))
+        self._count_lock = threading.Lock()
+        self._slow_us = int(slow_ms * 1000)
+        self._dump_cooldown = dump_cooldown
+        self._last_dump: dict[str, float] = {}
+        self._dump_lock = threading.Lock()
+        self._dump_queue: queue.Queue = queue.Queue()  # (reason, path, 스냅샷). 쿨다운이 크기 제한
+        self._dump_thread: Optional[threading.Thread] = None
+        self.output_dir: Optional[Path] = None  # None이면 debug_config.debug_output_dir
+
+    def record(
+        self,
+        event: str,
+        decision: str,
+        control_type: str = "",
+        runtime_hash: int = 0,
+        timestamp: float = 0.0,
+        filter_us: int = 0,
+        total_us: int = 0,
+    ) -> None:
+        slot = next(self._slots)
+        event_code = _EVENT_CODES.get(event, 0)
+        decision_code = _DECISION_CODES.get(decision, 0)
+        _RECORD.pack_into(
+            self._buffer,
+            (slot % self.capacity) * _RECORD.size,
+            timestamp or time.time(),
+            runtime_hash,
+            _CONTROL_CODES.get(control_type, _CONTROL_OTHER),
+            event_code,
+            decision_code,
+            min(filter_us, _UINT32_MAX),
+            min(total_us, _UINT32_MAX),
+        )
+        with self._count_lock:
+            # 늦게 끝난 작은 슬롯이 written을 되돌리지 않게
+            if slot >= self._written:
+                self._written = slot + 1
+            self._decision_counts[event_code * len(DECISIONS) + decision_code] += 1
+
+        if total_us > self._slow_us:
+            self.dump_async("slow")
+
+    @property
+    def written(self) -> int:
+        return self._written
+
+    def decision_counts(self) -> dict:
+        """{(event, decision): 누적 수}. 0인 조합 제외."""
+        with self._count_lock:
+            counts = list(self._decision_counts)
+        return {
+            (EVENT_TYPES[i // len(DECISIONS)], DECISIONS[i % len(DECISIONS)]): n
+            for i, n in enumerate(counts) if n
+        }
+
+    def collect_metrics(self) -> list:
+        events = counter("uia_events", "UIA events by filter decision (flight recorder).")
+        for (event, decision), n in self.decision_counts().items():
+            events.add(n, event=event, decision=decision)
+        return [
+            events,
+            counter("flight_records", "Records written to the flight recorder.", self._written),
+        ]
+
+    def snapshot(self) -> bytes:
+        """헤더 + 시간순 레코드 바이트."""
+        written = self._written
+        buf = bytes(self._buffer)
+        size = _RECORD.size
+        if written <= self.capacity:
+            body = buf[:written * size]
+        else:
+            start = (written % self.capacity) * size
+            body = buf[start:] + buf[:start]
+        return _HEADER.pack(MAGIC, VERSION, size, self.capacity, written) + body
+
+    def _claim_dump(self, reason: str, force: bool) -> bool:
+        """같은 reason은 쿨다운 내 1회 (force=True면 무시)."""
+        now = time.monotonic()
+        with self._dump_lock:
+            last = self._last_dump.get(reason)
+            if not force and last is not None and now - last < self._dump_cooldown:
+                return False
+            self._last_dump[reason] = now
+            return True
+
+    def _dump_path(self, reason: str) -> Path:
+        output_dir = self.output_dir
+        if output_dir is None:
+            from .debug_config import debug_config
+            output_dir = debug_config.debug_output_dir
+        return output_dir / f"flight_{reason}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.kfr"
+
+    def _write(self, reason: str, path: Path, data: bytes) -> Optional[Path]:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(data)
+        except OSError as e:
+            log.warning(f"flight recorder dump failed: {e}")
+            return None
+        log.info(f"flight recorder dumped ({reason}): {path}")
+        return path
+
+    def dump(self, reason: str, path: Optional[Path] = None, force: bool = False) -> Optional[Path]:
+        """파일로 저장 (호출 스레드에서 기록). 같은 reason은 쿨다운 내 1회 (force=True면 무시)."""
+        if not self._claim_dump(reason, force):
+            return None
+        return self._write(reason, path or self._dump_path(reason), self.snapshot())
+
+    def dump_async(self, reason: str) -> bool:
+        """스냅샷만 잡고 기록은 백그라운드 스레드. COM 콜백용. 쿨다운이면 False."""
+        if not self._claim_dump(reason, False):
+            return False
+        self._dump_queue.put((reason, self._dump_path(reason), self.snapshot()))
+        with self._dump_lock:
+            if self._dump_thread is None:
+                self._dump_thread = threading.Thread(
+                    target=self._dump_loop,
+                    daemon=True,
+                    name="FlightRecorderWriter"
+                )
+                self._dump_thread.start()
+        return True
+
+    def _dump_loop(self) -> None:
+        while True:
+            reason, path, data = self._dump_queue.get()
+            try:
+                self._write(reason, path, data)
+            finally:
+                self._dump_queue.task_done()
+
+    def wait_idle(self, timeout: float = 5.0) -> bool:
+        """대기 중인 백그라운드 덤프가 모두 기록될 때까지 대기. 테스트/종료용."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if not self._dump_queue.unfinished_tasks:
+                return True
+            time.sleep(0.01)
+        return False
+
+
+def decode(data: bytes) -> Iterator[dict]:
+    """덤프 바이트 → 레코드 dict (시간순)."""
+    magic, version, size, capacity, written = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError("not a flight recorder dump")
+    if version != VERSION or size != _RECORD.size:
+        raise ValueError(f"unsupported dump version {version} (record size {size})")
+
+    first_seq = max(0, written - capacity)
+    for i, fields in enumerate(_RECORD.iter_unpack(data[_HEADER.size:])):
+        ts, rid, ctype, event, decision, filter_us, total_us = fields
+        yield {
+            "seq": first_seq + i,
+            "timestamp": ts,
+            "event": EVENT_TYPES[event] if event < len(EVENT_TYPES) else str(event),
+            "decision": DECISIONS[decision] if decision < len(DECISIONS) else str(decision),
+            "control_type": (CONTROL_TYPES[ctype] if ctype < len(CONTROL_TYPES)
+                             else "other"),
+            "runtime_id": f"{rid:08x}" if rid else "",
+            "filter_us": filter_us,
+            "total_us": total_us,
+        }
+
+
+def decode_file(path: Path) -> Iterator[dict]:
+    return decode(Path(path).read_bytes())
+
+
+flight_recorder = FlightRecorder()
+metrics_registry.register("flight_recorder", flight_recorder.collect_metrics)
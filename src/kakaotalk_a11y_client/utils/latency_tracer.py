@@ -0,0 +1,216 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025-2026 dnz3d4c
+"""포커스→발화 지연 추적. 단계별 히스토그램.
+
+COM 콜백 진입 시 begin(), 단계마다 mark(), 발화 후 finish().
+단계 구분:
+    filter     COM 콜백 진입 → 필터 통과 (디바운스/hwnd/RuntimeId/Control 변환)
+    coalescer  EventCoalescer.add → FocusMonitor._process_focus_event
+    dispatch   FocusMonitorService 핸들러 → speak 호출 직전 (중복 체크, 정규화)
+    speak      speak 호출 (음성+점자)
+    total      전체
+
+추적 객체는 스레드 로컬 + FocusEvent.trace로 전달. 샘플링 꺼지면
+mark()는 스레드 로컬 조회 1회로 끝남.
+"""
+
+import itertools
+import json
+import threading
+import time
+from bisect import bisect_left
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from ..config import LATENCY_TRACE_SAMPLE_EVERY, LATENCY_HISTOGRAM_BOUNDS_MS
+from .debug import get_logger
+from .metrics import counter, histogram, metrics_registry
+
+log = get_logger("LatencyTracer")
+
+STAGES = ("filter", "coalescer", "dispatch", "speak")
+
+_perf_ns = time.perf_counter_ns
+
+
+class LatencyHistogram:
+    """고정 버킷 히스토그램 (ms). 마지막 버킷은 상한 초과분."""
+
+    def __init__(self, bounds_ms: tuple = LATENCY_HISTOGRAM_BOUNDS_MS):
+        self.bounds = tuple(bounds_ms)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, ms: float) -> None:
+        self.counts[bisect_left(self.bounds, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def percentile(self, pct: float) -> float:
+        """버킷 상한 기준 근사 백분위 (ms). 초과 버킷이면 max."""
+        if not self.count:
+            return 0.0
+        target = self.count * pct / 100.0
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= target:
+                return self.bounds[i] if i < len(self.bounds) else self.max_ms
+        return self.max_ms
+
+    def to_dict(self) -> dict:
+        labels = [f"<={b}" for b in self.bounds] + [f">{self.bounds[-1]}"]
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+class LatencyTrace:
+    """이벤트 1건의 단계별 타임스탬프 (perf_counter_ns)."""
+
+    __slots__ = ("start", "last", "marks")
+
+    def __init__(self, start: int):
+        self.start = start
+        self.last = start
+        self.marks: list[tuple[str, int]] = []
+
+
+class _TraceLocal(threading.local):
+    # 클래스 기본값: getattr 폴백(AttributeError) 비용 회피
+    trace: Optional[LatencyTrace] = None
+
+
+class LatencyTracer:
+    """단계별 지연 히스토그램 수집기.
+
+    sample_every=N이면 N번째 이벤트마다 추적, 0이면 끔.
+    발화까지 도달한 추적만 기록 (중복/필터로 끝난 건 dropped).
+    """
+
+    def __init__(self, sample_every: int = LATENCY_TRACE_SAMPLE_EVERY):
+        self._sample_every = max(0, sample_every)
+        self._counter = itertools.count(1)  # 락 없이 순번 (flight_recorder 슬롯과 같은 방식)
+        self._local = _TraceLocal()
+        self._lock = threading.Lock()
+        self._histograms = {name: LatencyHistogram() for name in (*STAGES, "total")}
+        self.dropped = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._sample_every > 0
+
+    def set_sample_every(self, n: int) -> None:
+        self._sample_every = max(0, n)
+
+    def begin(self) -> Optional[LatencyTrace]:
+        """COM 콜백 진입 시 호출. 샘플 대상이 아니면 None."""
+        if not self._sample_every:
+            return None
+        # 여러 COM 스레드에서 동시 호출. next(count)는 원자적
+        if next(self._counter) % self._sample_every:
+            self._local.trace = None
+            return None
+        trace = LatencyTrace(_perf_ns())
+        self._local.trace = trace
+        return trace
+
+    def attach(self, trace: Optional[LatencyTrace]) -> None:
+        """다른 스레드로 넘어온 이벤트의 추적 이어받기 (coalescer 배치 경로)."""
+        if trace is not None:
+            self._local.trace = trace
+
+    def mark(self, stage: str) -> None:
+        """현재 스레드 추적에 단계 종료 시각 기록."""
+        trace = self._local.trace
+        if trace is None:
+            return
+        now = _perf_ns()
+        trace.marks.append((stage, now - trace.last))
+        trace.last = now
+
+    def finish(self) -> None:
+        """현재 추적 종료. speak 단계까지 갔으면 히스토그램에 반영."""
+        trace = self._local.trace
+        if trace is None:
+            return
+        self._local.trace = None
+
+        with self._lock:
+            if not trace.marks or trace.marks[-1][0] != "speak":
+                self.dropped += 1
+                return
+            for stage, elapsed_ns in trace.marks:
+                hist = self._histograms.get(stage)
+                if hist is not None:
+                    hist.record(elapsed_ns / 1e6)
+            self._histograms["total"].record((trace.last - trace.start) / 1e6)
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                "sample_every": self._sample_every,
+                "dropped": self.dropped,
+                "stages": {name: h.to_dict() for name, h in self._histograms.items()},
+            }
+
+    def collect_metrics(self) -> list:
+        """메트릭 collector. finish()의 락 안 잡음 (버킷 목록 복사)."""
+        latency = histogram("focus_latency", "Focus-to-speech latency by stage.")
+        for stage, hist in list(self._histograms.items()):
+            counts = list(hist.counts)
+            bounds = [b / 1000 for b in hist.bounds] + [float("inf")]
+            latency.add_histogram(zip(bounds, counts), hist.total_ms / 1000, stage=stage)
+        return [
+            latency,
+            counter("focus_latency_dropped", "Traces that ended before speech.", self.dropped),
+        ]
+
+    def get_summary(self) -> str:
+        """상태 발화용 한 줄 요약."""
+        with self._lock:
+            total = self._histograms["total"]
+            if not total.count:
+                return "지연 측정 없음"
+            return (f"포커스 지연 {total.count}건, "
+                    f"중앙값 {total.percentile(50):g}밀리초, "
+                    f"95퍼센트 {total.percentile(95):g}밀리초")
+
+    def save_json(self, path: Optional[Path] = None) -> Optional[Path]:
+        """히스토그램 JSON 저장. path 없으면 DEBUG 로그 폴더, 없으면 None."""
+        if path is None:
+            from . import profiler as profiler_module
+            if profiler_module.log_dir is None:
+                return None
+            path = profiler_module.log_dir / f'latency_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
+
+        data = self.get_stats()
+        data["timestamp"] = datetime.now().isoformat()
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+        except OSError as e:
+            log.warning(f"latency histogram save failed: {e}")
+            return None
+        log.debug(f"latency histogram saved: {path}")
+        return path
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms = {name: LatencyHistogram() for name in (*STAGES, "total")}
+            self.dropped = 0
+
+
+latency_tracer = LatencyTracer()
+metrics_registry.register("latency_tracer", latency_tracer.collect_metrics)
@@ -23,6 +23,9 @@ from ..config import (
 )
 from ..window_finder import KAKAOTALK_MENU_CLASS
 from .debug import get_logger
+from .text_normalizer import normalize_speech_text
+from .latency_tracer import latency_tracer
+from .metrics import counter, gauge, metrics_registry
 
 log = get_logger("MenuHandler")
 
@@ -60,6 +63,12 @@ class MenuHandler:
         # 콜백
         self._speak_callback: Optional[Callable[[str], None]] = None
 
+        # 메트릭용 누적 카운터 (락 없이 읽음)
+        self._lookup_cached = 0
+        self._lookup_enum = 0
+        self._menu_entries = 0
+        self._items_spoken = 0
+
     def set_speak_callback(self, callback: Callable[[str], None]) -> None:
         """TTS 콜백 설정."""
         self._speak_callback = callback
@@ -73,14 +82,21 @@ class MenuHandler:
         # 캐시 유효하면 바로 반환
         with self._lock:
             if now - self._menu_cache["time"] < TIMING_MENU_CACHE_TTL:
+                self._lookup_cached += 1
                 return self._menu_cache["hwnd"]
 
         # 실제 검색 (락 밖에서 수행 - EnumWindows 비용)
         hwnd = self._find_menu_window_impl()
         with self._lock:
+            self._lookup_enum += 1
             self._menu_cache = {"hwnd": hwnd, "time": now}
         return hwnd
 
+    def invalidate_menu_cache(self) -> None:
+        """다음 find_menu_window는 TTL 무시하고 실제 검색."""
+        with self._lock:
+            self._menu_cache = {"hwnd": None, "time": 0.0}
+
     def _find_menu_window_impl(self) -> Optional[int]:
         """EnumWindows로 EVA_Menu 검색."""
         result = None
@@ -179,6 +195,7 @@ class MenuHandler:
         """메뉴 모드 진입."""
         with self._lock:
             self._in_menu_mode = True
+            self._menu_entries += 1
             self._last_menu_hwnd = menu_hwnd
             self._menu_enter_time = time.time()
             self._current_menu_type = self.detect_menu_type(menu_hwnd)
@@ -286,10 +303,27 @@ class MenuHandler:
 
         # 발화
         if self._speak_callback:
-            self._speak_callback(actual_name)
-        log.trace(f"[이벤트] MenuItem: {actual_name[:30]}...")
+            text = normalize_speech_text(actual_name)
+            latency_tracer.mark("dispatch")
+            self._speak_callback(text)
+            latency_tracer.mark("speak")
+            with self._lock:
+                self._items_spoken += 1
+        log.trace("[이벤트] MenuItem: %.30s...", actual_name)
         return True
 
+    def collect_metrics(self) -> list:
+        """메트릭 collector. self._lock 안 잡음 (카운터 증가는 락 안)."""
+        lookups = counter("menu_window_lookups", "EVA_Menu window lookups by source.")
+        lookups.add(self._lookup_cached, source="cache")
+        lookups.add(self._lookup_enum, source="enum_windows")
+        return [
+            gauge("menu_mode", "Context menu mode active.", self._in_menu_mode),
+            counter("menu_entries", "Context menu mode entries.", self._menu_entries),
+            counter("menu_items_spoken", "Menu items announced.", self._items_spoken),
+            lookups,
+        ]
+
 
 # 싱글톤 인스턴스
 _menu_handler: Optional[MenuHandler] = None
@@ -300,4 +334,5 @@ def get_menu_handler() -> MenuHandler:
     global _menu_handler
     if _menu_handler is None:
         _menu_handler = MenuHandler()
+        metrics_registry.register("menu_handler", _menu_handler.collect_metrics)
     return _menu_handler
@@ -0,0 +1,302 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025-2026 dnz3d4c
+"""런타임 메트릭 레지스트리 + 로컬 HTTP 엔드포인트 (기본 꺼짐).
+
+서브시스템이 collector(인자 없는 함수 → MetricFamily 목록)를 등록하고,
+스크랩 시점에만 호출. collector는 서브시스템 락을 잡지 않고 카운터 속성을
+그대로 읽음 (int/float 읽기, dict/list 복사는 GIL 아래 원자적).
+
+엔드포인트 (--metrics-port, 127.0.0.1 전용):
+    /metrics       OpenMetrics 텍스트
+    /metrics.json  같은 내용 JSON
+"""
+
+import json
+import math
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Iterable, Optional
+
+from ..config import METRICS_HOST, METRICS_PREFIX
+from .debug import get_logger
+
+log = get_logger("Metrics")
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+_LOOPBACK_HOSTS = ("127.0.0.1", "localhost")
+
+# 타입별 샘플 접미사
+_COUNTER_SUFFIX = "_total"
+
+Collector = Callable[[], Iterable["MetricFamily"]]
+
+
+@dataclass
+class MetricFamily:
+    """메트릭 1종 + 라벨별 샘플. samples: (접미사, 라벨, 값)."""
+    name: str
+    type: str  # counter / gauge / histogram
+    help: str
+    unit: str = ""
+    samples: list = field(default_factory=list)
+
+    def add(self, value: float, **labels) -> "MetricFamily":
+        suffix = _COUNTER_SUFFIX if self.type == "counter" else ""
+        self.samples.append((suffix, labels, value))
+        return self
+
+    def add_histogram(self, buckets: Iterable[tuple], total: float, **labels) -> "MetricFamily":
+        """buckets: (상한, 개수) 오름차순, 비누적. +Inf 버킷과 count는 합계로 채움."""
+        cumulative = 0
+        for upper, count in buckets:
+            cumulative += count
+            if math.isinf(upper):
+                continue
+            self.samples.append(("_bucket", {**labels, "le": upper}, cumulative))
+        self.samples.append(("_bucket", {**labels, "le": math.inf}, cumulative))
+        self.samples.append(("_count", labels, cumulative))
+        self.samples.append(("_sum", labels, total))
+        return self
+
+
+def counter(name: str, help: str, value: Optional[float] = None, **labels) -> MetricFamily:
+    family = MetricFamily(name, "counter", help)
+    return family.add(value, **labels) if value is not None else family
+
+
+def gauge(name: str, help: str, value: Optional[float] = None, **labels) -> MetricFamily:
+    family = MetricFamily(name, "gauge", help)
+    return family.add(value, **labels) if value is not None else family
+
+
+def histogram(name: str, help: str, unit: str = "seconds") -> MetricFamily:
+    return MetricFamily(f"{name}_{unit}" if unit else name, "histogram", help, unit)
+
+
+def _format_value(value) -> str:
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int):
+        return str(value)
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    parts = []
+    for key, value in labels.items():
+        text = _format_value(value) if isinstance(value, float) else str(value)
+        parts.append(f'{key}="{_escape(text)}"')
+    return "{" + ",".join(parts) + "}"
+
+
+class MetricsRegistry:
+    """collector 등록/수집. 등록은 이름 단위 (같은 이름이면 교체)."""
+
+    def __init__(self, prefix: str = METRICS_PREFIX):
+        self.prefix = prefix
+        self._collectors: dict[str, Collector] = {}
+        self._lock = threading.Lock()  # 등록/해제만 (수집은 복사본 순회)
+        self.collector_errors = 0
+
+    def register(self, name: str, collector: Collector) -> None:
+        with self._lock:
+            self._collectors[name] = collector
+
+    def unregister(self, name: str, collector: Optional[Collector] = None) -> None:
+        """collector 주면 같은 것일 때만 해제 (새 인스턴스가 이미 교체한 경우 유지)."""
+        with self._lock:
+            current = self._collectors.get(name)
+            if current is not None and (collector is None or current == collector):
+                del self._collectors[name]
+
+    @property
+    def names(self) -> list[str]:
+        return sorted(self._collectors)
+
+    def collect(self) -> list[MetricFamily]:
+        """모든 collector 호출. 같은 이름 메트릭은 샘플 합침 (OpenMetrics는 이름당 1블록)."""
+        families: dict[str, MetricFamily] = {}
+        for name, collector in sorted(self._collectors.copy().items()):
+            try:
+                collected = list(collector())
+            except Exception as e:
+                # 한 서브시스템 오류로 전체 스크랩이 실패하지 않게
+                self.collector_errors += 1
+                log.trace("collector %s failed: %s", name, e)
+                continue
+            for family in collected:
+                existing = families.get(family.name)
+                if existing is None:
+                    families[family.name] = family
+                else:
+                    existing.samples.extend(family.samples)
+        families["metrics_collector_errors"] = counter(
+            "metrics_collector_errors", "Collector exceptions during scrapes.",
+            self.collector_errors,
+        )
+        return list(families.values())
+
+    def render_openmetrics(self) -> str:
+        lines = []
+        for family in self.collect():
+            name = f"{self.prefix}_{family.name}" if self.prefix else family.name
+            lines.append(f"# TYPE {name} {family.type}")
+            if family.unit:
+                lines.append(f"# UNIT {name} {family.unit}")
+            lines.append(f"# HELP {name} {_escape(family.help)}")
+            for suffix, labels, value in family.samples:
+                lines.append(f"{name}{suffix}{_format_labels(labels)} {_format_value(value)}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def to_json(self) -> dict:
+        metrics = {}
+        for family in self.collect():
+            name = f"{self.prefix}_{family.name}" if self.prefix else family.name
+            metrics[name] = {
+                "type": family.type,
+                "help": family.help,
+                "unit": family.unit,
+                "samples": [
+                    {
+                        "name": name + suffix,
+                        "labels": {k: v if not isinstance(v, float) else _format_value(v)
+                                   for k, v in labels.items()},
+                        "value": value if not isinstance(value, float) or math.isfinite(value)
+                        else _format_value(value),
+                    }
+                    for suffix, labels, value in family.samples
+                ],
+            }
+        return {"timestamp": datetime.now().isoformat(), "metrics": metrics}
+
+
+metrics_registry = MetricsRegistry()
+
+
+# =============================================================================
+# HTTP 엔드포인트
+# =============================================================================
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    server_version = "KakaoTalkA11yMetrics"
+
+    def do_GET(self):
+        registry: MetricsRegistry = self.server.registry
+        path = self.path.split("?", 1)[0]
+        try:
+            if path == "/metrics":
+                body = registry.render_openmetrics().encode("utf-8")
+                content_type = OPENMETRICS_CONTENT_TYPE
+            elif path == "/metrics.json":
+                body = json.dumps(registry.to_json(), ensure_ascii=False).encode("utf-8")
+                content_type = "application/json; charset=utf-8"
+            else:
+                self.send_error(404)
+                return
+        except Exception as e:
+            log.warning(f"metrics render failed: {e}")
+            self.send_error(500)
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        log.trace("%s " + format, self.client_address[0], *args)
+
+
+class MetricsServer:
+    """로컬 전용 메트릭 HTTP 서버. 요청마다 데몬 스레드."""
+
+    def __init__(
+        self,
+        registry: MetricsRegistry = metrics_registry,
+        port: int = 0,
+        host: str = METRICS_HOST,
+    ):
+        if host not in _LOOPBACK_HOSTS:
+            raise ValueError(f"metrics endpoint is localhost-only: {host}")
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._server is not None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/metrics"
+
+    def start(self) -> int:
+        """바인드 후 실제 포트 반환 (port=0이면 임의 포트)."""
+        if self._server is not None:
+            return self.port
+        server = ThreadingHTTPServer((self.host, self.port), _MetricsHandler)
+        server.daemon_threads = True
+        server.registry = self.registry
+        self._server = server
+        self.port = server.server_address[1]
+        self._thread = threading.Thread(
+            target=server.serve_forever, daemon=True, name="MetricsServer"
+        )
+        self._thread.start()
+        log.info(f"metrics endpoint: {self.url}")
+        return self.port
+
+    def stop(self) -> None:
+        server = self._server
+        if server is None:
+            return
+        self._server = None
+        server.shutdown()
+        server.server_close()
+        if self._thread:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        log.debug("metrics endpoint stopped")
+
+
+_server: Optional[MetricsServer] = None
+
+
+def start_metrics_server(port: int) -> Optional[MetricsServer]:
+    """전역 엔드포인트 시작. 바인드 실패 시 None (앱 실행은 계속)."""
+    global _server
+    if _server is not None:
+        return _server
+    server = MetricsServer(port=port)
+    try:
+        server.start()
+    except OSError as e:
+        log.warning(f"metrics endpoint start failed (port {port}): {e}")
+        return None
+    _server = server
+    return server
+
+
+def stop_metrics_server() -> None:
+    global _server
+    if _server is not None:
+        _server.stop()
+        _server = None
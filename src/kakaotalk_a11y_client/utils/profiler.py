@@ -1,18 +1,32 @@
 # SPDX-License-Identifier: MIT
 # Copyright 2025-2026 dnz3d4c
-"""UIA 성능 프로파일러. 로그: <프로젝트>/logs/profile_*.log (DEBUG 모드)"""
+"""UIA 성능 프로파일러. 로그: <프로젝트>/logs/profile_*.log (DEBUG 모드)
+
+작업별 로그 버킷 히스토그램으로 p50/p90/p99/p999 제공.
+컨텍스트 스택은 스레드별, 기록은 작업 이름 해시로 나눈 락(lock striping).
+"""
 import os
+import math
 import time
 import logging
 import functools
-from contextlib import contextmanager
+import threading
+from collections import deque
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Deque, Dict, Optional
 from pathlib import Path
 import json
 from datetime import datetime
 
-from ..config import PERF_SLOW_THRESHOLD_MS, PERF_COMPARISON_THRESHOLD_PCT
+from ..config import (
+    PERF_SLOW_THRESHOLD_MS,
+    PERF_COMPARISON_THRESHOLD_PCT,
+    PERF_RECENT_SAMPLES,
+    PERF_HISTOGRAM_SUB_BUCKETS,
+    PERF_LOCK_STRIPES,
+)
+from .metrics import gauge, histogram, metrics_registry
 
 
 def _get_project_root() -> Path:
@@ -71,13 +85,96 @@ def init_profiler(enabled: bool = None) -> None:
         profile_logger.addHandler(logging.NullHandler())
 
 
+PERCENTILES = (50, 90, 99, 99.9)
+
+
+def _pct_label(pct: float) -> str:
+    """50 → 'p50', 99.9 → 'p999'."""
+    return "p" + f"{pct:g}".replace(".", "")
+
+
+class LogHistogram:
+    """로그 버킷 히스토그램 (ms). 2배 구간을 sub_buckets개로 나눔 (HDR 방식).
+
+    버킷 번호는 math.frexp로 계산 (log 호출 없음). 빈 버킷은 저장 안 함.
+    """
+
+    __slots__ = ("sub_buckets", "counts", "count")
+
+    def __init__(self, sub_buckets: int = PERF_HISTOGRAM_SUB_BUCKETS):
+        self.sub_buckets = sub_buckets
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+
+    def _index(self, value: float) -> int:
+        if value <= 0:
+            return -(1 << 30)  # 0 이하 전용 버킷
+        mantissa, exponent = math.frexp(value)  # value = m * 2**e, 0.5 <= m < 1
+        return exponent * self.sub_buckets + int((mantissa - 0.5) * 2 * self.sub_buckets)
+
+    def bucket_bounds(self, index: int) -> tuple:
+        if index == -(1 << 30):
+            return 0.0, 0.0
+        exponent, sub = divmod(index, self.sub_buckets)
+        low = math.ldexp(0.5 + sub / (2 * self.sub_buckets), exponent)
+        high = math.ldexp(0.5 + (sub + 1) / (2 * self.sub_buckets), exponent)
+        return low, high
+
+    def record(self, value: float, n: int = 1) -> None:
+        index = self._index(value)
+        self.counts[index] = self.counts.get(index, 0) + n
+        self.count += n
+
+    def merge(self, other: "LogHistogram") -> None:
+        for index, n in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + n
+        self.count += other.count
+
+    def percentile(self, pct: float) -> float:
+        """버킷 중간값 기준 근사 백분위."""
+        if not self.count:
+            return 0.0
+        target = self.count * pct / 100.0
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                low, high = self.bucket_bounds(index)
+                return (low + high) / 2
+        return 0.0
+
+    def count_at_least(self, threshold: float) -> int:
+        """하한이 threshold 이상인 버킷의 개수 합."""
+        return sum(n for i, n in self.counts.items() if self.bucket_bounds(i)[0] >= threshold)
+
+    def copy(self) -> "LogHistogram":
+        clone = LogHistogram(self.sub_buckets)
+        clone.counts = dict(self.counts)
+        clone.count = self.count
+        return clone
+
+    def to_list(self) -> list:
+        """[[버킷 하한 ms, 개수], ...] (리포트 JSON용)."""
+        return [[round(self.bucket_bounds(i)[0], 6), self.counts[i]] for i in sorted(self.counts)]
+
+    @classmethod
+    def from_list(cls, buckets: list, sub_buckets: int = PERF_HISTOGRAM_SUB_BUCKETS) -> "LogHistogram":
+        """to_list() 결과 복원. 반올림된 하한이라 버킷 안쪽으로 밀어서 배치."""
+        hist = cls(sub_buckets)
+        for low, n in buckets:
+            hist.record(low * (1 + 1 / (4 * sub_buckets)), int(n))
+        return hist
+
+
 @dataclass
 class ProfileMetrics:
     call_count: int = 0
     total_time: float = 0.0
     min_time: float = float('inf')
     max_time: float = 0.0
-    samples: List[float] = field(default_factory=list)
+    # 최근 측정값 (deque라 오래된 값 제거 O(1))
+    samples: Deque[float] = field(default_factory=lambda: deque(maxlen=PERF_RECENT_SAMPLES))
+    histogram: LogHistogram = field(default_factory=LogHistogram)
 
     @property
     def avg_time(self) -> float:
@@ -86,55 +183,139 @@ class ProfileMetrics:
     def record(self, elapsed: float):
         self.call_count += 1
         self.total_time += elapsed
-        self.min_time = min(self.min_time, elapsed)
-        self.max_time = max(self.max_time, elapsed)
-        # 최근 100개만 유지
+        if elapsed < self.min_time:
+            self.min_time = elapsed
+        if elapsed > self.max_time:
+            self.max_time = elapsed
         self.samples.append(elapsed)
-        if len(self.samples) > 100:
-            self.samples.pop(0)
+        self.histogram.record(elapsed)
+
+    def copy(self) -> "ProfileMetrics":
+        """리포트용 복사본. 기록 중인 스레드의 스트라이프 락 안에서 호출."""
+        return ProfileMetrics(self.call_count, self.total_time, self.min_time, self.max_time,
+                              deque(self.samples, maxlen=self.samples.maxlen), self.histogram.copy())
+
+    def percentile(self, pct: float) -> float:
+        """근사 백분위 (ms). 관측 범위로 clamp."""
+        if not self.call_count:
+            return 0.0
+        return min(max(self.histogram.percentile(pct), self.min_time), self.max_time)
+
+    def percentiles(self) -> Dict[str, float]:
+        return {_pct_label(p): self.percentile(p) for p in PERCENTILES}
+
+
+class _ContextLocal(threading.local):
+    # 클래스 기본값: 스레드 첫 접근 시 빈 스택
+    stack: tuple = ()
+    prefix: str = ""
+
+
+class _Measurement:
+    """measure() 컨텍스트 (generator 기반 contextmanager보다 가벼움)."""
+
+    __slots__ = ("_profiler", "_name", "_start")
+
+    def __init__(self, profiler: "UIAProfiler", name: str):
+        self._profiler = profiler
+        self._name = name
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._profiler._record(self._name, (time.perf_counter() - self._start) * 1000)
+        return False
+
+
+_DISABLED = nullcontext()
 
 
 class UIAProfiler:
-    """프로파일러. measure()로 시간 측정, 100ms 초과 시 경고."""
+    """프로파일러. measure()로 시간 측정, 100ms 초과 시 경고.
+
+    비활성 시 measure()는 공유 nullcontext 반환 (할당/시간 측정 없음).
+    """
 
-    def __init__(self):
+    def __init__(self, lock_stripes: int = PERF_LOCK_STRIPES):
         self.metrics: Dict[str, ProfileMetrics] = {}
         self.enabled = True
         self.slow_threshold_ms = PERF_SLOW_THRESHOLD_MS
-        self._context_stack: List[str] = []
+        self._local = _ContextLocal()
+        # 스트라이프 락: 연산별 기록. _insert_lock: metrics dict 변경(새 연산 추가/reset)과 복사
+        self._locks = [threading.Lock() for _ in range(max(1, lock_stripes))]
+        self._insert_lock = threading.Lock()
 
-    @contextmanager
     def measure(self, operation: str):
         if not self.enabled:
-            yield
-            return
-
-        full_name = f"{'.'.join(self._context_stack)}.{operation}" if self._context_stack else operation
-        start = time.perf_counter()
-
-        try:
-            yield
-        finally:
-            elapsed_ms = (time.perf_counter() - start) * 1000
-
-            if full_name not in self.metrics:
-                self.metrics[full_name] = ProfileMetrics()
-            self.metrics[full_name].record(elapsed_ms)
-
-            # 느린 작업 경고
-            if elapsed_ms > self.slow_threshold_ms:
-                profile_logger.warning(f"SLOW: {full_name} took {elapsed_ms:.1f}ms")
-            else:
-                profile_logger.debug(f"{full_name}: {elapsed_ms:.1f}ms")
+            return _DISABLED
+        prefix = self._local.prefix
+        return _Measurement(self, prefix + operation if prefix else operation)
+
+    def _record(self, full_name: str, elapsed_ms: float) -> None:
+        metrics = self.metrics.get(full_name)
+        if metrics is None:
+            # 새 연산은 드묾. 리포트 복사와 겹치지 않게 전역 락
+            with self._insert_lock:
+                metrics = self.metrics.get(full_name)
+                if metrics is None:
+                    metrics = self.metrics[full_name] = ProfileMetrics()
+        with self._locks[hash(full_name) % len(self._locks)]:
+            metrics.record(elapsed_ms)
+
+        # 느린 작업 경고
+        if elapsed_ms > self.slow_threshold_ms:
+            profile_logger.warning("SLOW: %s took %.1fms", full_name, elapsed_ms)
+        else:
+            profile_logger.debug("%s: %.1fms", full_name, elapsed_ms)
 
     @contextmanager
     def context(self, name: str):
-        """중첩 컨텍스트. 'parent.child' 형태로 기록."""
-        self._context_stack.append(name)
+        """중첩 컨텍스트. 'parent.child' 형태로 기록. 스레드별 스택."""
+        local = self._local
+        saved_stack, saved_prefix = local.stack, local.prefix
+        local.stack = saved_stack + (name,)
+        local.prefix = ".".join(local.stack) + "."
         try:
             yield
         finally:
-            self._context_stack.pop()
+            local.stack, local.prefix = saved_stack, saved_prefix
+
+    def snapshot(self) -> Dict[str, ProfileMetrics]:
+        """리포트용 복사본 (기록 중인 스레드와 분리).
+
+        dict는 새 연산 추가와 겹치지 않게, 연산별 값(히스토그램 버킷 dict 포함)은 스트라이프 락 안에서 복사.
+        """
+        with self._insert_lock:
+            items = list(self.metrics.items())
+        copies = {}
+        for name, metrics in items:
+            with self._locks[hash(name) % len(self._locks)]:
+                copies[name] = metrics.copy()
+        return copies
+
+    def reset(self) -> None:
+        with self._insert_lock:
+            for lock in self._locks:
+                lock.acquire()
+            try:
+                self.metrics = {}
+            finally:
+                for lock in self._locks:
+                    lock.release()
+
+    def collect_metrics(self) -> list:
+        """메트릭 collector. snapshot 복사본으로 읽음."""
+        duration = histogram("profile_duration", "UIAProfiler.measure() durations by operation.")
+        for name, m in self.snapshot().items():
+            hist = m.histogram
+            duration.add_histogram(
+                ((hist.bucket_bounds(i)[1] / 1000, hist.counts[i]) for i in sorted(hist.counts)),
+                m.total_time / 1000,
+                operation=name,
+            )
+        return [gauge("profile_enabled", "UIAProfiler enabled.", self.enabled), duration]
 
     def profile_uia_search(self, control_type: str, search_params: dict, result_count: int, elapsed_ms: float):
         params_str = ', '.join(f"{k}={v}" for k, v in search_params.items() if v)
@@ -163,16 +344,18 @@ class UIAProfiler:
 
         # 느린 순 정렬
         sorted_metrics = sorted(
-            self.metrics.items(),
+            self.snapshot().items(),
             key=lambda x: x[1].avg_time,
             reverse=True
         )
 
         for name, m in sorted_metrics[:20]:  # 상위 20개
+            pcts = ", ".join(f"{label}: {value:.1f}ms" for label, value in m.percentiles().items())
             lines.append(
                 f"{name}:\n"
                 f"  calls: {m.call_count}, avg: {m.avg_time:.1f}ms, "
-                f"min: {m.min_time:.1f}ms, max: {m.max_time:.1f}ms"
+                f"min: {m.min_time:.1f}ms, max: {m.max_time:.1f}ms\n"
+                f"  {pcts}"
             )
 
         return "\n".join(lines)
@@ -195,8 +378,10 @@ class UIAProfiler:
                 'avg_time': m.avg_time,
                 'min_time': m.min_time if m.min_time != float('inf') else 0,
                 'max_time': m.max_time,
+                **m.percentiles(),
+                'histogram': m.histogram.to_list(),
             }
-            for name, m in self.metrics.items()
+            for name, m in self.snapshot().items()
         }
         with open(json_path, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2)
@@ -331,6 +516,7 @@ class UIAProfiler:
 
 # 싱글톤 인스턴스
 profiler = UIAProfiler()
+metrics_registry.register("profiler", profiler.collect_metrics)
 
 
 def profile(operation: str = None):
@@ -0,0 +1,190 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025-2026 dnz3d4c
+"""샘플링 프로파일러. 모든 Python 스레드 스택을 주기적으로 수집.
+
+profiler.measure()로 감싸지 않은 코드까지 포함해서 스레드 이름별로 집계
+(FocusMonitor-Event, MessageListMonitor-Event, EventCoalescer-Flush 등).
+출력: flamegraph용 collapsed stack (스레드;바깥 프레임;...;안쪽 프레임 개수).
+
+샘플 1회 = sys._current_frames() + 프레임 체인 순회. 키는 code 객체 튜플,
+문자열 변환은 저장 시점에만. 대기 중인 스레드도 샘플 (wall-clock 기준).
+"""
+
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from ..config import SAMPLING_PROFILER_RATE_HZ, SAMPLING_PROFILER_MAX_DEPTH
+from .debug import get_logger
+
+log = get_logger("SamplingProfiler")
+
+_perf = time.perf_counter
+
+
+def _frame_label(code) -> str:
+    name = getattr(code, "co_qualname", code.co_name)
+    return f"{Path(code.co_filename).stem}:{name}"
+
+
+class SamplingProfiler:
+    """opt-in 샘플링 프로파일러. start()/stop()으로 켜고 끔.
+
+    샘플링 스레드 자신은 제외. 밀린 틱은 따라잡지 않고 건너뜀.
+    """
+
+    def __init__(
+        self,
+        rate_hz: float = SAMPLING_PROFILER_RATE_HZ,
+        max_depth: int = SAMPLING_PROFILER_MAX_DEPTH,
+    ):
+        self.rate_hz = rate_hz
+        self.max_depth = max_depth
+        self._counts: dict[tuple, int] = {}  # (스레드 이름, code 튜플 안쪽→바깥) → 샘플 수
+        self._names: dict[int, str] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.ticks = 0
+        self._busy = 0.0      # 샘플링에 쓴 시간
+        self._elapsed = 0.0   # 켜져 있던 시간 (중지된 구간 합)
+        self._started_at = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(self) -> bool:
+        if self._thread is not None:
+            return False
+        self._stop.clear()
+        self._started_at = _perf()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="SamplingProfiler")
+        self._thread.start()
+        log.info("sampling profiler started (%g Hz)", self.rate_hz)
+        return True
+
+    def stop(self) -> None:
+        thread = self._thread
+        if thread is None:
+            return
+        self._stop.set()
+        thread.join(timeout=1.0)
+        self._thread = None
+        self._elapsed += _perf() - self._started_at
+        log.info("sampling profiler stopped: %d ticks, overhead %.2f%%",
+                 self.ticks, self.overhead_pct)
+
+    def _run(self) -> None:
+        interval = 1.0 / self.rate_hz
+        own = threading.get_ident()
+        next_tick = _perf()
+        while True:
+            next_tick += interval
+            delay = next_tick - _perf()
+            if delay < 0:
+                # 밀렸으면 건너뜀 (연속 샘플로 부하 키우지 않음)
+                next_tick = _perf()
+                delay = 0
+            if self._stop.wait(delay):
+                return
+            start = _perf()
+            self.sample_once(skip_ident=own)
+            self._busy += _perf() - start
+
+    def _refresh_names(self) -> None:
+        self._names = {t.ident: t.name for t in threading.enumerate() if t.ident is not None}
+
+    def sample_once(self, skip_ident: Optional[int] = None) -> None:
+        """현재 모든 스레드 스택 1회 수집."""
+        frames = sys._current_frames()
+        names = self._names
+        # 새 스레드 등장 또는 1초마다 이름 갱신 (ident 재사용 대비)
+        if self.ticks % max(1, int(self.rate_hz)) == 0 or any(i not in names for i in frames):
+            self._refresh_names()
+            names = self._names
+
+        max_depth = self.max_depth
+        with self._lock:
+            counts = self._counts
+            for ident, frame in frames.items():
+                if ident == skip_ident:
+                    continue
+                stack = []
+                while frame is not None and len(stack) < max_depth:
+                    stack.append(frame.f_code)
+                    frame = frame.f_back
+                key = (names.get(ident) or f"thread-{ident}", tuple(stack))
+                counts[key] = counts.get(key, 0) + 1
+            self.ticks += 1
+        del frames
+
+    @property
+    def overhead_pct(self) -> float:
+        """샘플링 스레드가 쓴 시간 / 켜져 있던 시간."""
+        elapsed = self._elapsed + (_perf() - self._started_at if self._thread else 0.0)
+        return self._busy / elapsed * 100 if elapsed > 0 else 0.0
+
+    def collapsed_lines(self) -> list[str]:
+        """collapsed stack 줄 (샘플 많은 순)."""
+        with self._lock:
+            items = sorted(self._counts.items(), key=lambda kv: -kv[1])
+        labels: dict = {}
+        lines = []
+        for (thread_name, codes), count in items:
+            frames = [thread_name.replace(";", "_")]
+            for code in reversed(codes):
+                label = labels.get(code)
+                if label is None:
+                    label = labels[code] = _frame_label(code)
+                frames.append(label)
+            lines.append(f"{';'.join(frames)} {count}")
+        return lines
+
+    def write_collapsed(self, path: Optional[Path] = None) -> Optional[Path]:
+        """collapsed stack 파일 저장. path 없으면 DEBUG 로그 폴더, 없으면 None."""
+        if path is None:
+            from . import profiler as profiler_module
+            if profiler_module.log_dir is None:
+                return None
+            path = profiler_module.log_dir / f'sampling_{datetime.now().strftime("%Y%m%d_%H%M%S")}.collapsed'
+
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                for line in self.collapsed_lines():
+                    f.write(line)
+                    f.write("\n")
+        except OSError as e:
+            log.warning(f"collapsed stack save failed: {e}")
+            return None
+        log.debug(f"collapsed stacks saved: {path}")
+        return path
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            per_thread: dict[str, int] = {}
+            for (thread_name, _), count in self._counts.items():
+                per_thread[thread_name] = per_thread.get(thread_name, 0) + count
+            stacks = len(self._counts)
+        return {
+            "running": self.running,
+            "rate_hz": self.rate_hz,
+            "ticks": self.ticks,
+            "stacks": stacks,
+            "overhead_pct": round(self.overhead_pct, 3),
+            "threads": dict(sorted(per_thread.items(), key=lambda kv: -kv[1])),
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts = {}
+            self.ticks = 0
+        self._busy = 0.0
+        self._elapsed = 0.0
+        self._started_at = _perf()
+
+
+sampling_profiler = SamplingProfiler()
@@ -0,0 +1,82 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025-2026 dnz3d4c
+"""음성/점자 출력용 텍스트 정규화. 포커스, 메뉴, 메시지 발화 공통 단계.
+
+기호 제거 + 카카오톡 토큰 확장 + 공백 정리.
+같은 문자열이 반복 발화되는 경우가 많아 결과를 LRU로 메모.
+
+한글 문자열에서 str.translate는 문자당 dict 조회라 느림(replace 체인의 10배+)이라 안 씀.
+제거는 정규식 search 후 있을 때만 sub, 특수 공백/줄바꿈은 str.split()이 처리.
+"""
+
+import re
+from functools import lru_cache
+
+from ..config import SPEECH_NORMALIZE_CACHE_SIZE, SPEECH_TOKEN_EXPANSIONS
+
+# 제거할 문자: 목록 기호, 폭 없는 문자, 이모지 변형 선택자
+_STRIP_CHARS = (
+    "\u2022"  # bullet
+    "\u200b"  # zero width space
+    "\u200c"  # zero width non-joiner
+    "\u200d"  # zero width joiner (이모지 결합용)
+    "\u2060"  # word joiner
+    "\ufeff"  # BOM / zero width no-break space
+    "\ufe0e"  # variation selector-15 (text)
+    "\ufe0f"  # variation selector-16 (emoji)
+)
+
+# 특수 공백(NBSP, U+3000 등), 줄바꿈, 탭은 전부 str.isspace() 대상이라 split()이 처리
+
+# 정규식 search/sub가 str.translate보다 훨씬 빠름
+_STRIP_PATTERN = re.compile(f"[{_STRIP_CHARS}]")
+
+# 토큰 확장: 긴 토큰 우선 매칭되도록 길이 역순 alternation
+_TOKEN_PATTERN = (
+    re.compile("|".join(
+        re.escape(t) for t in sorted(SPEECH_TOKEN_EXPANSIONS, key=len, reverse=True)
+    ))
+    if SPEECH_TOKEN_EXPANSIONS else None
+)
+
+
+def _expand_token(match: "re.Match[str]") -> str:
+    return f" {SPEECH_TOKEN_EXPANSIONS[match.group(0)]} "
+
+
+@lru_cache(maxsize=SPEECH_NORMALIZE_CACHE_SIZE)
+def normalize_speech_text(text: str) -> str:
+    """발화용 정규화. 기호 제거/치환 → 토큰 확장 → 연속 공백 축약."""
+    if not text:
+        return ""
+    # COM 프로퍼티가 str 아닌 값을 돌려주는 경우 대비
+    if not isinstance(text, str):
+        text = str(text)
+
+    result = text
+    if _STRIP_PATTERN.search(result):
+        result = _STRIP_PATTERN.sub("", result)
+
+    # "(" 없으면 정규식 스킵 (대부분의 메시지)
+    if _TOKEN_PATTERN is not None and "(" in result:
+        result = _TOKEN_PATTERN.sub(_expand_token, result)
+
+    # split()은 모든 공백 연속을 하나로 취급 + 양끝 제거
+    return " ".join(result.split())
+
+
+def clear_normalize_cache() -> None:
+    """메모 캐시 비우기. 설정 변경/테스트용."""
+    normalize_speech_text.cache_clear()
+
+
+def get_normalize_cache_stats() -> dict:
+    info = normalize_speech_text.cache_info()
+    total = info.hits + info.misses
+    return {
+        "size": info.currsize,
+        "max_size": info.maxsize,
+        "hit_count": info.hits,
+        "miss_count": info.misses,
+        "hit_rate": f"{info.hits / total:.1%}" if total else "0.0%",
+    }
@@ -4,10 +4,13 @@
 
 import time
 from dataclasses import dataclass, field
+from functools import partial
 from typing import Any, Dict, Optional, Callable
 
 from ..config import CACHE_MESSAGE_LIST_TTL
+from .metrics import counter, gauge, metrics_registry
 from .profiler import profile_logger
+from .wrapper_tracker import wrapper_tracker
 
 
 @dataclass
@@ -47,6 +50,9 @@ class UIACache:
         return None
 
     def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        # 새 키면 만료 항목부터 정리 (주기 정리까지 기다리면 만료된 UIA 요소 목록이 COM 참조를 붙잡음)
+        if key not in self._cache:
+            self.cleanup_expired()
         # LRU: 크기 초과 시 가장 오래된 항목 제거
         if key not in self._cache and len(self._cache) >= self.MAX_SIZE:
             oldest_key = min(self._cache, key=lambda k: self._cache[k].last_access)
@@ -117,6 +123,18 @@ class UIACache:
             "default_ttl": self.default_ttl,
         }
 
+    def cached_values(self) -> list:
+        """살아 있는 항목 값 (만료 포함, 정리 전까지 참조 유지)."""
+        return [entry.value for entry in list(self._cache.values())]
+
+    def collect_metrics(self, cache_name: str) -> list:
+        """메트릭 collector (카운터 직접 읽기)."""
+        return [
+            counter("uia_cache_hits", "UIACache hits.", self._hit_count, cache=cache_name),
+            counter("uia_cache_misses", "UIACache misses.", self._miss_count, cache=cache_name),
+            gauge("uia_cache_entries", "UIACache entries.", len(self._cache), cache=cache_name),
+        ]
+
     def log_stats(self) -> None:
         stats = self.get_stats()
         profile_logger.info(
@@ -132,5 +150,7 @@ class UIACache:
 
 # 메시지 목록 캐시 (폴링 간격과 동기화)
 message_list_cache = UIACache(default_ttl=CACHE_MESSAGE_LIST_TTL)
-
-
+metrics_registry.register(
+    "uia_cache", partial(message_list_cache.collect_metrics, "message_list")
+)
+wrapper_tracker.register("message_list_cache", message_list_cache, UIACache.cached_values)
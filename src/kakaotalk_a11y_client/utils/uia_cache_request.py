@@ -15,11 +15,17 @@ try:
         UIA_NamePropertyId,
         UIA_ClassNamePropertyId,
         UIA_AutomationIdPropertyId,
+        UIA_BoundingRectanglePropertyId,
+        UIA_RuntimeIdPropertyId,
+        TreeScope_Children,
+        TreeScope_Element,
+        TreeScope_Subtree,
     )
     HAS_CACHE_REQUEST = True
 except Exception:
     HAS_CACHE_REQUEST = False
     COMError = Exception
+    UIA_RuntimeIdPropertyId = 30000
 
 from .debug import get_logger
 
@@ -106,6 +112,7 @@ class CacheRequestManager:
             self._cache_request.AddProperty(UIA_NamePropertyId)
             self._cache_request.AddProperty(UIA_ClassNamePropertyId)
             self._cache_request.AddProperty(UIA_AutomationIdPropertyId)
+            self._cache_request.AddProperty(UIA_BoundingRectanglePropertyId)  # 스캔 ROI
 
             log.info("CacheRequest initialized")
             return True
@@ -169,3 +176,42 @@ def get_cache_manager() -> CacheRequestManager:
 def get_focused_with_cache() -> Optional[CachedFocusInfo]:
     """편의 함수. CacheRequest 미지원 시 None 반환 (호출자가 폴백)."""
     return get_cache_manager().get_focused_cached()
+
+
+def _create_dump_cache_request(tree_scope: int, include_coords: bool):
+    """덤프용 속성 CacheRequest. RawView 기준 (auto.Control.GetChildren과 같은 트리)."""
+    try:
+        uia = CreateObject(CUIAutomation)
+        cache_request = uia.CreateCacheRequest()
+        cache_request.TreeScope = tree_scope
+        cache_request.TreeFilter = uia.RawViewCondition
+        for prop in (UIA_ControlTypePropertyId, UIA_NamePropertyId,
+                     UIA_ClassNamePropertyId, UIA_AutomationIdPropertyId,
+                     UIA_RuntimeIdPropertyId):
+            cache_request.AddProperty(prop)
+        if include_coords:
+            cache_request.AddProperty(UIA_BoundingRectanglePropertyId)
+        return cache_request
+    except Exception as e:
+        log.warning(f"tree dump CacheRequest creation failed: {e}")
+        return None
+
+
+def create_subtree_cache_request(include_coords: bool = False):
+    """하위 트리 전체 + 덤프용 속성 CacheRequest. BuildUpdatedCache 1회로 수집.
+
+    깊이/노드 상한 없이 전부 가져옴. 반환값은 생성한 스레드(아파트먼트)에서만 사용.
+    """
+    if not HAS_CACHE_REQUEST:
+        return None
+    return _create_dump_cache_request(TreeScope_Subtree, include_coords)
+
+
+def create_children_cache_request(include_coords: bool = False):
+    """요소 + 직계 자식만 캐시하는 덤프용 CacheRequest. 노드마다 BuildUpdatedCache.
+
+    max_depth/DumpBudget 안에서만 펼칠 때 사용. 반환값은 생성한 스레드에서만 사용.
+    """
+    if not HAS_CACHE_REQUEST:
+        return None
+    return _create_dump_cache_request(TreeScope_Element | TreeScope_Children, include_coords)
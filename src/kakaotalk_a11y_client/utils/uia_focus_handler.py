@@ -4,6 +4,7 @@
 
 import threading
 import time
+from operator import attrgetter
 from typing import Callable, Optional, Tuple
 from dataclasses import dataclass
 
@@ -21,6 +22,11 @@ from .debug import get_logger
 from ..window_finder import filter_kakaotalk_hwnd, is_kakaotalk_hwnd_cached
 from .event_coalescer import EventCoalescer
 from .com_utils import com_thread
+from .latency_tracer import latency_tracer, LatencyTrace
+from .flight_recorder import flight_recorder, runtime_id_hash
+from .event_recorder import event_recorder
+from .metrics import gauge, metrics_registry
+from .wrapper_tracker import wrapper_tracker
 
 # COM 인터페이스 import (uia_events에서)
 from .uia_events import (
@@ -38,6 +44,7 @@ try:
         UIA_ClassNamePropertyId,
         UIA_RuntimeIdPropertyId,
         UIA_NativeWindowHandlePropertyId,
+        UIA_BoundingRectanglePropertyId,
     )
     HAS_CACHE_PROPS = True
 except ImportError:
@@ -47,6 +54,7 @@ except ImportError:
     UIA_ClassNamePropertyId = None
     UIA_RuntimeIdPropertyId = None
     UIA_NativeWindowHandlePropertyId = None
+    UIA_BoundingRectanglePropertyId = None
 
 log = get_logger("UIA_Focus")
 
@@ -63,6 +71,7 @@ class FocusEvent:
     control: auto.Control
     timestamp: float
     source: str  # "event", "polling", or "selection" (ElementSelected)
+    trace: Optional[LatencyTrace] = None  # 지연 추적 (샘플링 대상일 때만)
 
 
 # FocusChangedHandler는 uia_events.py에서 import
@@ -80,6 +89,7 @@ class FocusMonitor:
         self._callback: Optional[Callable[[FocusEvent], None]] = None
         self._last_focus: Optional[auto.Control] = None
         self._lock = threading.Lock()
+        wrapper_tracker.register("focus_monitor.last_focus", self, attrgetter("_last_focus"))
 
         # Phase 1: CompareElements 대체
         self._last_runtime_id: Optional[Tuple[int, ...]] = None
@@ -114,11 +124,13 @@ class FocusMonitor:
             self._running = False
             raise RuntimeError("FocusChanged 이벤트 등록 실패")
 
+        metrics_registry.register("focus_monitor", self._collect_metrics)
         return True
 
     def stop(self) -> None:
         """모니터링 중지"""
         self._running = False
+        metrics_registry.unregister("focus_monitor", self._collect_metrics)
 
         # Phase 2: EventCoalescer 중지
         if self._coalescer:
@@ -169,7 +181,9 @@ class FocusMonitor:
                         cache_request.AddProperty(UIA_ClassNamePropertyId)
                         cache_request.AddProperty(UIA_RuntimeIdPropertyId)
                         cache_request.AddProperty(UIA_NativeWindowHandlePropertyId)
-                        log.debug("FocusChanged CacheRequest created (5 properties)")
+                        # 이모지 스캔 ROI (scan_regions) - 스캔 시 COM 왕복 없음
+                        cache_request.AddProperty(UIA_BoundingRectanglePropertyId)
+                        log.debug("FocusChanged CacheRequest created (6 properties)")
                     except Exception as e:
                         log.debug(f"CacheRequest creation failed: {e}")
                         cache_request = None
@@ -213,11 +227,22 @@ class FocusMonitor:
         """COM 콜백. 1차 필터링(디바운싱/중복체크) → 2차 coalescer."""
         if not self._running or not self._coalescer:
             return
+        if event_recorder.active:
+            # 필터 전 원본 (재생 시 필터 결정까지 재현)
+            event_recorder.record_element("focus", auto.Control(element=sender))
+
+        trace = latency_tracer.begin()
+        entry_ns = time.perf_counter_ns()
+        now = time.time()
+        record = flight_recorder.record
+        rid_hash = 0
+        control_type = ""
+        handed_off = False  # coalescer에 넘긴 뒤엔 _process_focus_event가 finish()
 
         try:
             # 1. 시간 기반 디바운싱 - Phase 1에서 효과 입증
-            now = time.time()
             if now - self._last_event_time < TIMING_FOCUS_DEBOUNCE_SECS:
+                record("focus", "debounce", timestamp=now)
                 return
             self._last_event_time = now
 
@@ -227,13 +252,15 @@ class FocusMonitor:
             if native_hwnd:
                 # 빠른 경로: hwnd 있으면 캐시로 카카오톡 판별
                 if not is_kakaotalk_hwnd_cached(native_hwnd):
-                    log.trace(f"[SKIP] hwnd filter: native={native_hwnd}")
+                    log.trace("[SKIP] hwnd filter: native=%s", native_hwnd)
+                    record("focus", "hwnd", timestamp=now)
                     return
             else:
                 # 느린 경로: hwnd 없으면 기존 폴백 (포그라운드 → 캐시)
                 hwnd = filter_kakaotalk_hwnd(sender)
                 if not hwnd:
                     log.trace("[SKIP] hwnd filter: native=None")
+                    record("focus", "hwnd", timestamp=now)
                     return
 
             # 3. RuntimeID 기반 중복 체크 (CompareElements 대체)
@@ -242,8 +269,10 @@ class FocusMonitor:
             except Exception:
                 runtime_id = (id(sender),)  # 폴백
 
+            rid_hash = runtime_id_hash(runtime_id)
             if runtime_id == self._last_runtime_id:
                 log.trace("[SKIP] duplicate RuntimeId")
+                record("focus", "duplicate", runtime_hash=rid_hash, timestamp=now)
                 return
             self._last_runtime_id = runtime_id
 
@@ -251,50 +280,73 @@ class FocusMonitor:
             focused = auto.Control(element=sender)
             if not focused:
                 log.trace("[SKIP] Control conversion failed")
+                record("focus", "control", runtime_hash=rid_hash, timestamp=now)
                 return
 
             # 5. Chrome_* 요소 무시 (광고 웹뷰)
             if (focused.ClassName or "").startswith(CHROME_CLASS_PREFIX):
                 log.trace("[SKIP] Chrome_* element")
+                record("focus", "chrome", runtime_hash=rid_hash, timestamp=now)
                 return
 
             # 6. 컨테이너 타입 무시 (개별 아이템만 통과)
             control_type = focused.ControlTypeName
             if control_type in _CONTAINER_CONTROL_TYPES:
-                log.trace(f"[SKIP] container: {control_type}: {(focused.Name or '')[:20]}")
+                if log.trace_enabled:
+                    log.trace("[SKIP] container: %s: %.20s", control_type, focused.Name or "")
+                record("focus", "container", control_type, rid_hash, now)
                 return
 
             # 7. MenuItemControl + placeholder 무시 (아직 안 그려진 메뉴)
             # 콜백 호출 자체를 줄여서 CPU 절약
             name = focused.Name or ""
             if control_type == "MenuItemControl" and (not name or name == KAKAO_MENU_ITEM_PLACEHOLDER):
+                record("focus", "placeholder", control_type, rid_hash, now)
                 return  # 로그도 안 찍고 완전 무시
 
-            log.trace(f"[PASS] {control_type}: {name[:20]}")
+            log.trace("[PASS] %s: %.20s", control_type, name)
 
             # 8. FocusEvent 생성 + 즉시 처리 (NVDA gainFocus 패턴)
             event = FocusEvent(
                 control=focused,
                 timestamp=now,
                 source="event",
+                trace=trace,
             )
+            latency_tracer.mark("filter")
 
             # 포커스 이벤트는 즉시 처리 (NVDA gainFocus 패턴)
             # immediate=True로 20ms 배치 지연 없이 바로 콜백 호출
             key = (runtime_id, "focus")
+            filter_ns = time.perf_counter_ns()
+            handed_off = True
             self._coalescer.add(key, event, immediate=True)
 
+            # immediate 경로: add()가 반환되면 발화까지 끝난 상태
+            record("focus", "pass", control_type, rid_hash, now,
+                   (filter_ns - entry_ns) // 1000,
+                   (time.perf_counter_ns() - entry_ns) // 1000)
+
         except COMError:
             # COM 에러는 예상 가능 (요소 사라짐, 창 닫힘 등) - 무시
             pass
         except Exception as e:
             log.error(f"focus event processing error: {e}")
+            record("focus", "error", control_type, rid_hash, now,
+                   total_us=(time.perf_counter_ns() - entry_ns) // 1000)
+            flight_recorder.dump_async("error")
+        finally:
+            if not handed_off:
+                # 필터로 끝난 이벤트 → dropped
+                latency_tracer.finish()
 
     def _process_focus_event(self, event: FocusEvent) -> None:
         """coalescer가 호출. 실제 콜백 실행."""
         if not self._running:
             return
 
+        latency_tracer.attach(event.trace)
+        latency_tracer.mark("coalescer")
         try:
             with self._lock:
                 self._last_focus = event.control
@@ -303,6 +355,8 @@ class FocusMonitor:
                 self._callback(event)
         except Exception as e:
             log.error(f"callback error: {e}")
+        finally:
+            latency_tracer.finish()
 
     @property
     def is_running(self) -> bool:
@@ -330,3 +384,11 @@ class FocusMonitor:
             "running": self._running,
         }
 
+    def _collect_metrics(self) -> list:
+        # 필터 결정별 수는 flight_recorder collector (uia_events{event="focus"})
+        families = [gauge("focus_monitor_running", "FocusMonitor running.", self._running)]
+        coalescer = self._coalescer
+        if coalescer is not None:
+            families.extend(coalescer.collect_metrics("focus"))
+        return families
+
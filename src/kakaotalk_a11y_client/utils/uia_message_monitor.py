@@ -4,6 +4,7 @@
 
 import threading
 import time
+from operator import attrgetter
 from typing import Callable, Optional
 from dataclasses import dataclass
 
@@ -25,6 +26,10 @@ from .uia_events import (
 
 from .debug import get_logger
 from .uia_focus_handler import FocusEvent
+from .flight_recorder import flight_recorder
+from .event_recorder import event_recorder, names_of
+from .metrics import counter, gauge, metrics_registry
+from .wrapper_tracker import wrapper_tracker
 
 log = get_logger("UIA_MsgMon")
 
@@ -57,6 +62,11 @@ class MessageEvent:
     source: str  # "event" or "polling"
     children: list = None  # GetChildren() 결과 (이중 호출 방지)
 
+    def __post_init__(self):
+        # 콜백이 붙잡고 있는 이벤트 추적 (추적 중일 때만, 이벤트마다 생성되므로)
+        if wrapper_tracker.active:
+            wrapper_tracker.register("message_event.children", self, attrgetter("children"))
+
 
 class MessageListMonitor:
     """StructureChanged 이벤트로 새 메시지 감지. 200ms 디바운싱."""
@@ -97,10 +107,18 @@ class MessageListMonitor:
 
         # 초기 children (중복 GetChildren 방지)
         self._initial_children: Optional[list] = None
+        wrapper_tracker.register("message_monitor.initial_children", self,
+                                 attrgetter("_initial_children"))
 
         # pause 중 새 메시지 이벤트 발생 여부 (resume 시 체크용)
         self._missed_event_flag = False
 
+        # 메트릭용 누적 카운터 (락 없이 읽음)
+        self._structure_events = 0
+        self._flush_count = 0
+        self._stale_flushes = 0
+        self._new_messages = 0
+
         log.trace(f"MessageListMonitor initialized: comtypes={HAS_COMTYPES}")
 
     def start(self, on_message_changed: Callable[[MessageEvent], None]) -> bool:
@@ -121,15 +139,20 @@ class MessageListMonitor:
             self._initial_children = None
             self._last_count = 0
 
+        if event_recorder.active:
+            self._record_list()
+
         # 이벤트 스레드 시작
         self._start_event_thread()
 
+        metrics_registry.register("message_monitor", self._collect_metrics)
         return True
 
     def stop(self) -> None:
         """모니터링 중지"""
         self._running = False
         self._paused = False
+        metrics_registry.unregister("message_monitor", self._collect_metrics)
 
         # 디바운스 타이머 취소
         if self._debounce_timer:
@@ -300,6 +323,13 @@ class MessageListMonitor:
             self._selection_handler = None
             self._root_element = None
 
+    def _record_list(self) -> None:
+        try:
+            hwnd = self.list_control.NativeWindowHandle or 0
+        except Exception:
+            hwnd = 0
+        event_recorder.record("list", hwnd=hwnd, names=names_of(self._initial_children))
+
     def _on_element_selected(self, sender, eventId) -> None:
         """ElementSelected → FocusEvent 변환. NVDA queueEvent("gainFocus") 등가."""
         if not self._running or self._paused or not self._selection_callback:
@@ -309,6 +339,8 @@ class MessageListMonitor:
             control = auto.Control(element=sender)
             if not control:
                 return
+            if event_recorder.active:
+                event_recorder.record_element("selection", control)
 
             # Name 비어 있으면 Value 폴백 (NVDA _get_name 패턴)
             UIA_ValueValuePropertyId = 30045
@@ -323,16 +355,24 @@ class MessageListMonitor:
 
             if not name.strip():
                 log.trace("[ElementSelected] no name/value, skipping")
+                flight_recorder.record("selection", "no_name", control.ControlTypeName)
                 return
 
-            log.trace(f"[ElementSelected] {control.ControlTypeName}: {name[:30]}")
+            if log.trace_enabled:
+                log.trace("[ElementSelected] %s: %.30s", control.ControlTypeName, name)
 
             event = FocusEvent(
                 control=control,
                 timestamp=time.time(),
                 source="selection"
             )
+            start_ns = time.perf_counter_ns()
             self._selection_callback(event)
+            flight_recorder.record(
+                "selection", "pass", control.ControlTypeName,
+                timestamp=event.timestamp,
+                total_us=(time.perf_counter_ns() - start_ns) // 1000,
+            )
 
         except Exception as e:
             log.trace(f"ElementSelected callback error: {e}")
@@ -341,6 +381,8 @@ class MessageListMonitor:
         """200ms 디바운싱 후 _flush_pending_events 호출."""
         if not self._running:
             return
+        if event_recorder.active:
+            event_recorder.record("structure", change_type=change_type)
         if self._paused:
             # pause 중에는 플래그만 설정 (resume 시 체크)
             self._missed_event_flag = True
@@ -348,6 +390,7 @@ class MessageListMonitor:
 
         # 디바운싱: 이벤트 버퍼링 후 200ms 후에 일괄 처리
         with self._lock:
+            self._structure_events += 1
             self._pending_event_count += 1
             self._debounce_generation += 1
             current_gen = self._debounce_generation
@@ -365,7 +408,8 @@ class MessageListMonitor:
             self._debounce_timer.daemon = True
             self._debounce_timer.start()
 
-            log.trace(f"StructureChanged buffered: type={change_type}, pending={self._pending_event_count}")
+            log.trace("StructureChanged buffered: type=%s, pending=%d", change_type, self._pending_event_count)
+            flight_recorder.record("structure", "buffered")
 
     def _flush_pending_events(self, generation: int) -> None:
         """stale 타이머 무시, 메시지 개수 변화 시 콜백 호출."""
@@ -379,9 +423,11 @@ class MessageListMonitor:
             with self._lock:
                 # stale 타이머 무시 (레이스 컨디션 방지)
                 if generation != self._debounce_generation:
-                    log.trace(f"stale timer ignored: gen={generation}, current={self._debounce_generation}")
+                    log.trace("stale timer ignored: gen=%d, current=%d", generation, self._debounce_generation)
+                    self._stale_flushes += 1
                     return
 
+                self._flush_count += 1
                 pending = self._pending_event_count
                 self._pending_event_count = 0
                 self._debounce_timer = None
@@ -389,6 +435,9 @@ class MessageListMonitor:
                 if current_count > self._last_count:
                     new_count = current_count - self._last_count
                     self._last_count = current_count
+                    self._new_messages += new_count
+                    if event_recorder.active:
+                        event_recorder.record("messages", names=names_of(children[-new_count:]))
 
                     # children을 이벤트에 포함 (GetChildren 이중 호출 방지)
                     event = MessageEvent(
@@ -398,7 +447,7 @@ class MessageListMonitor:
                         children=children  # 이미 가져온 children 전달
                     )
 
-                    log.debug(f"StructureChanged flushed: pending={pending}, new={new_count}")
+                    log.debug("StructureChanged flushed: pending=%d, new=%d", pending, new_count)
 
                     if self._callback:
                         try:
@@ -428,6 +477,23 @@ class MessageListMonitor:
             "last_count": self._last_count,
         }
 
+    def _collect_metrics(self) -> list:
+        return [
+            gauge("message_monitor_running", "MessageListMonitor running.", self._running),
+            gauge("message_monitor_paused", "MessageListMonitor paused.", self._paused),
+            gauge("message_monitor_list_items", "Message list children at last check.",
+                  self._last_count),
+            gauge("message_monitor_pending_events", "StructureChanged events awaiting flush.",
+                  self._pending_event_count),
+            counter("message_monitor_structure_events", "StructureChanged events received.",
+                    self._structure_events),
+            counter("message_monitor_flushes", "Debounced flushes that queried the list.",
+                    self._flush_count),
+            counter("message_monitor_stale_flushes", "Flushes skipped by a newer debounce timer.",
+                    self._stale_flushes),
+            counter("message_monitor_new_messages", "New messages detected.", self._new_messages),
+        ]
+
     def _check_missed_messages(self) -> None:
         """pause 중 놓친 메시지 체크. resume() 에서 호출."""
         if not self._running or not self._callback:
@@ -441,6 +507,9 @@ class MessageListMonitor:
                 if current_count > self._last_count:
                     new_count = current_count - self._last_count
                     self._last_count = current_count
+                    if event_recorder.active:
+                        event_recorder.record("messages", names=names_of(children[-new_count:]),
+                                              source="missed")
 
                     event = MessageEvent(
                         new_count=new_count,
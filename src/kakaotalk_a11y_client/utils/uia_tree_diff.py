@@ -0,0 +1,307 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025-2026 dnz3d4c
+"""UIA 트리 스냅샷 비교. 키 기반 매칭으로 O(n log n).
+
+노드 키:
+    RuntimeId 있으면 "rid:1.2.3" (같은 세션 덤프끼리)
+    없거나 use_runtime_id=False면 경로 서명
+        부모 키/ControlType|ClassName|AutomationId#n  (n: 같은 서명 형제 중 순번)
+    이름/좌표가 바뀌어도 같은 노드로 매칭. 다른 타입 형제 삽입은 순번에 영향 없음.
+    RuntimeId는 프로세스마다 달라서 카카오톡 버전 간 비교는 경로 서명 사용.
+
+결과: 삽입/삭제/이동(부모 변경 또는 형제 순서 변경)/변경(속성).
+이전 트리만 인덱스로 들고 새 트리는 흘려보내며 비교.
+파일 입력은 .jsonl만 줄 단위 스트리밍. .json(중첩) 덤프는 json.load로 통째로 읽음.
+자동 덤프는 파일을 다시 읽지 않고 stream_tree_dump(on_node) + NodeKeyer로 덤프 중에 인덱스 구성.
+"""
+
+import json
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Union
+
+# 변경 비교 대상 (IsEmpty는 Name에서 파생)
+CHANGE_FIELDS = ("ControlType", "Name", "ClassName", "AutomationId", "BoundingRectangle")
+
+TreeSource = Union[dict, list, str, Path, None]
+
+# (key, parent_key, sibling index, 비교 필드 튜플)
+KeyedNode = tuple[str, Optional[str], int, tuple]
+
+
+def _iter_nested(tree) -> Iterator[tuple[int, int, dict]]:
+    if not tree:
+        return
+    # filter_fn 덤프는 루트가 리스트일 수 있음
+    roots = tree if isinstance(tree, list) else [tree]
+    stack = [(node, -1) for node in reversed(roots)]
+    next_id = 0
+    while stack:
+        node, parent_id = stack.pop()
+        node_id = next_id
+        next_id += 1
+        yield node_id, parent_id, node
+        for child in reversed(node.get("Children") or ()):
+            stack.append((child, node_id))
+
+
+def _iter_jsonl(path: Path) -> Iterator[tuple[int, int, dict]]:
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            parent_id = record.get("parent")
+            yield record["id"], -1 if parent_id is None else parent_id, record
+
+
+def iter_flat_nodes(source: TreeSource) -> Iterator[tuple[int, int, dict]]:
+    """(id, parent_id, 속성) 전위 순서. 루트 parent_id는 -1.
+
+    source: 중첩 dict/list, .json(중첩) 또는 .jsonl(stream_tree_dump) 파일 경로.
+    .jsonl만 줄 단위로 읽음. .json은 전체를 메모리에 올린 뒤 순회.
+    """
+    if isinstance(source, (str, Path)):
+        path = Path(source)
+        if path.suffix == ".jsonl":
+            yield from _iter_jsonl(path)
+            return
+        with open(path, encoding="utf-8") as f:
+            source = json.load(f)
+    yield from _iter_nested(source)
+
+
+class NodeKeyer:
+    """전위 순서로 들어오는 (id, parent_id, 속성)에 매칭 키 부여. 부모 키가 항상 먼저 정해짐.
+
+    파일/dict 없이 덤프 스트리밍 중에 노드 단위로 바로 키를 만들 때 사용.
+    """
+
+    def __init__(self, use_runtime_id: bool = True):
+        self.use_runtime_id = use_runtime_id
+        self._keys: dict[int, str] = {}
+        self._child_counts: dict[int, int] = {}
+        self._sig_counts: dict[int, dict[tuple, int]] = {}
+
+    def __call__(self, node_id: int, parent_id: int, props: dict) -> KeyedNode:
+        parent_key = self._keys.get(parent_id)
+        index = self._child_counts.get(parent_id, 0)
+        self._child_counts[parent_id] = index + 1
+
+        runtime_id = props.get("RuntimeId") if self.use_runtime_id else None
+        if runtime_id:
+            key = "rid:" + ".".join(map(str, runtime_id))
+        else:
+            sig = (props.get("ControlType", ""), props.get("ClassName", ""),
+                   props.get("AutomationId", ""))
+            counts = self._sig_counts.setdefault(parent_id, {})
+            n = counts.get(sig, 0)
+            counts[sig] = n + 1
+            key = f"{parent_key or ''}/{sig[0]}|{sig[1]}|{sig[2]}#{n}"
+
+        self._keys[node_id] = key
+        return key, parent_key, index, tuple(props.get(f) for f in CHANGE_FIELDS)
+
+
+def iter_keyed_nodes(source: TreeSource, use_runtime_id: bool = True) -> Iterator[KeyedNode]:
+    """노드마다 매칭 키 계산. 전위 순서라 부모 키가 항상 먼저 정해짐."""
+    keyer = NodeKeyer(use_runtime_id)
+    for node_id, parent_id, props in iter_flat_nodes(source):
+        yield keyer(node_id, parent_id, props)
+
+
+class TreeIndex:
+    """키 → (부모 키, 형제 순번, 비교 필드). 이전 스냅샷 보관용 (속성 dict 안 들고 있음)."""
+
+    __slots__ = ("entries",)
+
+    def __init__(self, entries: Optional[dict] = None):
+        self.entries: dict[str, tuple[Optional[str], int, tuple]] = entries or {}
+
+    @classmethod
+    def build(cls, source: TreeSource, use_runtime_id: bool = True) -> "TreeIndex":
+        index = cls()
+        for node in iter_keyed_nodes(source, use_runtime_id):
+            index.add(node)
+        return index
+
+    def add(self, node: KeyedNode) -> None:
+        key, parent_key, index, fields = node
+        # 키 중복 시 첫 노드 유지
+        self.entries.setdefault(key, (parent_key, index, fields))
+
+    def nodes(self) -> Iterator[KeyedNode]:
+        for key, (parent_key, index, fields) in self.entries.items():
+            yield key, parent_key, index, fields
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.entries
+
+
+@dataclass
+class TreeDiff:
+    old_nodes: int = 0
+    new_nodes: int = 0
+    inserted: list[dict] = field(default_factory=list)
+    removed: list[dict] = field(default_factory=list)
+    moved: list[dict] = field(default_factory=list)
+    changed: list[dict] = field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.inserted or self.removed or self.moved or self.changed)
+
+    def summary(self) -> str:
+        return (f"삽입 {len(self.inserted)}, 삭제 {len(self.removed)}, "
+                f"이동 {len(self.moved)}, 변경 {len(self.changed)}")
+
+    def to_dict(self) -> dict:
+        return {
+            "old_nodes": self.old_nodes,
+            "new_nodes": self.new_nodes,
+            "inserted": self.inserted,
+            "removed": self.removed,
+            "moved": self.moved,
+            "changed": self.changed,
+        }
+
+
+def _fields_dict(fields: tuple) -> dict:
+    return {name: value for name, value in zip(CHANGE_FIELDS, fields) if value is not None}
+
+
+def _stable_positions(old_indices: list[int]) -> set[int]:
+    """최장 증가 부분수열 위치. 여기 안 든 노드가 순서 변경된 노드."""
+    tails: list[int] = []      # 길이별 마지막 값
+    tail_pos: list[int] = []   # 길이별 마지막 위치
+    prev = [-1] * len(old_indices)
+    for pos, value in enumerate(old_indices):
+        i = bisect_left(tails, value)
+        if i == len(tails):
+            tails.append(value)
+            tail_pos.append(pos)
+        else:
+            tails[i] = value
+            tail_pos[i] = pos
+        prev[pos] = tail_pos[i - 1] if i else -1
+
+    stable = set()
+    pos = tail_pos[-1] if tail_pos else -1
+    while pos >= 0:
+        stable.add(pos)
+        pos = prev[pos]
+    return stable
+
+
+def diff_index(old: TreeIndex, new_nodes: Iterable[KeyedNode]) -> TreeDiff:
+    """이전 인덱스와 새 노드 스트림 비교."""
+    diff = TreeDiff(old_nodes=len(old))
+    entries = old.entries
+    seen: set[str] = set()
+    # 같은 부모 아래 매칭된 노드의 (이전 순번, 키, 새 순번), 새 트리 순서
+    siblings: dict[Optional[str], list[tuple[int, str, int]]] = {}
+
+    for key, parent_key, index, fields in new_nodes:
+        diff.new_nodes += 1
+        entry = entries.get(key)
+        if entry is None or key in seen:
+            diff.inserted.append({
+                "key": key, "parent": parent_key, "index": index, **_fields_dict(fields)
+            })
+            continue
+        seen.add(key)
+        old_parent, old_index, old_fields = entry
+
+        if old_fields != fields:
+            diff.changed.append({
+                "key": key,
+                "fields": {
+                    name: [a, b]
+                    for name, a, b in zip(CHANGE_FIELDS, old_fields, fields) if a != b
+                },
+            })
+
+        if old_parent != parent_key:
+            diff.moved.append({
+                "key": key, "old_parent": old_parent, "new_parent": parent_key,
+                "old_index": old_index, "new_index": index,
+            })
+        else:
+            siblings.setdefault(parent_key, []).append((old_index, key, index))
+
+    # 부모 유지 + 형제 순서 바뀐 노드
+    for parent_key, matched in siblings.items():
+        if len(matched) < 2:
+            continue
+        stable = _stable_positions([old_index for old_index, _, _ in matched])
+        if len(stable) == len(matched):
+            continue
+        for pos, (old_index, key, index) in enumerate(matched):
+            if pos not in stable:
+                diff.moved.append({
+                    "key": key, "old_parent": parent_key, "new_parent": parent_key,
+                    "old_index": old_index, "new_index": index,
+                })
+
+    for key, (parent_key, index, fields) in entries.items():
+        if key not in seen:
+            diff.removed.append({
+                "key": key, "parent": parent_key, "index": index, **_fields_dict(fields)
+            })
+    return diff
+
+
+def diff_trees(old: TreeSource, new: TreeSource, use_runtime_id: bool = True) -> TreeDiff:
+    """두 스냅샷 비교. old만 인덱스로 만들고 new는 스트리밍."""
+    return diff_index(
+        TreeIndex.build(old, use_runtime_id), iter_keyed_nodes(new, use_runtime_id)
+    )
+
+
+def _label(node: dict) -> str:
+    name = (node.get("Name") or "")[:40]
+    return f"{node.get('ControlType', '?')} '{name}'" if name else node.get("ControlType", "?")
+
+
+def _subtree_roots(nodes: list[dict]) -> list[dict]:
+    """부모도 같은 목록에 있는 노드 제외 (하위 트리 통째로 삽입/삭제)."""
+    keys = {node["key"] for node in nodes}
+    return [node for node in nodes if node["parent"] not in keys]
+
+
+def format_tree_diff(diff: TreeDiff, limit: int = 50) -> str:
+    """마크다운 보고서. 삽입/삭제는 하위 트리 루트만 표시."""
+    lines = [
+        "# UIA 트리 비교",
+        "",
+        f"- 노드: {diff.old_nodes} → {diff.new_nodes}",
+        f"- {diff.summary()}",
+    ]
+    if diff.is_empty:
+        lines += ["", "변경 없음"]
+        return "\n".join(lines) + "\n"
+
+    sections = (
+        ("삽입", _subtree_roots(diff.inserted),
+         lambda n: f"- {_label(n)} (부모 `{n['parent']}`, #{n['index']})"),
+        ("삭제", _subtree_roots(diff.removed),
+         lambda n: f"- {_label(n)} (`{n['key']}`)"),
+        ("이동", diff.moved,
+         lambda n: f"- `{n['key']}`: #{n['old_index']} → #{n['new_index']}"
+                   + ("" if n["old_parent"] == n["new_parent"] else f" (부모 `{n['new_parent']}`)")),
+        ("변경", diff.changed,
+         lambda n: f"- `{n['key']}`: " + ", ".join(
+             f"{name} {old!r} → {new!r}" for name, (old, new) in n["fields"].items())),
+    )
+    for title, nodes, fmt in sections:
+        if not nodes:
+            continue
+        lines += ["", f"## {title} ({len(nodes)})", ""]
+        lines += [fmt(node) for node in nodes[:limit]]
+        if len(nodes) > limit:
+            lines.append(f"- ... 외 {len(nodes) - limit}개")
+    return "\n".join(lines) + "\n"
@@ -1,20 +1,339 @@
 # SPDX-License-Identifier: MIT
 # Copyright 2025-2026 dnz3d4c
-"""UIA 트리 JSON 덤프. 디버깅용 유틸리티."""
+"""UIA 트리 JSON 덤프. 디버깅용 유틸리티.
 
-from typing import Callable, Optional
+dump_tree_json: 재귀 + 노드마다 live 속성 조회, 메모리에 트리 전체 구성.
+stream_tree_dump: CacheRequest(TreeScope_Subtree) 1회로 하위 트리 수집 후
+    명시적 스택으로 순회하며 노드 단위로 파일에 기록 (JSONL / compact JSON).
+    budget 지정 시 TreeScope_Children으로 max_depth/상한 안의 노드만 펼침.
+"""
+
+import json
+import threading
+import time
+from typing import Callable, IO, Iterator, Optional
 
 import uiautomation as auto
 
+from .debug import get_logger
+from .uia_cache_request import (
+    CONTROL_TYPE_NAMES,
+    UIA_RuntimeIdPropertyId,
+    create_children_cache_request,
+    create_subtree_cache_request,
+)
+
+log = get_logger("TreeDump")
+
+
+class DumpBudget:
+    """노드 수/시간 상한. 초과 시 나머지 노드는 건너뜀 (truncated=True)."""
+
+    def __init__(self, max_nodes: int = 0, max_seconds: float = 0.0):
+        self.max_nodes = max_nodes
+        self.deadline = time.monotonic() + max_seconds if max_seconds > 0 else 0.0
+        self.nodes = 0
+        self.truncated = False
+
+    def exhausted(self) -> bool:
+        """상한 도달 여부. 도달했으면 truncated=True."""
+        if self.truncated:
+            return True
+        if ((self.max_nodes and self.nodes >= self.max_nodes)
+                or (self.deadline and time.monotonic() > self.deadline)):
+            self.truncated = True
+        return self.truncated
+
+    def take(self) -> bool:
+        """노드 1개 사용. 상한 넘으면 False."""
+        if self.exhausted():
+            return False
+        self.nodes += 1
+        return True
+
+
+def _rect_dict(rect) -> dict:
+    return {
+        "left": rect.left,
+        "top": rect.top,
+        "right": rect.right,
+        "bottom": rect.bottom
+    }
+
+
+def _live_props(element: auto.Control, include_coords: bool) -> dict:
+    """노드 속성 live 조회 (속성마다 COM 호출)."""
+    raw_name = element.Name or ""
+    node = {
+        "ControlType": element.ControlTypeName,
+        "Name": raw_name,
+        "ClassName": element.ClassName or "",
+        "AutomationId": element.AutomationId or "",
+        "IsEmpty": not raw_name.strip(),
+    }
+    if include_coords:
+        try:
+            node["BoundingRectangle"] = _rect_dict(element.BoundingRectangle)
+        except Exception:
+            pass
+    return node
+
+
+def _live_children(element: auto.Control) -> list:
+    return element.GetChildren()
+
+
+def _cached_props(element, include_coords: bool) -> dict:
+    """BuildUpdatedCache된 IUIAutomationElement에서 속성 읽기 (COM 호출 없음)."""
+    raw_name = element.CachedName or ""
+    control_type = element.CachedControlType
+    node = {
+        "ControlType": CONTROL_TYPE_NAMES.get(control_type, f"Unknown({control_type})"),
+        "Name": raw_name,
+        "ClassName": element.CachedClassName or "",
+        "AutomationId": element.CachedAutomationId or "",
+        "IsEmpty": not raw_name.strip(),
+    }
+    if include_coords:
+        try:
+            node["BoundingRectangle"] = _rect_dict(element.CachedBoundingRectangle)
+        except Exception:
+            pass
+    try:
+        runtime_id = element.GetCachedPropertyValue(UIA_RuntimeIdPropertyId)
+        if runtime_id:
+            node["RuntimeId"] = list(runtime_id)
+    except Exception:
+        pass
+    return node
+
+
+def _cached_children(element) -> list:
+    children = element.GetCachedChildren()
+    if not children:
+        return []
+    return [children.GetElement(i) for i in range(children.Length)]
+
+
+def _level_children_fn(cache_request) -> Callable:
+    """노드마다 Children 범위 BuildUpdatedCache 후 캐시된 자식 (펼칠 때만 COM 왕복)."""
+    def children(element) -> list:
+        return _cached_children(element.BuildUpdatedCache(cache_request))
+    return children
+
+
+def iter_tree_nodes(
+    root,
+    max_depth: int = 6,
+    include_coords: bool = False,
+    budget: Optional[DumpBudget] = None,
+    cached: bool = False,
+    level_request=None,
+) -> Iterator[tuple[int, int, int, dict]]:
+    """전위 순회 (id, parent_id, depth, 속성). 루트 parent_id는 -1.
+
+    재귀 없이 명시적 스택 사용. cached=True면 root는 BuildUpdatedCache 결과.
+    level_request(Children 범위 CacheRequest) 지정 시 자식은 펼칠 때 노드별로 캐시.
+    budget 초과 시 순회 중단 (budget.truncated=True). 상한에 닿으면 자식도 안 펼침.
+    """
+    if not cached:
+        props_fn, children_fn = _live_props, _live_children
+    elif level_request is not None:
+        props_fn, children_fn = _cached_props, _level_children_fn(level_request)
+    else:
+        props_fn, children_fn = _cached_props, _cached_children
+    stack = [(root, -1, 0)]
+    next_id = 0
+    while stack:
+        element, parent_id, depth = stack.pop()
+        if budget is not None and not budget.take():
+            return
+        node_id = next_id
+        next_id += 1
+        try:
+            props = props_fn(element, include_coords)
+        except Exception as e:
+            # 순회 중 사라진 요소
+            yield node_id, parent_id, depth, {"error": str(e)}
+            continue
+        yield node_id, parent_id, depth, props
+
+        if depth >= max_depth or (budget is not None and budget.exhausted()):
+            continue
+        try:
+            children = children_fn(element)
+        except Exception as e:
+            yield next_id, node_id, depth + 1, {"error": str(e)}
+            next_id += 1
+            continue
+        # 역순 push → 문서 순서대로 pop
+        for child in reversed(children):
+            stack.append((child, node_id, depth + 1))
+
+
+class JsonlTreeWriter:
+    """노드 1개 = 1줄. id/parent/depth로 트리 복원."""
+
+    def __init__(self, fp: IO[str]):
+        self._fp = fp
+
+    def write(self, node_id: int, parent_id: int, depth: int, props: dict) -> None:
+        record = {
+            "id": node_id,
+            "parent": parent_id if parent_id >= 0 else None,
+            "depth": depth,
+            **props,
+        }
+        self._fp.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+        self._fp.write("\n")
+
+    def close(self) -> None:
+        pass
+
+
+class JsonTreeWriter:
+    """dump_tree_json과 같은 중첩 구조를 순회 순서대로 기록.
+
+    노드를 열어둔 채 다음 노드의 depth를 보고 Children 배열을 열고 닫음.
+    indent 지정 시 노드마다 줄바꿈 + depth 들여쓰기 (사람이 읽는 수동 덤프용).
+    """
+
+    def __init__(self, fp: IO[str], indent: Optional[int] = None):
+        self._fp = fp
+        self._indent = indent
+        self._open: list[int] = []  # 열린 노드 depth 스택
+        self._written = False
+
+    def write(self, node_id: int, parent_id: int, depth: int, props: dict) -> None:
+        write = self._fp.write
+        if self._open:
+            if depth > self._open[-1]:
+                write(',"Children":[')
+            else:
+                write("}")
+                self._open.pop()
+                while self._open and self._open[-1] >= depth:
+                    write("]}")
+                    self._open.pop()
+                write(",")
+        if self._indent:
+            write("\n" + " " * (self._indent * depth))
+        # 닫는 중괄호는 다음 노드/close에서
+        write(json.dumps(props, ensure_ascii=False, separators=(",", ":"))[:-1])
+        self._open.append(depth)
+        self._written = True
+
+    def close(self) -> None:
+        write = self._fp.write
+        if not self._written:
+            write("null")
+            return
+        if self._open:
+            write("}")
+            self._open.pop()
+        while self._open:
+            write("]}")
+            self._open.pop()
+        if self._indent:
+            write("\n")
+
+
+TREE_WRITERS = {
+    "jsonl": JsonlTreeWriter,
+    "json": JsonTreeWriter,
+}
+
+# 스레드(COM 아파트먼트)별 CacheRequest. include_coords → 요청 (미지원이면 None)
+_thread_cache = threading.local()
+
+
+def _get_thread_cache_request(include_coords: bool, per_level: bool = False):
+    requests = _thread_cache.__dict__.setdefault("requests", {})
+    key = (include_coords, per_level)
+    if key not in requests:
+        create = create_children_cache_request if per_level else create_subtree_cache_request
+        requests[key] = create(include_coords)
+    return requests[key]
+
+
+def stream_tree_dump(
+    element: auto.Control,
+    fp: Optional[IO[str]],
+    fmt: str = "json",
+    max_depth: int = 6,
+    include_coords: bool = False,
+    budget: Optional[DumpBudget] = None,
+    cache_request=None,
+    indent: Optional[int] = None,
+    on_node: Optional[Callable[[int, int, int, dict], None]] = None,
+) -> dict:
+    """UIA 트리를 fp에 스트리밍 기록. 반환: 노드 수/잘림/캐시 사용/소요 시간.
+
+    on_node: 노드마다 (id, parent_id, depth, 속성)으로 호출 (예: 기록하면서 diff 인덱스 구성).
+    fp가 None이면 기록 없이 on_node만 호출.
+
+    cache_request 없으면 스레드별 CacheRequest 사용.
+    budget 없으면 하위 트리 전체를 BuildUpdatedCache 1회로 (max_depth와 무관, COM 왕복 1회).
+    budget 있으면 Children 범위로 max_depth/상한 안의 노드만 펼침 (펼친 노드마다 왕복 1회).
+    cache_request를 직접 주면 budget 유무에 맞는 범위여야 함.
+    CacheRequest 불가(comtypes 없음/BuildUpdatedCache 실패)면 live 순회로 폴백.
+    """
+    start = time.perf_counter()
+    if fmt not in TREE_WRITERS:
+        raise ValueError(f"unknown tree dump format: {fmt}")
+
+    per_level = budget is not None
+    if cache_request is None:
+        cache_request = (_get_thread_cache_request(include_coords, per_level=True) if per_level
+                         else _get_thread_cache_request(include_coords))
+
+    root, cached = element, False
+    if cache_request is not None:
+        try:
+            # auto.Control이면 내부 IUIAutomationElement 사용
+            raw = getattr(element, "Element", element)
+            root = raw.BuildUpdatedCache(cache_request)
+            cached = True
+        except Exception as e:
+            log.debug("subtree cache failed, live traversal: %s", e)
+            root = element
+
+    writer = None
+    if fp is not None:
+        writer = (JsonTreeWriter(fp, indent) if fmt == "json" else TREE_WRITERS[fmt](fp))
+    nodes = 0
+    for node_id, parent_id, depth, props in iter_tree_nodes(
+        root, max_depth, include_coords, budget, cached,
+        level_request=cache_request if cached and per_level else None,
+    ):
+        if writer is not None:
+            writer.write(node_id, parent_id, depth, props)
+        if on_node is not None:
+            on_node(node_id, parent_id, depth, props)
+        nodes += 1
+    if writer is not None:
+        writer.close()
+
+    return {
+        "nodes": nodes,
+        "truncated": budget.truncated if budget is not None else False,
+        "cached": cached,
+        "elapsed_ms": round((time.perf_counter() - start) * 1000, 1),
+    }
+
 
 def dump_tree_json(
     element: auto.Control,
     max_depth: int = 5,
     current_depth: int = 0,
     include_coords: bool = False,
-    filter_fn: Optional[Callable[[auto.Control], bool]] = None
+    filter_fn: Optional[Callable[[auto.Control], bool]] = None,
+    budget: Optional[DumpBudget] = None,
 ) -> Optional[dict]:
-    """UIA 트리를 JSON 형식으로 덤프."""
+    """UIA 트리를 JSON 형식으로 덤프. budget 지정 시 노드/시간 상한 적용."""
+    if budget is not None and not budget.take():
+        return None
+
     # 필터 조건 확인
     if filter_fn is not None and not filter_fn(element):
         # 필터 불통과 시 자식만 탐색 (플랫하게 반환)
@@ -24,7 +343,7 @@ def dump_tree_json(
                 for child in element.GetChildren():
                     child_result = dump_tree_json(
                         child, max_depth, current_depth + 1,
-                        include_coords, filter_fn
+                        include_coords, filter_fn, budget
                     )
                     if child_result:
                         if isinstance(child_result, list):
@@ -35,26 +354,7 @@ def dump_tree_json(
                 pass
         return children if children else None
 
-    raw_name = element.Name or ""
-    node = {
-        "ControlType": element.ControlTypeName,
-        "Name": raw_name,
-        "ClassName": element.ClassName or "",
-        "AutomationId": element.AutomationId or "",
-        "IsEmpty": not raw_name.strip(),
-    }
-
-    if include_coords:
-        try:
-            rect = element.BoundingRectangle
-            node["BoundingRectangle"] = {
-                "left": rect.left,
-                "top": rect.top,
-                "right": rect.right,
-                "bottom": rect.bottom
-            }
-        except Exception:
-            pass
+    node = _live_props(element, include_coords)
 
     # 자식 탐색
     if current_depth < max_depth:
@@ -63,7 +363,7 @@ def dump_tree_json(
             for child in element.GetChildren():
                 child_result = dump_tree_json(
                     child, max_depth, current_depth + 1,
-                    include_coords, filter_fn
+                    include_coords, filter_fn, budget
                 )
                 if child_result:
                     if isinstance(child_result, list):
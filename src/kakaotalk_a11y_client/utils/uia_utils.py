@@ -215,17 +215,15 @@ def is_focus_in_message_list(element: Optional[auto.Control] = None) -> bool:
         for i in range(12):  # 부모 12단계까지 탐색
             if not current:
                 break
-            # 디버그: 각 단계별 ClassName, Name 출력
-            try:
-                cls_name = current.ClassName
-                name = current.Name
-                log.trace(f"is_focus_in_message_list: depth={i}, ClassName={cls_name}, Name={name[:20] if name else None}")
-            except Exception:
-                pass
-
-            if (current.ClassName == KAKAO_LIST_CONTROL_CLASS
+            cls_name = current.ClassName
+            # 디버그: 각 단계별 ClassName, Name 출력 (TRACE 꺼지면 Name 조회 안 함)
+            if log.trace_enabled:
+                log.trace("is_focus_in_message_list: depth=%d, ClassName=%s, Name=%.20s",
+                          i, cls_name, current.Name)
+
+            if (cls_name == KAKAO_LIST_CONTROL_CLASS
                     and current.Name == KAKAO_MESSAGE_LIST_NAME):
-                log.debug(f"is_focus_in_message_list: found at depth={i}")
+                log.debug("is_focus_in_message_list: found at depth=%d", i)
                 return True
             current = current.GetParentControl()
 
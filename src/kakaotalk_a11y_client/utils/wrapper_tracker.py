@@ -0,0 +1,380 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025-2026 dnz3d4c
+"""UIA 래퍼 보유량 + 메모리 증가 추적 (누수 진단, 기본 꺼짐).
+
+라이브 UIA 래퍼(auto.Control, IUIAutomationElement)는 잡고 있는 동안 카카오톡 쪽 COM 참조도
+붙잡음. 래퍼를 보관하는 곳이 owner 이름으로 자기 인스턴스를 등록 (약한 참조, 등록은 항상):
+
+    wrapper_tracker.register("chat_room.messages", self, attrgetter("messages"))
+
+켜져 있으면 (--track-wrappers [SECS]) 주기마다:
+    - owner별 보유 래퍼 수 (살아 있는 인스턴스들의 probe 결과 합) + 인스턴스 수
+    - gc 전수 조사로 살아 있는 래퍼 총수 (owner "(live)", owner 밖에서 새는 것 포착)
+    - tracemalloc 스냅샷, 직전/첫 스냅샷 대비 증가 상위 위치
+최근 WRAPPER_LEAK_WINDOW 샘플 동안 한 번도 줄지 않고 WRAPPER_LEAK_MIN_GROWTH 이상 늘어난
+owner는 누수 의심 (경고 1회 + wrapper_leak_suspect 메트릭).
+
+판정 값은 인스턴스당 보유량 (인스턴스가 늘어난 것은 누수 아님). baseline(살아 있는 목록 길이 등
+정상 보유량)을 주면 그만큼 뺀 초과분으로 판정 → 메시지가 계속 들어오는 방의 목록 증가는 제외.
+"""
+
+import gc
+import math
+import threading
+import time
+import tracemalloc
+import weakref
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, Sequence
+
+from ..config import (
+    WRAPPER_LEAK_MIN_GROWTH,
+    WRAPPER_LEAK_WINDOW,
+    WRAPPER_TRACEMALLOC_FRAMES,
+    WRAPPER_TRACEMALLOC_TOP,
+    WRAPPER_TRACK_INTERVAL_SECS,
+)
+from .debug import get_logger
+from .metrics import gauge, metrics_registry
+
+log = get_logger("WrapperTracker")
+
+LIVE_OWNER = "(live)"  # gc 전수 조사 결과
+
+Probe = Callable[[Any], Any]
+
+
+def count_wrappers(value) -> int:
+    """probe 결과 → 래퍼 수. None은 0, 컨테이너는 원소 합, 나머지는 1."""
+    if value is None:
+        return 0
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sum(count_wrappers(item) for item in value)
+    if isinstance(value, dict):
+        return sum(count_wrappers(item) for item in value.values())
+    return 1
+
+
+def is_growing(counts: Sequence[int], min_growth: int) -> bool:
+    """한 번도 줄지 않고 min_growth 이상 늘었으면 True."""
+    counts = list(counts)
+    if len(counts) < 2:
+        return False
+    return (all(b >= a for a, b in zip(counts, counts[1:]))
+            and counts[-1] - counts[0] >= min_growth)
+
+
+def default_wrapper_types() -> tuple:
+    """전수 조사 대상 타입. import 안 되는 환경이면 빈 튜플."""
+    types = []
+    try:
+        import uiautomation as auto
+        if isinstance(getattr(auto, "Control", None), type):
+            types.append(auto.Control)
+    except Exception:
+        pass
+    try:
+        from ctypes import POINTER
+
+        from comtypes.gen.UIAutomationClient import IUIAutomationElement
+        types.append(POINTER(IUIAutomationElement))
+    except Exception:
+        pass
+    return tuple(types)
+
+
+@dataclass
+class WrapperSample:
+    timestamp: float
+    owners: dict[str, int]        # owner → 보유 래퍼 수
+    instances: dict[str, int]     # owner → 살아 있는 인스턴스 수
+    live_wrappers: Optional[int]  # 전수 조사 (끄면 None)
+    traced_kb: float              # tracemalloc 현재 (끄면 0)
+
+
+_PRUNE_AT = 1024  # 샘플 사이 등록이 많으면 (MessageEvent) 죽은 참조 정리
+
+
+@dataclass
+class _Owner:
+    probe: Probe
+    # id → 약한 참조 (WeakSet 대신: eq 데이터클래스는 해시 불가)
+    refs: dict[int, weakref.ref] = field(default_factory=dict)
+
+    def alive(self) -> list:
+        """살아 있는 인스턴스. 죽은 참조는 정리."""
+        alive = []
+        for key, ref in list(self.refs.items()):
+            instance = ref()
+            if instance is None:
+                del self.refs[key]
+            else:
+                alive.append(instance)
+        return alive
+
+
+class WrapperTracker:
+    """owner별 래퍼 보유량 샘플링 + 누수 의심 판정. start() 없이 sample()만 불러도 됨."""
+
+    def __init__(
+        self,
+        window: int = WRAPPER_LEAK_WINDOW,
+        min_growth: int = WRAPPER_LEAK_MIN_GROWTH,
+        top: int = WRAPPER_TRACEMALLOC_TOP,
+    ):
+        self.window = window
+        self.min_growth = min_growth
+        self.top = top
+        self._owners: dict[str, _Owner] = {}
+        self._lock = threading.Lock()  # 등록/순회
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._history: dict[str, deque] = {}
+        self._peaks: dict[str, int] = {}
+        self._census = True
+        self._defaults = (window, min_growth)
+        self._baseline: Optional[Callable[[], int]] = None
+        self._wrapper_types: tuple = ()
+        self._trace_memory = False
+        self._started_tracing = False
+        self._first_snapshot = None
+        self._last_snapshot = None
+        self.active = False
+        self.samples = 0
+        self.last: Optional[WrapperSample] = None
+        self.suspects: set[str] = set()
+        self.top_growth: list[dict] = []    # 직전 스냅샷 대비
+        self.total_growth: list[dict] = []  # 첫 스냅샷 대비
+
+    # === 등록 ===
+
+    def register(self, owner: str, instance, probe: Probe) -> None:
+        """instance가 살아 있는 동안 probe(instance)가 반환한 래퍼를 owner 몫으로 셈."""
+        with self._lock:
+            entry = self._owners.get(owner)
+            if entry is None:
+                entry = self._owners[owner] = _Owner(probe)
+            if len(entry.refs) >= _PRUNE_AT:
+                entry.alive()
+            entry.refs[id(instance)] = weakref.ref(instance)
+
+    @property
+    def owners(self) -> list[str]:
+        return sorted(self._owners)
+
+    # === 켜기/끄기 ===
+
+    def start(
+        self,
+        interval: float = WRAPPER_TRACK_INTERVAL_SECS,
+        census: bool = True,
+        wrapper_types: Optional[tuple] = None,
+        trace_memory: bool = True,
+        thread: bool = True,
+        window: Optional[int] = None,
+        min_growth: Optional[int] = None,
+        baseline: Optional[Callable[[], int]] = None,
+    ) -> bool:
+        """추적 시작. thread=False면 샘플은 호출자가 sample()로. 이미 켜져 있으면 False.
+
+        window/min_growth: 이번 추적만 판정 기준 변경 (stop()에서 원복).
+        baseline: 정상 보유량 (예: 살아 있는 메시지 목록 길이). 인스턴스당 보유량에서 빼고 판정.
+        """
+        if self.active:
+            return False
+        self.reset()
+        default_window, default_growth = self._defaults
+        self.window = window if window is not None else default_window
+        self.min_growth = min_growth if min_growth is not None else default_growth
+        self._baseline = baseline
+        self._census = census
+        self._wrapper_types = default_wrapper_types() if wrapper_types is None else wrapper_types
+        self._trace_memory = trace_memory
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start(WRAPPER_TRACEMALLOC_FRAMES)
+            self._started_tracing = True
+        self.active = True
+        self._stop.clear()
+        if thread:
+            self._thread = threading.Thread(target=self._run, args=(interval,), daemon=True,
+                                            name="WrapperTracker")
+            self._thread.start()
+        log.info(f"wrapper tracking started: interval={interval}s, census={census}, "
+                 f"types={[t.__name__ for t in self._wrapper_types]}")
+        return True
+
+    def stop(self) -> None:
+        if not self.active:
+            return
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+        self.active = False
+        self.window, self.min_growth = self._defaults
+        self._baseline = None
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        self._first_snapshot = self._last_snapshot = None
+        self.log_summary()
+
+    def reset(self) -> None:
+        self._history.clear()
+        self._peaks.clear()
+        self.samples = 0
+        self.last = None
+        self.suspects = set()
+        self.top_growth = []
+        self.total_growth = []
+
+    def _run(self, interval: float) -> None:
+        while True:
+            try:
+                self.sample()
+            except Exception as e:
+                log.warning(f"wrapper sample failed: {e}")
+            if self._stop.wait(interval):
+                return
+
+    # === 샘플 ===
+
+    def _owner_counts(self) -> tuple[dict[str, int], dict[str, int]]:
+        with self._lock:
+            snapshot = [(name, entry.probe, entry.alive()) for name, entry in self._owners.items()]
+        counts, instances = {}, {}
+        for name, probe, alive in snapshot:
+            total = 0
+            for instance in alive:
+                try:
+                    total += count_wrappers(probe(instance))
+                except Exception:
+                    pass  # 정리 중인 인스턴스
+            counts[name] = total
+            instances[name] = len(alive)
+        return counts, instances
+
+    def _count_live(self) -> int:
+        types = self._wrapper_types
+        if not types:
+            return 0
+        return sum(1 for obj in gc.get_objects() if isinstance(obj, types))
+
+    def _snapshot_memory(self) -> float:
+        if not self._trace_memory or not tracemalloc.is_tracing():
+            return 0.0
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ])
+        if self._first_snapshot is None:
+            self._first_snapshot = snapshot
+        else:
+            self.total_growth = self._growth(snapshot, self._first_snapshot)
+        if self._last_snapshot is not None:
+            self.top_growth = self._growth(snapshot, self._last_snapshot)
+        self._last_snapshot = snapshot
+        return tracemalloc.get_traced_memory()[0] / 1024
+
+    def _growth(self, snapshot, previous) -> list[dict]:
+        stats = [s for s in snapshot.compare_to(previous, "lineno") if s.size_diff > 0]
+        return [
+            {"location": str(stat.traceback[0]), "size_diff_kb": round(stat.size_diff / 1024, 1),
+             "count_diff": stat.count_diff, "size_kb": round(stat.size / 1024, 1)}
+            for stat in stats[:self.top]
+        ]
+
+    def sample(self) -> WrapperSample:
+        """1회 샘플 + 누수 판정."""
+        counts, instances = self._owner_counts()
+        live = self._count_live() if self._census else None
+        traced_kb = self._snapshot_memory()
+        sample = WrapperSample(time.time(), counts, instances, live, round(traced_kb, 1))
+
+        baseline = 0
+        if self._baseline is not None:
+            try:
+                baseline = self._baseline()
+            except Exception:
+                pass
+        tracked = {
+            name: (count, max(0, math.ceil(count / instances[name]) - baseline) if instances[name] else 0)
+            for name, count in counts.items()
+        }
+        if live is not None:
+            tracked[LIVE_OWNER] = (live, live)
+        for name, (count, leak_value) in tracked.items():
+            self._peaks[name] = max(self._peaks.get(name, 0), count)
+            history = self._history.setdefault(name, deque(maxlen=self.window))
+            history.append(leak_value)
+            if (name not in self.suspects and len(history) == self.window
+                    and is_growing(history, self.min_growth)):
+                self.suspects.add(name)
+                log.warning(f"wrapper leak suspect: {name} {history[0]} → {history[-1]} "
+                            f"over {self.window} samples")
+
+        self.samples += 1
+        self.last = sample
+        log.debug(f"wrappers: {counts}, live={live}, traced={traced_kb:.0f}KB")
+        for growth in self.top_growth[:3]:
+            log.trace(f"memory growth: {growth['location']} +{growth['size_diff_kb']}KB")
+        return sample
+
+    # === 결과 ===
+
+    def report(self) -> dict:
+        last = self.last
+        names = sorted(set(self._peaks))
+        return {
+            "samples": self.samples,
+            "owners": {
+                name: {
+                    "current": (last.live_wrappers if name == LIVE_OWNER
+                                else last.owners.get(name, 0)) if last else 0,
+                    "peak": self._peaks.get(name, 0),
+                    "instances": last.instances.get(name, 0) if last else 0,
+                    "suspect": name in self.suspects,
+                }
+                for name in names
+            },
+            "suspects": sorted(self.suspects),
+            "traced_kb": last.traced_kb if last else 0.0,
+            "top_growth": list(self.top_growth),
+            "total_growth": list(self.total_growth),
+        }
+
+    def log_summary(self) -> None:
+        report = self.report()
+        owners = ", ".join(f"{name}={data['current']}(peak {data['peak']})"
+                           for name, data in report["owners"].items())
+        log.info(f"wrapper tracking: {report['samples']} samples, {owners}, "
+                 f"suspects={report['suspects'] or 'none'}")
+        for growth in report["total_growth"][:5]:
+            log.info(f"memory growth since start: {growth['location']} "
+                     f"+{growth['size_diff_kb']}KB ({growth['count_diff']:+d} blocks)")
+
+    def collect_metrics(self) -> list:
+        families = [gauge("wrapper_tracker_active", "Wrapper tracking enabled.", self.active)]
+        last = self.last
+        if last is None:
+            return families
+        retained = gauge("wrapper_retained", "UIA wrappers retained per owner at last sample.")
+        instances = gauge("wrapper_owner_instances", "Live owner instances at last sample.")
+        suspect = gauge("wrapper_leak_suspect", "Owner retained count grew without release.")
+        for name in sorted(last.owners):
+            retained.add(last.owners[name], owner=name)
+            instances.add(last.instances.get(name, 0), owner=name)
+            suspect.add(name in self.suspects, owner=name)
+        if last.live_wrappers is not None:
+            retained.add(last.live_wrappers, owner=LIVE_OWNER)
+            suspect.add(LIVE_OWNER in self.suspects, owner=LIVE_OWNER)
+        families += [retained, instances, suspect]
+        if last.traced_kb:
+            families.append(gauge("wrapper_tracker_traced_bytes", "tracemalloc traced memory.",
+                                  int(last.traced_kb * 1024)))
+        return families
+
+
+wrapper_tracker = WrapperTracker()
+metrics_registry.register("wrapper_tracker", wrapper_tracker.collect_metrics)
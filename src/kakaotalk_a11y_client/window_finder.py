@@ -15,6 +15,7 @@ from .config import (
     TIMING_HWND_CACHE_TTL,
     CACHE_HWND_CLASS_MAX_SIZE,
     CACHE_HWND_CLASS_EVICT_COUNT,
+    DEFAULT_DPI,
 )
 
 # 로거는 함수 내부에서 lazy import (순환 import 방지)
@@ -288,6 +289,16 @@ def get_client_rect(hwnd: int) -> tuple[int, int, int, int]:
     return (left, top, right, bottom)
 
 
+def get_window_dpi(hwnd: int) -> int:
+    """창이 있는 모니터 DPI (GetDpiForWindow, Windows 10 1607+). 실패 시 DEFAULT_DPI."""
+    try:
+        import ctypes
+        dpi = ctypes.windll.user32.GetDpiForWindow(hwnd)
+    except Exception:
+        return DEFAULT_DPI
+    return dpi or DEFAULT_DPI
+
+
 # =============================================================================
 # hwnd → 카카오톡 여부 캐시 (FocusChanged 이벤트 필터링 최적화)
 # =============================================================================
@@ -152,3 +152,25 @@ def mock_update_info():
 def mock_tray_icon(mocker):
     """TrayIcon 모킹 - MainFrame 생성 시 필요."""
     return mocker.patch("kakaotalk_a11y_client.gui.tray_icon.TrayIcon")
+
+
+# =============================================================================
+# 가짜 UIA 트리 fixtures
+# =============================================================================
+
+
+@pytest.fixture(scope="module")
+def platform_modules():
+    """Windows 전용 모듈 대역 (tests/uia_sim). 모듈 테스트 끝나면 sys.modules에서 제거."""
+    from tests.uia_sim import platform_modules
+
+    with platform_modules() as installed:
+        yield installed
+
+
+@pytest.fixture
+def fake_uia_tree():
+    """합성 UIA 트리 생성 함수 (tests/uia_sim build_tree, 벤치마크와 공용)."""
+    from tests.uia_sim import build_tree
+
+    return build_tree
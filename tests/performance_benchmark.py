@@ -1,43 +1,239 @@
 """
 카카오톡 접근성 클라이언트 성능 벤치마크
 - 적용 전/후 비교용
-- 동일 조건에서 반복 측정
+- 워밍업 후 평균의 신뢰구간이 목표 폭 안에 들 때까지 반복 (적응형), IQR 밖 이상치 제외
+- 비교: 평균 차이의 95% 신뢰구간 + Welch t 검정 (유의하고 변화가 임계 이상일 때만 개선/저하)
+- --backend sim: 같은 벤치마크를 헤드리스 시뮬레이터(tests/uia_sim) 트리에서 실행 (비Windows 가능)
 
 사용법:
-    측정: uv run python tests/performance_benchmark.py measure <label>
+    측정: uv run python tests/performance_benchmark.py measure <label> [--backend live|sim]
     비교: uv run python tests/performance_benchmark.py compare <baseline.json> <after.json>
+    목록: uv run python tests/performance_benchmark.py list
+
+종료 코드: 0 정상, 1 측정 불가, 2 유의한 저하 (compare)
 """
-import time
+import argparse
 import json
+import math
+import os
+import platform
 import statistics
+import sys
+import sysconfig
+import time
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-import sys
-
-import uiautomation as auto
+from typing import Optional
 
 # 측정 결과 저장 경로
 RESULTS_DIR = Path.home() / '.kakaotalk_a11y' / 'benchmarks'
-RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+
+# =============================================================================
+# 측정 설정
+# =============================================================================
+
+WARMUP_ITERATIONS = 3      # 캐시/JIT/COM 프록시 준비 (기록 안 함)
+MIN_ITERATIONS = 10        # 신뢰구간 판정 전 최소 반복
+MAX_ITERATIONS = 200       # 항목당 반복 상한
+MAX_SECONDS = 30.0         # 항목당 측정 시간 상한
+CI_LEVEL = 0.95            # 신뢰수준
+CI_TARGET_PCT = 5.0        # 목표: 신뢰구간 반폭 <= 평균의 5%
+OUTLIER_IQR_K = 1.5        # Tukey 울타리 (Q1 - k*IQR, Q3 + k*IQR)
+
+# =============================================================================
+# 비교 설정
+# =============================================================================
+
+COMPARE_ALPHA = 0.05       # 유의수준
+COMPARE_MIN_CHANGE_PCT = 5.0  # 유의해도 이보다 작은 변화는 유지
+
+# =============================================================================
+# 시뮬레이터 백엔드 설정
+# =============================================================================
+
+SIM_FRIENDS = 300
+SIM_CHATS = 100
+SIM_MESSAGES = 200
+
+
+# =============================================================================
+# 통계
+# =============================================================================
+
+
+def reject_outliers(samples: list[float], k: float = OUTLIER_IQR_K) -> tuple[list[float], int]:
+    """Tukey 울타리 밖 값 제외. 반환: (남은 값, 제외 수). 4개 미만이면 그대로."""
+    if len(samples) < 4:
+        return list(samples), 0
+    q1, _, q3 = statistics.quantiles(samples, n=4)
+    iqr = q3 - q1
+    low, high = q1 - k * iqr, q3 + k * iqr
+    kept = [x for x in samples if low <= x <= high]
+    return kept, len(samples) - len(kept)
+
+
+def _betacf(a: float, b: float, x: float) -> float:
+    """불완전 베타 함수 연분수 (Lentz)."""
+    tiny = 1e-300
+    c, d = 1.0, 1.0 - (a + b) * x / (a + 1)
+    d = 1.0 / (d if abs(d) > tiny else tiny)
+    h = d
+    for m in range(1, 300):
+        for num in (m * (b - m) * x / ((a + 2 * m - 1) * (a + 2 * m)),
+                    -(a + m) * (a + b + m) * x / ((a + 2 * m) * (a + 2 * m + 1))):
+            d = 1.0 + num * d
+            d = 1.0 / (d if abs(d) > tiny else tiny)
+            c = 1.0 + num / c
+            c = c if abs(c) > tiny else tiny
+            h *= d * c
+        if abs(d * c - 1.0) < 1e-12:
+            break
+    return h
+
+
+def _betainc(a: float, b: float, x: float) -> float:
+    """정규화 불완전 베타 함수 I_x(a, b)."""
+    if x <= 0:
+        return 0.0
+    if x >= 1:
+        return 1.0
+    front = math.exp(math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b)
+                     + a * math.log(x) + b * math.log1p(-x))
+    if x < (a + 1) / (a + b + 2):
+        return front * _betacf(a, b, x) / a
+    return 1.0 - front * _betacf(b, a, 1 - x) / b
+
+
+def t_two_sided_p(t: float, df: float) -> float:
+    """Student t 양측 p값."""
+    if df <= 0:
+        return 1.0
+    return _betainc(df / 2, 0.5, df / (df + t * t))
+
+
+@lru_cache(maxsize=512)
+def t_critical(df: float, level: float = CI_LEVEL) -> float:
+    """양측 신뢰수준 level의 t 임계값 (이분법)."""
+    alpha = 1 - level
+    low, high = 0.0, 1e4
+    for _ in range(100):
+        mid = (low + high) / 2
+        if t_two_sided_p(mid, df) > alpha:
+            low = mid
+        else:
+            high = mid
+    return (low + high) / 2
+
+
+def mean_ci(samples: list[float], level: float = CI_LEVEL) -> tuple[float, float]:
+    """평균과 신뢰구간 반폭. 2개 미만이면 반폭 inf."""
+    mean = statistics.mean(samples)
+    if len(samples) < 2:
+        return mean, math.inf
+    sem = statistics.stdev(samples) / math.sqrt(len(samples))
+    return mean, t_critical(len(samples) - 1, level) * sem
+
+
+def welch_test(base: list[float], curr: list[float], level: float = CI_LEVEL) -> dict:
+    """Welch t 검정. 반환: diff(curr-base 평균 차), ci_low/ci_high(차이 신뢰구간), t, df, p."""
+    n1, n2 = len(base), len(curr)
+    m1, m2 = statistics.mean(base), statistics.mean(curr)
+    diff = m2 - m1
+    v1 = statistics.variance(base) / n1 if n1 > 1 else 0.0
+    v2 = statistics.variance(curr) / n2 if n2 > 1 else 0.0
+    se = math.sqrt(v1 + v2)
+    if se == 0:
+        p = 1.0 if diff == 0 else 0.0
+        return {"diff": diff, "ci_low": diff, "ci_high": diff, "t": 0.0, "df": 0.0, "p": p}
+    # Welch–Satterthwaite 자유도
+    terms = (v1 * v1 / (n1 - 1) if n1 > 1 else 0.0) + (v2 * v2 / (n2 - 1) if n2 > 1 else 0.0)
+    df = (v1 + v2) ** 2 / terms if terms > 0 else float(n1 + n2 - 2)
+    t = diff / se
+    half = t_critical(round(df, 3), level) * se
+    return {"diff": diff, "ci_low": diff - half, "ci_high": diff + half,
+            "t": t, "df": df, "p": t_two_sided_p(t, df)}
+
+
+# =============================================================================
+# 환경
+# =============================================================================
+
+
+def _cpu_name() -> str:
+    name = platform.processor()
+    if name and name != platform.machine():
+        return name
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return name or platform.machine()
+
+
+def environment() -> dict:
+    """결과 해석에 필요한 실행 환경 (인터프리터, CPU, free-threading)."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu": _cpu_name(),
+        "cpu_count": os.cpu_count(),
+        "free_threading_build": bool(sysconfig.get_config_var("Py_GIL_DISABLED")),
+        "gil_enabled": is_gil_enabled() if is_gil_enabled else True,
+    }
+
+
+# 비교 시 달라지면 경고할 키
+_ENVIRONMENT_KEYS = ("python", "implementation", "machine", "cpu", "free_threading_build",
+                     "gil_enabled")
 
 
 class PerformanceBenchmark:
     """성능 벤치마크 클래스"""
 
-    def __init__(self, label: str = "baseline"):
+    def __init__(self, label: str = "baseline", backend: Optional[dict] = None):
         self.label = label
         self.results = {
             "label": label,
             "timestamp": datetime.now().isoformat(),
+            "environment": environment(),
+            "backend": backend or {"name": "live"},
             "metrics": {}
         }
 
-    def measure(self, name: str, func, iterations: int = 10):
-        """함수 실행 시간 측정 (여러 번 반복)"""
+    def measure(self, name: str, func, iterations: Optional[int] = None,
+                min_iterations: int = MIN_ITERATIONS, max_iterations: int = MAX_ITERATIONS,
+                warmup: int = WARMUP_ITERATIONS, max_seconds: float = MAX_SECONDS,
+                ci_target_pct: float = CI_TARGET_PCT):
+        """함수 실행 시간 측정.
+
+        워밍업 후 min_iterations 이상, 이상치 제외 평균의 신뢰구간 반폭이 ci_target_pct 이하가
+        될 때까지 반복 (max_iterations/max_seconds 상한). iterations를 주면 그 횟수로 고정.
+        """
+        if iterations is not None:
+            min_iterations = max_iterations = iterations
+
+        for _ in range(warmup):
+            try:
+                func()
+            except Exception:
+                pass
+
         times = []
         errors = 0
+        attempts = 0
+        converged = False
+        deadline = time.perf_counter() + max_seconds
 
-        for i in range(iterations):
+        while attempts < max_iterations:
+            attempts += 1
             try:
                 start = time.perf_counter()
                 func()
@@ -45,34 +241,86 @@ class PerformanceBenchmark:
                 times.append(elapsed_ms)
             except Exception as e:
                 errors += 1
-                print(f"  {name} 측정 {i+1} 실패: {e}")
-
-        if times:
-            self.results["metrics"][name] = {
-                "iterations": iterations,
-                "errors": errors,
-                "min_ms": round(min(times), 2),
-                "max_ms": round(max(times), 2),
-                "avg_ms": round(statistics.mean(times), 2),
-                "median_ms": round(statistics.median(times), 2),
-                "stdev_ms": round(statistics.stdev(times), 2) if len(times) > 1 else 0,
-            }
-            print(f"  {name}: avg={self.results['metrics'][name]['avg_ms']}ms, errors={errors}")
-        else:
+                print(f"  {name} 측정 {attempts} 실패: {e}")
+
+            if len(times) >= min_iterations and iterations is None:
+                kept, _ = reject_outliers(times)
+                mean, half = mean_ci(kept)
+                if mean > 0 and half / mean * 100 <= ci_target_pct:
+                    converged = True
+                    break
+            if time.perf_counter() >= deadline and attempts >= min_iterations:
+                break
+
+        if not times:
             self.results["metrics"][name] = {"error": "all iterations failed"}
             print(f"  {name}: 모든 측정 실패")
+            return
+
+        kept, outliers = reject_outliers(times)
+        mean, half = mean_ci(kept)
+        self.results["metrics"][name] = {
+            "iterations": attempts,
+            "warmup": warmup,
+            "errors": errors,
+            "outliers": outliers,
+            "converged": converged,
+            "min_ms": round(min(kept), 4),
+            "max_ms": round(max(kept), 4),
+            "avg_ms": round(mean, 4),
+            "median_ms": round(statistics.median(kept), 4),
+            "stdev_ms": round(statistics.stdev(kept), 4) if len(kept) > 1 else 0,
+            "ci_low_ms": round(mean - half, 4) if math.isfinite(half) else None,
+            "ci_high_ms": round(mean + half, 4) if math.isfinite(half) else None,
+            "ci_half_pct": round(half / mean * 100, 2) if mean > 0 and math.isfinite(half) else None,
+            "samples_ms": [round(t, 4) for t in times],
+        }
+        data = self.results["metrics"][name]
+        ci = f"+-{data['ci_half_pct']}%" if data["ci_half_pct"] is not None else "CI 없음"
+        print(f"  {name}: avg={data['avg_ms']:.3f}ms ({ci}), n={len(kept)}, "
+              f"outliers={outliers}, errors={errors}{'' if converged or iterations else ', 미수렴'}")
 
-    def save(self):
+    def save(self, results_dir: Optional[Path] = None):
         """결과 JSON 저장"""
+        results_dir = Path(results_dir) if results_dir else RESULTS_DIR
+        results_dir.mkdir(parents=True, exist_ok=True)
         filename = f"{self.label}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        filepath = RESULTS_DIR / filename
+        filepath = results_dir / filename
         with open(filepath, 'w', encoding='utf-8') as f:
             json.dump(self.results, f, indent=2, ensure_ascii=False)
         print(f"\n결과 저장: {filepath}")
         return filepath
 
 
-def find_kakao_window():
+# =============================================================================
+# 백엔드
+# =============================================================================
+
+
+@contextmanager
+def uia_backend(name: str = "live", call_us: float = 0.0):
+    """uiautomation 모듈 (live) 또는 같은 API의 시뮬레이터 대역 (sim) 제공.
+
+    sim: 친구/채팅 목록 + 채팅방 1개짜리 합성 트리. call_us > 0이면 왕복마다 그만큼 대기
+    (프로세스 간 COM 비용 흉내). 반환: (auto 모듈, 결과에 남길 백엔드 정보)
+    """
+    if name == "live":
+        import uiautomation as auto
+        yield auto, {"name": "live"}
+        return
+    if name != "sim":
+        raise ValueError(f"알 수 없는 백엔드: {name}")
+
+    from tests.uia_sim import SimKakaoTalk
+
+    sim = SimKakaoTalk(friends=SIM_FRIENDS, chats=SIM_CHATS, call_us=call_us)
+    sim.open_chat_room("홍길동", messages=SIM_MESSAGES, activate=False)
+    sim.focus(sim.friend_list.children[0])
+    yield sim.automation, {"name": "sim", "call_us": call_us, "friends": SIM_FRIENDS,
+                           "chats": SIM_CHATS, "messages": SIM_MESSAGES}
+
+
+def find_kakao_window(auto):
     """카카오톡 메인 창 찾기"""
     # 창 이름이 '카카오톡' 또는 'KakaoTalk Dialog'일 수 있음
     kakao = auto.WindowControl(searchDepth=1, Name='카카오톡')
@@ -81,61 +329,22 @@ def find_kakao_window():
     return kakao
 
 
-def run_benchmark(label: str = "baseline"):
-    """전체 벤치마크 실행"""
-    print(f"\n{'='*50}")
-    print(f"성능 벤치마크: {label}")
-    print(f"{'='*50}\n")
-
-    bench = PerformanceBenchmark(label)
-
-    # 카카오톡 창 확인
-    kakao = find_kakao_window()
-    if not kakao.Exists(maxSearchSeconds=3):
-        print("카카오톡이 실행되지 않았습니다")
-        return None
-
-    print("카카오톡 발견, 측정 시작...\n")
+def define_benchmarks(auto, kakao) -> list[tuple]:
+    """(이름, 설명, 함수, 최소 반복) 목록. live/sim 공용."""
 
-    # 1. 창 찾기 성능
-    print("[1/6] 창 찾기")
-    bench.measure("find_main_window",
-        lambda: find_kakao_window().Exists(maxSearchSeconds=0.1),
-        iterations=20)
-
-    # 2. 포커스 컨트롤 가져오기
-    print("[2/6] 포커스 컨트롤")
-    bench.measure("get_focused_control",
-        lambda: auto.GetFocusedControl(),
-        iterations=20)
-
-    # 3. 리스트 자식 요소 가져오기
-    print("[3/6] 리스트 자식 요소")
     def get_list_children():
         list_ctrl = kakao.ListControl(searchDepth=6)
         if list_ctrl.Exists(maxSearchSeconds=0.5):
             return list_ctrl.GetChildren()
         return []
-    bench.measure("get_list_children", get_list_children, iterations=10)
 
-    # 4. 리스트 자식 필터링 (빈 항목 제외)
-    print("[4/6] 리스트 필터링")
     def filter_list_children():
         list_ctrl = kakao.ListControl(searchDepth=6)
         if list_ctrl.Exists(maxSearchSeconds=0.5):
             children = list_ctrl.GetChildren()
             return [c for c in children if c.Name and c.Name.strip()]
         return []
-    bench.measure("filter_list_children", filter_list_children, iterations=10)
-
-    # 5. 깊은 탐색 (searchDepth=10)
-    print("[5/6] 깊은 탐색")
-    bench.measure("deep_search_depth10",
-        lambda: kakao.ButtonControl(searchDepth=10, Name='전송').Exists(maxSearchSeconds=0.5),
-        iterations=10)
 
-    # 6. 트리 덤프 (depth=3)
-    print("[6/6] 트리 덤프")
     def dump_tree_depth3():
         count = 0
         def count_elements(ctrl, depth=0):
@@ -147,10 +356,44 @@ def run_benchmark(label: str = "baseline"):
                 count_elements(child, depth + 1)
         count_elements(kakao)
         return count
-    bench.measure("tree_dump_depth3", dump_tree_depth3, iterations=5)
+
+    return [
+        ("find_main_window", "창 찾기",
+         lambda: find_kakao_window(auto).Exists(maxSearchSeconds=0.1), 20),
+        ("get_focused_control", "포커스 컨트롤", lambda: auto.GetFocusedControl(), 20),
+        ("get_list_children", "리스트 자식 요소", get_list_children, 10),
+        ("filter_list_children", "리스트 필터링", filter_list_children, 10),
+        ("deep_search_depth10", "깊은 탐색",
+         lambda: kakao.ButtonControl(searchDepth=10, Name='전송').Exists(maxSearchSeconds=0.5), 10),
+        ("tree_dump_depth3", "트리 덤프", dump_tree_depth3, 5),
+    ]
+
+
+def run_benchmark(label: str = "baseline", backend: str = "live", call_us: float = 0.0,
+                  results_dir: Optional[Path] = None, **measure_options):
+    """전체 벤치마크 실행. 반환: 저장 경로 (카카오톡 없으면 None)"""
+    print(f"\n{'='*50}")
+    print(f"성능 벤치마크: {label} ({backend})")
+    print(f"{'='*50}\n")
+
+    with uia_backend(backend, call_us=call_us) as (auto, backend_info):
+        bench = PerformanceBenchmark(label, backend=backend_info)
+
+        # 카카오톡 창 확인
+        kakao = find_kakao_window(auto)
+        if not kakao.Exists(maxSearchSeconds=3):
+            print("카카오톡이 실행되지 않았습니다")
+            return None
+
+        print("카카오톡 발견, 측정 시작...\n")
+
+        benchmarks = define_benchmarks(auto, kakao)
+        for i, (name, title, func, min_iterations) in enumerate(benchmarks, 1):
+            print(f"[{i}/{len(benchmarks)}] {title}")
+            bench.measure(name, func, min_iterations=min_iterations, **measure_options)
 
     # 결과 저장
-    filepath = bench.save()
+    filepath = bench.save(results_dir)
 
     # 요약 출력
     print(f"\n{'='*50}")
@@ -158,12 +401,52 @@ def run_benchmark(label: str = "baseline"):
     print(f"{'='*50}")
     for name, data in bench.results["metrics"].items():
         if "avg_ms" in data:
-            print(f"  {name}: {data['avg_ms']}ms (+-{data['stdev_ms']})")
+            print(f"  {name}: {data['avg_ms']:.3f}ms "
+                  f"[{data['ci_low_ms']}, {data['ci_high_ms']}] n={data['iterations']}")
 
     return filepath
 
 
-def compare_results(baseline_path: str, after_path: str):
+# =============================================================================
+# 비교
+# =============================================================================
+
+
+def compare_metric(b: dict, a: dict, alpha: float = COMPARE_ALPHA,
+                   min_change_pct: float = COMPARE_MIN_CHANGE_PCT) -> dict:
+    """항목 하나 비교. 표본(samples_ms)이 없는 예전 결과는 검정 없이 untested."""
+    b_avg, a_avg = b["avg_ms"], a["avg_ms"]
+    change_pct = (a_avg - b_avg) / b_avg * 100 if b_avg > 0 else 0.0
+    result = {"base_ms": b_avg, "after_ms": a_avg, "change_pct": change_pct,
+              "ci_low_pct": None, "ci_high_pct": None, "p": None, "verdict": "untested"}
+
+    b_samples = reject_outliers(b.get("samples_ms") or [])[0]
+    a_samples = reject_outliers(a.get("samples_ms") or [])[0]
+    if len(b_samples) < 2 or len(a_samples) < 2:
+        return result
+
+    test = welch_test(b_samples, a_samples)
+    base_mean = statistics.mean(b_samples)
+    if base_mean > 0:
+        result["change_pct"] = test["diff"] / base_mean * 100
+        result["ci_low_pct"] = test["ci_low"] / base_mean * 100
+        result["ci_high_pct"] = test["ci_high"] / base_mean * 100
+    result["p"] = test["p"]
+
+    if test["p"] < alpha and result["change_pct"] >= min_change_pct:
+        result["verdict"] = "regressed"
+    elif test["p"] < alpha and result["change_pct"] <= -min_change_pct:
+        result["verdict"] = "improved"
+    else:
+        result["verdict"] = "unchanged"
+    return result
+
+
+_VERDICT_LABELS = {"improved": "개선", "regressed": "저하", "unchanged": "유지", "untested": "검정불가"}
+
+
+def compare_results(baseline_path: str, after_path: str, alpha: float = COMPARE_ALPHA,
+                    min_change_pct: float = COMPARE_MIN_CHANGE_PCT):
     """두 결과 비교"""
     with open(baseline_path, 'r', encoding='utf-8') as f:
         baseline = json.load(f)
@@ -174,12 +457,20 @@ def compare_results(baseline_path: str, after_path: str):
     print(f"성능 비교: {baseline['label']} vs {after['label']}")
     print(f"{'='*60}\n")
 
-    print(f"{'측정 항목':<30} {'Before':>10} {'After':>10} {'변화':>10} {'판정':>8}")
-    print("-" * 70)
+    b_env, a_env = baseline.get("environment", {}), after.get("environment", {})
+    for key in _ENVIRONMENT_KEYS:
+        if b_env.get(key) != a_env.get(key):
+            print(f"경고: 환경 다름 {key}: {b_env.get(key)} → {a_env.get(key)}")
+    b_backend = baseline.get("backend", {}).get("name", "live")
+    a_backend = after.get("backend", {}).get("name", "live")
+    if b_backend != a_backend:
+        print(f"경고: 백엔드 다름 {b_backend} → {a_backend}")
 
-    improvements = 0
-    regressions = 0
+    print(f"{'측정 항목':<24} {'Before':>10} {'After':>10} {'변화':>8} "
+          f"{'95% CI':>18} {'p':>8} {'판정':>6}")
+    print("-" * 92)
 
+    comparisons = {}
     for name in baseline["metrics"]:
         if name not in after["metrics"]:
             continue
@@ -190,31 +481,30 @@ def compare_results(baseline_path: str, after_path: str):
         if "avg_ms" not in b or "avg_ms" not in a:
             continue
 
-        b_avg = b["avg_ms"]
-        a_avg = a["avg_ms"]
-
-        if b_avg > 0:
-            change_pct = ((a_avg - b_avg) / b_avg) * 100
-        else:
-            change_pct = 0
-
-        if change_pct < -5:
-            verdict = "개선"
-            improvements += 1
-        elif change_pct > 5:
-            verdict = "저하"
-            regressions += 1
+        result = compare_metric(b, a, alpha, min_change_pct)
+        comparisons[name] = result
+        if result["p"] is None:
+            ci, p = "-", "-"
         else:
-            verdict = "유지"
+            ci = f"[{result['ci_low_pct']:+.1f}, {result['ci_high_pct']:+.1f}]%"
+            p = f"{result['p']:.4f}"
+        print(f"{name:<24} {result['base_ms']:>8.3f}ms {result['after_ms']:>8.3f}ms "
+              f"{result['change_pct']:>+7.1f}% {ci:>18} {p:>8} "
+              f"{_VERDICT_LABELS[result['verdict']]:>6}")
 
-        print(f"{name:<30} {b_avg:>8.1f}ms {a_avg:>8.1f}ms {change_pct:>+8.1f}% {verdict:>8}")
+    verdicts = [r["verdict"] for r in comparisons.values()]
+    improvements = verdicts.count("improved")
+    regressions = verdicts.count("regressed")
 
-    print("-" * 70)
-    print(f"총평: 개선 {improvements}개, 저하 {regressions}개")
+    print("-" * 92)
+    print(f"총평: 개선 {improvements}개, 저하 {regressions}개 "
+          f"(p < {alpha}, 변화 {min_change_pct:g}% 이상)")
 
     return {
         "improvements": improvements,
         "regressions": regressions,
+        "untested": verdicts.count("untested"),
+        "comparisons": comparisons,
     }
 
 
@@ -229,29 +519,54 @@ def list_benchmarks():
         print(f"  {f.name}")
 
 
-if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("사용법:")
-        print("  측정: python performance_benchmark.py measure <label>")
-        print("  비교: python performance_benchmark.py compare <baseline.json> <after.json>")
-        print("  목록: python performance_benchmark.py list")
-        sys.exit(1)
-
-    cmd = sys.argv[1]
-
-    if cmd == "measure":
-        label = sys.argv[2] if len(sys.argv) > 2 else "baseline"
-        run_benchmark(label)
+def main():
+    root = Path(__file__).parent.parent
+    sys.path.insert(0, str(root / "src"))
+    sys.path.insert(0, str(root))
+
+    parser = argparse.ArgumentParser(description="카카오톡 접근성 클라이언트 성능 벤치마크")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    p_measure = sub.add_parser("measure", help="측정")
+    p_measure.add_argument("label", nargs="?", default="baseline")
+    p_measure.add_argument("--backend", choices=("live", "sim"), default="live",
+                           help="live: 실행 중인 카카오톡, sim: 헤드리스 시뮬레이터 트리")
+    p_measure.add_argument("--call-us", type=float, default=0.0,
+                           help="sim 왕복당 대기 (마이크로초, 프로세스 간 COM 비용 흉내)")
+    p_measure.add_argument("--warmup", type=int, default=WARMUP_ITERATIONS)
+    p_measure.add_argument("--max-iterations", type=int, default=MAX_ITERATIONS)
+    p_measure.add_argument("--max-seconds", type=float, default=MAX_SECONDS, help="항목당 시간 상한")
+    p_measure.add_argument("--ci-target", type=float, default=CI_TARGET_PCT,
+                           help="신뢰구간 반폭 목표 (평균 대비 %%)")
+    p_measure.add_argument("--output-dir", type=Path, default=None)
+
+    p_compare = sub.add_parser("compare", help="비교")
+    p_compare.add_argument("baseline")
+    p_compare.add_argument("after")
+    p_compare.add_argument("--alpha", type=float, default=COMPARE_ALPHA)
+    p_compare.add_argument("--min-change", type=float, default=COMPARE_MIN_CHANGE_PCT,
+                           help="판정 최소 변화율 (%%)")
+
+    sub.add_parser("list", help="저장된 결과 목록")
+    args = parser.parse_args()
+
+    if args.cmd == "measure":
+        if args.backend == "sim":
+            from tests.uia_sim import install_platform_modules
+            install_platform_modules()
+        filepath = run_benchmark(args.label, backend=args.backend, call_us=args.call_us,
+                                 results_dir=args.output_dir, warmup=args.warmup,
+                                 max_iterations=args.max_iterations,
+                                 max_seconds=args.max_seconds, ci_target_pct=args.ci_target)
+        return 0 if filepath else 1
+
+    if args.cmd == "compare":
+        summary = compare_results(args.baseline, args.after, args.alpha, args.min_change)
+        return 2 if summary["regressions"] else 0
+
+    list_benchmarks()
+    return 0
 
-    elif cmd == "compare":
-        if len(sys.argv) < 4:
-            print("비교할 두 파일 경로 필요")
-            sys.exit(1)
-        compare_results(sys.argv[2], sys.argv[3])
 
-    elif cmd == "list":
-        list_benchmarks()
-
-    else:
-        print(f"알 수 없는 명령: {cmd}")
-        sys.exit(1)
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025-2026 dnz3d4c
+"""헤드리스 UIA 시뮬레이터. 카카오톡 없이 (비Windows 포함) 포커스/메시지 경로 구동.
+
+    from tests.uia_sim import platform_modules, SimKakaoTalk
+    with platform_modules():            # 패키지 import 동안만 (Windows에선 no-op)
+        from kakaotalk_a11y_client.utils import uia_focus_handler
+
+    sim = SimKakaoTalk()
+    room = sim.open_chat_room("홍길동", messages=50)
+    with sim.installed():
+        ...                             # FocusMonitor / MessageListMonitor 실제 코드
+        sim.focus(room.messages[-1])
+        sim.post_message(room, "안녕")
+    sim.counter.snapshot()              # API별 COM/Win32 왕복 수
+
+    EventReplayer.from_file("session.jsonl").run(speed=None)   # --record-events 기록 재생
+    run_soak(LoadProfile(duration=600)).passed                  # 채팅 폭주 소크
+"""
+
+from .adapter import SimUIAAdapter
+from .counter import RoundTripCounter
+from .elements import (
+    CONTROL_TYPE_IDS,
+    MissingControl,
+    SimCacheRequest,
+    SimCOMError,
+    SimElement,
+    SimElementArray,
+    SimRect,
+    TreeScope_Children,
+    TreeScope_Descendants,
+    TreeScope_Element,
+    TreeScope_Subtree,
+    UIA_AutomationIdPropertyId,
+    UIA_BoundingRectanglePropertyId,
+    UIA_ClassNamePropertyId,
+    UIA_ControlTypePropertyId,
+    UIA_NamePropertyId,
+    UIA_NativeWindowHandlePropertyId,
+    UIA_RuntimeIdPropertyId,
+    UIA_ValueValuePropertyId,
+)
+from .kakaotalk import (
+    LIST_CONTROL_CLASS,
+    MAIN_WINDOW_TITLE,
+    MENU_CLASS,
+    MESSAGE_LIST_NAME,
+    WINDOW_CLASS,
+    SimChatRoom,
+    SimKakaoTalk,
+)
+from .load import LoadBudget, LoadProfile, SoakReport, run_soak
+from .pipeline import MessageLatency, SimPipeline
+from .platform_modules import install_platform_modules, platform_modules
+from .replay import EventReplayer, ReplayReport, prepare_records
+from .script import EventScript, ScriptStep
+from .tree import build_tree, dump_cache_request
+from .uia import (
+    STRUCTURE_CHILD_ADDED,
+    STRUCTURE_CHILD_REMOVED,
+    STRUCTURE_CHILDREN_BULK_ADDED,
+    STRUCTURE_CHILDREN_INVALIDATED,
+    UIA_ELEMENT_SELECTED_EVENT_ID,
+    SimUIAClient,
+)
+from .windows import FakeWindowSystem, SimWin32Error, SimWindow
+
+__all__ = [
+    "CONTROL_TYPE_IDS",
+    "EventReplayer",
+    "EventScript",
+    "FakeWindowSystem",
+    "LIST_CONTROL_CLASS",
+    "LoadBudget",
+    "LoadProfile",
+    "MAIN_WINDOW_TITLE",
+    "MENU_CLASS",
+    "MESSAGE_LIST_NAME",
+    "MessageLatency",
+    "MissingControl",
+    "ReplayReport",
+    "RoundTripCounter",
+    "STRUCTURE_CHILD_ADDED",
+    "STRUCTURE_CHILD_REMOVED",
+    "STRUCTURE_CHILDREN_BULK_ADDED",
+    "STRUCTURE_CHILDREN_INVALIDATED",
+    "ScriptStep",
+    "SimCacheRequest",
+    "SimChatRoom",
+    "SimCOMError",
+    "SimElement",
+    "SimElementArray",
+    "SimKakaoTalk",
+    "SimPipeline",
+    "SimRect",
+    "SimUIAAdapter",
+    "SimUIAClient",
+    "SimWin32Error",
+    "SimWindow",
+    "SoakReport",
+    "TreeScope_Children",
+    "TreeScope_Descendants",
+    "TreeScope_Element",
+    "TreeScope_Subtree",
+    "UIA_AutomationIdPropertyId",
+    "UIA_BoundingRectanglePropertyId",
+    "UIA_ClassNamePropertyId",
+    "UIA_ControlTypePropertyId",
+    "UIA_ELEMENT_SELECTED_EVENT_ID",
+    "UIA_NamePropertyId",
+    "UIA_NativeWindowHandlePropertyId",
+    "UIA_RuntimeIdPropertyId",
+    "UIA_ValueValuePropertyId",
+    "WINDOW_CLASS",
+    "build_tree",
+    "dump_cache_request",
+    "install_platform_modules",
+    "platform_modules",
+    "prepare_records",
+    "run_soak",
+]
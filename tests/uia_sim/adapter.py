@@ -0,0 +1,78 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025-2026 dnz3d4c
+"""UIAAdapter 프로토콜 구현 (infrastructure.uia_adapter.UIAAdapter).
+
+FocusMonitorService(uia_adapter=...)에 그대로 주입. 호출은 SimElement를 거치므로
+왕복 수는 UIAAdapterImpl이 실제 uiautomation에 하는 호출과 같은 단위로 기록됨.
+"""
+
+import threading
+from typing import Optional
+
+from .elements import SimElement
+
+
+class SimUIAAdapter:
+    """SimKakaoTalk 위의 UIAAdapter."""
+
+    def __init__(self, sim):
+        self._sim = sim
+        self.com_threads: set[int] = set()
+
+    def get_control_from_handle(self, hwnd: int) -> Optional[SimElement]:
+        self._sim.counter.hit("ControlFromHandle")
+        return self._sim.windows.element_for(hwnd)
+
+    def find_list_control(self, parent, name: str, search_depth: int = 4) -> Optional[SimElement]:
+        if not parent:
+            return None
+        return parent.find("ListControl", search_depth, Name=name)
+
+    def control_exists(self, control, max_seconds: float = 1.0) -> bool:
+        if not control:
+            return False
+        return control.Exists(maxSearchSeconds=max_seconds)
+
+    def get_children(self, control, max_depth: int = 2, filter_empty: bool = True) -> list:
+        """find_all_descendants와 같은 깊이 우선 GetChildren 반복."""
+        if not control:
+            return []
+        result = []
+
+        def traverse(element, depth):
+            if depth >= max_depth:
+                return
+            try:
+                for child in element.GetChildren():
+                    result.append(child)
+                    traverse(child, depth + 1)
+            except Exception:
+                pass
+
+        traverse(control, 0)
+        if filter_empty:
+            result = [c for c in result if (c.Name or "").strip()]
+        return result
+
+    def init_com(self) -> None:
+        self.com_threads.add(threading.get_ident())
+
+    def uninit_com(self) -> None:
+        self.com_threads.discard(threading.get_ident())
+
+    def get_focused_control(self) -> Optional[SimElement]:
+        self._sim.counter.hit("GetFocusedControl")
+        return self._sim.uia.focused
+
+    def find_menu_item_control(self, parent, search_depth: int = 3) -> Optional[SimElement]:
+        if not parent:
+            return None
+        return parent.find("MenuItemControl", search_depth)
+
+    def get_direct_children(self, control) -> list:
+        if not control:
+            return []
+        try:
+            return control.GetChildren()
+        except Exception:
+            return []
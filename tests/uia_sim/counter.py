@@ -0,0 +1,60 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025-2026 dnz3d4c
+"""COM/Win32 왕복 카운터. 시뮬레이터 전 계층 공용."""
+
+import threading
+import time
+from collections import Counter
+from typing import Optional
+
+
+class RoundTripCounter:
+    """API 이름별 왕복 수.
+
+    왕복 = 프로세스 경계를 넘는 호출 (live 속성, GetChildren, BuildUpdatedCache,
+    트리 탐색, win32gui). Cached* 읽기는 왕복이 아니므로 cached_reads로 따로 셈.
+    call_us > 0이면 왕복마다 그만큼 바쁜 대기 (프로세스 간 COM 비용 흉내).
+    """
+
+    def __init__(self, call_us: float = 0.0):
+        self.call_us = call_us
+        self.calls: Counter = Counter()
+        self.cached_reads = 0
+        self._lock = threading.Lock()  # Timer/이벤트 스레드에서도 호출됨
+
+    def hit(self, api: str) -> None:
+        with self._lock:
+            self.calls[api] += 1
+        if self.call_us > 0:
+            end = time.perf_counter() + self.call_us / 1e6
+            while time.perf_counter() < end:
+                pass
+
+    def cached(self) -> None:
+        with self._lock:
+            self.cached_reads += 1
+
+    @property
+    def total(self) -> int:
+        with self._lock:
+            return sum(self.calls.values())
+
+    def count(self, prefix: str = "") -> int:
+        """prefix로 시작하는 API 왕복 합계 (예: "win32gui.", "Current")."""
+        with self._lock:
+            return sum(n for api, n in self.calls.items() if api.startswith(prefix))
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return dict(self.calls)
+
+    def delta(self, before: dict, after: Optional[dict] = None) -> dict:
+        """before 이후 늘어난 API별 왕복 수 (0은 제외)."""
+        after = self.snapshot() if after is None else after
+        return {api: n - before.get(api, 0) for api, n in after.items()
+                if n - before.get(api, 0)}
+
+    def reset(self) -> None:
+        with self._lock:
+            self.calls.clear()
+            self.cached_reads = 0
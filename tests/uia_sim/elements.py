@@ -0,0 +1,554 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025-2026 dnz3d4c
+"""합성 UIA 요소.
+
+SimElement 하나가 auto.Control(live 속성, GetChildren, ListControl(...) 검색)과
+IUIAutomationElement(Current*/Cached*, BuildUpdatedCache, GetCachedChildren)를 겸함.
+상태는 SimNode에 두고, 캐시가 붙은 뷰는 같은 노드를 공유하는 별도 SimElement.
+
+live/Current* 접근과 트리 탐색은 전부 RoundTripCounter에 기록.
+소문자 속성(name, children, runtime_id 등)은 시뮬레이터 쪽 조작용이라 세지 않음.
+
+실제 auto.Control처럼 RuntimeId 속성은 없음 (GetRuntimeId()만).
+"""
+
+import itertools
+from dataclasses import dataclass
+from typing import Callable, Iterator, Optional
+
+from .counter import RoundTripCounter
+
+# uia_cache_request.CONTROL_TYPE_NAMES와 같은 순서 (50000부터)
+_CONTROL_TYPE_ORDER = (
+    "ButtonControl", "CalendarControl", "CheckBoxControl", "ComboBoxControl",
+    "EditControl", "HyperlinkControl", "ImageControl", "ListItemControl",
+    "ListControl", "MenuControl", "MenuBarControl", "MenuItemControl",
+    "ProgressBarControl", "RadioButtonControl", "ScrollBarControl", "SliderControl",
+    "SpinnerControl", "StatusBarControl", "TabControl", "TabItemControl",
+    "TextControl", "ToolBarControl", "ToolTipControl", "TreeControl",
+    "TreeItemControl", "CustomControl", "GroupControl", "ThumbControl",
+    "DataGridControl", "DataItemControl", "DocumentControl", "SplitButtonControl",
+    "WindowControl", "PaneControl", "HeaderControl", "HeaderItemControl",
+    "TableControl", "TitleBarControl", "SeparatorControl",
+)
+CONTROL_TYPE_IDS = {name: 50000 + i for i, name in enumerate(_CONTROL_TYPE_ORDER)}
+
+# UIA 속성 ID (UIAutomationClient.h)
+UIA_RuntimeIdPropertyId = 30000
+UIA_BoundingRectanglePropertyId = 30001
+UIA_ProcessIdPropertyId = 30002
+UIA_ControlTypePropertyId = 30003
+UIA_NamePropertyId = 30005
+UIA_AutomationIdPropertyId = 30011
+UIA_ClassNamePropertyId = 30012
+UIA_NativeWindowHandlePropertyId = 30020
+UIA_ValueValuePropertyId = 30045
+UIA_SelectionItemIsSelectedPropertyId = 30079
+
+# TreeScope (비트 조합)
+TreeScope_Element = 1
+TreeScope_Children = 2
+TreeScope_Descendants = 4
+TreeScope_Subtree = 7
+
+SIM_PROCESS_ID = 4242
+
+_runtime_serial = itertools.count(1)
+
+
+class SimCOMError(Exception):
+    """UIA_E_ELEMENTNOTAVAILABLE / 캐시 안 된 속성 등. 앱 코드는 COMError(비Windows=Exception)로 잡음."""
+
+
+@dataclass
+class SimRect:
+    left: int = 0
+    top: int = 0
+    right: int = 0
+    bottom: int = 0
+
+    def width(self) -> int:
+        return self.right - self.left
+
+    def height(self) -> int:
+        return self.bottom - self.top
+
+
+class SimNode:
+    """요소 상태. 뷰(SimElement)들이 공유."""
+
+    __slots__ = ("name", "control_type", "class_name", "automation_id", "hwnd", "rect",
+                 "runtime_id", "value", "process_id", "selected", "parent", "children",
+                 "alive")
+
+    def __init__(self, name, control_type, class_name, automation_id, hwnd, rect,
+                 runtime_id, value, process_id):
+        self.name = name
+        self.control_type = control_type
+        self.class_name = class_name
+        self.automation_id = automation_id
+        self.hwnd = hwnd
+        self.rect = rect
+        self.runtime_id = runtime_id
+        self.value = value
+        self.process_id = process_id
+        self.selected = False
+        self.parent: Optional["SimElement"] = None
+        self.children: list["SimElement"] = []
+        self.alive = True
+
+
+_PROPERTY_GETTERS: dict[int, Callable[[SimNode], object]] = {
+    UIA_RuntimeIdPropertyId: lambda n: n.runtime_id,
+    UIA_BoundingRectanglePropertyId: lambda n: n.rect,
+    UIA_ProcessIdPropertyId: lambda n: n.process_id,
+    UIA_ControlTypePropertyId: lambda n: CONTROL_TYPE_IDS.get(n.control_type, 0),
+    UIA_NamePropertyId: lambda n: n.name,
+    UIA_AutomationIdPropertyId: lambda n: n.automation_id,
+    UIA_ClassNamePropertyId: lambda n: n.class_name,
+    UIA_NativeWindowHandlePropertyId: lambda n: n.hwnd,
+    UIA_ValueValuePropertyId: lambda n: n.value,
+    UIA_SelectionItemIsSelectedPropertyId: lambda n: n.selected,
+}
+
+
+class SimCacheRequest:
+    """IUIAutomationCacheRequest."""
+
+    def __init__(self):
+        self.properties: list[int] = []
+        self.patterns: list[int] = []
+        self.TreeScope = TreeScope_Element
+        self.TreeFilter = None
+
+    def AddProperty(self, property_id: int) -> None:
+        if property_id not in self.properties:
+            self.properties.append(property_id)
+
+    def AddPattern(self, pattern_id: int) -> None:
+        self.patterns.append(pattern_id)
+
+    def Clone(self) -> "SimCacheRequest":
+        clone = SimCacheRequest()
+        clone.properties = list(self.properties)
+        clone.patterns = list(self.patterns)
+        clone.TreeScope = self.TreeScope
+        clone.TreeFilter = self.TreeFilter
+        return clone
+
+
+class SimElementArray:
+    """IUIAutomationElementArray."""
+
+    def __init__(self, items: list):
+        self._items = items
+        self.Length = len(items)
+
+    def GetElement(self, index: int):
+        return self._items[index]
+
+
+class SimSelectionItemPattern:
+    """SelectionItemPattern. IsSelected 읽기도 왕복."""
+
+    def __init__(self, element: "SimElement"):
+        self._element = element
+
+    @property
+    def IsSelected(self) -> bool:
+        self._element._touch("SelectionItemPattern.IsSelected")
+        return self._element._node.selected
+
+
+class MissingControl:
+    """검색 실패 결과. auto.Control처럼 객체는 있지만 Exists()가 False."""
+
+    def __init__(self, description: str, counter: RoundTripCounter):
+        self._description = description
+        self._counter = counter
+
+    def Exists(self, maxSearchSeconds: float = 0, searchIntervalSeconds: float = 0) -> bool:
+        self._counter.hit("Exists")
+        return False
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        raise LookupError(f"Find Control Timeout: {self._description}")
+
+    def __repr__(self) -> str:
+        return f"<MissingControl {self._description}>"
+
+
+def _live(api: str, getter: Callable[[SimNode], object]) -> property:
+    def fget(self):
+        self._touch(api)
+        return getter(self._node)
+    return property(fget)
+
+
+def _cached(property_id: int) -> property:
+    def fget(self):
+        return self.GetCachedPropertyValue(property_id)
+    return property(fget)
+
+
+_CONTROL_TYPE_ID = _PROPERTY_GETTERS[UIA_ControlTypePropertyId]
+
+
+class SimElement:
+    """auto.Control + IUIAutomationElement 겸용 합성 요소."""
+
+    __slots__ = ("_node", "_counter", "_cache", "_cached_children", "_cached_parent")
+
+    def __init__(
+        self,
+        name: str = "",
+        control_type: str = "PaneControl",
+        class_name: str = "",
+        automation_id: str = "",
+        *,
+        hwnd: int = 0,
+        rect: Optional[SimRect] = None,
+        runtime_id: Optional[tuple] = None,
+        value: str = "",
+        process_id: int = SIM_PROCESS_ID,
+        counter: Optional[RoundTripCounter] = None,
+    ):
+        if runtime_id is None:
+            # 창 요소는 (42, hwnd), 나머지는 프로바이더 할당 ID 흉내
+            runtime_id = (42, hwnd) if hwnd else (7, process_id, next(_runtime_serial))
+        self._node = SimNode(name, control_type, class_name, automation_id, hwnd,
+                             rect or SimRect(), tuple(runtime_id), value, process_id)
+        self._counter = counter or RoundTripCounter()
+        self._cache: Optional[dict] = None
+        self._cached_children: Optional[list] = None
+        self._cached_parent: Optional["SimElement"] = None
+
+    # === 시뮬레이터 조작 (세지 않음) ===
+
+    def add(self, child: "SimElement", index: Optional[int] = None) -> "SimElement":
+        child._node.parent = self._base()
+        for element in child.walk():
+            element._counter = self._counter
+        if index is None:
+            self._node.children.append(child)
+        else:
+            self._node.children.insert(index, child)
+        return child
+
+    def append(self, name: str = "", control_type: str = "PaneControl", **kwargs) -> "SimElement":
+        """자식 요소 생성 + 추가."""
+        return self.add(SimElement(name, control_type, counter=self._counter, **kwargs))
+
+    def remove(self) -> None:
+        """부모에서 떼고 하위 트리 전체를 사라진 요소로 표시."""
+        parent = self._node.parent
+        if parent is not None:
+            siblings = parent._node.children
+            for i, sibling in enumerate(siblings):
+                if sibling._node is self._node:
+                    del siblings[i]
+                    break
+            self._node.parent = None
+        for element in self.walk():
+            element._node.alive = False
+
+    def walk(self) -> Iterator["SimElement"]:
+        """자신 포함 전위 순회."""
+        stack = [self]
+        while stack:
+            element = stack.pop()
+            yield element
+            stack.extend(reversed(element._node.children))
+
+    def _base(self) -> "SimElement":
+        """캐시 없는 원본 뷰 (부모 링크용)."""
+        if self._cache is None:
+            return self
+        return SimElement._view(self._node, self._counter)
+
+    @staticmethod
+    def _view(node: SimNode, counter: RoundTripCounter) -> "SimElement":
+        element = SimElement.__new__(SimElement)
+        element._node = node
+        element._counter = counter
+        element._cache = None
+        element._cached_children = None
+        element._cached_parent = None
+        return element
+
+    @property
+    def node(self) -> SimNode:
+        return self._node
+
+    @property
+    def counter(self) -> RoundTripCounter:
+        return self._counter
+
+    @property
+    def name(self) -> str:
+        return self._node.name
+
+    @name.setter
+    def name(self, value: str) -> None:
+        self._node.name = value
+
+    @property
+    def control_type(self) -> str:
+        return self._node.control_type
+
+    @property
+    def class_name(self) -> str:
+        return self._node.class_name
+
+    @property
+    def hwnd(self) -> int:
+        return self._node.hwnd
+
+    @property
+    def runtime_id(self) -> tuple:
+        return self._node.runtime_id
+
+    @property
+    def alive(self) -> bool:
+        return self._node.alive
+
+    @property
+    def selected(self) -> bool:
+        return self._node.selected
+
+    @selected.setter
+    def selected(self, value: bool) -> None:
+        self._node.selected = value
+
+    @property
+    def children(self) -> list["SimElement"]:
+        return list(self._node.children)
+
+    @property
+    def parent(self) -> Optional["SimElement"]:
+        return self._node.parent
+
+    def is_same(self, other) -> bool:
+        return isinstance(other, SimElement) and other._node is self._node
+
+    def is_descendant_of(self, ancestor: "SimElement") -> bool:
+        parent = self._node.parent
+        while parent is not None:
+            if parent._node is ancestor._node:
+                return True
+            parent = parent._node.parent
+        return False
+
+    def find(self, control_type: Optional[str] = None, search_depth: int = 0xFFFFFFFF,
+             counted: bool = True, **conditions) -> Optional["SimElement"]:
+        """깊이 우선 검색 (자신 제외). conditions: Name/ClassName/AutomationId.
+
+        counted=True면 방문 노드마다 TreeWalker 왕복 1회 (uiautomation 검색과 같은 방식).
+        """
+        if counted:
+            self._touch("FindControl")
+        stack = [(child, 1) for child in reversed(self._node.children)]
+        while stack:
+            element, depth = stack.pop()
+            if counted:
+                self._counter.hit("TreeWalker")
+            node = element._node
+            if ((control_type is None or node.control_type == control_type)
+                    and all(_PROPERTY_GETTERS[_CONDITION_IDS[key]](node) == value
+                            for key, value in conditions.items())):
+                return element
+            if depth < search_depth:
+                stack.extend((child, depth + 1) for child in reversed(node.children))
+        return None
+
+    def find_all(self, control_type: Optional[str] = None, **conditions) -> list["SimElement"]:
+        """조건에 맞는 모든 하위 요소 (세지 않음, 시뮬레이터 조작용)."""
+        result = []
+        for element in self.walk():
+            node = element._node
+            if element is self:
+                continue
+            if ((control_type is None or node.control_type == control_type)
+                    and all(_PROPERTY_GETTERS[_CONDITION_IDS[key]](node) == value
+                            for key, value in conditions.items())):
+                result.append(element)
+        return result
+
+    # === 왕복 기록 ===
+
+    def _touch(self, api: str) -> None:
+        self._counter.hit(api)
+        if not self._node.alive:
+            raise SimCOMError(f"element not available: {api}")
+
+    # === auto.Control (live) ===
+
+    Name = _live("Name", lambda n: n.name)
+    ControlType = _live("ControlType", _CONTROL_TYPE_ID)
+    ControlTypeName = _live("ControlTypeName", lambda n: n.control_type)
+    ClassName = _live("ClassName", lambda n: n.class_name)
+    AutomationId = _live("AutomationId", lambda n: n.automation_id)
+    NativeWindowHandle = _live("NativeWindowHandle", lambda n: n.hwnd)
+    BoundingRectangle = _live("BoundingRectangle", lambda n: n.rect)
+    ProcessId = _live("ProcessId", lambda n: n.process_id)
+
+    def GetRuntimeId(self) -> list:
+        self._touch("GetRuntimeId")
+        return list(self._node.runtime_id)
+
+    def GetChildren(self) -> list["SimElement"]:
+        """TreeWalker: 첫 자식 1회 + 형제마다 1회."""
+        self._touch("GetChildren")
+        children = list(self._node.children)
+        if children:
+            self._counter.hit("TreeWalker")  # GetFirstChild
+            for _ in children[1:]:
+                self._counter.hit("TreeWalker")  # GetNextSibling
+        return children
+
+    def GetParentControl(self) -> Optional["SimElement"]:
+        self._touch("GetParentControl")
+        return self._node.parent
+
+    def GetFirstChildControl(self) -> Optional["SimElement"]:
+        self._touch("GetFirstChildControl")
+        children = self._node.children
+        return children[0] if children else None
+
+    def GetLastChildControl(self) -> Optional["SimElement"]:
+        self._touch("GetLastChildControl")
+        children = self._node.children
+        return children[-1] if children else None
+
+    def _sibling(self, offset: int) -> Optional["SimElement"]:
+        parent = self._node.parent
+        if parent is None:
+            return None
+        siblings = parent._node.children
+        for i, sibling in enumerate(siblings):
+            if sibling._node is self._node:
+                j = i + offset
+                return siblings[j] if 0 <= j < len(siblings) else None
+        return None
+
+    def GetNextSiblingControl(self) -> Optional["SimElement"]:
+        self._touch("GetNextSiblingControl")
+        return self._sibling(1)
+
+    def GetPreviousSiblingControl(self) -> Optional["SimElement"]:
+        self._touch("GetPreviousSiblingControl")
+        return self._sibling(-1)
+
+    def Exists(self, maxSearchSeconds: float = 0, searchIntervalSeconds: float = 0) -> bool:
+        self._counter.hit("Exists")
+        return self._node.alive
+
+    def GetPropertyValue(self, property_id: int):
+        self._touch("GetPropertyValue")
+        getter = _PROPERTY_GETTERS.get(property_id)
+        return getter(self._node) if getter else None
+
+    def GetSelectionItemPattern(self) -> SimSelectionItemPattern:
+        self._touch("GetSelectionItemPattern")
+        return SimSelectionItemPattern(self)
+
+    def _search(self, control_type: Optional[str], searchDepth: int = 0xFFFFFFFF, **conditions):
+        found = self.find(control_type, searchDepth, **conditions)
+        if found is not None:
+            return found
+        return MissingControl(f"{control_type or 'Control'}{conditions}", self._counter)
+
+    def Control(self, searchDepth: int = 0xFFFFFFFF, **conditions):
+        return self._search(None, searchDepth, **conditions)
+
+    # === IUIAutomationElement (Current*) ===
+
+    CurrentName = _live("CurrentName", lambda n: n.name)
+    CurrentControlType = _live("CurrentControlType", _CONTROL_TYPE_ID)
+    CurrentClassName = _live("CurrentClassName", lambda n: n.class_name)
+    CurrentAutomationId = _live("CurrentAutomationId", lambda n: n.automation_id)
+    CurrentNativeWindowHandle = _live("CurrentNativeWindowHandle", lambda n: n.hwnd)
+    CurrentBoundingRectangle = _live("CurrentBoundingRectangle", lambda n: n.rect)
+    CurrentProcessId = _live("CurrentProcessId", lambda n: n.process_id)
+
+    def GetCurrentPropertyValue(self, property_id: int):
+        self._touch("GetCurrentPropertyValue")
+        getter = _PROPERTY_GETTERS.get(property_id)
+        return getter(self._node) if getter else None
+
+    def BuildUpdatedCache(self, cache_request: SimCacheRequest) -> "SimElement":
+        """왕복 1회로 cache_request 속성 (+ TreeScope 하위) 스냅샷."""
+        self._touch("BuildUpdatedCache")
+        return self.with_cache(cache_request)
+
+    def with_cache(self, cache_request: Optional[SimCacheRequest],
+                   _scope: Optional[int] = None) -> "SimElement":
+        """캐시가 붙은 뷰 생성 (세지 않음, 이벤트 sender용)."""
+        view = SimElement._view(self._node, self._counter)
+        if cache_request is None:
+            return view
+        node = self._node
+        view._cache = {pid: _PROPERTY_GETTERS[pid](node)
+                       for pid in cache_request.properties if pid in _PROPERTY_GETTERS}
+        scope = cache_request.TreeScope if _scope is None else _scope
+        if scope & (TreeScope_Children | TreeScope_Descendants):
+            # Children만이면 한 단계, Descendants면 끝까지
+            child_scope = scope if scope & TreeScope_Descendants else TreeScope_Element
+            view._cached_children = []
+            for child in node.children:
+                cached_child = child.with_cache(cache_request, child_scope)
+                cached_child._cached_parent = view
+                view._cached_children.append(cached_child)
+        return view
+
+    # === IUIAutomationElement (Cached*) ===
+
+    def GetCachedPropertyValue(self, property_id: int):
+        self._counter.cached()
+        cache = self._cache
+        if cache is None or property_id not in cache:
+            raise SimCOMError(f"property not cached: {property_id}")
+        return cache[property_id]
+
+    CachedName = _cached(UIA_NamePropertyId)
+    CachedControlType = _cached(UIA_ControlTypePropertyId)
+    CachedClassName = _cached(UIA_ClassNamePropertyId)
+    CachedAutomationId = _cached(UIA_AutomationIdPropertyId)
+    CachedNativeWindowHandle = _cached(UIA_NativeWindowHandlePropertyId)
+    CachedBoundingRectangle = _cached(UIA_BoundingRectanglePropertyId)
+    CachedProcessId = _cached(UIA_ProcessIdPropertyId)
+
+    def GetCachedChildren(self) -> Optional[SimElementArray]:
+        self._counter.cached()
+        if not self._cached_children:
+            return None
+        return SimElementArray(self._cached_children)
+
+    def GetCachedParent(self) -> Optional["SimElement"]:
+        self._counter.cached()
+        return self._cached_parent
+
+    def __repr__(self) -> str:
+        node = self._node
+        return f"<SimElement {node.control_type} {node.name!r} {node.runtime_id}>"
+
+
+_CONDITION_IDS = {
+    "Name": UIA_NamePropertyId,
+    "ClassName": UIA_ClassNamePropertyId,
+    "AutomationId": UIA_AutomationIdPropertyId,
+}
+
+
+def _typed_search(control_type: str):
+    def search(self, searchDepth: int = 0xFFFFFFFF, **conditions):
+        return self._search(control_type, searchDepth, **conditions)
+    search.__name__ = control_type
+    return search
+
+
+for _type_name in _CONTROL_TYPE_ORDER:
+    setattr(SimElement, _type_name, _typed_search(_type_name))
+del _type_name
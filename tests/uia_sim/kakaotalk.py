@@ -0,0 +1,320 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025-2026 dnz3d4c
+"""합성 카카오톡 세션.
+
+창 구성 (hwnd는 FakeWindowSystem, 요소는 데스크톱 루트 아래):
+    카카오톡 (EVA_Window_Dblclk, WindowControl)
+        TabControl → 친구 / 채팅 / 더보기 (TabItemControl, SelectionItem)
+        친구 / 채팅 (ListControl, EVA_VH_ListControl_Dblclk, 자식 hwnd)
+    채팅방 (EVA_Window_Dblclk, 제목=방 이름)
+        메시지 (ListControl, EVA_VH_ListControl_Dblclk, 자식 hwnd) → ListItemControl
+        입력창 (EditControl)
+    컨텍스트 메뉴 (EVA_Menu, MenuControl, AutomationId "KakaoTalk Menu") → MenuItemControl
+
+installed()가 앱 모듈의 win32gui/auto/pythoncom 전역, _create_uia_client,
+CacheRequest 싱글톤을 시뮬레이터로 바꿔서 FocusMonitor/MessageListMonitor/
+FocusMonitorService/MenuHandler를 실제 코드 그대로 돌림.
+"""
+
+import itertools
+import sys
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterable, Optional, Union
+
+from .adapter import SimUIAAdapter
+from .counter import RoundTripCounter
+from .elements import (
+    SimElement,
+    SimRect,
+    TreeScope_Subtree,
+    UIA_AutomationIdPropertyId,
+    UIA_ClassNamePropertyId,
+    UIA_ControlTypePropertyId,
+    UIA_NamePropertyId,
+    UIA_NativeWindowHandlePropertyId,
+    UIA_RuntimeIdPropertyId,
+)
+from .platform_modules import (
+    install_platform_modules,
+    make_automation_module,
+    make_pythoncom_module,
+    make_win32gui_module,
+)
+from .uia import STRUCTURE_CHILD_ADDED, STRUCTURE_CHILDREN_BULK_ADDED, SimUIAClient
+from .windows import FakeWindowSystem
+
+# config.py / window_finder.py와 같은 값
+MAIN_WINDOW_TITLE = "카카오톡"
+WINDOW_CLASS = "EVA_Window_Dblclk"
+MENU_CLASS = "EVA_Menu"
+LIST_CONTROL_CLASS = "EVA_VH_ListControl_Dblclk"
+MESSAGE_LIST_NAME = "메시지"
+MENU_AUTOMATION_ID = "KakaoTalk Menu"
+MENU_ITEM_PLACEHOLDER = "Menu Item"
+
+TAB_NAMES = ("친구", "채팅", "더보기")
+DEFAULT_MENU_ITEMS = ("복사", "답장", "공감", "공유", "나에게", "삭제")
+
+_PACKAGE = "kakaotalk_a11y_client"
+_MISSING = object()
+
+
+@dataclass
+class SimChatRoom:
+    title: str
+    hwnd: int
+    window: SimElement
+    message_list: SimElement
+    edit: SimElement
+
+    @property
+    def messages(self) -> list[SimElement]:
+        return self.message_list.children
+
+
+class SimKakaoTalk:
+    """합성 카카오톡 + 창 시스템 + IUIAutomation. 모든 왕복은 self.counter에."""
+
+    def __init__(self, friends: int = 30, chats: int = 20, call_us: float = 0.0):
+        self.counter = RoundTripCounter(call_us)
+        self.windows = FakeWindowSystem(self.counter)
+        self.desktop = SimElement("데스크톱 1", "PaneControl", counter=self.counter)
+        self.uia = SimUIAClient(self.desktop, self.windows, self.counter)
+        self.adapter = SimUIAAdapter(self)
+        self.automation = make_automation_module(self)
+        self.win32gui = make_win32gui_module(self.windows)
+        self.rooms: dict[str, SimChatRoom] = {}
+        self.menu: Optional[SimElement] = None
+        self._serial = itertools.count(1)
+
+        self.main = self._create_window(WINDOW_CLASS, MAIN_WINDOW_TITLE)
+        self.tabs = self.main.append("", "TabControl")
+        for name in TAB_NAMES:
+            self.tabs.append(name, "TabItemControl")
+        self.tabs.children[0].selected = True
+        self.friend_list = self._create_list(self.main, TAB_NAMES[0])
+        for i in range(friends):
+            self.friend_list.append(f"친구 {i + 1}", "ListItemControl")
+        self.chat_list = self._create_list(self.main, TAB_NAMES[1])
+        for i in range(chats):
+            self.chat_list.append(f"채팅방 {i + 1}, 마지막 메시지 {i + 1}, 오후 3:00",
+                                  "ListItemControl")
+        self.windows.set_foreground(self.main.hwnd)
+
+    # === 창 구성 ===
+
+    def _create_window(self, class_name: str, title: str, control_type: str = "WindowControl",
+                       automation_id: str = "") -> SimElement:
+        hwnd = self.windows.allocate_hwnd()
+        n = len(self.windows.top_level)
+        rect = (100 + n * 20, 100 + n * 20, 500 + n * 20, 800 + n * 20)
+        element = self.desktop.append(title, control_type, class_name=class_name,
+                                      automation_id=automation_id, hwnd=hwnd,
+                                      rect=SimRect(*rect))
+        self.windows.create_window(class_name, title, rect=rect, element=element)
+        return element
+
+    def _create_list(self, parent: SimElement, name: str) -> SimElement:
+        hwnd = self.windows.allocate_hwnd()
+        element = parent.append(name, "ListControl", class_name=LIST_CONTROL_CLASS, hwnd=hwnd)
+        self.windows.create_window(LIST_CONTROL_CLASS, "", parent=parent.hwnd, element=element)
+        return element
+
+    def open_chat_room(self, title: str, messages: int = 20, activate: bool = True) -> SimChatRoom:
+        window = self._create_window(WINDOW_CLASS, title)
+        message_list = self._create_list(window, MESSAGE_LIST_NAME)
+        edit = window.append("", "EditControl", class_name="RICHEDIT50W")
+        room = SimChatRoom(title, window.hwnd, window, message_list, edit)
+        self.rooms[title] = room
+        for _ in range(messages):
+            self._add_message(room)
+        if activate:
+            self.activate(room)
+        return room
+
+    def close_chat_room(self, room: SimChatRoom) -> None:
+        self.rooms.pop(room.title, None)
+        room.window.remove()
+        self.windows.destroy_window(room.hwnd)
+
+    def open_foreign_window(self, title: str = "메모장", class_name: str = "Notepad") -> SimElement:
+        """카카오톡 아닌 앱 창 (hwnd 필터 경로용). 자식 hwnd 있는 EditControl 하나 포함."""
+        window = self._create_window(class_name, title)
+        hwnd = self.windows.allocate_hwnd()
+        edit = window.append("", "EditControl", class_name="Edit", hwnd=hwnd)
+        self.windows.create_window("Edit", "", parent=window.hwnd, element=edit)
+        return window
+
+    def activate(self, target: Union[SimChatRoom, SimElement, int]) -> None:
+        hwnd = target if isinstance(target, int) else target.hwnd
+        self.windows.set_foreground(hwnd)
+
+    def select_tab(self, name: str) -> SimElement:
+        selected = None
+        for tab in self.tabs.children:
+            tab.selected = tab.name == name
+            if tab.selected:
+                selected = tab
+        return selected
+
+    # === 메시지 ===
+
+    def _add_message(self, room: SimChatRoom, text: Optional[str] = None,
+                     sender: str = "") -> SimElement:
+        n = next(self._serial)
+        sender = sender or room.title
+        text = text or f"메시지 {n}"
+        return room.message_list.append(f"{sender}, {text}, 오후 3:{n % 60:02d}",
+                                        "ListItemControl")
+
+    def post_message(self, room: SimChatRoom, text: Optional[str] = None,
+                     sender: str = "") -> SimElement:
+        """메시지 1개 추가 + StructureChanged(ChildAdded, sender=새 항목)."""
+        item = self._add_message(room, text, sender)
+        self.uia.emit_structure_changed(item, STRUCTURE_CHILD_ADDED)
+        return item
+
+    def post_messages(self, room: SimChatRoom, texts: Union[int, Iterable[str]]) -> list[SimElement]:
+        """여러 개 추가 + StructureChanged(ChildrenBulkAdded, sender=목록) 1회."""
+        if isinstance(texts, int):
+            texts = [None] * texts
+        items = [self._add_message(room, text) for text in texts]
+        self.uia.emit_structure_changed(room.message_list, STRUCTURE_CHILDREN_BULK_ADDED)
+        return items
+
+    # === 포커스 / 선택 ===
+
+    def focus(self, element: SimElement) -> int:
+        return self.uia.emit_focus_changed(element)
+
+    def select(self, element: SimElement) -> int:
+        """같은 목록 안에서 단일 선택 + ElementSelected."""
+        parent = element.parent
+        if parent is not None:
+            for sibling in parent.children:
+                sibling.selected = False
+        element.selected = True
+        return self.uia.emit_element_selected(element)
+
+    # === 컨텍스트 메뉴 ===
+
+    def open_menu(self, items: Iterable[str] = DEFAULT_MENU_ITEMS,
+                  placeholders: bool = False) -> SimElement:
+        """EVA_Menu 창. placeholders=True면 항목 이름이 아직 "Menu Item" (그려지기 전)."""
+        self.close_menu()
+        menu = self._create_window(MENU_CLASS, "", "MenuControl", MENU_AUTOMATION_ID)
+        for name in items:
+            menu.append(MENU_ITEM_PLACEHOLDER if placeholders else name, "MenuItemControl",
+                        value=name)
+        self.menu = menu
+        return menu
+
+    def render_menu(self) -> None:
+        """placeholder 항목에 실제 이름 채우기."""
+        if self.menu is not None:
+            for item in self.menu.children:
+                item.name = item.node.value
+
+    def close_menu(self) -> None:
+        if self.menu is not None:
+            self.menu.remove()
+            self.windows.destroy_window(self.menu.hwnd)
+            self.menu = None
+
+    # === 앱 모듈 연결 ===
+
+    def _focus_cache_request(self):
+        cache_request = self.uia.CreateCacheRequest()
+        for pid in (UIA_ControlTypePropertyId, UIA_NamePropertyId,
+                    UIA_ClassNamePropertyId, UIA_AutomationIdPropertyId):
+            cache_request.AddProperty(pid)
+        return cache_request
+
+    @contextmanager
+    def installed(self):
+        """앱 모듈 전역을 시뮬레이터로 교체. 종료 시 원복 (이번에 등록한 대역 포함) + 창 관련 캐시 비움."""
+        saved: list[tuple] = [(sys.modules, name, _MISSING) for name in install_platform_modules()]
+
+        from kakaotalk_a11y_client import window_finder
+        from kakaotalk_a11y_client.utils import (
+            menu_handler,
+            uia_cache_request,
+            uia_focus_handler,
+            uia_message_monitor,
+        )
+
+        def swap(target, attr, value):
+            saved.append((target, attr, getattr(target, attr, _MISSING)))
+            setattr(target, attr, value)
+
+        def swap_module(name, module):
+            saved.append((sys.modules, name, sys.modules.get(name, _MISSING)))
+            sys.modules[name] = module
+
+        pythoncom = make_pythoncom_module()
+        # 함수 안 지역 import용
+        swap_module("uiautomation", self.automation)
+        swap_module("win32gui", self.win32gui)
+        swap_module("pythoncom", pythoncom)
+        # 모듈 전역 import용
+        replacements = {"win32gui": self.win32gui, "auto": self.automation,
+                        "pythoncom": pythoncom}
+        for name, module in list(sys.modules.items()):
+            if module is None or not (name == _PACKAGE or name.startswith(_PACKAGE + ".")):
+                continue
+            for attr, replacement in replacements.items():
+                if attr in vars(module):
+                    swap(module, attr, replacement)
+
+        def create_client():
+            return self.uia
+
+        for module in (uia_focus_handler, uia_message_monitor):
+            swap(module, "HAS_COMTYPES", True)
+            swap(module, "_create_uia_client", create_client)
+        swap(uia_message_monitor, "TreeScope_Subtree", TreeScope_Subtree)
+        swap(uia_focus_handler, "HAS_CACHE_PROPS", True)
+        for attr, pid in (("UIA_ControlTypePropertyId", UIA_ControlTypePropertyId),
+                          ("UIA_NamePropertyId", UIA_NamePropertyId),
+                          ("UIA_ClassNamePropertyId", UIA_ClassNamePropertyId),
+                          ("UIA_RuntimeIdPropertyId", UIA_RuntimeIdPropertyId),
+                          ("UIA_NativeWindowHandlePropertyId", UIA_NativeWindowHandlePropertyId)):
+            swap(uia_focus_handler, attr, pid)
+
+        cache_manager = uia_cache_request.CacheRequestManager()
+        cache_manager._initialized = True
+        cache_manager._uia = self.uia
+        cache_manager._cache_request = self._focus_cache_request()
+        swap(uia_cache_request, "_cache_manager", cache_manager)
+
+        # MenuHandler 싱글톤은 새로 (메뉴 캐시/모드 상태가 세션 간 섞이지 않게)
+        previous_menu_handler = menu_handler._menu_handler
+        swap(menu_handler, "_menu_handler", None)
+
+        _clear_window_caches(window_finder)
+        try:
+            yield self
+        finally:
+            for target, attr, value in reversed(saved):
+                if target is sys.modules:
+                    if value is _MISSING:
+                        sys.modules.pop(attr, None)
+                    else:
+                        sys.modules[attr] = value
+                elif value is _MISSING:
+                    delattr(target, attr)
+                else:
+                    setattr(target, attr, value)
+            if previous_menu_handler is not None:
+                from kakaotalk_a11y_client.utils.metrics import metrics_registry
+                metrics_registry.register("menu_handler", previous_menu_handler.collect_metrics)
+            _clear_window_caches(window_finder)
+
+
+def _clear_window_caches(window_finder) -> None:
+    """hwnd 판별 캐시 비움 (시뮬레이터 hwnd가 실제/다른 세션 hwnd와 겹치지 않게)."""
+    with window_finder._hwnd_class_cache_lock:
+        window_finder._hwnd_class_cache.clear()
+    with window_finder._kakaotalk_hwnd_cache_lock:
+        window_finder._kakaotalk_hwnd_cache = {"hwnd": None, "time": 0.0}
@@ -0,0 +1,506 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025-2026 dnz3d4c
+"""채팅 폭주 부하 생성 + 소크 테스트.
+
+방 N개 × 분당 M개 메시지, ChildrenBulkAdded 버스트, 동시 포커스 이동, 컨텍스트 메뉴
+열림/닫힘, 활성 방 전환을 실제 폴링 스레드가 도는 파이프라인(SimPipeline)에 지정 시간 동안 가함.
+
+    report = run_soak(LoadProfile(duration=600, rooms=20, messages_per_min=60))
+    print(report.format())
+    report.passed               # LoadBudget 기준 통과 여부
+
+측정:
+    CPU       process_time / 생성 이벤트 수 (시뮬레이터 비용 포함)
+    스레드    샘플별 활성 수 + 시작된 스레드 총수 (threading.settrace로 셈, Timer 포함)
+    메모리    tracemalloc. 앱 패키지 코드에서 할당된 것만, 워밍업 후 → 끝 증가량과
+              후반부(중간 → 끝) 증가량 (정상 상태 상한: 초기 캐시 채움이 끝난 뒤엔 평평해야 함)
+    래퍼      wrapper_tracker owner별 보유 SimElement 수, 계속 늘기만 하는 owner (누수 의심).
+              판정은 모든 방의 살아 있는 메시지 수를 넘는 보유량만 (메시지가 계속 쌓이는 방은 정상)
+    큐 깊이   metrics_registry의 coalescer_pending / message_monitor_pending_events 최댓값
+    발화 지연 활성 방 메시지 추가 → 발화 (ms)
+"""
+
+import gc
+import random
+import sys
+import threading
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from .kakaotalk import SimChatRoom, SimKakaoTalk
+from .pipeline import SimPipeline
+
+QUEUE_GAUGES = ("coalescer_pending", "message_monitor_pending_events")
+MONITOR_READY_TIMEOUT_SECS = 5.0  # 활성 방 메시지 모니터 등록 대기 (폴링 스레드 웜업 포함)
+NAVIGATION_WINDOW = 30            # 포커스 이동 대상: 활성 방 마지막 N개 메시지
+
+
+@dataclass
+class LoadProfile:
+    """부하 모양. 간격/주기 0이면 해당 부하 없음."""
+
+    duration: float = 60.0          # 초
+    rooms: int = 5
+    messages_per_min: float = 30.0  # 방당
+    room_messages: int = 50         # 방별 초기 메시지 수
+    max_room_messages: int = 300    # 비활성 방 목록 상한 (오래된 것부터 제거)
+    burst_every: float = 10.0       # 활성 방 ChildrenBulkAdded 주기 (초)
+    burst_size: int = 20
+    focus_per_sec: float = 5.0      # 포커스/선택 이동
+    menu_every: float = 15.0        # 컨텍스트 메뉴 열기 주기 (초)
+    menu_hold: float = 1.0          # 메뉴 열려 있는 시간 (초)
+    switch_every: float = 20.0      # 활성 방 전환 주기 (초)
+    warmup: float = 2.0             # 메모리/스레드 기준점 전 대기
+    sample_interval: float = 0.5
+    trace_memory: bool = True       # tracemalloc (켜면 CPU 수치가 부풀려짐)
+    track_wrappers: bool = True     # wrapper_tracker owner별 보유량 샘플
+    wrapper_interval: float = 2.0   # wrapper_tracker 샘플 주기 (초)
+    wrapper_leak_window: int = 10   # 누수 판정 샘플 수
+    wrapper_leak_growth: int = 50   # 살아 있는 메시지 수를 넘는 보유량이 이만큼 늘면 누수 의심
+    seed: int = 43
+
+
+@dataclass
+class LoadBudget:
+    """통과 기준. None이면 검사 안 함."""
+
+    cpu_ms_per_event: Optional[float] = 5.0
+    thread_growth: Optional[int] = 8               # 최대 활성 스레드 - 부하 시작 시
+    thread_starts_per_sec: Optional[float] = 20.0
+    memory_growth_kb: Optional[float] = 2048.0     # 앱 코드 할당량 증가
+    steady_memory_growth_kb: Optional[float] = 512.0  # 후반부 (중간 → 끝) 증가
+    wrapper_suspects: Optional[int] = 0            # 보유량이 계속 느는 owner 수
+    latency_p95_ms: Optional[float] = 1000.0
+    queue_depth: Optional[int] = 100
+    announced_ratio: Optional[float] = 0.95        # 활성 방 메시지 중 발화 비율
+
+
+@dataclass
+class BudgetCheck:
+    name: str
+    value: float
+    limit: float
+    passed: bool
+
+
+@dataclass
+class SoakSample:
+    t: float               # 부하 시작 후 초
+    threads: int
+    traced_kb: float       # tracemalloc 전체 (끄면 0)
+    queues: dict[str, int]
+
+
+@dataclass
+class SoakReport:
+    profile: LoadProfile
+    budget: LoadBudget
+    wall_secs: float
+    cpu_secs: float
+    events: dict[str, int]
+    samples: list[SoakSample]
+    threads_at_start: int
+    thread_starts: int
+    memory_start_kb: float
+    memory_end_kb: float
+    latencies_ms: list[float]
+    posted_active: int
+    round_trips: int
+    memory_mid_kb: float = 0.0
+    wrappers: dict = field(default_factory=dict)  # wrapper_tracker.report() (끄면 빈 dict)
+    checks: list[BudgetCheck] = field(default_factory=list)
+
+    def __post_init__(self):
+        if not self.checks:
+            self.checks = self.evaluate(self.budget)
+
+    # === 지표 ===
+
+    @property
+    def total_events(self) -> int:
+        return sum(self.events.values())
+
+    @property
+    def cpu_ms_per_event(self) -> float:
+        return self.cpu_secs * 1000 / self.total_events if self.total_events else 0.0
+
+    @property
+    def peak_threads(self) -> int:
+        return max((s.threads for s in self.samples), default=self.threads_at_start)
+
+    @property
+    def thread_starts_per_sec(self) -> float:
+        return self.thread_starts / self.wall_secs if self.wall_secs else 0.0
+
+    @property
+    def memory_growth_kb(self) -> float:
+        return self.memory_end_kb - self.memory_start_kb
+
+    @property
+    def steady_memory_growth_kb(self) -> float:
+        return self.memory_end_kb - self.memory_mid_kb
+
+    @property
+    def queue_peaks(self) -> dict[str, int]:
+        peaks = {name: 0 for name in QUEUE_GAUGES}
+        for sample in self.samples:
+            for name, depth in sample.queues.items():
+                peaks[name] = max(peaks.get(name, 0), depth)
+        return peaks
+
+    def latency_percentile(self, pct: float) -> float:
+        values = sorted(self.latencies_ms)
+        if not values:
+            return 0.0
+        return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+    @property
+    def announced_ratio(self) -> float:
+        return len(self.latencies_ms) / self.posted_active if self.posted_active else 1.0
+
+    # === 판정 ===
+
+    def evaluate(self, budget: LoadBudget) -> list[BudgetCheck]:
+        measured = {
+            "cpu_ms_per_event": self.cpu_ms_per_event,
+            "thread_growth": self.peak_threads - self.threads_at_start,
+            "thread_starts_per_sec": self.thread_starts_per_sec,
+            "memory_growth_kb": self.memory_growth_kb if self.profile.trace_memory else None,
+            "steady_memory_growth_kb": (self.steady_memory_growth_kb
+                                        if self.profile.trace_memory else None),
+            "wrapper_suspects": len(self.wrappers["suspects"]) if self.wrappers else None,
+            "latency_p95_ms": self.latency_percentile(95),
+            "queue_depth": max(self.queue_peaks.values(), default=0),
+        }
+        checks = []
+        for name, value in measured.items():
+            limit = getattr(budget, name)
+            if limit is not None and value is not None:
+                checks.append(BudgetCheck(name, round(value, 3), limit, value <= limit))
+        if budget.announced_ratio is not None:
+            ratio = self.announced_ratio
+            checks.append(BudgetCheck("announced_ratio", round(ratio, 4), budget.announced_ratio,
+                                      ratio >= budget.announced_ratio))
+        return checks
+
+    @property
+    def passed(self) -> bool:
+        return all(check.passed for check in self.checks)
+
+    def to_dict(self) -> dict:
+        return {
+            "passed": self.passed,
+            "profile": asdict(self.profile),
+            "budget": asdict(self.budget),
+            "wall_secs": round(self.wall_secs, 3),
+            "cpu_secs": round(self.cpu_secs, 3),
+            "events": self.events,
+            "cpu_ms_per_event": round(self.cpu_ms_per_event, 4),
+            "threads": {"at_start": self.threads_at_start, "peak": self.peak_threads,
+                        "started": self.thread_starts},
+            "memory_kb": {"start": round(self.memory_start_kb, 1), "mid": round(self.memory_mid_kb, 1),
+                          "end": round(self.memory_end_kb, 1)},
+            "wrappers": self.wrappers,
+            "queue_peaks": self.queue_peaks,
+            "latency_ms": {"p50": round(self.latency_percentile(50), 3),
+                           "p95": round(self.latency_percentile(95), 3),
+                           "max": round(max(self.latencies_ms, default=0.0), 3)},
+            "messages": {"posted_active": self.posted_active, "announced": len(self.latencies_ms)},
+            "round_trips": self.round_trips,
+            "checks": [asdict(c) for c in self.checks],
+            "samples": [asdict(s) for s in self.samples],
+        }
+
+    def format(self) -> str:
+        p = self.profile
+        lines = [
+            f"=== 소크 ({self.wall_secs:.1f}초, 방 {p.rooms}개 × 분당 {p.messages_per_min:g}개) ===",
+            "이벤트: " + ", ".join(f"{k} {v:,}" for k, v in sorted(self.events.items())),
+            f"CPU {self.cpu_secs:.2f}초 ({self.cpu_ms_per_event:.3f}ms/event), "
+            f"COM/Win32 왕복 {self.round_trips:,}",
+            f"스레드: 시작 {self.threads_at_start}, 최대 {self.peak_threads}, "
+            f"생성 {self.thread_starts:,}개 ({self.thread_starts_per_sec:.1f}/s)",
+        ]
+        if p.trace_memory:
+            lines.append(f"앱 메모리: {self.memory_start_kb:.0f}KB → {self.memory_end_kb:.0f}KB "
+                         f"({self.memory_growth_kb:+.0f}KB, 후반 {self.steady_memory_growth_kb:+.0f}KB)")
+        if self.wrappers:
+            owners = ", ".join(f"{name} {data['current']}(최대 {data['peak']})"
+                               for name, data in self.wrappers["owners"].items())
+            lines.append(f"래퍼 보유: {owners or '없음'}")
+        lines.append("큐 최대: " + ", ".join(f"{k} {v}" for k, v in self.queue_peaks.items()))
+        lines.append(f"메시지 발화 {len(self.latencies_ms)}/{self.posted_active}, "
+                     f"지연 p50 {self.latency_percentile(50):.1f}ms, "
+                     f"p95 {self.latency_percentile(95):.1f}ms")
+        lines.append("")
+        for check in self.checks:
+            mark = "OK  " if check.passed else "FAIL"
+            op = ">=" if check.name == "announced_ratio" else "<="
+            lines.append(f"{mark} {check.name:<22} {check.value:>12g} {op} {check.limit:g}")
+        lines.append("")
+        lines.append("PASS" if self.passed else "FAIL")
+        return "\n".join(lines)
+
+
+def _app_memory_kb() -> float:
+    """앱 패키지 파일에서 할당된 살아 있는 메모리 (KB)."""
+    import kakaotalk_a11y_client
+
+    package_dir = str(Path(kakaotalk_a11y_client.__file__).parent)
+    snapshot = tracemalloc.take_snapshot().filter_traces(
+        [tracemalloc.Filter(True, package_dir + "*")]
+    )
+    return sum(stat.size for stat in snapshot.statistics("filename")) / 1024
+
+
+class _ThreadStartCounter:
+    """threading.settrace로 새 스레드 시작 횟수만 셈 (첫 호출에서 추적 해제)."""
+
+    def __init__(self):
+        self.count = 0
+        self._lock = threading.Lock()
+        self._previous = None
+
+    def _trace(self, frame, event, arg):
+        sys.settrace(None)
+        with self._lock:
+            self.count += 1
+        return None
+
+    def __enter__(self) -> "_ThreadStartCounter":
+        self._previous = threading.gettrace()
+        threading.settrace(self._trace)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        threading.settrace(self._previous)
+
+
+class _LoadRun:
+    """부하 스레드 묶음. 모든 상태 변경은 이 객체를 거침."""
+
+    def __init__(self, profile: LoadProfile, sim: SimKakaoTalk, pipeline: SimPipeline,
+                 rooms: list[SimChatRoom]):
+        self.profile = profile
+        self.sim = sim
+        self.pipeline = pipeline
+        self.rooms = rooms
+        self.active = rooms[0]
+        self.menu_open = False
+        self.stop = threading.Event()
+        self.events: dict[str, int] = {}
+        self.posted_active = 0
+        self.samples: list[SoakSample] = []
+        self.memory_mid_kb = 0.0
+        self._events_lock = threading.Lock()
+        self._rng = random.Random(profile.seed)
+        self._started = 0.0
+
+    def _count(self, kind: str, n: int = 1) -> None:
+        with self._events_lock:
+            self.events[kind] = self.events.get(kind, 0) + n
+
+    def _monitoring(self, room: SimChatRoom) -> bool:
+        """room 메시지 목록에 MessageListMonitor가 등록돼 있는지 (발화 기대 대상)."""
+        monitor = self.pipeline.message_monitor._list_monitor
+        return (monitor is not None and monitor._event_handler is not None
+                and monitor.list_control.node is room.message_list.node)
+
+    # === 부하 스레드 ===
+
+    def _flood(self) -> None:
+        p = self.profile
+        rate = p.rooms * p.messages_per_min / 60
+        interval = 1 / rate if rate > 0 else None
+        next_message = time.monotonic()
+        next_burst = time.monotonic() + p.burst_every if p.burst_every > 0 else None
+        while not self.stop.is_set():
+            now = time.monotonic()
+            if next_burst is not None and now >= next_burst:
+                self._post(self.active, p.burst_size)
+                next_burst += p.burst_every
+            if interval is not None and now >= next_message:
+                self._post(self._rng.choice(self.rooms), 1)
+                next_message += interval
+            wake = min(t for t in (next_message if interval else None, next_burst, now + 0.1)
+                       if t is not None)
+            self.stop.wait(max(0.0, wake - time.monotonic()))
+
+    def _post(self, room: SimChatRoom, count: int) -> None:
+        expected = room is self.active and self._monitoring(room)
+        if count == 1:
+            items = [self.sim.post_message(room)]
+            self._count("structure")
+        else:
+            items = self.sim.post_messages(room, count)
+            self._count("bulk")
+        if expected:
+            self.pipeline.latency.mark_posted(items)
+            self.posted_active += len(items)
+        elif room is not self.active:
+            # 비활성 방은 가상화 목록처럼 상한 유지
+            excess = len(room.messages) - self.profile.max_room_messages
+            for item in room.messages[:max(0, excess)]:
+                item.remove()
+
+    def _navigate(self) -> None:
+        p = self.profile
+        if p.focus_per_sec <= 0:
+            return
+        interval = 1 / p.focus_per_sec
+        n = 0
+        while not self.stop.wait(interval):
+            menu = self.sim.menu
+            if self.menu_open and menu is not None and menu.children:
+                self.sim.focus(self._rng.choice(menu.children))
+                self._count("focus")
+                continue
+            messages = self.active.messages[-NAVIGATION_WINDOW:]
+            if not messages:
+                continue
+            target = self._rng.choice(messages)
+            n += 1
+            if n % 5 == 0:
+                self.sim.select(target)
+                self._count("selection")
+            else:
+                self.sim.focus(target)
+                self._count("focus")
+
+    def _control(self) -> None:
+        """메뉴 열기/닫기 + 활성 방 전환. 실제 폴링 스레드가 변화를 감지."""
+        p = self.profile
+        now = time.monotonic()
+        next_menu = now + p.menu_every if p.menu_every > 0 else None
+        next_switch = now + p.switch_every if p.switch_every > 0 and len(self.rooms) > 1 else None
+        close_menu_at = None
+        while not self.stop.is_set():
+            now = time.monotonic()
+            if close_menu_at is not None and now >= close_menu_at:
+                self.menu_open = False
+                self.sim.close_menu()
+                self._count("menu_close")
+                close_menu_at = None
+            if next_menu is not None and now >= next_menu and close_menu_at is None:
+                self.sim.open_menu()
+                self.menu_open = True
+                self._count("menu_open")
+                close_menu_at = now + p.menu_hold
+                next_menu += p.menu_every
+            if next_switch is not None and now >= next_switch and close_menu_at is None:
+                candidates = [room for room in self.rooms if room is not self.active]
+                self.active = self._rng.choice(candidates)
+                self.sim.activate(self.active)
+                self._count("foreground")
+                next_switch += p.switch_every
+            pending = [t for t in (next_menu, next_switch, close_menu_at) if t is not None]
+            self.stop.wait(max(0.0, min(pending, default=now + 0.1) - time.monotonic()))
+        if close_menu_at is not None:
+            self.sim.close_menu()
+
+    def _sample(self) -> None:
+        from kakaotalk_a11y_client.utils.metrics import metrics_registry
+
+        while True:
+            queues = {}
+            for family in metrics_registry.collect():
+                if family.name in QUEUE_GAUGES:
+                    queues[family.name] = int(sum(value for _, _, value in family.samples))
+            traced = tracemalloc.get_traced_memory()[0] / 1024 if tracemalloc.is_tracing() else 0.0
+            self.samples.append(SoakSample(round(time.monotonic() - self._started, 3),
+                                           threading.active_count(), round(traced, 1), queues))
+            if self.stop.wait(self.profile.sample_interval):
+                return
+
+    def run(self, thread_starts: "_ThreadStartCounter") -> tuple[float, float, int]:
+        """부하 가함. (wall 초, CPU 초, 부하 시작 시 스레드 수) 반환. 부하 스레드 자신은 안 셈."""
+        workers = [threading.Thread(target=target, daemon=True, name=f"Load-{target.__name__}")
+                   for target in (self._flood, self._navigate, self._control)]
+        sampler = threading.Thread(target=self._sample, daemon=True, name="Load-sample")
+        self._started = time.monotonic()
+        cpu_start = time.process_time()
+        for worker in workers:
+            worker.start()
+        sampler.start()
+        threads_at_start = threading.active_count()
+        with thread_starts:
+            self.stop.wait(self.profile.duration / 2)
+            if self.profile.trace_memory:
+                gc.collect()
+                self.memory_mid_kb = _app_memory_kb()
+            self.stop.wait(max(0.0, self._started + self.profile.duration - time.monotonic()))
+            self.stop.set()
+            for worker in (*workers, sampler):
+                worker.join(timeout=5.0)
+            self.pipeline.drain()
+        return (time.monotonic() - self._started, time.process_time() - cpu_start,
+                threads_at_start)
+
+
+def run_soak(profile: Optional[LoadProfile] = None, budget: Optional[LoadBudget] = None) -> SoakReport:
+    """부하 실행 + 예산 판정."""
+    from kakaotalk_a11y_client.utils.wrapper_tracker import wrapper_tracker
+
+    from .elements import SimElement
+
+    profile = profile or LoadProfile()
+    budget = budget or LoadBudget()
+    wrappers: dict = {}
+
+    started_tracing = profile.trace_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    try:
+        sim = SimKakaoTalk(friends=0, chats=0)
+        rooms = [sim.open_chat_room(f"부하 {i + 1}", messages=profile.room_messages, activate=False)
+                 for i in range(max(1, profile.rooms))]
+        with SimPipeline(sim, poll_thread=True, record_utterances=False) as pipeline:
+            load = _LoadRun(profile, sim, pipeline, rooms)
+            sim.activate(rooms[0])
+            deadline = time.monotonic() + MONITOR_READY_TIMEOUT_SECS
+            while not load._monitoring(rooms[0]) and time.monotonic() < deadline:
+                time.sleep(0.01)
+            time.sleep(profile.warmup)
+
+            gc.collect()
+            memory_start = _app_memory_kb() if profile.trace_memory else 0.0
+            # 전수 조사는 끔 (시뮬레이터 트리 자체가 SimElement를 들고 있음)
+            tracking = profile.track_wrappers and wrapper_tracker.start(
+                profile.wrapper_interval, census=False, wrapper_types=(SimElement,),
+                trace_memory=False, window=profile.wrapper_leak_window,
+                min_growth=profile.wrapper_leak_growth,
+                baseline=lambda: sum(len(room.messages) for room in rooms))
+            thread_starts = _ThreadStartCounter()
+            try:
+                wall, cpu, threads_at_start = load.run(thread_starts)
+            finally:
+                if tracking:
+                    wrapper_tracker.stop()
+                    wrappers = wrapper_tracker.report()
+            gc.collect()
+            memory_end = _app_memory_kb() if profile.trace_memory else 0.0
+        latencies = list(pipeline.latency.values)
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+
+    return SoakReport(
+        profile=profile,
+        budget=budget,
+        wall_secs=wall,
+        cpu_secs=cpu,
+        events=dict(load.events),
+        samples=load.samples,
+        threads_at_start=threads_at_start,
+        thread_starts=thread_starts.count,
+        memory_start_kb=memory_start,
+        memory_end_kb=memory_end,
+        memory_mid_kb=load.memory_mid_kb,
+        wrappers=wrappers,
+        latencies_ms=latencies,
+        posted_active=load.posted_active,
+        round_trips=sim.counter.total,
+    )
@@ -0,0 +1,183 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025-2026 dnz3d4c
+"""시뮬레이터 위 실제 파이프라인 (FocusMonitorService + MessageMonitor + ChatRoomNavigator).
+
+재생기(replay)와 부하 생성기(load)가 공유. 발화는 출력 백엔드 자리에서 가로채고
+(메시지 지연 측정 + 선택적으로 RecordingBackend 기록), 끝나면 출력 백엔드/지연 추적 설정 원복.
+
+    with SimPipeline(sim) as pipeline:      # poll_thread=False: pipeline.poll()로 직접 구동
+        sim.activate(room); pipeline.poll()
+        pipeline.latency.mark_posted(sim.post_messages(room, 3))
+        pipeline.drain()
+    pipeline.latency.values                 # 메시지 추가 → 발화 (ms)
+"""
+
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import ExitStack, contextmanager
+from typing import Iterable, Optional
+
+from kakaotalk_a11y_client.output.base import OutputBackend
+
+from .kakaotalk import SimKakaoTalk
+
+REGISTRATION_TIMEOUT_SECS = 2.0   # MessageListMonitor 핸들러 등록 대기
+DRAIN_TIMEOUT_SECS = 2.0          # 디바운스 타이머 대기
+DRAIN_SETTLE_SECS = 0.1           # 코얼레서 flush 여유
+
+
+@contextmanager
+def captured_output(backend, sample_every: int = 1):
+    """출력 백엔드 교체 + 지연 추적 전수 샘플링. 종료 시 원복."""
+    from kakaotalk_a11y_client import accessibility
+    from kakaotalk_a11y_client.utils.latency_tracer import latency_tracer
+
+    saved_name, saved_options = accessibility._backend_name, dict(accessibility._backend_options)
+    saved_sample_every = latency_tracer.get_stats()["sample_every"]
+    accessibility.set_output_backend(backend)
+    latency_tracer.reset()
+    latency_tracer.set_sample_every(sample_every)
+    try:
+        yield backend
+    finally:
+        latency_tracer.set_sample_every(saved_sample_every)
+        accessibility.set_output_backend(saved_name, **saved_options)
+
+
+class MessageLatency:
+    """메시지 추가 시각 → 같은 텍스트 첫 발화까지 지연 (ms). 발화 스레드에서 바로 매칭."""
+
+    def __init__(self):
+        self._posted: dict[str, deque] = defaultdict(deque)
+        self._lock = threading.Lock()
+        self.posted = 0
+        self.values: list[float] = []
+
+    def mark_posted(self, items: Iterable, when: Optional[float] = None) -> None:
+        from kakaotalk_a11y_client.utils.text_normalizer import normalize_speech_text
+
+        when = time.time() if when is None else when
+        with self._lock:
+            for item in items:
+                self._posted[normalize_speech_text(item.name)].append(when)
+                self.posted += 1
+
+    def on_speech(self, text: str, when: float) -> None:
+        with self._lock:
+            times = self._posted.get(text)
+            if not times:
+                return
+            self.values.append((when - times.popleft()) * 1000)
+            if not times:
+                del self._posted[text]
+
+
+class _SpeechProbe(OutputBackend):
+    """출력 백엔드 대역. 지연 매칭 + (있으면) RecordingBackend로 전달."""
+
+    name = "sim_probe"
+    has_braille = False
+
+    def __init__(self, latency: MessageLatency, recording=None):
+        self.latency = latency
+        self.recording = recording
+        self.spoken = 0
+
+    def speak(self, text: str, interrupt: bool = False) -> None:
+        self.spoken += 1
+        self.latency.on_speech(text, time.time())
+        if self.recording is not None:
+            self.recording.speak(text, interrupt)
+
+
+class SimPipeline:
+    """SimKakaoTalk에 설치된 실제 포커스/메시지 파이프라인. 컨텍스트 매니저.
+
+    record_utterances=False면 발화 텍스트를 보관하지 않음 (장시간 부하용, 수만 건).
+    """
+
+    def __init__(self, sim: SimKakaoTalk, poll_thread: bool = False, record_utterances: bool = True):
+        from kakaotalk_a11y_client.output import RecordingBackend
+
+        self.sim = sim
+        self.poll_thread = poll_thread
+        self.recording = RecordingBackend() if record_utterances else None
+        self.latency = MessageLatency()
+        self.probe = _SpeechProbe(self.latency, self.recording)
+        self.service = None
+        self.message_monitor = None
+        self._stack: Optional[ExitStack] = None
+        self._last_cleanup = 0.0
+        self._list_monitor = None
+
+    def __enter__(self) -> "SimPipeline":
+        stack = ExitStack()
+        try:
+            stack.enter_context(self.sim.installed())
+            # installed() 안에서 import (Windows 전용 모듈 대역이 sys.modules에 있을 때)
+            from kakaotalk_a11y_client.focus_monitor import FocusMonitorService
+            from kakaotalk_a11y_client.mode_manager import ModeManager
+            from kakaotalk_a11y_client.navigation.chat_room import ChatRoomNavigator
+            from kakaotalk_a11y_client.navigation.message_monitor import MessageMonitor
+
+            stack.enter_context(captured_output(self.probe))
+            navigator = ChatRoomNavigator(uia_adapter=self.sim.adapter)
+            self.message_monitor = MessageMonitor(navigator)
+            self.service = FocusMonitorService(
+                mode_manager=ModeManager(),
+                message_monitor=self.message_monitor,
+                chat_navigator=navigator,
+                hotkey_manager=None,
+                uia_adapter=self.sim.adapter,
+            )
+            self.service.start(poll_thread=self.poll_thread)
+            stack.callback(self.message_monitor.stop)
+            stack.callback(self.service.stop)
+            self.sim.uia.wait_for_handlers("focus")
+        except BaseException:
+            stack.close()
+            raise
+        self._stack = stack
+        self._last_cleanup = time.time()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self._stack is not None:
+            self._stack.close()
+            self._stack = None
+
+    # === 구동 ===
+
+    def poll(self) -> None:
+        """폴링 1회 (poll_thread=False용). 새 메시지 모니터면 핸들러 등록까지 대기."""
+        # 호출 시점 = 변화를 볼 시점. 메뉴 캐시 TTL 기다리지 않음
+        self.service._menu_handler.invalidate_menu_cache()
+        _, self._last_cleanup = self.service._poll_once(self._last_cleanup)
+        monitor = self.message_monitor._list_monitor
+        if monitor is not None and monitor is not self._list_monitor:
+            self.wait_registered(monitor)
+        self._list_monitor = monitor
+
+    def wait_registered(self, monitor, timeout: float = REGISTRATION_TIMEOUT_SECS) -> bool:
+        """MessageListMonitor 이벤트 스레드가 StructureChanged/ElementSelected 둘 다 등록할 때까지."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            handler = monitor._selection_handler
+            if handler is not None and self.sim.uia.handler_count("automation", handler=handler):
+                return True
+            time.sleep(0.002)
+        return False
+
+    def drain(self, timeout: float = DRAIN_TIMEOUT_SECS) -> None:
+        """대기 중인 메시지 디바운스 + 코얼레서 flush + 음성 워커 출력이 끝날 때까지."""
+        from kakaotalk_a11y_client import accessibility
+
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            monitor = self.message_monitor._list_monitor
+            if monitor is None or monitor._debounce_timer is None:
+                break
+            time.sleep(0.01)
+        time.sleep(DRAIN_SETTLE_SECS)
+        accessibility.wait_speech_idle(max(deadline - time.monotonic(), DRAIN_SETTLE_SECS))
@@ -0,0 +1,177 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025-2026 dnz3d4c
+"""Windows/데스크톱 전용 모듈 대역 (uiautomation, win32gui, win32con, pythoncom, pyautogui).
+
+install_platform_modules(): 실제 모듈을 import할 수 없을 때만 sys.modules에 대역 등록.
+Windows에선 아무것도 안 바꿈. 패키지 import 전에 호출해야 함.
+platform_modules(): 같은 등록을 with 블록 동안만 (테스트용, 종료 시 대역 제거).
+시뮬레이터 연결 (모듈 전역 교체)은 SimKakaoTalk.installed() 담당.
+"""
+
+import importlib
+import sys
+import types
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from .elements import SimElement
+from .windows import FakeWindowSystem
+
+# 앱이 쓰는 win32con 상수
+WIN32CON_CONSTANTS = {
+    "MOD_ALT": 0x0001,
+    "MOD_CONTROL": 0x0002,
+    "MOD_SHIFT": 0x0004,
+    "MOD_WIN": 0x0008,
+    "SW_HIDE": 0,
+    "SW_RESTORE": 9,
+    "WM_QUIT": 0x0012,
+    "WM_HOTKEY": 0x0312,
+    "WM_USER": 0x0400,
+}
+
+
+class _AutomationControl:
+    """auto.Control 대역. element=를 주면 그 요소를 그대로 반환 (SimElement가 Control 겸용)."""
+
+    def __new__(cls, element=None, **kwargs):
+        if element is not None:
+            return element
+        return super().__new__(cls)
+
+
+def make_automation_module(sim=None) -> types.ModuleType:
+    """uiautomation 대역. sim(SimKakaoTalk) 없으면 전부 None 반환."""
+    module = types.ModuleType("uiautomation")
+    module.__sim__ = True
+    module.Control = _AutomationControl
+
+    def GetRootControl():
+        if sim is None:
+            return None
+        sim.counter.hit("GetRootControl")
+        return sim.desktop
+
+    def GetFocusedControl():
+        if sim is None:
+            return None
+        sim.counter.hit("GetFocusedControl")
+        return sim.uia.focused
+
+    def ControlFromHandle(hwnd: int) -> Optional[SimElement]:
+        if sim is None:
+            return None
+        sim.counter.hit("ControlFromHandle")
+        return sim.windows.element_for(hwnd)
+
+    def WindowControl(searchDepth: int = 0xFFFFFFFF, **conditions):
+        """auto.WindowControl(searchDepth=1, Name=...) 최상위 창 검색 (루트=데스크톱)."""
+        if sim is None:
+            return None
+        return sim.desktop.WindowControl(searchDepth, **conditions)
+
+    module.GetRootControl = GetRootControl
+    module.GetFocusedControl = GetFocusedControl
+    module.ControlFromHandle = ControlFromHandle
+    module.WindowControl = WindowControl
+    return module
+
+
+def make_pythoncom_module() -> types.ModuleType:
+    """pythoncom 대역. 이벤트는 emit_*()가 직접 전달하므로 펌프는 할 일 없음."""
+    module = types.ModuleType("pythoncom")
+    module.__sim__ = True
+    module.COINIT_MULTITHREADED = 0
+    module.COINIT_APARTMENTTHREADED = 2
+    module.PumpWaitingMessages = lambda: 0
+    module.CoInitialize = lambda: None
+    module.CoInitializeEx = lambda flags=0: None
+    module.CoUninitialize = lambda: None
+    return module
+
+
+def make_win32con_module() -> types.ModuleType:
+    module = types.ModuleType("win32con")
+    module.__sim__ = True
+    for name, value in WIN32CON_CONSTANTS.items():
+        setattr(module, name, value)
+    return module
+
+
+def make_win32gui_module(windows: Optional[FakeWindowSystem] = None) -> types.ModuleType:
+    """win32gui 대역. 함수는 windows(없으면 빈 창 시스템)에 위임."""
+    windows = windows or FakeWindowSystem()
+    module = types.ModuleType("win32gui")
+    module.__sim__ = True
+    for name in dir(FakeWindowSystem):
+        if name[:1].isupper():
+            setattr(module, name, getattr(windows, name))
+    return module
+
+
+class _FailSafeException(Exception):
+    pass
+
+
+def make_pyautogui_module() -> types.ModuleType:
+    """pyautogui 대역. 디스플레이 없으면 실제 모듈은 import 시 실패함.
+
+    screenshot()은 검은 RGB 배열 (np.array()로 PIL 이미지와 같게 변환됨),
+    입력 함수는 아무것도 안 함.
+    """
+    import numpy as np
+
+    module = types.ModuleType("pyautogui")
+    module.__sim__ = True
+    module.FAILSAFE = True
+    module.PAUSE = 0.1
+    module.FailSafeException = _FailSafeException
+
+    def screenshot(region=None):
+        width, height = (region[2], region[3]) if region else (1920, 1080)
+        return np.zeros((height, width, 3), dtype=np.uint8)
+
+    module.screenshot = screenshot
+    for name in ("click", "press", "hotkey", "moveTo"):
+        setattr(module, name, lambda *args, **kwargs: None)
+    return module
+
+
+_FACTORIES = {
+    "uiautomation": make_automation_module,
+    "win32gui": make_win32gui_module,
+    "win32con": make_win32con_module,
+    "pythoncom": make_pythoncom_module,
+    "pyautogui": make_pyautogui_module,
+}
+
+
+def install_platform_modules() -> list[str]:
+    """import 안 되는 Windows 전용 모듈만 대역 등록. 등록한 이름 목록 반환."""
+    installed = []
+    for name, factory in _FACTORIES.items():
+        if name in sys.modules:
+            continue
+        try:
+            importlib.import_module(name)
+        except Exception:
+            # uiautomation/pyautogui는 Windows·디스플레이 없으면 ImportError 외 예외도 냄
+            sys.modules[name] = factory()
+            installed.append(name)
+    return installed
+
+
+@contextmanager
+def platform_modules() -> Iterator[list[str]]:
+    """install_platform_modules()를 블록 동안만. 종료 시 이번에 등록한 대역만 sys.modules에서 제거.
+
+    블록 안에서 import한 앱 모듈은 대역을 전역으로 계속 들고 있음 (시뮬레이터 연결은 installed()).
+    """
+    installed = install_platform_modules()
+    modules = {name: sys.modules[name] for name in installed}
+    try:
+        yield installed
+    finally:
+        for name, module in modules.items():
+            if sys.modules.get(name) is module:
+                del sys.modules[name]
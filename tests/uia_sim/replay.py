@@ -0,0 +1,309 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025-2026 dnz3d4c
+"""기록 재생. --record-events로 남긴 JSONL을 시뮬레이터 위 실제 파이프라인에 다시 흘려보냄.
+
+    from tests.uia_sim import EventReplayer
+    report = EventReplayer.from_file("session.jsonl").run(speed=4.0)  # 4배속, None이면 최대 속도
+    print(report.format())
+
+기록의 hwnd/RuntimeId는 재생 때마다 새 시뮬레이터 요소로 대응:
+    foreground  카카오톡 메인/채팅방/다른 앱 창 (처음 보는 hwnd면 생성)
+    focus 등    같은 RuntimeId면 같은 요소, 채팅방 ListItem은 이름으로 기존 메시지 찾음
+    structure   직후 messages 레코드의 이름으로 메시지 추가 + StructureChanged 발생
+포그라운드/메뉴 변화는 폴링 스레드 대신 SimPipeline.poll()로 직접 폴링.
+"""
+
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Union
+
+from .kakaotalk import MAIN_WINDOW_TITLE, WINDOW_CLASS, SimChatRoom, SimKakaoTalk
+from .pipeline import SimPipeline
+from .uia import STRUCTURE_CHILD_ADDED
+
+
+@dataclass
+class ReplayReport:
+    """재생 1회 결과. 지연은 ms."""
+
+    speed: Optional[float]
+    records: int
+    kinds: dict[str, int]
+    recorded_secs: float
+    wall_secs: float
+    utterances: list[tuple[float, str]] = field(default_factory=list)  # (재생 시작 후 초, 텍스트)
+    stages: dict[str, dict] = field(default_factory=dict)              # latency_tracer 단계별
+    message_latency_ms: list[float] = field(default_factory=list)      # 메시지 추가 → 발화
+    posted_messages: int = 0
+    round_trips: int = 0
+
+    @property
+    def events_per_sec(self) -> float:
+        return self.records / self.wall_secs if self.wall_secs else 0.0
+
+    def to_dict(self) -> dict:
+        latencies = sorted(self.message_latency_ms)
+        return {
+            "speed": self.speed,
+            "records": self.records,
+            "kinds": self.kinds,
+            "recorded_secs": round(self.recorded_secs, 3),
+            "wall_secs": round(self.wall_secs, 3),
+            "events_per_sec": round(self.events_per_sec, 1),
+            "utterances": len(self.utterances),
+            "posted_messages": self.posted_messages,
+            "announced_messages": len(latencies),
+            "message_latency_ms": {
+                "p50": _percentile(latencies, 50),
+                "p95": _percentile(latencies, 95),
+                "max": round(latencies[-1], 3) if latencies else 0.0,
+            },
+            "stages": self.stages,
+            "round_trips": self.round_trips,
+        }
+
+    def format(self) -> str:
+        data = self.to_dict()
+        speed = "max" if not self.speed else f"{self.speed:g}x"
+        lines = [
+            f"=== 재생 ({speed}) ===",
+            f"레코드 {self.records}개 ({self.recorded_secs:.2f}초 기록) → {self.wall_secs:.2f}초, "
+            f"{self.events_per_sec:.0f} events/s",
+            f"발화 {len(self.utterances)}개, 메시지 {data['announced_messages']}/{self.posted_messages} 발화, "
+            f"COM/Win32 왕복 {self.round_trips:,}",
+        ]
+        latency = data["message_latency_ms"]
+        if data["announced_messages"]:
+            lines.append(f"메시지 지연: p50 {latency['p50']:.1f}ms, p95 {latency['p95']:.1f}ms, "
+                         f"max {latency['max']:.1f}ms")
+        for stage, stats in self.stages.items():
+            if stats.get("count"):
+                lines.append(f"  {stage:<10} {stats['count']:>5}건  p50 {stats['p50_ms']:g}ms  "
+                             f"p95 {stats['p95_ms']:g}ms  max {stats['max_ms']:g}ms")
+        return "\n".join(lines)
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, int(len(values) * pct / 100))
+    return round(values[index], 3)
+
+
+def prepare_records(records: list[dict]) -> list[dict]:
+    """재생 순서로 정렬 + 메시지 이름 연결 (원본 레코드는 안 건드림).
+
+    list 이름은 직전 foreground 레코드의 "_messages"로 (채팅방 초기 내용),
+    messages 이름은 그 앞 첫 structure 레코드의 "_added"로. structure 없이 온 건 "_orphan".
+    """
+    prepared = sorted((dict(r) for r in records), key=lambda r: r.get("t", 0.0))
+    last_foreground: Optional[dict] = None
+    pending: list[dict] = []
+    for record in prepared:
+        kind = record.get("kind")
+        if kind == "foreground":
+            last_foreground = record
+        elif kind == "list":
+            if last_foreground is not None:
+                last_foreground["_messages"] = list(record.get("names", []))
+            pending = []
+        elif kind == "structure":
+            pending.append(record)
+        elif kind == "messages":
+            names = list(record.get("names", []))
+            if pending:
+                pending[0]["_added"] = names
+            else:
+                record["_orphan"] = names
+            pending = []
+    return prepared
+
+
+class EventReplayer:
+    """기록 레코드를 SimKakaoTalk + 실제 FocusMonitorService/MessageMonitor로 재생."""
+
+    def __init__(self, records: list[dict]):
+        self.records = prepare_records(records)
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path]) -> "EventReplayer":
+        from kakaotalk_a11y_client.utils.event_recorder import read_recording
+
+        _, records = read_recording(Path(path))
+        return cls(records)
+
+    @property
+    def duration(self) -> float:
+        return self.records[-1].get("t", 0.0) if self.records else 0.0
+
+    def run(self, speed: Optional[float] = 1.0) -> ReplayReport:
+        """재생. speed=None/0이면 지연 없이. 출력 백엔드/지연 추적 설정은 끝나면 원복."""
+        from kakaotalk_a11y_client.utils.latency_tracer import latency_tracer
+
+        session = _ReplaySession(SimKakaoTalk(friends=0, chats=0))
+        with SimPipeline(session.sim) as pipeline:
+            wall_secs = session.run(pipeline, self.records, speed)
+        stages = {name: {k: v for k, v in stats.items() if k != "buckets"}
+                  for name, stats in latency_tracer.get_stats()["stages"].items()}
+
+        speech = pipeline.recording.utterances("speech")
+        return ReplayReport(
+            speed=speed or None,
+            records=len(self.records),
+            kinds=dict(Counter(r.get("kind", "") for r in self.records)),
+            recorded_secs=self.duration,
+            wall_secs=wall_secs,
+            utterances=[(u.timestamp - session.started, u.text) for u in speech],
+            stages=stages,
+            message_latency_ms=list(pipeline.latency.values),
+            posted_messages=pipeline.latency.posted,
+            round_trips=session.sim.counter.total,
+        )
+
+
+class _ReplaySession:
+    """재생 1회 상태: 기록 hwnd/RuntimeId → 시뮬레이터 요소 대응표 + 파이프라인."""
+
+    def __init__(self, sim: SimKakaoTalk):
+        self.sim = sim
+        self.pipeline: Optional[SimPipeline] = None
+        self.started = 0.0
+        self._hwnds: dict[int, object] = {}       # 기록 hwnd → SimElement
+        self._elements: dict[tuple, object] = {}  # 기록 RuntimeId → SimElement
+        self._rooms: dict[int, SimChatRoom] = {}  # 시뮬레이터 창 hwnd → 채팅방
+        self._window = sim.main                   # 현재 포그라운드 (시뮬레이터)
+        self._room: Optional[SimChatRoom] = None  # 마지막 채팅방
+
+    def run(self, pipeline: SimPipeline, records: list[dict], speed: Optional[float]) -> float:
+        self.pipeline = pipeline
+        self.started = time.time()
+        base = time.perf_counter()
+        for record in records:
+            if speed:
+                delay = record.get("t", 0.0) / speed - (time.perf_counter() - base)
+                if delay > 0:
+                    time.sleep(delay)
+            self._apply(record)
+        pipeline.drain()
+        return time.perf_counter() - base
+
+    # === 레코드 적용 ===
+
+    def _apply(self, record: dict) -> None:
+        kind = record.get("kind")
+        if kind == "foreground":
+            self._foreground(record)
+            self.pipeline.poll()
+        elif kind == "focus":
+            self.sim.focus(self._element(record))
+        elif kind == "selection":
+            self.sim.select(self._element(record))
+        elif kind == "list":
+            if self._room is not None and record.get("hwnd"):
+                self._hwnds[record["hwnd"]] = self._room.message_list
+        elif kind == "structure":
+            self._structure(record)
+        elif kind == "messages":
+            if self._room is not None:
+                for name in record.get("_orphan", ()):
+                    self._room.message_list.append(name, "ListItemControl")
+        elif kind == "menu_open":
+            menu = self._ensure_menu()
+            if record.get("hwnd"):
+                self._hwnds[record["hwnd"]] = menu
+            self.pipeline.poll()
+        elif kind == "menu_close":
+            self.sim.close_menu()
+            self.pipeline.poll()
+
+    def _foreground(self, record: dict) -> None:
+        hwnd = record.get("hwnd") or 0
+        window = self._hwnds.get(hwnd)
+        if window is None or not window.alive:
+            window = self._create_window(record)
+            if hwnd:
+                self._hwnds[hwnd] = window
+        room = self._rooms.get(window.hwnd)
+        if room is not None:
+            self._room = room
+            # 다시 들어온 방: 모니터가 꺼져 있던 동안 온 메시지 채우기
+            names = record.get("_messages", [])
+            for name in names[len(room.messages):]:
+                room.message_list.append(name, "ListItemControl")
+        self._window = window
+        self.sim.activate(window)
+
+    def _create_window(self, record: dict):
+        class_name = record.get("class_name", "")
+        title = record.get("title", "")
+        if class_name == WINDOW_CLASS and title == MAIN_WINDOW_TITLE:
+            return self.sim.main
+        if class_name == WINDOW_CLASS:
+            room = self.sim.open_chat_room(title, messages=0, activate=False)
+            self._rooms[room.hwnd] = room
+            return room.window
+        return self.sim.open_foreign_window(title, class_name or "Unknown")
+
+    def _ensure_menu(self):
+        if self.sim.menu is None:
+            self.sim.open_menu(items=())
+        return self.sim.menu
+
+    def _element(self, record: dict):
+        runtime_id = tuple(record.get("runtime_id") or ())
+        element = self._elements.get(runtime_id) if runtime_id else None
+        if element is None or not element.alive:
+            element = self._resolve(record)
+            if runtime_id:
+                self._elements[runtime_id] = element
+        name = record.get("name", "")
+        if element.name != name:
+            element.name = name
+        return element
+
+    def _resolve(self, record: dict):
+        control_type = record.get("control_type") or "PaneControl"
+        name = record.get("name", "")
+        hwnd = record.get("hwnd") or 0
+        mapped = self._hwnds.get(hwnd) if hwnd else None
+        if mapped is not None and mapped.alive and mapped.control_type == control_type:
+            return mapped
+
+        if control_type == "MenuItemControl":
+            return self._child(self._ensure_menu(), name, control_type, value=name)
+        room = self._rooms.get(self._window.hwnd)
+        if room is not None and control_type == "ListItemControl":
+            return self._child(room.message_list, name, control_type)
+
+        parent = mapped if mapped is not None and mapped.alive else self._window
+        if not hwnd or mapped is not None:
+            return parent.append(name, control_type, class_name=record.get("class_name", ""),
+                                 automation_id=record.get("automation_id", ""))
+        # 자식 hwnd 있는 요소 (목록/편집창 등)
+        sim_hwnd = self.sim.windows.allocate_hwnd()
+        element = parent.append(name, control_type, class_name=record.get("class_name", ""),
+                                automation_id=record.get("automation_id", ""), hwnd=sim_hwnd)
+        self.sim.windows.create_window(element.class_name, "", parent=parent.hwnd, element=element)
+        self._hwnds[hwnd] = element
+        return element
+
+    @staticmethod
+    def _child(parent, name: str, control_type: str, **kwargs):
+        """같은 이름의 기존 자식 (뒤에서부터), 없으면 추가."""
+        for child in reversed(parent.children):
+            if child.name == name and child.control_type == control_type:
+                return child
+        return parent.append(name, control_type, **kwargs)
+
+    def _structure(self, record: dict) -> None:
+        room = self._rooms.get(self._window.hwnd) or self._room
+        if room is None:
+            return
+        items = [room.message_list.append(name, "ListItemControl")
+                 for name in record.get("_added", ())]
+        self.pipeline.latency.mark_posted(items)
+        change_type = record.get("change_type", STRUCTURE_CHILD_ADDED)
+        sender = items[-1] if items and change_type == STRUCTURE_CHILD_ADDED else room.message_list
+        self.sim.uia.emit_structure_changed(sender, change_type)
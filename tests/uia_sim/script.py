@@ -0,0 +1,88 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025-2026 dnz3d4c
+"""이벤트 스크립트. 단계별 지연 + 동작을 순서대로 실행.
+
+    script = (EventScript()
+              .focus(room.messages[-1])
+              .post(room, "안녕", delay=0.05)
+              .select(room.messages[-2], delay=0.05))
+    script.run(sim)             # 지연 그대로 (1x)
+    script.run(sim, speed=4.0)  # 4배속
+    script.run(sim, speed=None) # 지연 없이
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from .elements import SimElement
+from .uia import STRUCTURE_CHILD_ADDED
+
+
+@dataclass
+class ScriptStep:
+    delay: float  # 이전 단계 후 대기 (초)
+    action: str
+    args: tuple = ()
+    kwargs: dict = field(default_factory=dict)
+
+
+class EventScript:
+    """SimKakaoTalk에 대한 동작 목록. 빌더 메서드는 self 반환."""
+
+    def __init__(self):
+        self.steps: list[ScriptStep] = []
+
+    def _add(self, action: str, delay: float, *args, **kwargs) -> "EventScript":
+        self.steps.append(ScriptStep(delay, action, args, kwargs))
+        return self
+
+    def focus(self, element: SimElement, delay: float = 0.0) -> "EventScript":
+        return self._add("focus", delay, element)
+
+    def select(self, element: SimElement, delay: float = 0.0) -> "EventScript":
+        return self._add("select", delay, element)
+
+    def structure(self, element: SimElement, change_type: int = STRUCTURE_CHILD_ADDED,
+                  delay: float = 0.0) -> "EventScript":
+        return self._add("structure", delay, element, change_type)
+
+    def post(self, room, text: Optional[str] = None, delay: float = 0.0) -> "EventScript":
+        return self._add("post", delay, room, text)
+
+    def foreground(self, target, delay: float = 0.0) -> "EventScript":
+        return self._add("foreground", delay, target)
+
+    def open_menu(self, delay: float = 0.0, **kwargs) -> "EventScript":
+        return self._add("open_menu", delay, **kwargs)
+
+    def close_menu(self, delay: float = 0.0) -> "EventScript":
+        return self._add("close_menu", delay)
+
+    def call(self, func: Callable, *args, delay: float = 0.0) -> "EventScript":
+        return self._add("call", delay, func, *args)
+
+    @property
+    def duration(self) -> float:
+        return sum(step.delay for step in self.steps)
+
+    def run(self, sim, speed: Optional[float] = 1.0) -> int:
+        """단계 실행. speed=None/0이면 지연 없이. 실행한 단계 수 반환."""
+        handlers = {
+            "focus": sim.focus,
+            "select": sim.select,
+            "structure": sim.uia.emit_structure_changed,
+            "post": sim.post_message,
+            "foreground": sim.activate,
+            "open_menu": sim.open_menu,
+            "close_menu": sim.close_menu,
+        }
+        for step in self.steps:
+            if speed and step.delay > 0:
+                time.sleep(step.delay / speed)
+            if step.action == "call":
+                func, *args = step.args
+                func(*args)
+            else:
+                handlers[step.action](*step.args, **step.kwargs)
+        return len(self.steps)
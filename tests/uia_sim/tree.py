@@ -0,0 +1,71 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025-2026 dnz3d4c
+"""규칙적인 합성 트리 (트리 덤프/비교 테스트·벤치마크용).
+
+build_tree(): 창 아래 breadth^depth 규모 SimElement 트리. 왕복은 루트의 RoundTripCounter에 기록.
+dump_cache_request(): uia_cache_request의 덤프용 CacheRequest와 같은 속성 구성.
+"""
+
+from .counter import RoundTripCounter
+from .elements import (
+    SimCacheRequest,
+    SimElement,
+    SimRect,
+    TreeScope_Children,
+    TreeScope_Element,
+    TreeScope_Subtree,
+    UIA_AutomationIdPropertyId,
+    UIA_BoundingRectanglePropertyId,
+    UIA_ClassNamePropertyId,
+    UIA_ControlTypePropertyId,
+    UIA_NamePropertyId,
+    UIA_RuntimeIdPropertyId,
+)
+
+# 레벨별 컨트롤 타입 (루트=창, 그 아래 반복)
+_LEVEL_TYPES = ("WindowControl", "PaneControl", "ListControl", "ListItemControl",
+                "TextControl", "ButtonControl")
+
+
+def build_tree(breadth: int = 4, depth: int = 4, call_us: float = 0.0) -> SimElement:
+    """breadth^depth 규모 트리. 노드 수 = (breadth^(depth+1) - 1) / (breadth - 1).
+
+    노드 번호 n은 레벨 순 (루트=1): AutomationId "id{n}", RuntimeId (42, 7, n).
+    call_us > 0이면 왕복마다 그만큼 대기 (프로세스 간 COM 비용 흉내).
+    """
+    counter = RoundTripCounter(call_us)
+    serial = iter(range(1, 1 << 30))
+
+    def make(level: int, label: str) -> SimElement:
+        n = next(serial)
+        return SimElement(
+            label,
+            _LEVEL_TYPES[min(level, len(_LEVEL_TYPES) - 1)],
+            "EVA_Window_Dblclk" if level == 0 else f"EVA_Child{level}",
+            f"id{n}",
+            rect=SimRect(n, n, n + 100, n + 20),
+            runtime_id=(42, 7, n),
+            counter=counter,
+        )
+
+    root = make(0, "카카오톡")
+    frontier = [root]
+    for level in range(1, depth + 1):
+        next_frontier = []
+        for parent in frontier:
+            for i in range(breadth):
+                next_frontier.append(parent.add(make(level, f"항목 {level}-{i}")))
+        frontier = next_frontier
+    return root
+
+
+def dump_cache_request(per_level: bool = False, include_coords: bool = True) -> SimCacheRequest:
+    """덤프용 CacheRequest. per_level이면 요소+직계 자식 (budget 덤프), 아니면 하위 트리 전체."""
+    cache_request = SimCacheRequest()
+    cache_request.TreeScope = (TreeScope_Element | TreeScope_Children) if per_level else TreeScope_Subtree
+    for prop in (UIA_ControlTypePropertyId, UIA_NamePropertyId, UIA_ClassNamePropertyId,
+                 UIA_AutomationIdPropertyId, UIA_RuntimeIdPropertyId):
+        cache_request.AddProperty(prop)
+    if include_coords:
+        cache_request.AddProperty(UIA_BoundingRectanglePropertyId)
+    return cache_request
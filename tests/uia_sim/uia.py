@@ -0,0 +1,221 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025-2026 dnz3d4c
+"""IUIAutomation 대역 + 스크립트 이벤트 발생.
+
+_create_uia_client() 자리에 끼워 넣으면 앱 코드가 등록한 COM 핸들러
+(HandleFocusChangedEvent / HandleStructureChangedEvent / HandleAutomationEvent)를
+emit_*()가 호출하는 스레드에서 그대로 부름. 등록 시 받은 CacheRequest로
+sender에 Cached* 스냅샷을 붙여서 전달 (이벤트 전달 자체는 왕복으로 안 셈).
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from .counter import RoundTripCounter
+from .elements import (
+    SimCacheRequest,
+    SimCOMError,
+    SimElement,
+    TreeScope_Children,
+    TreeScope_Descendants,
+    TreeScope_Element,
+    TreeScope_Subtree,
+)
+from .windows import FakeWindowSystem
+
+# StructureChangeType
+STRUCTURE_CHILD_ADDED = 0
+STRUCTURE_CHILD_REMOVED = 1
+STRUCTURE_CHILDREN_INVALIDATED = 2
+STRUCTURE_CHILDREN_BULK_ADDED = 3
+STRUCTURE_CHILDREN_BULK_REMOVED = 4
+STRUCTURE_CHILDREN_REORDERED = 5
+
+# 이벤트 ID
+UIA_ELEMENT_SELECTED_EVENT_ID = 20012
+UIA_MENU_OPENED_EVENT_ID = 20003
+UIA_MENU_CLOSED_EVENT_ID = 20007
+
+FOCUS = "focus"
+STRUCTURE = "structure"
+AUTOMATION = "automation"
+
+
+@dataclass
+class _Registration:
+    kind: str
+    handler: object
+    cache_request: Optional[SimCacheRequest] = None
+    element: Optional[SimElement] = None
+    scope: int = TreeScope_Subtree
+    event_id: int = 0
+
+    def covers(self, element: SimElement) -> bool:
+        if self.element is None:
+            return True
+        scope = self.scope or TreeScope_Subtree  # 비Windows 폴백 상수는 None
+        if scope & TreeScope_Element and element.is_same(self.element):
+            return True
+        parent = element.parent
+        if scope & TreeScope_Children and parent is not None and parent.is_same(self.element):
+            return True
+        return bool(scope & TreeScope_Descendants) and element.is_descendant_of(self.element)
+
+
+class SimUIAClient:
+    """IUIAutomation. 핸들러 등록/해제 + emit_*()로 이벤트 주입."""
+
+    def __init__(
+        self,
+        root: SimElement,
+        windows: FakeWindowSystem,
+        counter: Optional[RoundTripCounter] = None,
+    ):
+        self.root = root
+        self.windows = windows
+        self.counter = counter or root.counter
+        self.focused: Optional[SimElement] = None
+        self.RawViewCondition = object()
+        self.ControlViewCondition = object()
+        self._registrations: list[_Registration] = []
+        self._changed = threading.Condition()
+        self.delivered = {FOCUS: 0, STRUCTURE: 0, AUTOMATION: 0}
+
+    # === IUIAutomation ===
+
+    def CreateCacheRequest(self) -> SimCacheRequest:
+        # UIA 코어는 클라이언트 프로세스 안 (왕복 아님)
+        return SimCacheRequest()
+
+    def GetRootElement(self) -> SimElement:
+        self.counter.hit("GetRootElement")
+        return self.root
+
+    def ElementFromHandle(self, hwnd: int) -> SimElement:
+        self.counter.hit("ElementFromHandle")
+        element = self.windows.element_for(hwnd)
+        if element is None:
+            raise SimCOMError(f"ElementFromHandle: no element for hwnd {hwnd}")
+        return element
+
+    def GetFocusedElement(self) -> Optional[SimElement]:
+        self.counter.hit("GetFocusedElement")
+        return self.focused
+
+    def GetFocusedElementBuildCache(self, cache_request: SimCacheRequest) -> Optional[SimElement]:
+        self.counter.hit("GetFocusedElementBuildCache")
+        focused = self.focused
+        return focused.with_cache(cache_request) if focused is not None else None
+
+    def CompareElements(self, a: SimElement, b: SimElement) -> bool:
+        self.counter.hit("CompareElements")
+        return a.is_same(b)
+
+    # === 핸들러 등록 ===
+
+    def _register(self, api: str, registration: _Registration) -> None:
+        self.counter.hit(api)
+        with self._changed:
+            self._registrations.append(registration)
+            self._changed.notify_all()
+
+    def _unregister(self, api: str, kind: str, handler, event_id: int = 0) -> None:
+        self.counter.hit(api)
+        with self._changed:
+            self._registrations = [
+                r for r in self._registrations
+                if not (r.kind == kind and r.handler is handler
+                        and (not event_id or r.event_id == event_id))
+            ]
+            self._changed.notify_all()
+
+    def AddFocusChangedEventHandler(self, cache_request, handler) -> None:
+        self._register("AddFocusChangedEventHandler",
+                       _Registration(FOCUS, handler, cache_request))
+
+    def RemoveFocusChangedEventHandler(self, handler) -> None:
+        self._unregister("RemoveFocusChangedEventHandler", FOCUS, handler)
+
+    def AddStructureChangedEventHandler(self, element, scope, cache_request, handler) -> None:
+        self._register("AddStructureChangedEventHandler",
+                       _Registration(STRUCTURE, handler, cache_request, element, scope))
+
+    def RemoveStructureChangedEventHandler(self, element, handler) -> None:
+        self._unregister("RemoveStructureChangedEventHandler", STRUCTURE, handler)
+
+    def AddAutomationEventHandler(self, event_id, element, scope, cache_request, handler) -> None:
+        self._register("AddAutomationEventHandler",
+                       _Registration(AUTOMATION, handler, cache_request, element, scope, event_id))
+
+    def RemoveAutomationEventHandler(self, event_id, element, handler) -> None:
+        self._unregister("RemoveAutomationEventHandler", AUTOMATION, handler, event_id)
+
+    def RemoveAllEventHandlers(self) -> None:
+        self.counter.hit("RemoveAllEventHandlers")
+        with self._changed:
+            self._registrations = []
+            self._changed.notify_all()
+
+    def handler_count(self, kind: Optional[str] = None, event_id: int = 0, handler=None) -> int:
+        with self._changed:
+            return sum(1 for r in self._registrations
+                       if (kind is None or r.kind == kind)
+                       and (not event_id or r.event_id == event_id)
+                       and (handler is None or r.handler is handler))
+
+    def wait_for_handlers(self, kind: str, count: int = 1, timeout: float = 2.0,
+                          event_id: int = 0) -> bool:
+        """모니터 스레드가 핸들러를 등록할 때까지 대기."""
+        deadline = time.monotonic() + timeout
+        with self._changed:
+            while self.handler_count(kind, event_id) < count:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._changed.wait(remaining)
+        return True
+
+    # === 이벤트 주입 ===
+
+    def _targets(self, kind: str, element: SimElement, event_id: int = 0) -> list[_Registration]:
+        with self._changed:
+            return [r for r in self._registrations
+                    if r.kind == kind and (not event_id or r.event_id == event_id)
+                    and r.covers(element)]
+
+    def emit_focus_changed(self, element: SimElement) -> int:
+        """포커스 이동 + FocusChanged 전달. 받은 핸들러 수 반환."""
+        self.focused = element
+        targets = self._targets(FOCUS, element)
+        for registration in targets:
+            sender = element.with_cache(registration.cache_request)
+            registration.handler.HandleFocusChangedEvent(sender)
+        self.delivered[FOCUS] += len(targets)
+        return len(targets)
+
+    def emit_structure_changed(
+        self,
+        element: SimElement,
+        change_type: int = STRUCTURE_CHILD_ADDED,
+        runtime_id: Optional[tuple] = None,
+    ) -> int:
+        targets = self._targets(STRUCTURE, element)
+        runtime_id = list(runtime_id if runtime_id is not None else element.runtime_id)
+        for registration in targets:
+            sender = element.with_cache(registration.cache_request)
+            registration.handler.HandleStructureChangedEvent(sender, change_type, runtime_id)
+        self.delivered[STRUCTURE] += len(targets)
+        return len(targets)
+
+    def emit_automation_event(self, event_id: int, element: SimElement) -> int:
+        targets = self._targets(AUTOMATION, element, event_id)
+        for registration in targets:
+            sender = element.with_cache(registration.cache_request)
+            registration.handler.HandleAutomationEvent(sender, event_id)
+        self.delivered[AUTOMATION] += len(targets)
+        return len(targets)
+
+    def emit_element_selected(self, element: SimElement) -> int:
+        return self.emit_automation_event(UIA_ELEMENT_SELECTED_EVENT_ID, element)
@@ -0,0 +1,170 @@
+# SPDX-License-Identifier: MIT
+# Copyright 2025-2026 dnz3d4c
+"""가짜 창 시스템. win32gui 모듈 자리에 그대로 끼워 넣음.
+
+앱이 쓰는 win32gui 함수만 구현. 호출마다 "win32gui.<함수>"로 왕복 기록.
+EnumWindows는 최상위 창만 Z 순서(포그라운드 먼저)로 열거.
+"""
+
+import itertools
+import threading
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from .counter import RoundTripCounter
+from .elements import SimElement
+
+
+class SimWin32Error(OSError):
+    """pywintypes.error 흉내 (잘못된 hwnd 등)."""
+
+
+@dataclass
+class SimWindow:
+    hwnd: int
+    class_name: str
+    title: str = ""
+    parent: int = 0  # 0이면 최상위 창
+    visible: bool = True
+    iconic: bool = False
+    rect: tuple = (0, 0, 800, 600)
+    element: Optional[SimElement] = None
+
+
+class FakeWindowSystem:
+    """win32gui 대역. 창 생성/제거/포그라운드 전환은 소문자 메서드 (세지 않음)."""
+
+    def __init__(self, counter: Optional[RoundTripCounter] = None):
+        self.counter = counter or RoundTripCounter()
+        self._windows: dict[int, SimWindow] = {}
+        self._z_order: list[int] = []  # 최상위 창, 앞쪽이 위
+        self._foreground = 0
+        self._hwnds = itertools.count(0x10010, 0x10)
+        self._lock = threading.RLock()
+
+    # === 시뮬레이터 조작 ===
+
+    def create_window(
+        self,
+        class_name: str,
+        title: str = "",
+        *,
+        parent: int = 0,
+        rect: tuple = (0, 0, 800, 600),
+        visible: bool = True,
+        element: Optional[SimElement] = None,
+    ) -> SimWindow:
+        """새 창. element 주면 그 요소의 hwnd로 씀 (없으면 새 hwnd)."""
+        with self._lock:
+            hwnd = element.hwnd if element is not None and element.hwnd else next(self._hwnds)
+            window = SimWindow(hwnd, class_name, title, parent, visible, False, rect, element)
+            self._windows[hwnd] = window
+            if not parent:
+                self._z_order.insert(0, hwnd)
+            return window
+
+    def allocate_hwnd(self) -> int:
+        return next(self._hwnds)
+
+    def destroy_window(self, hwnd: int) -> None:
+        with self._lock:
+            for child in [w.hwnd for w in self._windows.values() if w.parent == hwnd]:
+                self.destroy_window(child)
+            self._windows.pop(hwnd, None)
+            if hwnd in self._z_order:
+                self._z_order.remove(hwnd)
+            if self._foreground == hwnd:
+                self._foreground = self._z_order[0] if self._z_order else 0
+
+    def set_foreground(self, hwnd: int) -> None:
+        with self._lock:
+            self._require(hwnd)
+            if hwnd in self._z_order:
+                self._z_order.remove(hwnd)
+                self._z_order.insert(0, hwnd)
+            self._foreground = hwnd
+
+    def window(self, hwnd: int) -> Optional[SimWindow]:
+        return self._windows.get(hwnd)
+
+    def element_for(self, hwnd: int) -> Optional[SimElement]:
+        window = self._windows.get(hwnd)
+        return window.element if window else None
+
+    @property
+    def foreground(self) -> int:
+        return self._foreground
+
+    @property
+    def top_level(self) -> list[int]:
+        return list(self._z_order)
+
+    def _require(self, hwnd: int) -> SimWindow:
+        window = self._windows.get(hwnd)
+        if window is None:
+            raise SimWin32Error(1400, "Invalid window handle.")
+        return window
+
+    # === win32gui API ===
+
+    def GetForegroundWindow(self) -> int:
+        self.counter.hit("win32gui.GetForegroundWindow")
+        return self._foreground
+
+    def SetForegroundWindow(self, hwnd: int) -> None:
+        self.counter.hit("win32gui.SetForegroundWindow")
+        self.set_foreground(hwnd)
+
+    def GetClassName(self, hwnd: int) -> str:
+        self.counter.hit("win32gui.GetClassName")
+        return self._require(hwnd).class_name
+
+    def GetWindowText(self, hwnd: int) -> str:
+        self.counter.hit("win32gui.GetWindowText")
+        window = self._windows.get(hwnd)
+        return window.title if window else ""
+
+    def IsWindow(self, hwnd: int) -> bool:
+        self.counter.hit("win32gui.IsWindow")
+        return hwnd in self._windows
+
+    def IsWindowVisible(self, hwnd: int) -> bool:
+        self.counter.hit("win32gui.IsWindowVisible")
+        window = self._windows.get(hwnd)
+        return bool(window and window.visible)
+
+    def IsIconic(self, hwnd: int) -> bool:
+        self.counter.hit("win32gui.IsIconic")
+        window = self._windows.get(hwnd)
+        return bool(window and window.iconic)
+
+    def ShowWindow(self, hwnd: int, cmd: int) -> bool:
+        self.counter.hit("win32gui.ShowWindow")
+        window = self._require(hwnd)
+        was_visible = window.visible
+        window.visible = cmd != 0  # SW_HIDE
+        window.iconic = cmd in (2, 6, 7)  # SW_SHOWMINIMIZED, SW_MINIMIZE, SW_SHOWMINNOACTIVE
+        return was_visible
+
+    def EnumWindows(self, callback: Callable[[int, object], bool], extra) -> None:
+        """pywin32처럼 콜백이 False를 반환하면 중단 + 예외."""
+        self.counter.hit("win32gui.EnumWindows")
+        for hwnd in list(self._z_order):
+            if hwnd not in self._windows:
+                continue
+            if callback(hwnd, extra) is False:
+                raise SimWin32Error(0, "EnumWindows", "callback stopped enumeration")
+
+    def GetWindowRect(self, hwnd: int) -> tuple:
+        self.counter.hit("win32gui.GetWindowRect")
+        return self._require(hwnd).rect
+
+    def GetClientRect(self, hwnd: int) -> tuple:
+        self.counter.hit("win32gui.GetClientRect")
+        left, top, right, bottom = self._require(hwnd).rect
+        return (0, 0, right - left, bottom - top)
+
+    def ClientToScreen(self, hwnd: int, point: tuple) -> tuple:
+        self.counter.hit("win32gui.ClientToScreen")
+        left, top, _, _ = self._require(hwnd).rect
+        return (left + point[0], top + point[1])
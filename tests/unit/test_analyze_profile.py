@@ -0,0 +1,158 @@
+# SPDX-License-Identifier: MIT
+"""scripts/analyze_profile.py 단위 테스트."""
+
+import importlib.util
+import json
+import random
+import statistics
+import sys
+from pathlib import Path
+
+import pytest
+
+from tests.uia_sim import platform_modules
+
+with platform_modules():
+    from kakaotalk_a11y_client.utils import profiler as profiler_module
+    from kakaotalk_a11y_client.utils.profiler import LogHistogram, UIAProfiler
+
+    _SCRIPT = Path(__file__).parents[2] / "scripts" / "analyze_profile.py"
+    _spec = importlib.util.spec_from_file_location("analyze_profile", _SCRIPT)
+    analyze_profile = importlib.util.module_from_spec(_spec)
+    sys.modules["analyze_profile"] = analyze_profile  # 프로세스 풀 pickle용
+    _spec.loader.exec_module(analyze_profile)
+
+
+def _write_log(path, timings, start_minute=0):
+    lines = []
+    for i, (name, ms) in enumerate(timings):
+        minute = start_minute + i // 60
+        clock = f"23:{minute % 60:02d}:{i % 60:02d}"
+        if ms > analyze_profile.SLOW_MS:
+            lines.append(f"2026-03-01 {clock},123 | WARNING | SLOW: {name} took {ms:.1f}ms")
+        else:
+            lines.append(f"2026-03-01 {clock},123 | DEBUG | {name}: {ms:.1f}ms")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+class TestOperationStats:
+    """스트리밍 통계 테스트."""
+
+    def test_online_mean_std_match_exact(self):
+        values = [random.Random(1).uniform(1, 200) for _ in range(500)]
+        op = analyze_profile.OperationStats("op")
+        for v in values:
+            op.add(v)
+        assert op.avg == pytest.approx(statistics.mean(values))
+        assert op.std == pytest.approx(statistics.stdev(values))
+        assert op.slow_count == sum(1 for v in values if v > 100)
+
+    def test_merge_equals_single_pass(self):
+        rng = random.Random(2)
+        values = [rng.expovariate(1 / 30) for _ in range(1000)]
+        whole = analyze_profile.OperationStats("op")
+        a = analyze_profile.OperationStats("op")
+        b = analyze_profile.OperationStats("op")
+        for i, v in enumerate(values):
+            whole.add(v)
+            (a if i % 3 else b).add(v)
+        a.merge(b)
+
+        assert a.count == whole.count
+        assert a.avg == pytest.approx(whole.avg)
+        assert a.std == pytest.approx(whole.std)
+        assert a.hist.counts == whole.hist.counts
+        assert a.percentile(50) == whole.percentile(50)
+
+
+class TestParsing:
+    """로그/리포트 파싱 테스트."""
+
+    def test_serial_and_parallel_same_result(self, tmp_path):
+        for n in range(3):
+            _write_log(tmp_path / f"profile_{n}.log",
+                       [("find_menu", 10.0 + n), ("right_click", 150.0)] * 40)
+        sources = analyze_profile.collect_sources([tmp_path])
+
+        serial = analyze_profile.parse_sources(sources, jobs=1)
+        parallel = analyze_profile.parse_sources(sources, jobs=2)
+
+        assert serial.files == parallel.files == 3
+        for name in ("find_menu", "right_click"):
+            assert serial.operations[name].count == parallel.operations[name].count == 120
+            assert serial.operations[name].avg == pytest.approx(parallel.operations[name].avg)
+        assert serial.operations["right_click"].slow_count == 120
+        assert serial.timeline == parallel.timeline
+
+    def test_timeline_wraps_midnight(self, tmp_path):
+        log = tmp_path / "profile_x.log"
+        log.write_text("2026-03-01 23:58:00,000 | DEBUG | op: 5.0ms\n", encoding="utf-8")
+        session = analyze_profile.parse_log_file(log)
+        assert [b["time"] for b in analyze_profile.get_timeline_analysis(session)] == ["23:55-00:00"]
+
+    def test_filter_and_time_range(self, tmp_path):
+        _write_log(tmp_path / "profile_a.log", [("find_menu", 10.0), ("other", 5.0)] * 90)
+        session = analyze_profile.parse_log_file(
+            tmp_path / "profile_a.log", filter_pattern="MENU",
+            time_range=analyze_profile.parse_time_range("23:00-23:01"))
+        assert list(session.operations) == ["find_menu"]
+        # 23:00:00 ~ 23:01:00 (끝 시각 포함) 61줄 중 짝수 줄
+        assert session.operations["find_menu"].count == 31
+
+    def test_save_report_json_input(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(profiler_module, "log_dir", tmp_path)
+        profiler = UIAProfiler()
+        for v in range(1, 201):
+            profiler._record("find_menu", float(v))
+        path = profiler.save_report(tmp_path / "report.txt").with_suffix(".json")
+
+        session = analyze_profile.parse_sources([path], jobs=1)
+        op = session.operations["find_menu"]
+        assert op.count == 200
+        assert op.avg == pytest.approx(100.5)
+        assert op.hist.count == 200
+        assert op.percentile(50) == pytest.approx(100, rel=0.05)
+        assert op.slow_count == pytest.approx(100, abs=4)
+        assert "find_menu" in analyze_profile.generate_report(session)
+
+
+class TestCompare:
+    """세션 비교 테스트."""
+
+    def _session(self, tmp_path, name, scale, seed):
+        rng = random.Random(seed)
+        path = tmp_path / f"{name}.log"
+        _write_log(path, [("stable", rng.gauss(20, 2)) for _ in range(200)]
+                   + [("slow_op", rng.gauss(20, 2) * scale) for _ in range(200)])
+        return analyze_profile.parse_sources([path], jobs=1)
+
+    def test_flags_only_real_regression(self, tmp_path):
+        base = self._session(tmp_path, "base", 1.0, seed=1)
+        curr = self._session(tmp_path, "curr", 1.5, seed=2)
+        results, new_ops, removed_ops = analyze_profile.compare_sessions(base, curr)
+        verdicts = {r.name: r.verdict for r in results}
+
+        assert verdicts == {"slow_op": "regressed", "stable": "unchanged"}
+        assert not new_ops and not removed_ops
+        report = analyze_profile.generate_comparison_report(
+            results, new_ops, removed_ops, "base", "curr", 0.01, 10.0)
+        assert "## 성능 저하 (유의)" in report
+
+    def test_small_samples_untested(self, tmp_path):
+        base = analyze_profile.SessionStats()
+        curr = analyze_profile.SessionStats()
+        for v in (1.0, 2.0, 3.0):
+            base.operation("op").add(v)
+            curr.operation("op").add(v * 10)
+        curr.operation("new_op").add(1.0)
+        results, new_ops, _ = analyze_profile.compare_sessions(base, curr)
+        assert results[0].verdict == "untested"
+        assert new_ops == ["new_op"]
+
+    def test_mann_whitney_identical_is_not_significant(self):
+        hist = LogHistogram()
+        for v in range(1, 100):
+            hist.record(float(v))
+        z, p = analyze_profile.mann_whitney(hist, hist)
+        assert z == pytest.approx(0.0)
+        assert p == pytest.approx(1.0)
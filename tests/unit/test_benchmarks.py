@@ -0,0 +1,114 @@
+# SPDX-License-Identifier: MIT
+"""마이크로벤치마크 러너 + 기준선 비교 테스트."""
+
+import json
+
+import pytest
+
+import benchmarks
+from benchmarks import __main__ as cli
+from benchmarks import runner
+from benchmarks.bench_detector import PLACED, synthetic_scene
+
+
+def _result(name: str, min_ns: float) -> runner.BenchResult:
+    return runner.BenchResult(name, min_ns, min_ns, min_ns, 0.0, 1, 1)
+
+
+class TestCompare:
+    """최솟값 변화율 분류."""
+
+    def test_verdicts(self):
+        baseline = {"a": _result("a", 100), "b": _result("b", 100), "c": _result("c", 100),
+                    "gone": _result("gone", 100)}
+        current = {"a": _result("a", 125), "b": _result("b", 70), "c": _result("c", 110),
+                   "added": _result("added", 5)}
+
+        verdicts = {c.name: c.verdict for c in runner.compare(baseline, current, 20.0)}
+
+        assert verdicts == {"a": runner.REGRESSED, "b": runner.IMPROVED, "c": runner.UNCHANGED,
+                            "gone": runner.REMOVED, "added": runner.NEW}
+
+    def test_threshold_boundary(self):
+        comparisons = runner.compare({"a": _result("a", 100)}, {"a": _result("a", 120)}, 20.0)
+        assert comparisons[0].verdict == runner.REGRESSED
+        assert comparisons[0].change_pct == pytest.approx(20.0)
+
+
+class TestRunner:
+    """측정 + 등록 벤치마크 실행."""
+
+    def test_measure_fixed_loops(self):
+        calls = []
+        result = runner.measure("x", lambda: calls.append(1), repeats=3, loops=10)
+
+        assert len(calls) == 30
+        assert result.repeats == 3 and result.loops == 10
+        assert result.min_ns <= result.median_ns <= result.max_ns
+
+    def test_generator_teardown_and_skip(self, monkeypatch):
+        monkeypatch.setattr(runner, "MIN_REPEAT_SECS", 0.0)
+        closed = []
+
+        def with_teardown():
+            try:
+                yield lambda: None
+            finally:
+                closed.append(True)
+
+        def broken():
+            raise RuntimeError("no display")
+
+        report = runner.run([runner.Benchmark("ok", with_teardown), runner.Benchmark("bad", broken)],
+                            repeats=1)
+
+        assert list(report.results) == ["ok"]
+        assert closed == [True]
+        assert report.skipped == {"bad": "RuntimeError: no display"}
+
+    def test_baseline_roundtrip(self, tmp_path):
+        report = runner.BenchReport(results={"a": _result("a", 42.0)})
+        path = runner.save_baseline(report, tmp_path / "sub" / "base.json")
+
+        assert runner.load_baseline(path) == report.results
+        assert "python" in json.loads(path.read_text(encoding="utf-8"))["environment"]
+
+    def test_registered_covers_hot_paths(self):
+        names = {b.name for b in benchmarks.registered()}
+        for prefix in ("coalescer.", "uia_cache.", "list_filter.", "focus_service.on_focus_event",
+                       "focus_service.is_duplicate", "hwnd_cached.", "detector.detect_emojis"):
+            assert any(name.startswith(prefix) for name in names), prefix
+
+
+class TestCli:
+    """python -m benchmarks 종료 코드."""
+
+    @pytest.fixture(autouse=True)
+    def fast(self, monkeypatch):
+        monkeypatch.setattr(runner, "MIN_REPEAT_SECS", 0.0)
+
+    def test_regression_exits_2(self, tmp_path, capsys):
+        path = tmp_path / "base.json"
+        fast = {"uia_cache.get_hit": _result("uia_cache.get_hit", 0.001)}
+        runner.save_baseline(runner.BenchReport(results=fast), path)
+
+        code = cli.main(["--filter", "uia_cache.get_hit", "--repeats", "1", "--baseline", str(path)])
+
+        assert code == 2
+        assert "regressed" in capsys.readouterr().out
+
+    def test_save_then_compare(self, tmp_path):
+        path = tmp_path / "base.json"
+        args = ["--filter", "uia_cache.get_hit", "--repeats", "1", "--baseline", str(path)]
+
+        assert cli.main(args + ["--save-baseline"]) == 0
+        assert cli.main(args + ["--threshold", "1e9"]) == 0
+
+
+def test_synthetic_scene_detected():
+    from kakaotalk_a11y_client.detector import detect_emojis
+
+    image, templates = synthetic_scene()
+    found = detect_emojis(image, templates)
+
+    assert [d["id"] for d in found] == list(range(1, PLACED + 1))
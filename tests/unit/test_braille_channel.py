@@ -0,0 +1,152 @@
+# SPDX-License-Identifier: MIT
+"""점자 출력 채널 단위 테스트."""
+
+import threading
+import time
+
+import pytest
+
+from kakaotalk_a11y_client.accessibility import BrailleChannel
+
+
+class RecordingWriter:
+    """braille() 호출 기록. block 설정 시 기록 전 대기."""
+
+    def __init__(self):
+        self.texts = []
+        self.written = threading.Event()
+        self.block = None
+
+    def __call__(self, text: str) -> None:
+        if self.block is not None:
+            self.block.wait(1.0)
+        self.texts.append(text)
+        self.written.set()
+
+
+def _wait_until(predicate, timeout=1.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+@pytest.fixture
+def writer():
+    return RecordingWriter()
+
+
+class TestBrailleChannel:
+    """BrailleChannel 테스트."""
+
+    def test_single_submit_written(self, writer):
+        channel = BrailleChannel(writer, min_interval=0.05)
+        try:
+            channel.submit("안녕")
+            assert writer.written.wait(1.0)
+            assert writer.texts == ["안녕"]
+        finally:
+            channel.stop()
+
+    def test_burst_writes_last_item(self, writer):
+        """간격 안의 연속 출력은 마지막 것만 기록."""
+        channel = BrailleChannel(writer, min_interval=0.2)
+        try:
+            channel.submit("첫 메시지")
+            assert writer.written.wait(1.0)
+
+            for i in range(10):
+                channel.submit(f"메시지 {i}")
+
+            assert _wait_until(lambda: len(writer.texts) == 2)
+            assert writer.texts[-1] == "메시지 9"
+
+            stats = channel.get_stats()
+            assert stats["written"] == 2
+            assert stats["suppressed"] == 9
+        finally:
+            channel.stop()
+
+    def test_burst_after_idle_writes_once(self, writer):
+        """쉬다가 온 연속 출력도 첫 항목을 바로 쓰지 않고 마지막 것만 기록."""
+        channel = BrailleChannel(writer, min_interval=0.1)
+        try:
+            channel.submit("준비")
+            assert writer.written.wait(1.0)
+            writer.written.clear()
+            time.sleep(0.2)  # 간격보다 오래 쉼
+
+            for i in range(10):
+                channel.submit(f"메시지 {i}")
+
+            assert writer.written.wait(1.0)
+            time.sleep(0.2)
+            assert writer.texts == ["준비", "메시지 9"]
+        finally:
+            channel.stop()
+
+    def test_submit_after_stop_ignored(self, writer):
+        channel = BrailleChannel(writer, min_interval=0.0)
+        channel.submit("처음")
+        assert writer.written.wait(1.0)
+        channel.stop()
+
+        channel.submit("정지 후")
+        time.sleep(0.05)
+        assert channel._thread is None
+        assert writer.texts == ["처음"]
+
+        writer.written.clear()
+        channel.start()
+        try:
+            channel.submit("재시작")
+            assert writer.written.wait(1.0)
+            assert writer.texts == ["처음", "재시작"]
+        finally:
+            channel.stop()
+
+    def test_submit_does_not_block_on_slow_writer(self, writer):
+        writer.block = threading.Event()
+        channel = BrailleChannel(writer, min_interval=0.0)
+        try:
+            channel.submit("느린 출력")
+            start = time.perf_counter()
+            channel.submit("다음")
+            assert time.perf_counter() - start < 0.05
+        finally:
+            writer.block.set()
+            channel.stop()
+
+    def test_writer_error_counted(self):
+        def failing(text):
+            raise OSError("display disconnected")
+
+        channel = BrailleChannel(failing, min_interval=0.0)
+        try:
+            channel.submit("텍스트")
+            assert _wait_until(lambda: channel.get_stats()["errors"] == 1)
+        finally:
+            channel.stop()
+
+    def test_no_thread_until_first_submit(self, writer):
+        channel = BrailleChannel(writer)
+        assert channel._thread is None
+        channel.stop()
+
+    def test_writer_runs_with_com_initialized(self, writer, monkeypatch):
+        from kakaotalk_a11y_client.utils import com_utils
+
+        com_threads = []
+        monkeypatch.setattr(com_utils, "init_com_for_thread",
+                            lambda: com_threads.append(threading.get_ident()) or True)
+        monkeypatch.setattr(com_utils, "uninit_com_for_thread", lambda: True)
+
+        channel = BrailleChannel(writer, min_interval=0.0)
+        try:
+            channel.submit("안녕")
+            assert writer.written.wait(1.0)
+            assert com_threads == [channel._thread.ident]
+        finally:
+            channel.stop()
@@ -173,3 +173,38 @@ class TestChatRoomNavigator:
 
         navigator.current_focused_item = None
         assert navigator.current_focused_item is None
+
+    def test_focused_rect_saved_with_focus(self, navigator, mock_adapter):
+        """포커스 설정 시 사각형 저장 (핫키 스레드는 COM 없이 읽음)."""
+        from types import SimpleNamespace
+
+        rect = SimpleNamespace(left=10, top=20, right=110, bottom=60)
+        navigator.current_focused_item = SimpleNamespace(Name="메시지", BoundingRectangle=rect)
+        assert navigator.focused_rect == (10, 20, 110, 60)
+
+        navigator.invalidate_focused_rect()
+        assert navigator.focused_rect is None
+        assert navigator.current_focused_item is not None
+
+        navigator.current_focused_item = SimpleNamespace(Name="메시지", BoundingRectangle=rect)
+        navigator.exit_chat_room()
+        assert navigator.focused_rect is None
+
+
+class TestMessageMonitorScanRegion:
+    """새 메시지로 목록이 밀리면 저장한 포커스 사각형 무효화."""
+
+    def test_new_messages_invalidate_focused_rect(self):
+        from types import SimpleNamespace
+
+        from kakaotalk_a11y_client.navigation.message_monitor import MessageMonitor
+        from kakaotalk_a11y_client.utils.uia_message_monitor import MessageEvent
+
+        navigator = ChatRoomNavigator(uia_adapter=MockUIAAdapter())
+        rect = SimpleNamespace(left=10, top=20, right=110, bottom=60)
+        navigator.current_focused_item = SimpleNamespace(Name="메시지", BoundingRectangle=rect)
+        monitor = MessageMonitor(navigator)
+
+        monitor._on_message_event(MessageEvent(new_count=1, timestamp=0.0, source="event"))
+
+        assert navigator.focused_rect is None
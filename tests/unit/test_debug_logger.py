@@ -0,0 +1,161 @@
+# SPDX-License-Identifier: MIT
+"""Logger 지연 포맷팅 단위 테스트."""
+
+import time
+from logging.handlers import RotatingFileHandler
+
+import pytest
+
+from kakaotalk_a11y_client.utils import debug
+from kakaotalk_a11y_client.utils.debug import Logger, LogLevel, _LogWriter
+
+
+class CapturingWriter:
+    """_LogWriter 대체. 큐에 들어간 줄 기록."""
+
+    def __init__(self):
+        self.lines = []
+
+    def write(self, line: str) -> None:
+        self.lines.append(line)
+
+    @property
+    def out(self) -> str:
+        return "\n".join(self.lines)
+
+
+@pytest.fixture
+def capture(monkeypatch):
+    writer = CapturingWriter()
+    monkeypatch.setattr(debug, "_writer", writer)
+    return writer
+
+
+class ExplodingArg:
+    """포맷되면 실패하는 인자. 비활성 레벨에서 포맷 안 되는지 확인용."""
+
+    def __str__(self):
+        raise AssertionError("formatted while disabled")
+
+
+class TestLogger:
+    """Logger 테스트."""
+
+    def test_disabled_level_is_noop(self):
+        log = Logger("test", LogLevel.NONE)
+        assert log.trace is debug._noop
+        assert log.trace_enabled is False
+        log.trace("value=%s", ExplodingArg())
+
+    def test_disabled_callable_not_called(self):
+        log = Logger("test", LogLevel.INFO)
+        called = []
+        log.debug(lambda: called.append(1) or "msg")
+        assert called == []
+
+    def test_percent_args_formatted(self, capture):
+        log = Logger("test", LogLevel.TRACE)
+        log.trace("[PASS] %s: %.5s", "ListItemControl", "가나다라마바사")
+        assert "[PASS] ListItemControl: 가나다라마" in capture.out
+
+    def test_callable_message(self, capture):
+        log = Logger("test", LogLevel.DEBUG)
+        log.debug(lambda: "lazy message")
+        assert "lazy message" in capture.out
+
+    def test_plain_message_with_percent(self, capture):
+        """인자 없으면 % 포맷 안 함 (기존 f-string 호출 호환)."""
+        log = Logger("test", LogLevel.INFO)
+        log.info("hit rate 50%")
+        assert "hit rate 50%" in capture.out
+
+    def test_bad_format_args_still_logged(self, capture):
+        log = Logger("test", LogLevel.INFO)
+        log.info("count=%d", "not a number")
+        assert "count=%d" in capture.out
+
+    def test_level_change_rebinds(self, capture):
+        log = Logger("test", LogLevel.NONE)
+        log.level = LogLevel.TRACE
+        assert log.trace_enabled is True
+        assert log.isEnabledFor(LogLevel.TRACE)
+        log.trace("now on")
+        assert "now on" in capture.out
+
+        log.level = LogLevel.WARNING
+        assert log.info is debug._noop
+        assert not log.isEnabledFor(LogLevel.INFO)
+
+
+class TestLogWriter:
+    """_LogWriter 백그라운드 기록 테스트."""
+
+    @pytest.fixture
+    def handler(self, tmp_path):
+        handler = RotatingFileHandler(
+            tmp_path / "debug.log", maxBytes=200, backupCount=2, encoding="utf-8"
+        )
+        yield handler
+        handler.close()
+
+    def test_close_flushes_all_lines(self, handler, tmp_path):
+        writer = _LogWriter(handler, console=False, flush_interval=10.0)
+        for i in range(5):
+            writer.write(f"line {i}")
+        writer.close()
+
+        content = "".join(p.read_text(encoding="utf-8") for p in tmp_path.glob("debug.log*"))
+        for i in range(5):
+            assert f"line {i}" in content
+        assert writer.get_stats()["written"] == 5
+
+    def test_batch_threshold_triggers_early_flush(self, handler):
+        writer = _LogWriter(handler, console=False, flush_interval=10.0, batch_lines=3)
+        try:
+            for i in range(3):
+                writer.write(f"x{i}")
+            deadline = time.monotonic() + 1.0
+            while writer.get_stats()["written"] < 3 and time.monotonic() < deadline:
+                time.sleep(0.005)
+            assert writer.get_stats()["written"] == 3
+        finally:
+            writer.close()
+
+    def test_flush_waits_for_batch_in_flight(self):
+        writer = _LogWriter(None, console=False, flush_interval=10.0)
+        original = writer._write_batch
+
+        def slow_write(lines):
+            time.sleep(0.1)  # 큐는 이미 비었고 기록은 아직
+            original(lines)
+
+        writer._write_batch = slow_write
+        try:
+            for i in range(3):
+                writer.write(f"line {i}")
+            assert writer.flush(timeout=2.0) is True
+            assert writer.get_stats()["written"] == 3
+        finally:
+            writer.close()
+
+    def test_overload_drops_instead_of_blocking(self):
+        writer = _LogWriter(None, console=False, flush_interval=10.0,
+                            batch_lines=1000, max_lines=10)
+        try:
+            for i in range(25):
+                writer.write(f"line {i}")
+            stats = writer.get_stats()
+            assert stats["dropped"] == 15
+            assert stats["queued"] == 10
+        finally:
+            writer.close()
+
+    def test_rotation(self, handler, tmp_path):
+        writer = _LogWriter(handler, console=False, flush_interval=0.01)
+        for i in range(20):
+            writer.write(f"rotation test line {i:03d} " + "가" * 10)
+            writer.flush()
+        writer.close()
+
+        assert (tmp_path / "debug.log.1").exists()
+        assert (tmp_path / "debug.log").stat().st_size <= 200
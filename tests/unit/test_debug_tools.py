@@ -0,0 +1,185 @@
+# SPDX-License-Identifier: MIT
+"""자동 덤프 워커/덤프 상한 단위 테스트."""
+
+import json
+import threading
+import time
+
+from kakaotalk_a11y_client.utils.debug_tools import AutoDumpWorker
+from kakaotalk_a11y_client.utils.uia_tree_dump import DumpBudget
+
+
+class BlockingHandler:
+    """release 전까지 덤프 처리를 막는 핸들러."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.calls = []
+
+    def __call__(self, trigger, context):
+        self.release.wait(2.0)
+        self.calls.append(trigger)
+
+
+class TestAutoDumpWorker:
+    """AutoDumpWorker 테스트."""
+
+    def test_submit_does_not_block(self):
+        handler = BlockingHandler()
+        worker = AutoDumpWorker(handler, queue_size=4)
+        try:
+            start = time.perf_counter()
+            worker.submit("slow_refresh", {})
+            assert time.perf_counter() - start < 0.1
+        finally:
+            handler.release.set()
+            worker.wait_idle()
+            worker.stop()
+        assert handler.calls == ["slow_refresh"]
+
+    def test_same_trigger_deduped_while_pending(self):
+        handler = BlockingHandler()
+        worker = AutoDumpWorker(handler, queue_size=4)
+        try:
+            assert worker.submit("error_refresh", {}) is True
+            assert worker.submit("error_refresh", {}) is False
+            assert worker.get_stats()["deduped"] == 1
+        finally:
+            handler.release.set()
+            worker.wait_idle()
+            worker.stop()
+
+    def test_full_queue_drops(self):
+        handler = BlockingHandler()
+        worker = AutoDumpWorker(handler, queue_size=1)
+        try:
+            worker.submit("a", {})
+            # 워커가 a를 꺼낼 때까지 대기 후 큐 채우기
+            time.sleep(0.05)
+            worker.submit("b", {})
+            assert worker.submit("c", {}) is False
+            assert worker.get_stats()["dropped"] == 1
+        finally:
+            handler.release.set()
+            worker.wait_idle()
+            worker.stop()
+        assert handler.calls == ["a", "b"]
+
+    def test_handler_error_does_not_stop_worker(self):
+        calls = []
+
+        def handler(trigger, context):
+            calls.append(trigger)
+            if trigger == "bad":
+                raise RuntimeError("boom")
+
+        worker = AutoDumpWorker(handler, queue_size=4)
+        try:
+            worker.submit("bad", {})
+            worker.submit("good", {})
+            assert worker.wait_idle()
+        finally:
+            worker.stop()
+        assert calls == ["bad", "good"]
+
+
+class TestDumpBudget:
+    """DumpBudget 테스트."""
+
+    def test_node_limit(self):
+        budget = DumpBudget(max_nodes=3)
+        assert [budget.take() for _ in range(5)] == [True, True, True, False, False]
+        assert budget.truncated is True
+        assert budget.nodes == 3
+
+    def test_time_limit(self):
+        budget = DumpBudget(max_seconds=0.01)
+        assert budget.take() is True
+        time.sleep(0.02)
+        assert budget.take() is False
+
+    def test_unlimited(self):
+        budget = DumpBudget()
+        assert all(budget.take() for _ in range(1000))
+        assert budget.truncated is False
+
+
+class TestAutoDumpDeltas:
+    """자동 덤프 델타 저장 테스트."""
+
+    def test_keyframe_then_delta(self, tmp_path, monkeypatch, fake_uia_tree):
+        from kakaotalk_a11y_client.utils import debug_tools
+        from kakaotalk_a11y_client.utils.debug_tools import DebugToolManager
+
+        monkeypatch.setattr(debug_tools.debug_config, "debug_output_dir", tmp_path)
+        monkeypatch.setattr(debug_tools.debug_config, "auto_dump_keyframe_interval", 3)
+        root = fake_uia_tree(breadth=2, depth=2)
+        manager = DebugToolManager()
+        monkeypatch.setattr(manager, "_find_kakao_window", lambda: root)
+
+        paths = [manager._write_auto_snapshot(f"auto_t{i}", DumpBudget())[0] for i in range(2)]
+        root.children[1].children[-1].remove()
+        path, stats = manager._write_auto_snapshot("auto_t2", DumpBudget())
+        paths.append(path)
+        paths.append(manager._write_auto_snapshot("auto_t3", DumpBudget())[0])
+
+        assert [p.name for p in paths] == [
+            "auto_t0.json", "auto_t1.delta.json", "auto_t2.delta.json", "auto_t3.json"
+        ]
+        unchanged = json.loads(paths[1].read_text(encoding="utf-8"))
+        assert unchanged["base"] == "auto_t0.json"
+        assert unchanged["removed"] == [] and unchanged["inserted"] == []
+
+        delta = json.loads(paths[2].read_text(encoding="utf-8"))
+        assert delta["base"] == "auto_t1.delta.json"
+        assert len(delta["removed"]) == 1
+        assert stats["nodes"] == 6
+        assert manager.last_dump_stats == {}  # 수동 덤프 전용
+
+    def test_truncated_snapshot_not_diffed(self, tmp_path, monkeypatch, fake_uia_tree):
+        from kakaotalk_a11y_client.utils import debug_tools
+        from kakaotalk_a11y_client.utils.debug_tools import DebugToolManager
+
+        monkeypatch.setattr(debug_tools.debug_config, "debug_output_dir", tmp_path)
+        monkeypatch.setattr(debug_tools.debug_config, "auto_dump_keyframe_interval", 10)
+        root = fake_uia_tree(breadth=2, depth=2)
+        manager = DebugToolManager()
+        monkeypatch.setattr(manager, "_find_kakao_window", lambda: root)
+
+        manager._write_auto_snapshot("auto_t0", DumpBudget())
+        path, stats = manager._write_auto_snapshot("auto_t1", DumpBudget(max_nodes=3))
+
+        # 잘린 쪽과 비교하면 잘린 노드가 삭제로 보임 → 비교 생략
+        assert stats["truncated"] is True
+        partial = json.loads(path.read_text(encoding="utf-8"))
+        assert partial["partial"] is True and "removed" not in partial
+
+        # 잘린 인덱스는 base로 안 씀 → 다음은 키프레임
+        path, stats = manager._write_auto_snapshot("auto_t2", DumpBudget())
+        assert path.name == "auto_t2.json"
+        path, stats = manager._write_auto_snapshot("auto_t3", DumpBudget())
+        delta = json.loads(path.read_text(encoding="utf-8"))
+        assert delta["base"] == "auto_t2.json" and delta["removed"] == []
+
+    def test_cleanup_keeps_whole_chains(self, tmp_path, monkeypatch):
+        import os
+
+        from kakaotalk_a11y_client.utils import debug_tools
+        from kakaotalk_a11y_client.utils.debug_tools import DebugToolManager
+
+        monkeypatch.setattr(debug_tools.debug_config, "debug_output_dir", tmp_path)
+        monkeypatch.setattr(debug_tools.debug_config, "max_dump_files", 2)
+        names = [
+            "auto_t0.json", "auto_t0.context.json", "auto_t1.delta.json", "auto_t1.context.json",
+            "auto_t2.json", "auto_t2.context.json", "auto_t3.delta.json", "auto_t3.context.json",
+            "auto_t4.delta.json", "auto_t4.context.json",
+        ]
+        for i, name in enumerate(names):
+            path = tmp_path / name
+            path.write_text("{}", encoding="utf-8")
+            os.utime(path, ns=(i * 10**9, i * 10**9))
+
+        DebugToolManager().cleanup_old_dumps()
+
+        # 파일 4개 상한이지만 최신 체인(키프레임 t2 + 델타 t3, t4)은 통째로 남음
+        assert sorted(p.name for p in tmp_path.iterdir()) == sorted(names[4:])
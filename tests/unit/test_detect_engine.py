@@ -0,0 +1,135 @@
+# SPDX-License-Identifier: MIT
+"""병렬 이모지 탐지: 결과 순서/직렬과 동일, 취소, 새 스캔이 이전 스캔 취소."""
+
+import threading
+
+import pytest
+
+from benchmarks.bench_detector import chat_scene, score_detections
+from kakaotalk_a11y_client.detect_engine import DetectionEngine, DetectJob, ScanCancelled, resolve_workers
+from kakaotalk_a11y_client.detector import detect_emojis, detect_emojis_in_regions, prepare_templates
+from kakaotalk_a11y_client.tile_cache import TileCache
+
+
+@pytest.fixture
+def engine():
+    engine = DetectionEngine(workers=4)
+    yield engine
+    engine.shutdown()
+
+
+@pytest.fixture(scope="module")
+def scene():
+    try:
+        image, templates, truth, _ = chat_scene()
+    except FileNotFoundError:
+        pytest.skip("emoji templates not found")
+    return image, prepare_templates(templates), truth
+
+
+class TestJob:
+    """DetectJob.map 순서 / 취소."""
+
+    def test_results_in_submission_order(self, engine):
+        release = threading.Event()
+
+        def work(item):
+            if item == 0:
+                release.wait(1.0)  # 첫 작업을 가장 늦게 끝냄
+            elif item == 7:
+                release.set()
+            return item * 10
+
+        assert engine.start_job().map(work, list(range(8))) == [i * 10 for i in range(8)]
+
+    def test_serial_without_pool(self):
+        caller = threading.get_ident()
+        assert DetectJob().map(lambda _: threading.get_ident(), [1, 2, 3]) == [caller] * 3
+
+    def test_cancel_stops_pending_work(self, engine):
+        job = engine.start_job()
+        done = []
+
+        def work(item):
+            if item == 0:
+                job.cancel()
+            done.append(item)
+
+        with pytest.raises(ScanCancelled):
+            job.map(work, list(range(100)))
+        assert len(done) < 100
+
+    def test_cancelled_job_rejects_new_work(self):
+        job = DetectJob()
+        job.cancel()
+        with pytest.raises(ScanCancelled):
+            job.check()
+
+
+class TestEngine:
+    """진행 중 job 관리."""
+
+    def test_new_scan_cancels_previous(self, engine):
+        first = engine.start_job()
+        second = engine.start_job()
+        assert first.cancelled and not second.cancelled
+
+    def test_cancel_reports_active_job(self, engine):
+        job = engine.start_job()
+        assert engine.cancel() is True
+        assert job.cancelled
+        assert engine.cancel() is False
+
+    def test_finished_job_not_cancelled(self, engine):
+        job = engine.start_job()
+        engine.finish_job(job)
+        assert not engine.busy
+        assert engine.cancel() is False
+        assert not job.cancelled
+
+    def test_auto_workers(self):
+        assert 1 <= resolve_workers(0) <= 4
+        assert resolve_workers(3) == 3
+
+    def test_pool_limits_opencv_threads(self, monkeypatch):
+        from kakaotalk_a11y_client import detect_engine
+
+        calls = []
+        monkeypatch.setattr(detect_engine.cv2, "setNumThreads", calls.append)
+        DetectionEngine(workers=1).start_job()
+        assert calls == []
+
+        engine = DetectionEngine(workers=2)
+        try:
+            engine.start_job()
+            engine.start_job()
+        finally:
+            engine.shutdown()
+        assert calls == [1]
+
+
+class TestParallelDetection:
+    """병렬 결과 = 직렬 결과."""
+
+    def test_templates_parallel_same_as_serial(self, scene, engine):
+        image, prepared, truth = scene
+        found = detect_emojis_in_regions([((0, 0), image)], prepared, job=engine.start_job())
+
+        assert found == detect_emojis(image, prepared)
+        assert score_detections(found, truth) == (1.0, 1.0)
+
+    def test_tiles_parallel_same_as_serial(self, scene, engine):
+        image, prepared, _ = scene
+        serial = detect_emojis_in_regions([((0, 0), image)], prepared, tile_cache=TileCache())
+        cache = TileCache()
+        found = detect_emojis_in_regions([((0, 0), image)], prepared, tile_cache=cache, job=engine.start_job())
+
+        assert found == serial
+        assert len(cache) == cache.totals.misses > 1
+
+    def test_cancelled_scan_raises(self, scene, engine):
+        image, prepared, _ = scene
+        job = engine.start_job()
+        engine.start_job()
+        with pytest.raises(ScanCancelled):
+            detect_emojis_in_regions([((0, 0), image)], prepared, job=job)
@@ -0,0 +1,245 @@
+# SPDX-License-Identifier: MIT
+"""이모지 탐지: 국소 최대, NMS, 전처리 템플릿, 이전 구현과 정확도 비교, 배율 피라미드."""
+
+import numpy as np
+import pytest
+
+from benchmarks.bench_detector import chat_scene, chat_screenshot, legacy_detect_emojis, score_detections
+from kakaotalk_a11y_client import detector
+from kakaotalk_a11y_client.config import CV_SCALE_CACHE_MAX_WINDOWS, CV_SCALE_MAX_MISSES
+from kakaotalk_a11y_client.detector import (
+    TemplatePyramid,
+    TemplateSet,
+    detect_emojis,
+    detect_emojis_multiscale,
+    find_peaks,
+    nms,
+    prepare_pyramid,
+    prepare_templates,
+    scale_templates,
+)
+
+
+@pytest.fixture(scope="module")
+def scene():
+    try:
+        return chat_screenshot()
+    except FileNotFoundError:
+        pytest.skip("emoji templates not found")
+
+
+class TestFindPeaks:
+    """dilate 비교 국소 최대."""
+
+    def test_one_peak_per_blob(self):
+        result = np.zeros((40, 40), dtype=np.float32)
+        result[10:13, 10:13] = 0.85
+        result[11, 11] = 0.95
+        result[30, 30] = 0.9
+
+        ys, xs = find_peaks(result, 0.8, radius=3)
+
+        assert sorted(zip(ys.tolist(), xs.tolist())) == [(11, 11), (30, 30)]
+
+    def test_below_threshold_ignored(self):
+        result = np.full((10, 10), 0.5, dtype=np.float32)
+        ys, _ = find_peaks(result, 0.8, radius=2)
+        assert ys.size == 0
+
+
+class TestNms:
+    """NumPy greedy NMS."""
+
+    def test_overlap_suppressed(self):
+        boxes = np.array([[0, 0, 10, 10], [1, 1, 11, 11], [50, 50, 60, 60]])
+        keep = nms(boxes, np.array([0.8, 0.9, 0.85]), 0.3)
+        assert keep.tolist() == [1, 2]
+
+    def test_tie_keeps_first(self):
+        boxes = np.array([[0, 0, 10, 10], [0, 0, 10, 10]])
+        assert nms(boxes, np.array([0.9, 0.9]), 0.3).tolist() == [0]
+
+    def test_empty(self):
+        assert nms(np.empty((0, 4)), np.empty(0)).size == 0
+
+
+class TestTemplateSet:
+    """전처리 템플릿."""
+
+    def test_unknown_mode_rejected(self):
+        with pytest.raises(ValueError):
+            TemplateSet({}, mode="sobel")
+
+    def test_empty_set_is_falsy(self):
+        assert not TemplateSet({})
+
+    def test_default_templates_cached(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(detector, "_default_templates", None)
+        monkeypatch.setattr(detector, "load_templates", lambda: calls.append(1) or {})
+
+        detect_emojis(np.zeros((50, 50, 3), dtype=np.uint8))
+        detect_emojis(np.zeros((50, 50, 3), dtype=np.uint8))
+
+        assert calls == [1]
+
+    def test_template_larger_than_image_skipped(self, scene):
+        _, templates, _ = scene
+        assert detect_emojis(np.zeros((10, 10, 3), dtype=np.uint8), templates) == []
+
+
+class TestAccuracy:
+    """합성 채팅 화면 정답 대비."""
+
+    def test_same_as_legacy(self, scene):
+        image, templates, truth = scene
+        legacy = legacy_detect_emojis(image, templates)
+        found = detect_emojis(image, prepare_templates(templates))
+
+        assert score_detections(legacy, truth) == (1.0, 1.0)
+        assert score_detections(found, truth) == (1.0, 1.0)
+        assert [d["id"] for d in found] == [d["id"] for d in legacy]
+
+    def test_edge_mode(self, scene):
+        image, templates, truth = scene
+        found = detect_emojis(image, prepare_templates(templates, mode="edge"))
+        assert score_detections(found, truth) == (1.0, 1.0)
+
+    def test_bgra_input(self, scene):
+        image, templates, truth = scene
+        bgra = np.dstack([image, np.full(image.shape[:2], 255, dtype=np.uint8)])
+        assert score_detections(detect_emojis(bgra, templates), truth) == (1.0, 1.0)
+
+
+class TestTemplatePyramid:
+    """배율별 템플릿 + 창별 배율 기억."""
+
+    @pytest.fixture
+    def pyramid(self):
+        template = np.zeros((24, 20, 3), dtype=np.uint8)
+        return TemplatePyramid({1: ("a", template)}, scales=(1.0, 1.25, 1.5, 2.0))
+
+    def test_scaled_sizes(self):
+        scaled = scale_templates({1: ("a", np.zeros((24, 20, 3), dtype=np.uint8))}, 1.5)
+        assert scaled[1][1].shape == (36, 30, 3)
+
+    def test_dpi_order(self, pyramid):
+        assert pyramid.scale_for_dpi(144) == 1.5
+        assert pyramid.scan_order(dpi=120) == [1.25, 1.0, 1.5, 2.0]
+        assert pyramid.scan_order() == [1.0, 1.25, 1.5, 2.0]
+
+    def test_remembered_scale_first(self, pyramid):
+        pyramid.remember(7, 2.0)
+        assert pyramid.scan_order(7, dpi=96)[0] == 2.0
+        assert pyramid.scan_order(8, dpi=96)[0] == 1.0
+        pyramid.forget(7)
+        assert pyramid.last_scale(7) is None
+
+    def test_dpi_change_reorders(self, pyramid):
+        pyramid.remember(7, 2.0, dpi=192)
+        assert pyramid.scan_order(7, dpi=192)[0] == 2.0
+        assert pyramid.scan_order(7, dpi=120)[0] == 1.25
+
+    def test_remember_bounded(self, pyramid):
+        for window in range(CV_SCALE_CACHE_MAX_WINDOWS + 5):
+            pyramid.remember(window, 1.5)
+        assert pyramid.last_scale(0) is None
+        assert pyramid.last_scale(CV_SCALE_CACHE_MAX_WINDOWS + 4) == 1.5
+
+
+@pytest.fixture(scope="module")
+def scaled_scene():
+    try:
+        image, templates, truth, _ = chat_scene(scale=1.5)
+    except FileNotFoundError:
+        pytest.skip("emoji templates not found")
+    return [((0, 0), image)], prepare_pyramid(templates), truth
+
+
+class TestMultiscale:
+    """배율 다른 화면에서 탐지."""
+
+    def test_finds_scale_from_wrong_dpi_guess(self, scaled_scene):
+        crops, pyramid, truth = scaled_scene
+        pyramid.forget(1)
+
+        found = detect_emojis_multiscale(crops, pyramid, 1, dpi=96)
+
+        assert score_detections(found, truth) == (1.0, 1.0)
+        assert pyramid.last_scale(1) == 1.5
+
+    def test_remembered_scale_matches_once(self, scaled_scene, monkeypatch):
+        crops, pyramid, truth = scaled_scene
+        pyramid.remember(1, 1.5)
+        calls = []
+        original = detector.detect_emojis_in_regions
+        monkeypatch.setattr(detector, "detect_emojis_in_regions",
+                            lambda c, t, *args: calls.append(t) or original(c, t, *args))
+
+        found = detect_emojis_multiscale(crops, pyramid, 1, dpi=96)
+
+        assert calls == [pyramid[1.5]]
+        assert score_detections(found, truth) == (1.0, 1.0)
+
+    def test_empty_at_remembered_scale_matches_once(self, scaled_scene, monkeypatch):
+        _, pyramid, _ = scaled_scene
+        blank = [((0, 0), np.full((200, 200, 3), 255, dtype=np.uint8))]
+        pyramid.remember(3, 1.5, dpi=144)
+        calls = []
+        original = detector.detect_emojis_in_regions
+        monkeypatch.setattr(detector, "detect_emojis_in_regions",
+                            lambda c, t, *args: calls.append(t) or original(c, t, *args))
+
+        for _ in range(CV_SCALE_MAX_MISSES - 1):
+            assert detect_emojis_multiscale(blank, pyramid, 3, dpi=144) == []
+        assert calls == [pyramid[1.5]] * (CV_SCALE_MAX_MISSES - 1)
+        assert pyramid.last_scale(3) == 1.5
+
+        # 연속으로 비면 잊고 다음엔 전 배율
+        detect_emojis_multiscale(blank, pyramid, 3, dpi=144)
+        assert pyramid.last_scale(3) is None
+        calls.clear()
+        detect_emojis_multiscale(blank, pyramid, 3, dpi=144)
+        assert len(calls) == len(pyramid.scales)
+
+    def test_empty_window_cools_down_to_dpi_scale(self, scaled_scene, monkeypatch):
+        _, pyramid, _ = scaled_scene
+        blank = [((0, 0), np.full((200, 200, 3), 255, dtype=np.uint8))]
+        calls = []
+        original = detector.detect_emojis_in_regions
+        monkeypatch.setattr(detector, "detect_emojis_in_regions",
+                            lambda c, t, *args: calls.append(t) or original(c, t, *args))
+
+        detect_emojis_multiscale(blank, pyramid, 5, dpi=144)
+        assert len(calls) == len(pyramid.scales)
+
+        # 쿨다운 동안은 DPI 배율만 (ROI + 창 전체 폴백 둘 다)
+        calls.clear()
+        detect_emojis_multiscale(blank, pyramid, 5, dpi=144)
+        detect_emojis_multiscale(blank, pyramid, 5, dpi=144)
+        assert calls == [pyramid[1.5]] * 2
+
+        # DPI가 바뀌거나 쿨다운이 지나면 다시 전 배율
+        calls.clear()
+        detect_emojis_multiscale(blank, pyramid, 5, dpi=96)
+        assert len(calls) == len(pyramid.scales)
+        monkeypatch.setattr(pyramid, "empty_cooldown", 0.0)
+        calls.clear()
+        detect_emojis_multiscale(blank, pyramid, 5, dpi=96)
+        assert len(calls) == len(pyramid.scales)
+
+    def test_dpi_change_widens(self, scaled_scene):
+        crops, pyramid, truth = scaled_scene
+        pyramid.remember(4, 1.0, dpi=96)
+        assert pyramid.last_scale(4, dpi=144) is None
+
+        found = detect_emojis_multiscale(crops, pyramid, 4, dpi=144)
+
+        assert score_detections(found, truth) == (1.0, 1.0)
+        assert pyramid.last_scale(4, dpi=144) == 1.5
+
+    def test_nothing_found(self, scaled_scene):
+        _, pyramid, _ = scaled_scene
+        blank = [((0, 0), np.full((200, 200, 3), 255, dtype=np.uint8))]
+        assert detect_emojis_multiscale(blank, pyramid, 2) == []
+        assert pyramid.last_scale(2) is None
@@ -0,0 +1,177 @@
+# SPDX-License-Identifier: MIT
+"""이벤트 기록 + 시뮬레이터 재생 테스트."""
+
+import json
+import threading
+import time
+
+import pytest
+
+from tests.uia_sim import (
+    WINDOW_CLASS,
+    EventReplayer,
+    SimElement,
+    SimKakaoTalk,
+    platform_modules,
+    prepare_records,
+)
+
+with platform_modules():
+    from kakaotalk_a11y_client.utils.event_recorder import (
+        RECORDING_FORMAT,
+        EventRecorder,
+        event_recorder,
+        read_recording,
+    )
+
+ROOM_MESSAGES = ["홍길동, 첫 메시지, 오후 3:00", "홍길동, 둘째, 오후 3:01"]
+NEW_MESSAGE = "홍길동, 새 메시지, 오후 3:02"
+
+
+def _session_records() -> list[dict]:
+    """채팅방 진입 → 마지막 메시지 포커스 → 새 메시지 1개."""
+    return [
+        {"t": 0.0, "kind": "foreground", "hwnd": 100, "class_name": WINDOW_CLASS, "title": "홍길동"},
+        {"t": 0.001, "kind": "list", "hwnd": 101, "names": ROOM_MESSAGES},
+        {"t": 0.05, "kind": "focus", "control_type": "ListItemControl", "name": ROOM_MESSAGES[1],
+         "class_name": "", "automation_id": "", "hwnd": 0, "runtime_id": [7, 1, 2]},
+        {"t": 0.1, "kind": "structure", "change_type": 0},
+        {"t": 0.3, "kind": "messages", "names": [NEW_MESSAGE]},
+    ]
+
+
+class TestEventRecorder:
+    """JSONL 기록기."""
+
+    def test_roundtrip(self, tmp_path):
+        recorder = EventRecorder()
+        path = tmp_path / "sub" / "events.jsonl"
+        assert recorder.start(path)
+        recorder.record("structure", change_type=3)
+        recorder.record_element("focus", SimElement("항목", "ListItemControl", runtime_id=(7, 1, 9)))
+        recorder.stop()
+
+        header, records = read_recording(path)
+        assert header["format"] == RECORDING_FORMAT
+        assert [r["kind"] for r in records] == ["structure", "focus"]
+        assert records[1]["name"] == "항목"
+        assert records[1]["runtime_id"] == [7, 1, 9]
+        assert records[0]["t"] <= records[1]["t"]
+        assert recorder.written == 2
+
+    def test_written_off_caller_thread(self, tmp_path, monkeypatch):
+        from types import SimpleNamespace
+
+        from kakaotalk_a11y_client.utils import event_recorder as recorder_module
+
+        writers = []
+
+        def dumps(data, **kwargs):
+            writers.append(threading.get_ident())
+            return json.dumps(data, **kwargs)
+
+        recorder = EventRecorder()
+        path = tmp_path / "events.jsonl"
+        assert recorder.start(path)
+        monkeypatch.setattr(recorder_module, "json", SimpleNamespace(dumps=dumps, loads=json.loads))
+        for i in range(50):
+            recorder.record("structure", change_type=i)
+        recorder.record("bad", value=object())  # 직렬화 실패는 카운트만
+        assert recorder.wait_idle(1.0)
+
+        assert writers and threading.get_ident() not in writers
+        assert recorder.written == 50
+        assert recorder.errors == 1
+        _, records = read_recording(path)  # flush 됨 (stop 전)
+        assert [r["change_type"] for r in records] == list(range(50))
+        recorder.stop()
+        assert not recorder.active
+
+    def test_inactive_is_noop(self):
+        recorder = EventRecorder()
+        recorder.record("focus", name="x")
+        assert not recorder.active
+        assert recorder.written == 0
+
+    def test_rejects_other_format(self, tmp_path):
+        path = tmp_path / "other.jsonl"
+        path.write_text(json.dumps({"format": "something"}) + "\n", encoding="utf-8")
+        with pytest.raises(ValueError):
+            read_recording(path)
+
+
+class TestRecordingHooks:
+    """실제 파이프라인 구동 중 훅이 남기는 레코드."""
+
+    def test_pipeline_records(self, tmp_path):
+        sim = SimKakaoTalk(friends=2, chats=2)
+        room = sim.open_chat_room("홍길동", messages=3, activate=False)
+        path = tmp_path / "session.jsonl"
+        spoken = []
+        with sim.installed():
+            from kakaotalk_a11y_client.focus_monitor import FocusMonitorService
+            from kakaotalk_a11y_client.mode_manager import ModeManager
+            from kakaotalk_a11y_client.navigation.chat_room import ChatRoomNavigator
+            from kakaotalk_a11y_client.navigation.message_monitor import MessageMonitor
+
+            navigator = ChatRoomNavigator(uia_adapter=sim.adapter)
+            message_monitor = MessageMonitor(navigator)
+            service = FocusMonitorService(ModeManager(), message_monitor, navigator, None,
+                                          uia_adapter=sim.adapter, speak_callback=spoken.append)
+            service.start(poll_thread=False)
+            event_recorder.start(path)
+            try:
+                sim.activate(room)
+                service._poll_once(time.time())
+                assert sim.uia.wait_for_handlers("automation")
+                sim.focus(room.messages[-1])
+                item = sim.post_message(room, "안녕")
+                time.sleep(0.4)  # 메시지 디바운스
+                sim.open_menu(["복사"])
+                service._poll_once(time.time())
+                sim.close_menu()
+                service._menu_handler.invalidate_menu_cache()
+                service._poll_once(time.time())
+            finally:
+                event_recorder.stop()
+                service.stop()
+                message_monitor.stop()
+
+        _, records = read_recording(path)
+        kinds = [r["kind"] for r in records]
+        for kind in ("foreground", "list", "focus", "structure", "messages", "menu_open", "menu_close"):
+            assert kind in kinds, kind
+        assert kinds.index("foreground") < kinds.index("list") < kinds.index("structure")
+        listed = next(r for r in records if r["kind"] == "list")
+        assert listed["names"] == [m.name for m in room.messages[:3]]
+        messages = next(r for r in records if r["kind"] == "messages")
+        assert messages["names"] == [item.name]
+
+
+class TestReplay:
+    """기록 재생."""
+
+    def test_prepare_attaches_names(self):
+        prepared = prepare_records(_session_records())
+
+        assert prepared[0]["_messages"] == ROOM_MESSAGES
+        assert prepared[3]["_added"] == [NEW_MESSAGE]
+        assert "_added" not in _session_records()[3]  # 원본 유지
+
+    def test_replay_max_speed(self):
+        report = EventReplayer(_session_records()).run(speed=None)
+        texts = [text for _, text in report.utterances]
+
+        assert ROOM_MESSAGES[1] in texts
+        assert NEW_MESSAGE in texts
+        assert report.posted_messages == 1
+        assert len(report.message_latency_ms) == 1
+        assert report.stages["total"]["count"] >= 1
+        assert report.to_dict()["announced_messages"] == 1
+
+    def test_replay_keeps_recorded_timing(self):
+        replayer = EventReplayer(_session_records())
+        report = replayer.run(speed=1.0)
+
+        assert report.wall_secs >= replayer.duration
+        assert NEW_MESSAGE in [text for _, text in report.utterances]
@@ -0,0 +1,111 @@
+# SPDX-License-Identifier: MIT
+"""플라이트 레코더 단위 테스트."""
+
+import threading
+
+import pytest
+
+from kakaotalk_a11y_client.utils.flight_recorder import (
+    FlightRecorder,
+    decode,
+    decode_file,
+    runtime_id_hash,
+)
+
+
+@pytest.fixture
+def recorder(tmp_path):
+    rec = FlightRecorder(capacity=8, slow_ms=100, dump_cooldown=60.0)
+    rec.output_dir = tmp_path
+    return rec
+
+
+class TestFlightRecorder:
+    """FlightRecorder 테스트."""
+
+    def test_roundtrip(self, recorder):
+        rid = runtime_id_hash((42, 1, 2))
+        recorder.record("focus", "pass", "ListItemControl", rid, 1000.5, 120, 3400)
+        recorder.record("focus", "debounce", timestamp=1000.6)
+
+        records = list(decode(recorder.snapshot()))
+
+        assert [r["seq"] for r in records] == [0, 1]
+        first = records[0]
+        assert first["event"] == "focus"
+        assert first["decision"] == "pass"
+        assert first["control_type"] == "ListItemControl"
+        assert first["runtime_id"] == f"{rid:08x}"
+        assert first["filter_us"] == 120
+        assert first["total_us"] == 3400
+        assert first["timestamp"] == 1000.5
+        assert records[1]["runtime_id"] == ""
+
+    def test_ring_keeps_latest_in_order(self, recorder):
+        for i in range(20):
+            recorder.record("structure", "buffered", timestamp=float(i + 1))
+
+        records = list(decode(recorder.snapshot()))
+
+        assert len(records) == 8
+        assert [r["timestamp"] for r in records] == [float(i) for i in range(13, 21)]
+        assert records[0]["seq"] == 12
+
+    def test_unknown_control_type(self, recorder):
+        recorder.record("focus", "pass", "SpinnerControl")
+        assert next(decode(recorder.snapshot()))["control_type"] == "other"
+
+    def test_dump_cooldown(self, recorder):
+        recorder.record("focus", "error")
+        assert recorder.dump("error") is not None
+        assert recorder.dump("error") is None
+        assert recorder.dump("error", force=True) is not None
+
+    def test_slow_event_triggers_dump(self, recorder, tmp_path):
+        recorder.record("focus", "pass", "ListItemControl", total_us=250_000)
+        assert recorder.wait_idle(1.0)
+
+        dumps = list(tmp_path.glob("flight_slow_*.kfr"))
+        assert len(dumps) == 1
+        assert next(decode_file(dumps[0]))["total_us"] == 250_000
+
+    def test_async_dump_written_off_caller_thread(self, recorder, tmp_path, monkeypatch):
+        writers = []
+        write = recorder._write
+
+        def recording_write(*args):
+            writers.append(threading.get_ident())
+            return write(*args)
+
+        monkeypatch.setattr(recorder, "_write", recording_write)
+        recorder.record("focus", "error", timestamp=1000.5)
+
+        assert recorder.dump_async("error") is True
+        assert recorder.dump_async("error") is False  # 쿨다운
+        recorder.record("focus", "pass", timestamp=1000.6)  # 스냅샷 이후 기록은 덤프에 없음
+        assert recorder.wait_idle(1.0)
+
+        assert writers and threading.get_ident() not in writers
+        dumps = list(tmp_path.glob("flight_error_*.kfr"))
+        assert len(dumps) == 1
+        assert [r["timestamp"] for r in decode_file(dumps[0])] == [1000.5]
+
+    def test_concurrent_counts_exact(self):
+        recorder = FlightRecorder(capacity=64, slow_ms=1e9)
+
+        def worker():
+            for _ in range(5000):
+                recorder.record("focus", "pass", timestamp=1.0)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert recorder.written == 40000
+        assert recorder.decision_counts() == {("focus", "pass"): 40000}
+
+    def test_decode_rejects_other_files(self):
+        with pytest.raises(ValueError):
+            list(decode(b"not a dump" * 4))
@@ -0,0 +1,125 @@
+# SPDX-License-Identifier: MIT
+"""포커스→발화 지연 추적 단위 테스트."""
+
+import json
+import threading
+
+from kakaotalk_a11y_client.utils.latency_tracer import (
+    LatencyHistogram,
+    LatencyTracer,
+)
+
+
+def _run_event(tracer: LatencyTracer, stages=("filter", "coalescer", "dispatch", "speak")):
+    tracer.begin()
+    for stage in stages:
+        tracer.mark(stage)
+    tracer.finish()
+
+
+class TestLatencyHistogram:
+    """LatencyHistogram 테스트."""
+
+    def test_record_buckets(self):
+        hist = LatencyHistogram(bounds_ms=(1, 10, 100))
+        for ms in (0.5, 5, 5, 50, 500):
+            hist.record(ms)
+
+        assert hist.counts == [1, 2, 1, 1]
+        assert hist.count == 5
+        assert hist.max_ms == 500
+
+    def test_percentile_uses_bucket_upper_bound(self):
+        hist = LatencyHistogram(bounds_ms=(1, 10, 100))
+        for _ in range(90):
+            hist.record(0.5)
+        for _ in range(10):
+            hist.record(50)
+
+        assert hist.percentile(50) == 1
+        assert hist.percentile(95) == 100
+
+    def test_percentile_overflow_returns_max(self):
+        hist = LatencyHistogram(bounds_ms=(1,))
+        hist.record(3.5)
+        assert hist.percentile(99) == 3.5
+
+    def test_empty(self):
+        assert LatencyHistogram().percentile(50) == 0.0
+
+
+class TestLatencyTracer:
+    """LatencyTracer 테스트."""
+
+    def test_records_all_stages(self):
+        tracer = LatencyTracer(sample_every=1)
+        _run_event(tracer)
+
+        stages = tracer.get_stats()["stages"]
+        for name in ("filter", "coalescer", "dispatch", "speak", "total"):
+            assert stages[name]["count"] == 1
+
+    def test_without_speak_is_dropped(self):
+        """중복 체크 등으로 발화 안 한 이벤트는 기록 안 함."""
+        tracer = LatencyTracer(sample_every=1)
+        _run_event(tracer, stages=("filter", "coalescer"))
+
+        stats = tracer.get_stats()
+        assert stats["dropped"] == 1
+        assert stats["stages"]["total"]["count"] == 0
+
+    def test_disabled_is_noop(self):
+        tracer = LatencyTracer(sample_every=0)
+        assert tracer.begin() is None
+        _run_event(tracer)
+
+        assert not tracer.enabled
+        assert tracer.get_stats()["stages"]["total"]["count"] == 0
+
+    def test_sample_every(self):
+        tracer = LatencyTracer(sample_every=3)
+        for _ in range(9):
+            _run_event(tracer)
+
+        assert tracer.get_stats()["stages"]["total"]["count"] == 3
+
+    def test_attach_across_threads(self):
+        """coalescer 배치 경로: 다른 스레드에서 추적 이어받기."""
+        tracer = LatencyTracer(sample_every=1)
+        trace = tracer.begin()
+        tracer.mark("filter")
+
+        def flush():
+            tracer.attach(trace)
+            tracer.mark("coalescer")
+            tracer.mark("dispatch")
+            tracer.mark("speak")
+            tracer.finish()
+
+        t = threading.Thread(target=flush)
+        t.start()
+        t.join()
+
+        assert tracer.get_stats()["stages"]["total"]["count"] == 1
+
+    def test_mark_without_begin_ignored(self):
+        tracer = LatencyTracer(sample_every=1)
+        tracer.mark("speak")
+        tracer.finish()
+        assert tracer.get_stats()["dropped"] == 0
+
+    def test_save_json(self, tmp_path):
+        tracer = LatencyTracer(sample_every=1)
+        _run_event(tracer)
+
+        path = tracer.save_json(tmp_path / "latency.json")
+
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert data["stages"]["speak"]["count"] == 1
+        assert "timestamp" in data
+
+    def test_summary(self):
+        tracer = LatencyTracer(sample_every=1)
+        assert tracer.get_summary() == "지연 측정 없음"
+        _run_event(tracer)
+        assert "포커스 지연 1건" in tracer.get_summary()
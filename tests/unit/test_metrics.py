@@ -0,0 +1,214 @@
+# SPDX-License-Identifier: MIT
+"""메트릭 레지스트리/엔드포인트 단위 테스트."""
+
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from kakaotalk_a11y_client.utils.event_coalescer import EventCoalescer
+from kakaotalk_a11y_client.utils.flight_recorder import FlightRecorder
+from kakaotalk_a11y_client.utils.metrics import (
+    OPENMETRICS_CONTENT_TYPE,
+    MetricsRegistry,
+    MetricsServer,
+    counter,
+    gauge,
+    histogram,
+    metrics_registry,
+)
+from kakaotalk_a11y_client.utils.profiler import UIAProfiler
+from kakaotalk_a11y_client.utils.uia_cache import UIACache
+
+
+def _samples(registry) -> dict:
+    """OpenMetrics 텍스트 → {샘플 이름+라벨: 값}."""
+    result = {}
+    for line in registry.render_openmetrics().splitlines():
+        if line.startswith("#"):
+            continue
+        key, value = line.rsplit(" ", 1)
+        result[key] = value
+    return result
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry(prefix="t")
+
+
+class TestRegistry:
+    """MetricsRegistry 테스트."""
+
+    def test_render_counter_gauge(self, registry):
+        registry.register("a", lambda: [
+            counter("hits", "Hits.", 3, cache="x"),
+            gauge("running", "Running.", True),
+        ])
+        text = registry.render_openmetrics()
+
+        assert "# TYPE t_hits counter" in text
+        assert 't_hits_total{cache="x"} 3' in text
+        assert "t_running 1" in text
+        assert text.endswith("# EOF\n")
+
+    def test_histogram_cumulative_buckets(self, registry):
+        family = histogram("op", "Op.").add_histogram([(0.1, 2), (0.5, 3)], 1.25, op="a")
+        registry.register("h", lambda: [family])
+        samples = _samples(registry)
+
+        assert samples['t_op_seconds_bucket{op="a",le="0.1"}'] == "2"
+        assert samples['t_op_seconds_bucket{op="a",le="0.5"}'] == "5"
+        assert samples['t_op_seconds_bucket{op="a",le="+Inf"}'] == "5"
+        assert samples['t_op_seconds_count{op="a"}'] == "5"
+        assert "# UNIT t_op_seconds seconds" in registry.render_openmetrics()
+
+    def test_same_name_merged(self, registry):
+        registry.register("a", lambda: [counter("events", "E.", 1, owner="a")])
+        registry.register("b", lambda: [counter("events", "E.", 2, owner="b")])
+        assert registry.render_openmetrics().count("# TYPE t_events counter") == 1
+        assert _samples(registry)['t_events_total{owner="b"}'] == "2"
+
+    def test_failing_collector_skipped(self, registry):
+        registry.register("bad", lambda: 1 / 0)
+        registry.register("good", lambda: [gauge("ok", "Ok.", 1)])
+        samples = _samples(registry)
+        assert samples["t_ok"] == "1"
+        assert samples["t_metrics_collector_errors_total"] == "1"
+
+    def test_unregister_keeps_replacement(self, registry):
+        first = lambda: []  # noqa: E731
+        second = lambda: []  # noqa: E731
+        registry.register("x", first)
+        registry.register("x", second)
+        registry.unregister("x", first)
+        assert registry.names == ["x"]
+        registry.unregister("x", second)
+        assert registry.names == []
+
+    def test_label_escaping(self, registry):
+        registry.register("a", lambda: [gauge("g", "G.", 1, label='a"b\\c\nd')])
+        assert 't_g{label="a\\"b\\\\c\\nd"} 1' in registry.render_openmetrics()
+
+
+class TestSubsystemCollectors:
+    """서브시스템 collector 테스트."""
+
+    def test_builtin_collectors_registered(self):
+        assert {"profiler", "uia_cache", "latency_tracer", "flight_recorder"} <= set(
+            metrics_registry.names)
+
+    def test_profiler_histogram(self, registry):
+        profiler = UIAProfiler()
+        for ms in (1.0, 2.0, 200.0):
+            profiler._record("find_menu", ms)
+        registry.register("profiler", profiler.collect_metrics)
+        samples = _samples(registry)
+
+        assert samples['t_profile_duration_seconds_count{operation="find_menu"}'] == "3"
+        assert float(samples['t_profile_duration_seconds_sum{operation="find_menu"}']) == \
+            pytest.approx(0.203)
+
+    def test_uia_cache(self, registry):
+        cache = UIACache()
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("b")
+        registry.register("cache", lambda: cache.collect_metrics("test"))
+        samples = _samples(registry)
+
+        assert samples['t_uia_cache_hits_total{cache="test"}'] == "1"
+        assert samples['t_uia_cache_misses_total{cache="test"}'] == "1"
+        assert samples['t_uia_cache_entries{cache="test"}'] == "1"
+
+    def test_coalescer_counts(self, registry):
+        delivered = []
+        coalescer = EventCoalescer(delivered.append, flush_interval=10)
+        # 플러셔 스레드 먼저 종료 (배치 큐를 직접 flush)
+        coalescer._running = False
+        with coalescer._condition:
+            coalescer._condition.notify()
+        coalescer._thread.join(1.0)
+
+        coalescer.add(("a",), 1, immediate=True)
+        coalescer.add(("b",), 2)
+        coalescer.add(("b",), 3)
+        coalescer._flush()
+        registry.register("c", lambda: coalescer.collect_metrics("focus"))
+        samples = _samples(registry)
+
+        assert delivered == [1, 3]
+        assert samples['t_coalescer_events_total{owner="focus",path="immediate"}'] == "1"
+        assert samples['t_coalescer_events_total{owner="focus",path="batched"}'] == "2"
+        assert samples['t_coalescer_coalesced_total{owner="focus"}'] == "1"
+        assert samples['t_coalescer_flushed_total{owner="focus"}'] == "1"
+        assert samples['t_coalescer_pending{owner="focus"}'] == "0"
+
+    def test_coalescer_concurrent_counts_exact(self):
+        def failing(event):
+            raise RuntimeError(event)
+
+        coalescer = EventCoalescer(failing, flush_interval=10)
+
+        def worker():
+            for i in range(2000):
+                coalescer.add(("k",), i, immediate=True)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        coalescer.stop()
+
+        assert coalescer.immediate_count == 16000
+        assert coalescer.error_count == 16000
+
+    def test_flight_recorder_decisions(self, registry):
+        recorder = FlightRecorder(capacity=2)
+        for decision in ("pass", "debounce", "debounce", "hwnd"):
+            recorder.record("focus", decision)
+        registry.register("fr", recorder.collect_metrics)
+        samples = _samples(registry)
+
+        # 링 버퍼가 덮어써도 누적 수 유지
+        assert samples['t_uia_events_total{event="focus",decision="debounce"}'] == "2"
+        assert samples["t_flight_records_total"] == "4"
+
+
+class TestMetricsServer:
+    """로컬 HTTP 엔드포인트 테스트 (스크랩)."""
+
+    @pytest.fixture
+    def server(self, registry):
+        registry.register("a", lambda: [counter("hits", "Hits.", 7)])
+        server = MetricsServer(registry, port=0)
+        server.start()
+        yield server
+        server.stop()
+
+    def _get(self, server, path):
+        return urllib.request.urlopen(f"http://127.0.0.1:{server.port}{path}", timeout=2)
+
+    def test_scrape_openmetrics(self, server):
+        with self._get(server, "/metrics") as resp:
+            assert resp.headers["Content-Type"] == OPENMETRICS_CONTENT_TYPE
+            body = resp.read().decode("utf-8")
+        assert "t_hits_total 7" in body
+
+    def test_scrape_json(self, server):
+        with self._get(server, "/metrics.json") as resp:
+            data = json.loads(resp.read())
+        sample = data["metrics"]["t_hits"]["samples"][0]
+        assert sample == {"name": "t_hits_total", "labels": {}, "value": 7}
+
+    def test_unknown_path_404(self, server):
+        with pytest.raises(urllib.error.HTTPError) as exc:
+            self._get(server, "/")
+        assert exc.value.code == 404
+
+    def test_rejects_non_loopback_host(self, registry):
+        with pytest.raises(ValueError):
+            MetricsServer(registry, host="0.0.0.0")
@@ -0,0 +1,154 @@
+# SPDX-License-Identifier: MIT
+"""출력 백엔드 단위 테스트."""
+
+import json
+import sys
+import threading
+import time
+
+import pytest
+
+from kakaotalk_a11y_client import accessibility
+from kakaotalk_a11y_client.output import (
+    BACKENDS,
+    NullBackend,
+    RecordingBackend,
+    JsonlBackend,
+    create_backend,
+)
+
+
+@pytest.fixture
+def recording():
+    """accessibility 백엔드를 RecordingBackend로 교체 후 원복."""
+    backend = RecordingBackend()
+    accessibility.set_output_backend(backend)
+    yield backend
+    accessibility.set_output_backend("null")
+
+
+class TestCreateBackend:
+    """create_backend 테스트."""
+
+    def test_known_names(self):
+        assert set(BACKENDS) == {"ao2", "sapi", "null", "recording", "jsonl"}
+        assert isinstance(create_backend("null"), NullBackend)
+
+    def test_unknown_name(self):
+        with pytest.raises(ValueError):
+            create_backend("nope")
+
+
+class TestRecordingBackend:
+    """RecordingBackend 테스트."""
+
+    def test_order_and_timestamps(self):
+        backend = RecordingBackend()
+        backend.speak("하나")
+        backend.braille("하나")
+        backend.speak("둘", interrupt=True)
+
+        items = backend.utterances()
+        assert [u.seq for u in items] == [1, 2, 3]
+        assert [u.channel for u in items] == ["speech", "braille", "speech"]
+        assert items[2].interrupt is True
+        assert items[0].timestamp <= items[1].timestamp <= items[2].timestamp
+
+    def test_ring_buffer(self):
+        backend = RecordingBackend(max_size=3)
+        for i in range(5):
+            backend.speak(str(i))
+
+        assert backend.texts() == ["2", "3", "4"]
+        assert backend.dropped == 2
+
+
+class TestJsonlBackend:
+    """JsonlBackend 테스트."""
+
+    def test_writes_lines(self, tmp_path):
+        path = tmp_path / "out.jsonl"
+        backend = JsonlBackend(path)
+        backend.speak("안녕")
+        backend.braille("안녕")
+        backend.close()
+
+        lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+        assert [(r["seq"], r["channel"], r["text"]) for r in lines] == [
+            (1, "speech", "안녕"),
+            (2, "braille", "안녕"),
+        ]
+
+    def test_write_after_close_ignored(self, tmp_path):
+        backend = JsonlBackend(tmp_path / "out.jsonl")
+        backend.close()
+        backend.speak("무시")
+
+
+class TestAccessibilitySpeak:
+    """accessibility.speak + 백엔드 연동 테스트."""
+
+    def test_import_does_not_create_screen_reader(self):
+        """accessibility import만으로 accessible_output2를 불러오지 않음."""
+        assert "accessible_output2.outputs.auto" not in sys.modules
+
+    def test_speak_goes_to_backend(self, recording):
+        assert accessibility.speak("첫째") is True
+        accessibility.speak("둘째", interrupt=True)
+        assert accessibility.wait_speech_idle(1.0)
+
+        assert recording.texts() == ["첫째", "둘째"]
+
+    def test_backend_created_and_spoken_on_worker(self, monkeypatch):
+        """백엔드 생성과 speak()는 호출 스레드가 아닌 음성 워커 한 곳에서 (COM 아파트)."""
+        threads = []
+
+        class ThreadProbe(RecordingBackend):
+            name = "thread_probe"
+            has_braille = False
+
+            def __init__(self):
+                super().__init__()
+                threads.append(threading.get_ident())
+
+            def speak(self, text, interrupt=False):
+                threads.append(threading.get_ident())
+                super().speak(text, interrupt)
+
+        monkeypatch.setitem(BACKENDS, "thread_probe", ThreadProbe)
+        accessibility.set_output_backend("thread_probe")
+        try:
+            callers = [threading.Thread(target=accessibility.speak, args=(f"발화 {i}",))
+                       for i in range(3)]
+            for t in callers:
+                t.start()
+            for t in callers:
+                t.join()
+            accessibility.speak("마지막")
+            assert accessibility.wait_speech_idle(1.0)
+        finally:
+            accessibility.set_output_backend("null")
+
+        assert len(threads) == 5
+        assert len(set(threads)) == 1
+        assert threading.get_ident() not in threads
+
+    def test_braille_channel_receives_text(self, recording):
+        accessibility.speak("점자 확인")
+
+        deadline = time.monotonic() + 1.0
+        while not recording.texts("braille") and time.monotonic() < deadline:
+            time.sleep(0.005)
+        assert recording.texts("braille") == ["점자 확인"]
+
+    def test_interrupt_skips_braille(self, recording):
+        accessibility.speak("끊기", interrupt=True)
+        time.sleep(0.05)
+        assert recording.texts("braille") == []
+
+    def test_failed_backend_falls_back(self):
+        accessibility.set_output_backend("jsonl", path="/nonexistent/dir/out.jsonl")
+        try:
+            assert accessibility.speak("폴백") is False
+        finally:
+            accessibility.set_output_backend("null")
@@ -0,0 +1,125 @@
+# SPDX-License-Identifier: MIT
+"""성능 벤치마크 통계 (적응형 반복, 이상치, 신뢰구간 비교) + 시뮬레이터 백엔드 테스트."""
+
+import json
+import random
+
+import pytest
+
+from tests.performance_benchmark import (
+    PerformanceBenchmark,
+    compare_metric,
+    compare_results,
+    environment,
+    reject_outliers,
+    run_benchmark,
+    t_critical,
+    welch_test,
+)
+
+pytestmark = pytest.mark.usefixtures("platform_modules")
+
+
+def _metric(samples: list[float]) -> dict:
+    """저장 결과의 항목 하나 (compare에 필요한 키만)."""
+    return {"avg_ms": sum(samples) / len(samples), "samples_ms": samples}
+
+
+class TestStatistics:
+    """t 분포, 이상치, Welch 검정."""
+
+    @pytest.mark.parametrize("df,expected", [(1, 12.706), (10, 2.228), (30, 2.042), (1000, 1.962)])
+    def test_t_critical(self, df, expected):
+        assert t_critical(df) == pytest.approx(expected, abs=1e-3)
+
+    def test_reject_outliers(self):
+        kept, removed = reject_outliers([1.0, 1.1, 0.9, 1.0, 1.05, 50.0])
+        assert removed == 1
+        assert 50.0 not in kept
+
+    def test_welch_detects_shift(self):
+        rng = random.Random(1)
+        base = [rng.gauss(10, 0.5) for _ in range(50)]
+        same = [rng.gauss(10, 0.5) for _ in range(50)]
+        slow = [rng.gauss(12, 0.5) for _ in range(50)]
+
+        assert welch_test(base, slow)["p"] < 1e-6
+        assert welch_test(base, slow)["ci_low"] > 0
+        assert welch_test(base, same)["p"] > 0.01
+
+
+class TestMeasure:
+    """적응형 반복."""
+
+    def test_stops_when_ci_target_met(self):
+        bench = PerformanceBenchmark("t")
+        bench.measure("sleep", lambda: sum(range(2000)), warmup=2, min_iterations=5,
+                      max_iterations=500, ci_target_pct=50.0)
+        data = bench.results["metrics"]["sleep"]
+
+        assert data["converged"]
+        assert data["iterations"] < 500
+        assert data["ci_low_ms"] <= data["avg_ms"] <= data["ci_high_ms"]
+        assert len(data["samples_ms"]) == data["iterations"]
+
+    def test_fixed_iterations_and_errors(self):
+        calls = []
+
+        def flaky():
+            calls.append(1)
+            if len(calls) % 2:
+                raise RuntimeError("boom")
+
+        bench = PerformanceBenchmark("t")
+        bench.measure("flaky", flaky, iterations=6, warmup=0)
+        data = bench.results["metrics"]["flaky"]
+
+        assert data["iterations"] == 6
+        assert data["errors"] == 3
+        assert not data["converged"]
+
+    def test_environment_metadata(self):
+        env = PerformanceBenchmark("t").results["environment"]
+        assert env == environment()
+        for key in ("python", "cpu", "cpu_count", "free_threading_build", "gil_enabled"):
+            assert key in env
+
+
+class TestCompare:
+    """신뢰구간 + 유의성 판정."""
+
+    def test_verdicts(self):
+        rng = random.Random(2)
+        base = _metric([rng.gauss(10, 0.3) for _ in range(40)])
+        slow = _metric([rng.gauss(11, 0.3) for _ in range(40)])
+        fast = _metric([rng.gauss(9, 0.3) for _ in range(40)])
+        noisy = _metric([rng.gauss(10.1, 3) for _ in range(5)])
+
+        assert compare_metric(base, slow)["verdict"] == "regressed"
+        assert compare_metric(base, fast)["verdict"] == "improved"
+        assert compare_metric(base, noisy)["verdict"] == "unchanged"
+        assert compare_metric(base, slow, min_change_pct=20)["verdict"] == "unchanged"
+
+    def test_legacy_result_untested(self):
+        legacy = {"avg_ms": 10.0, "stdev_ms": 1.0}
+        result = compare_metric(legacy, {"avg_ms": 20.0, "stdev_ms": 1.0})
+        assert result["verdict"] == "untested"
+        assert result["change_pct"] == pytest.approx(100.0)
+
+
+class TestSimBackend:
+    """같은 벤치마크 정의를 시뮬레이터 트리에서."""
+
+    def test_run_and_compare(self, tmp_path):
+        paths = [run_benchmark(label, backend="sim", results_dir=tmp_path, warmup=1,
+                               max_iterations=20, max_seconds=0.5) for label in ("a", "b")]
+        data = json.loads(paths[0].read_text(encoding="utf-8"))
+
+        assert data["backend"]["name"] == "sim"
+        assert set(data["metrics"]) == {
+            "find_main_window", "get_focused_control", "get_list_children",
+            "filter_list_children", "deep_search_depth10", "tree_dump_depth3",
+        }
+        assert all(m["errors"] == 0 for m in data["metrics"].values())
+        summary = compare_results(str(paths[0]), str(paths[1]))
+        assert len(summary["comparisons"]) == 6
@@ -0,0 +1,191 @@
+# SPDX-License-Identifier: MIT
+"""UIAProfiler 단위 테스트."""
+
+import json
+import random
+import threading
+
+import pytest
+
+from kakaotalk_a11y_client.utils import profiler as profiler_module
+from kakaotalk_a11y_client.utils.profiler import LogHistogram, ProfileMetrics, UIAProfiler
+
+
+class TestLogHistogram:
+    """LogHistogram 테스트."""
+
+    def test_percentile_relative_error(self):
+        rng = random.Random(1)
+        values = sorted(rng.lognormvariate(0, 1.5) for _ in range(20000))
+        hist = LogHistogram()
+        for v in values:
+            hist.record(v)
+
+        for pct in (50, 90, 99, 99.9):
+            exact = values[int(len(values) * pct / 100) - 1]
+            assert hist.percentile(pct) == pytest.approx(exact, rel=0.05)
+
+    def test_bucket_contains_value(self):
+        hist = LogHistogram()
+        for value in (0.001, 0.37, 1.0, 42.5, 12345.0):
+            low, high = hist.bucket_bounds(hist._index(value))
+            assert low <= value < high
+
+    def test_from_list_roundtrip_and_merge(self):
+        hist = LogHistogram()
+        for v in (0.0, 0.37, 1.0, 42.5, 150.0, 12345.0):
+            hist.record(v)
+
+        restored = LogHistogram.from_list(hist.to_list())
+        assert restored.counts == hist.counts
+        assert restored.count_at_least(100.0) == 2
+
+        restored.merge(hist)
+        assert restored.count == 12
+        assert restored.counts == {i: 2 * n for i, n in hist.counts.items()}
+
+    def test_zero_and_empty(self):
+        hist = LogHistogram()
+        assert hist.percentile(50) == 0.0
+        hist.record(0.0)
+        assert hist.percentile(50) == 0.0
+
+
+class TestProfileMetrics:
+    """ProfileMetrics 테스트."""
+
+    def test_recent_samples_bounded(self):
+        metrics = ProfileMetrics()
+        for i in range(250):
+            metrics.record(float(i))
+        assert len(metrics.samples) == 100
+        assert metrics.samples[0] == 150.0
+        assert metrics.call_count == 250
+
+    def test_percentiles_clamped_to_observed_range(self):
+        metrics = ProfileMetrics()
+        metrics.record(5.0)
+        assert metrics.percentiles() == {"p50": 5.0, "p90": 5.0, "p99": 5.0, "p999": 5.0}
+
+
+class TestUIAProfiler:
+    """UIAProfiler 테스트."""
+
+    def test_disabled_measure_is_shared_noop(self):
+        profiler = UIAProfiler()
+        profiler.enabled = False
+        assert profiler.measure("a") is profiler.measure("b")
+        with profiler.measure("a"):
+            pass
+        assert profiler.metrics == {}
+
+    def test_nested_context_name(self):
+        profiler = UIAProfiler()
+        with profiler.context("refresh"):
+            with profiler.context("list"):
+                with profiler.measure("GetChildren"):
+                    pass
+            with profiler.measure("filter"):
+                pass
+        assert set(profiler.metrics) == {"refresh.list.GetChildren", "refresh.filter"}
+
+    def test_context_stack_per_thread(self):
+        profiler = UIAProfiler()
+        entered = threading.Event()
+        release = threading.Event()
+
+        def other():
+            with profiler.context("message"):
+                entered.set()
+                release.wait(2.0)
+                with profiler.measure("poll"):
+                    pass
+
+        thread = threading.Thread(target=other)
+        thread.start()
+        entered.wait(2.0)
+        with profiler.context("focus"):
+            release.set()
+            with profiler.measure("speak"):
+                pass
+        thread.join()
+
+        assert set(profiler.metrics) == {"message.poll", "focus.speak"}
+
+    def test_concurrent_recording_counts(self):
+        profiler = UIAProfiler(lock_stripes=4)
+
+        def worker():
+            for i in range(2000):
+                with profiler.measure(f"op{i % 5}"):
+                    pass
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert sum(m.call_count for m in profiler.metrics.values()) == 16000
+        assert all(m.call_count == 3200 for m in profiler.metrics.values())
+
+    def test_report_while_new_operations_added(self):
+        profiler = UIAProfiler(lock_stripes=4)
+        done = threading.Event()
+
+        def worker(base):
+            for i in range(3000):
+                profiler._record(f"op{base}_{i}", 1.0)
+            done.set()
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        while not done.is_set():
+            profiler.get_report()
+            profiler.collect_metrics()
+        for t in threads:
+            t.join()
+
+        assert len(profiler.snapshot()) == 12000
+
+    def test_report_while_same_operation_recorded(self):
+        profiler = UIAProfiler(lock_stripes=4)
+        profiler._record("op", 1.0)
+        done = threading.Event()
+
+        def worker():
+            # 값마다 새 버킷 → 히스토그램 dict 크기 계속 변함
+            for i in range(20000):
+                profiler._record("op", 0.001 * 1.01 ** i)
+            done.set()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        while not done.is_set():
+            profiler.get_report()
+            profiler.collect_metrics()
+        thread.join()
+
+        snapshot = profiler.snapshot()["op"]
+        assert snapshot.call_count == 20001
+        assert snapshot.histogram is not profiler.metrics["op"].histogram
+
+    def test_report_includes_percentiles(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(profiler_module, "log_dir", tmp_path)
+        profiler = UIAProfiler()
+        for ms in (1.0, 2.0, 3.0, 50.0):
+            profiler._record("op", ms)
+
+        assert "p99" in profiler.get_report()
+        path = profiler.save_report(tmp_path / "report.txt")
+        data = json.loads(path.with_suffix(".json").read_text(encoding="utf-8"))
+        assert data["op"]["call_count"] == 4
+        assert set(data["op"]) >= {"avg_time", "p50", "p90", "p99", "p999", "histogram"}
+        assert sum(count for _, count in data["op"]["histogram"]) == 4
+
+    def test_reset(self):
+        profiler = UIAProfiler()
+        profiler._record("op", 1.0)
+        profiler.reset()
+        assert profiler.metrics == {}
@@ -0,0 +1,89 @@
+# SPDX-License-Identifier: MIT
+"""샘플링 프로파일러 단위 테스트."""
+
+import threading
+import time
+
+from kakaotalk_a11y_client.utils.sampling_profiler import SamplingProfiler
+
+
+def _parked_worker(ready: threading.Event, release: threading.Event) -> None:
+    ready.set()
+    release.wait(5.0)
+
+
+def _start_worker(name: str):
+    ready, release = threading.Event(), threading.Event()
+    thread = threading.Thread(target=_parked_worker, args=(ready, release), name=name)
+    thread.start()
+    ready.wait(2.0)
+    return thread, release
+
+
+class TestSamplingProfiler:
+    """SamplingProfiler 테스트."""
+
+    def test_attributes_samples_to_thread_name(self):
+        thread, release = _start_worker("FocusMonitor-Event")
+        sampler = SamplingProfiler()
+        try:
+            for _ in range(3):
+                sampler.sample_once()
+        finally:
+            release.set()
+            thread.join()
+
+        assert sampler.ticks == 3
+        assert sampler.get_stats()["threads"]["FocusMonitor-Event"] == 3
+
+    def test_collapsed_format_root_first(self):
+        thread, release = _start_worker("EventCoalescer-Flush")
+        sampler = SamplingProfiler()
+        try:
+            sampler.sample_once()
+            sampler.sample_once()
+        finally:
+            release.set()
+            thread.join()
+
+        line = next(l for l in sampler.collapsed_lines() if l.startswith("EventCoalescer-Flush;"))
+        stack, count = line.rsplit(" ", 1)
+        frames = stack.split(";")
+        assert count == "2"
+        # 바깥(Thread.run) → 안쪽(_parked_worker → Event.wait) 순서
+        assert frames.index("threading:Thread.run") < frames.index(
+            "test_sampling_profiler:_parked_worker")
+
+    def test_max_depth(self):
+        sampler = SamplingProfiler(max_depth=2)
+        sampler.sample_once()
+        assert all(len(codes) <= 2 for _, codes in sampler._counts)
+
+    def test_skip_own_thread(self):
+        sampler = SamplingProfiler()
+        sampler.sample_once(skip_ident=threading.get_ident())
+        assert threading.current_thread().name not in sampler.get_stats()["threads"]
+
+    def test_start_stop_and_write(self, tmp_path):
+        sampler = SamplingProfiler(rate_hz=200)
+        assert sampler.start() is True
+        assert sampler.start() is False
+        time.sleep(0.1)
+        sampler.stop()
+
+        stats = sampler.get_stats()
+        assert stats["running"] is False
+        assert stats["ticks"] > 0
+        assert "SamplingProfiler" not in stats["threads"]
+        assert 0 <= stats["overhead_pct"] < 100
+
+        path = sampler.write_collapsed(tmp_path / "out.collapsed")
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert lines and all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+    def test_reset(self):
+        sampler = SamplingProfiler()
+        sampler.sample_once()
+        sampler.reset()
+        assert sampler.get_stats()["stacks"] == 0
+        assert sampler.ticks == 0
@@ -0,0 +1,116 @@
+# SPDX-License-Identifier: MIT
+"""말풍선 주변 스캔 영역(ROI) + 영역별 탐지 테스트."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from tests.uia_sim import SimCacheRequest, SimElement, SimRect, UIA_BoundingRectanglePropertyId
+
+from benchmarks.bench_detector import chat_scene, score_detections
+from kakaotalk_a11y_client.config import SCAN_ROI_PAD_X, SCAN_ROI_PAD_Y
+from kakaotalk_a11y_client.detector import detect_emojis, detect_emojis_in_regions, prepare_templates
+from kakaotalk_a11y_client.scan_regions import bubble_regions, clip, element_rect, merge_rects
+
+WINDOW = (100, 100, 900, 1800)
+
+
+def bubble(left, top, right, bottom, name="메시지"):
+    return SimElement(name, "ListItemControl", rect=SimRect(left, top, right, bottom))
+
+
+class TestElementRect:
+    """UIA 요소 → 사각형."""
+
+    def test_cached_rect_without_round_trip(self):
+        request = SimCacheRequest()
+        request.AddProperty(UIA_BoundingRectanglePropertyId)
+        element = bubble(10, 20, 110, 60).with_cache(request)
+        before = element._counter.total
+
+        assert element_rect(element) == (10, 20, 110, 60)
+        assert element._counter.total == before
+
+    def test_live_fallback(self):
+        assert element_rect(bubble(10, 20, 110, 60)) == (10, 20, 110, 60)
+
+    def test_cached_focus_info_raw_element(self):
+        info = SimpleNamespace(name="메시지", raw_element=bubble(1, 2, 30, 40))
+        assert element_rect(info) == (1, 2, 30, 40)
+
+    def test_saved_rect_passthrough(self):
+        assert element_rect((10, 20, 110, 60)) == (10, 20, 110, 60)
+        assert element_rect((10, 20, 10, 60)) is None
+
+    def test_empty_or_missing(self):
+        assert element_rect(None) is None
+        assert element_rect(bubble(0, 0, 0, 0)) is None
+        assert element_rect(object()) is None
+
+
+class TestGeometry:
+    """clip / merge."""
+
+    def test_clip_outside(self):
+        assert clip((0, 0, 50, 50), (100, 100, 200, 200)) is None
+        assert clip((50, 150, 150, 250), (100, 100, 200, 200)) == (100, 150, 150, 200)
+
+    def test_merge_overlapping(self):
+        rects = [(0, 100, 50, 150), (40, 0, 90, 60), (30, 40, 60, 110), (500, 500, 510, 510)]
+        assert merge_rects(rects) == [(0, 0, 90, 150), (500, 500, 510, 510)]
+
+
+class TestBubbleRegions:
+    """포커스/주변 말풍선 ROI."""
+
+    def test_focused_padded_and_clipped(self):
+        rois = bubble_regions(WINDOW, bubble(120, 300, 400, 360))
+        assert rois == [(100, 300 - SCAN_ROI_PAD_Y, 400 + SCAN_ROI_PAD_X, 360 + SCAN_ROI_PAD_Y)]
+
+    def test_padding_follows_dpi_scale(self):
+        rois = bubble_regions(WINDOW, bubble(300, 300, 400, 360), scale=1.5)
+        assert rois == [(300 - SCAN_ROI_PAD_X * 3 // 2, 300 - SCAN_ROI_PAD_Y * 3 // 2,
+                         400 + SCAN_ROI_PAD_X * 3 // 2, 360 + SCAN_ROI_PAD_Y * 3 // 2)]
+
+    def test_outside_window_falls_back(self):
+        assert bubble_regions(WINDOW, bubble(1000, 2000, 1200, 2100)) == []
+        assert bubble_regions(WINDOW, None) == []
+
+    def test_visible_neighbours(self):
+        messages = [bubble(200, 150 + i * 150, 500, 190 + i * 150, f"m{i}") for i in range(10)]
+        rois = bubble_regions(WINDOW, messages[5], messages, max_bubbles=2)
+
+        assert [r[1] + SCAN_ROI_PAD_Y for r in rois] == [750, 900, 1050]
+
+    def test_latest_bubbles_without_focus(self):
+        messages = [bubble(200, 150 + i * 150, 500, 190 + i * 150) for i in range(10)]
+        rois = bubble_regions(WINDOW, None, messages, max_bubbles=2)
+        assert [r[1] + SCAN_ROI_PAD_Y for r in rois] == [1350, 1500]
+
+
+@pytest.fixture(scope="module")
+def scene():
+    try:
+        return chat_scene()
+    except FileNotFoundError:
+        pytest.skip("emoji templates not found")
+
+
+class TestDetectInRegions:
+    """영역별 탐지 = 창 전체 탐지의 ROI 부분."""
+
+    def test_matches_full_window(self, scene):
+        image, templates, truth, bubbles = scene
+        prepared = prepare_templates(templates)
+        height, width = image.shape[:2]
+        focused = [bubble(*b) for b in bubbles]
+        regions = bubble_regions((0, 0, width, height), focused[0], focused, max_bubbles=len(focused))
+        crops = [((x1, y1), image[y1:y2, x1:x2]) for x1, y1, x2, y2 in regions]
+
+        found = detect_emojis_in_regions(crops, prepared)
+
+        assert score_detections(found, truth) == (1.0, 1.0)
+        assert [d["pos"] for d in found] == [d["pos"] for d in detect_emojis(image, prepared)]
+
+    def test_no_regions(self, scene):
+        assert detect_emojis_in_regions([], scene[1]) == []
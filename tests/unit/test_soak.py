@@ -0,0 +1,89 @@
+# SPDX-License-Identifier: MIT
+"""채팅 폭주 부하 생성기 + 예산 판정 테스트."""
+
+import json
+import threading
+
+import pytest
+
+from tests.uia_sim import LoadBudget, LoadProfile, run_soak
+from tests.uia_sim.load import _ThreadStartCounter
+
+pytestmark = pytest.mark.usefixtures("platform_modules")
+
+SHORT = LoadProfile(duration=1.5, rooms=3, messages_per_min=240, burst_every=0.5, burst_size=10,
+                    focus_per_sec=20, menu_every=0.6, menu_hold=0.2, switch_every=0.8,
+                    warmup=0.3, sample_interval=0.1, wrapper_interval=0.1)
+
+
+@pytest.fixture(scope="module")
+def report():
+    return run_soak(SHORT, LoadBudget())
+
+
+class TestSoakRun:
+    """짧은 부하 1회 (모듈 공유)."""
+
+    def test_all_load_kinds_generated(self, report):
+        for kind in ("structure", "bulk", "focus", "selection", "menu_open", "foreground"):
+            assert report.events.get(kind, 0) > 0, kind
+
+    def test_measurements(self, report):
+        assert report.cpu_secs > 0
+        assert len(report.samples) >= 5
+        assert report.thread_starts > 0  # 디바운스 Timer
+        assert report.memory_end_kb > 0
+        assert report.posted_active > 0
+        assert report.latencies_ms
+        assert set(report.queue_peaks) == {"coalescer_pending", "message_monitor_pending_events"}
+
+    def test_report_serializable(self, report):
+        data = json.loads(json.dumps(report.to_dict(), ensure_ascii=False))
+        assert data["passed"] == report.passed
+        assert {c["name"] for c in data["checks"]} == {
+            "cpu_ms_per_event", "thread_growth", "thread_starts_per_sec", "memory_growth_kb",
+            "steady_memory_growth_kb", "wrapper_suspects", "latency_p95_ms", "queue_depth",
+            "announced_ratio",
+        }
+        assert report.format().splitlines()[-1] == ("PASS" if report.passed else "FAIL")
+
+
+class TestSteadyState:
+    """정상 상태 메모리 상한 + 래퍼 보유량."""
+
+    def test_memory_ceiling(self, report):
+        checks = {c.name: c for c in report.checks}
+        assert report.memory_mid_kb > 0
+        assert checks["steady_memory_growth_kb"].passed, report.format()
+
+    def test_wrappers_tracked_without_suspects(self, report):
+        owners = report.wrappers["owners"]
+        assert report.wrappers["samples"] >= 5
+        assert owners["chat_room.messages"]["peak"] > 0
+        assert owners["message_monitor.initial_children"]["peak"] > 0
+        assert report.wrappers["suspects"] == []
+
+
+class TestBudget:
+    """예산 판정."""
+
+    def test_strict_budget_fails(self, report):
+        checks = {c.name: c for c in report.evaluate(LoadBudget(thread_starts_per_sec=0.0))}
+        assert not checks["thread_starts_per_sec"].passed
+
+    def test_disabled_checks_skipped(self, report):
+        budget = LoadBudget(cpu_ms_per_event=None, latency_p95_ms=None, announced_ratio=None)
+        names = {c.name for c in report.evaluate(budget)}
+        assert "cpu_ms_per_event" not in names
+        assert "latency_p95_ms" not in names
+        assert "announced_ratio" not in names
+
+
+def test_thread_start_counter():
+    with _ThreadStartCounter() as counter:
+        timers = [threading.Timer(0, lambda: None) for _ in range(3)]
+        for timer in timers:
+            timer.start()
+        for timer in timers:
+            timer.join()
+    assert counter.count == 3
@@ -0,0 +1,58 @@
+# SPDX-License-Identifier: MIT
+"""발화 텍스트 정규화 단위 테스트."""
+
+import pytest
+
+from kakaotalk_a11y_client.utils.text_normalizer import (
+    normalize_speech_text,
+    clear_normalize_cache,
+    get_normalize_cache_stats,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_normalize_cache()
+    yield
+    clear_normalize_cache()
+
+
+class TestNormalizeSpeechText:
+    """normalize_speech_text 테스트."""
+
+    def test_empty(self):
+        assert normalize_speech_text("") == ""
+
+    def test_plain_text_unchanged(self):
+        assert normalize_speech_text("안녕하세요 반가워요") == "안녕하세요 반가워요"
+
+    def test_strips_bullet_and_nbsp(self):
+        """기존 _speak_item 동작 유지: bullet 제거, NBSP → 공백."""
+        assert normalize_speech_text("\u2022 테스트\u00a0메시지") == "테스트 메시지"
+
+    def test_strips_zero_width_and_variation_selector(self):
+        assert normalize_speech_text("좋아요\u2764\ufe0f\u200b") == "좋아요\u2764"
+
+    def test_collapses_whitespace_and_newlines(self):
+        assert normalize_speech_text("  첫 줄\n\n둘째   줄\t끝  ") == "첫 줄 둘째 줄 끝"
+
+    def test_special_spaces_become_single_space(self):
+        assert normalize_speech_text("가\u3000나\u2028다\u202f\u2003라\r\n마") == "가 나 다 라 마"
+
+    def test_expands_kakao_tokens(self):
+        assert normalize_speech_text("(하트)고마워") == "하트 이모티콘 고마워"
+        assert normalize_speech_text("(이모티콘)") == "이모티콘"
+
+    def test_unknown_parentheses_kept(self):
+        assert normalize_speech_text("회의 (월)") == "회의 (월)"
+
+    def test_symbols_only_becomes_empty(self):
+        assert normalize_speech_text("\u2022\u00a0\u200b") == ""
+
+    def test_memo_cache_hit(self):
+        normalize_speech_text("반복 항목")
+        normalize_speech_text("반복 항목")
+
+        stats = get_normalize_cache_stats()
+        assert stats["hit_count"] == 1
+        assert stats["miss_count"] == 1
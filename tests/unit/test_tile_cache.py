@@ -0,0 +1,153 @@
+# SPDX-License-Identifier: MIT
+"""이모지 탐지 타일 캐시: 격자, 해시, 재스캔 적중, 경계 이모지, 통계."""
+
+import threading
+
+import numpy as np
+import pytest
+
+from benchmarks.bench_detector import chat_scene, score_detections
+from kakaotalk_a11y_client.detector import detect_emojis, detect_emojis_in_regions, prepare_templates
+from kakaotalk_a11y_client.tile_cache import TileCache, tile_digest, tile_grid
+
+
+@pytest.fixture(scope="module")
+def scene():
+    try:
+        image, templates, truth, _ = chat_scene()
+    except FileNotFoundError:
+        pytest.skip("emoji templates not found")
+    return image, prepare_templates(templates), truth
+
+
+def scan(cache, image, prepared):
+    with cache.scan() as tile_scan:
+        found = detect_emojis_in_regions([((0, 0), image)], prepared, tile_cache=tile_scan)
+    return found, tile_scan.stats
+
+
+class TestGrid:
+    """타일 격자 / 해시."""
+
+    def test_cores_partition_image(self):
+        covered = np.zeros((300, 500), dtype=int)
+        for x0, y0, x1, y1, cx, cy in tile_grid(300, 500, 128, 10, 30):
+            core = covered[y0 + cy:min(y0 + cy + 128, y1), x0 + cx:min(x0 + cx + 128, x1)]
+            core += 1
+        assert (covered == 1).all()
+
+    def test_window_has_lead_and_overlap(self):
+        tiles = tile_grid(300, 500, 128, 10, 30)
+        assert tiles[1] == (118, 0, 286, 158, 10, 0)
+
+    def test_digest(self):
+        tile = np.zeros((64, 64, 3), dtype=np.uint8)
+        changed = tile.copy()
+        changed[10, 10] = 255
+        assert tile_digest(tile) == tile_digest(tile.copy())
+        assert tile_digest(tile, stride=1) != tile_digest(changed, stride=1)
+
+
+class TestRescan:
+    """캐시 적중 / 부분 변경."""
+
+    def test_same_result_as_untiled(self, scene):
+        image, prepared, truth = scene
+        found, stats = scan(TileCache(), image, prepared)
+
+        assert stats.hits == 0 and stats.misses == stats.tiles > 1
+        assert [(d["id"], d["pos"]) for d in found] == [(d["id"], d["pos"]) for d in detect_emojis(image, prepared)]
+        assert score_detections(found, truth) == (1.0, 1.0)
+
+    def test_rescan_all_hits(self, scene):
+        image, prepared, truth = scene
+        cache = TileCache()
+        first, _ = scan(cache, image, prepared)
+        again, stats = scan(cache, image, prepared)
+
+        assert again == first
+        assert stats.hits == stats.tiles
+        assert stats.match_ms == 0
+        assert stats.saved_ms > 0
+        assert cache.last_scan is stats
+
+    def test_changed_region_rematched(self, scene):
+        image, prepared, truth = scene
+        cache = TileCache()
+        scan(cache, image, prepared)
+        changed = image.copy()
+        changed[10:20, 10:20] = 0  # 왼쪽 위 타일 core 안쪽만
+
+        found, stats = scan(cache, changed, prepared)
+
+        assert stats.misses == 1
+        assert score_detections(found, truth) == (1.0, 1.0)
+
+    def test_other_template_set_not_shared(self, scene):
+        image, prepared, _ = scene
+        cache = TileCache()
+        scan(cache, image, prepared)
+        _, stats = scan(cache, image, prepare_templates({t.emoji_id: (t.name, t.color) for t in prepared}))
+        assert stats.hits == 0
+
+
+class TestBoundary:
+    """타일 경계에 걸친 이모지."""
+
+    def test_emoji_across_tile_border_found_once(self, scene):
+        _, prepared, _ = scene
+        template = prepared.items[0]
+        image = np.full((200, 200, 3), 255, dtype=np.uint8)
+        x, y = 64 - template.width // 2, 64 - template.height // 2
+        image[y:y + template.height, x:x + template.width] = template.color
+
+        found, stats = scan(TileCache(tile_size=64), image, prepared)
+
+        assert stats.tiles == 16
+        assert [(d["id"], d["pos"]) for d in found] == [
+            (template.emoji_id, (x + template.width // 2, y + template.height // 2))]
+
+
+class TestBookkeeping:
+    """LRU 상한 / 통계 / 메트릭."""
+
+    def test_lru_bounded(self, scene):
+        _, prepared, _ = scene
+        cache = TileCache(tile_size=32, max_entries=5)
+        rng = np.random.default_rng(0)
+        scan(cache, rng.integers(0, 256, size=(96, 96, 3), dtype=np.uint8), prepared)
+        assert len(cache) == 5
+
+    def test_overlapping_scans_keep_own_stats(self, scene):
+        image, prepared, _ = scene
+        cache = TileCache()
+        scan(cache, image, prepared)
+        other = np.full_like(image, 255)
+        started = threading.Event()
+        results = {}
+
+        with cache.scan() as first:
+            def newer():
+                started.set()
+                results["newer"] = scan(cache, other, prepared)[1]
+
+            thread = threading.Thread(target=newer)
+            thread.start()
+            started.wait(1.0)
+            detect_emojis_in_regions([((0, 0), image)], prepared, tile_cache=first)
+            thread.join()
+
+        # 새 스캔이 끼어들어도 이전 스캔 적중은 이전 스캔 통계에만
+        assert first.stats.hits == first.stats.tiles > 0
+        assert results["newer"].hits == 0
+        assert cache.totals.tiles == first.stats.tiles * 2 + results["newer"].tiles
+
+    def test_metrics(self, scene):
+        image, prepared, _ = scene
+        cache = TileCache()
+        scan(cache, image, prepared)
+        scan(cache, image, prepared)
+
+        metrics = {m.name: m.samples[0][2] for m in cache.collect_metrics()}
+        assert metrics["emoji_tile_cache_hits"] == metrics["emoji_tile_cache_misses"] > 0
+        assert cache.get_stats()["hit_rate"] == "50.0%"
@@ -221,6 +221,18 @@ class TestUIACache:
         assert count == 1  # key1만 만료
         assert cache.get("key2") == "value2"
 
+    def test_set_new_key_drops_expired(self):
+        """새 키 저장 시 만료 항목 정리 (주기 정리 전에 참조 해제)."""
+        cache = UIACache(default_ttl=0.05)
+        cache.set("old", ["element"])
+        cache.set("keep", "value", ttl=10.0)
+
+        time.sleep(0.1)
+        cache.set("new", "value")
+
+        assert cache.size == 2
+        assert "old" not in cache._cache
+
     def test_size_property(self):
         """size 프로퍼티."""
         cache = UIACache()
@@ -0,0 +1,323 @@
+# SPDX-License-Identifier: MIT
+"""헤드리스 UIA 시뮬레이터 테스트. 실제 모니터 코드를 시뮬레이터 위에서 구동."""
+
+import importlib
+import sys
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from tests.uia_sim import (
+    EventScript,
+    SimCacheRequest,
+    SimCOMError,
+    SimElement,
+    SimKakaoTalk,
+    SimUIAAdapter,
+    TreeScope_Subtree,
+    UIA_NamePropertyId,
+    UIA_RuntimeIdPropertyId,
+    platform_modules,
+)
+
+with platform_modules():
+    from kakaotalk_a11y_client.infrastructure.uia_adapter import UIAAdapter
+    from kakaotalk_a11y_client.utils import uia_focus_handler
+    from kakaotalk_a11y_client.utils.uia_message_monitor import MessageListMonitor
+
+
+@pytest.fixture
+def sim():
+    sim = SimKakaoTalk(friends=5, chats=5)
+    sim.room = sim.open_chat_room("홍길동", messages=10)
+    return sim
+
+
+class TestSimElement:
+    """합성 요소 + 왕복 카운트."""
+
+    def test_live_access_counted(self):
+        element = SimElement("항목", "ListItemControl")
+        _ = element.Name, element.CurrentName, element.ControlTypeName
+        assert element.counter.snapshot() == {"Name": 1, "CurrentName": 1, "ControlTypeName": 1}
+
+    def test_cached_view_no_round_trip(self):
+        root = SimElement("목록", "ListControl")
+        root.append("a", "ListItemControl")
+        request = SimCacheRequest()
+        request.AddProperty(UIA_NamePropertyId)
+        request.TreeScope = TreeScope_Subtree
+
+        cached = root.BuildUpdatedCache(request)
+        before = root.counter.total
+        children = cached.GetCachedChildren()
+
+        assert cached.CachedName == "목록"
+        assert children.GetElement(0).CachedName == "a"
+        assert root.counter.total == before  # 캐시 읽기는 왕복 아님
+        assert root.counter.cached_reads == 3
+        with pytest.raises(SimCOMError):
+            _ = cached.CachedClassName  # 요청 안 한 속성
+
+    def test_removed_element_unavailable(self):
+        root = SimElement("목록", "ListControl")
+        item = root.append("a", "ListItemControl")
+        item.remove()
+        assert root.GetChildren() == []
+        assert not item.Exists()
+        with pytest.raises(SimCOMError):
+            _ = item.Name
+
+    def test_search_counts_tree_walk(self, sim):
+        sim.counter.reset()
+        found = sim.room.window.ListControl(Name="메시지", searchDepth=2)
+        missing = sim.room.window.MenuItemControl(searchDepth=1)
+
+        assert found.is_same(sim.room.message_list)
+        assert not missing.Exists()
+        assert sim.counter.calls["FindControl"] == 2
+        assert sim.counter.calls["TreeWalker"] > 0
+
+    def test_runtime_id(self, sim):
+        item = sim.room.messages[0]
+        assert tuple(item.GetRuntimeId()) == item.runtime_id
+        assert not hasattr(item, "RuntimeId")  # auto.Control과 같음
+        assert sim.room.window.runtime_id == (42, sim.room.hwnd)
+
+
+class TestFakeWindowSystem:
+    """win32gui 대역 + window_finder/menu_handler 실제 코드."""
+
+    def test_window_finder(self, sim):
+        from kakaotalk_a11y_client import window_finder
+
+        sim.open_foreign_window()
+        with sim.installed():
+            assert window_finder.find_chat_window() == sim.room.hwnd
+            assert window_finder.find_main_window() == sim.main.hwnd
+            assert window_finder.is_kakaotalk_chat_window(sim.room.hwnd)
+            assert not window_finder.is_kakaotalk_chat_window(sim.main.hwnd)
+            assert window_finder.is_kakaotalk_hwnd_cached(sim.room.message_list.hwnd)
+        assert sim.counter.calls["win32gui.EnumWindows"] == 2
+
+    def test_enum_windows_stop_raises(self, sim):
+        visited = []
+
+        def callback(hwnd, _):
+            visited.append(hwnd)
+            return False
+
+        with pytest.raises(OSError):
+            sim.windows.EnumWindows(callback, None)
+        assert visited == [sim.room.hwnd]  # 포그라운드가 Z 순서 맨 앞
+
+    def test_menu_window_detected(self, sim):
+        from kakaotalk_a11y_client.utils.menu_handler import get_menu_handler
+
+        sim.open_menu()
+        with sim.installed():
+            assert get_menu_handler().find_menu_window() == sim.menu.hwnd
+
+    def test_installed_restores_globals(self, sim):
+        from kakaotalk_a11y_client import window_finder
+
+        original = window_finder.win32gui
+        with sim.installed():
+            assert window_finder.win32gui is sim.win32gui
+            assert uia_focus_handler._create_uia_client() is sim.uia
+        assert window_finder.win32gui is original
+
+
+class TestFocusMonitorOnSim:
+    """uia_focus_handler.FocusMonitor: COM 핸들러 등록 → 필터 → 콜백."""
+
+    @pytest.fixture
+    def monitor(self, sim, monkeypatch):
+        monkeypatch.setattr(uia_focus_handler, "TIMING_FOCUS_DEBOUNCE_SECS", 0.0)
+        events = []
+        with sim.installed():
+            monitor = uia_focus_handler.FocusMonitor()
+            monitor.start(events.append)
+            assert sim.uia.wait_for_handlers("focus")
+            yield monitor, events
+            monitor.stop()
+
+    def test_list_items_pass(self, sim, monitor):
+        _, events = monitor
+        for item in sim.room.messages[-3:]:
+            sim.focus(item)
+
+        assert [e.control.name for e in events] == [m.name for m in sim.room.messages[-3:]]
+
+    def test_sender_has_cached_properties(self, sim, monitor):
+        _, events = monitor
+        sim.focus(sim.room.messages[-1])
+        assert events[0].control.CachedName == sim.room.messages[-1].name
+        assert events[0].control.GetCachedPropertyValue(UIA_RuntimeIdPropertyId)
+
+    def test_filters(self, sim, monitor):
+        _, events = monitor
+        sim.focus(sim.room.message_list)  # 컨테이너
+        sim.focus(sim.room.messages[0])
+        sim.focus(sim.room.messages[0])  # 같은 RuntimeId
+        notepad = sim.open_foreign_window()
+        sim.activate(notepad)
+        sim.focus(notepad.children[0])  # 외부 앱 (hwnd 필터)
+
+        assert [e.control.name for e in events] == [sim.room.messages[0].name]
+
+    def test_filtered_events_counted_as_dropped(self, sim, monitor, monkeypatch):
+        from kakaotalk_a11y_client.utils.latency_tracer import LatencyTracer
+
+        tracer = LatencyTracer(sample_every=1)
+        monkeypatch.setattr(uia_focus_handler, "latency_tracer", tracer)
+        sim.focus(sim.room.message_list)  # 컨테이너
+        sim.focus(sim.room.messages[0])
+        sim.focus(sim.room.messages[0])  # 같은 RuntimeId
+
+        # 필터로 끝난 2건 + 발화 안 한 통과 1건 (콜백이 speak 안 함)
+        assert tracer.get_stats()["dropped"] == 3
+
+    def test_placeholder_menu_item_ignored(self, sim, monitor):
+        _, events = monitor
+        menu = sim.open_menu(placeholders=True)
+        sim.focus(menu.children[0])
+        sim.render_menu()
+        sim.focus(menu.children[1])
+
+        assert [e.control.name for e in events] == [menu.children[1].name]
+
+    def test_round_trips_per_event(self, sim, monitor):
+        _, events = monitor
+        sim.focus(sim.room.messages[0])
+        before = sim.counter.snapshot()
+        sim.focus(sim.room.messages[1])
+        delta = sim.counter.delta(before)
+
+        assert len(events) == 2
+        assert delta["GetRuntimeId"] == 1
+        assert sum(delta.values()) < 20
+
+
+class TestMessageListMonitorOnSim:
+    """MessageListMonitor: StructureChanged 디바운스 + ElementSelected."""
+
+    @pytest.fixture
+    def monitor(self, sim, monkeypatch):
+        monkeypatch.setattr(MessageListMonitor, "EVENT_DEBOUNCE_INTERVAL", 0.01)
+        messages, selections = [], []
+        flushed = threading.Event()
+
+        def on_message(event):
+            messages.append(event)
+            flushed.set()
+
+        with sim.installed():
+            monitor = MessageListMonitor(sim.room.message_list, speak_callback=lambda text: None,
+                                         on_selection_changed=selections.append)
+            monitor.start(on_message)
+            assert sim.uia.wait_for_handlers("structure")
+            assert sim.uia.wait_for_handlers("automation")
+            yield monitor, messages, selections, flushed
+            monitor.stop()
+
+    def test_new_messages(self, sim, monitor):
+        _, messages, _, flushed = monitor
+        sim.post_messages(sim.room, ["안녕", "반가워"])
+
+        assert flushed.wait(2.0)
+        assert messages[0].new_count == 2
+        assert messages[0].children[-1].name.startswith("홍길동, 반가워")
+
+    def test_structure_outside_list_ignored(self, sim, monitor):
+        delivered = sim.uia.emit_structure_changed(sim.main.children[0])
+        assert delivered == 0
+
+    def test_element_selected(self, sim, monitor):
+        _, _, selections, _ = monitor
+        sim.select(sim.room.messages[3])
+
+        assert selections[0].source == "selection"
+        assert selections[0].control.name == sim.room.messages[3].name
+
+
+class TestFocusMonitorServiceOnSim:
+    """FocusMonitorService + SimUIAAdapter."""
+
+    @pytest.fixture
+    def service(self, sim):
+        spoken = []
+        with sim.installed():
+            from kakaotalk_a11y_client.focus_monitor import FocusMonitorService
+
+            service = FocusMonitorService(
+                mode_manager=MagicMock(in_navigation_mode=True),
+                message_monitor=MagicMock(),
+                chat_navigator=MagicMock(),
+                hotkey_manager=MagicMock(),
+                uia_adapter=sim.adapter,
+                speak_callback=spoken.append,
+            )
+            service._running = True
+            yield service, spoken
+
+    def test_adapter_protocol(self, sim):
+        assert isinstance(SimUIAAdapter(sim), UIAAdapter)
+
+    def test_list_item_and_menu_item_spoken(self, sim, service):
+        service, spoken = service
+        menu = sim.open_menu(["복사", "답장"])
+
+        service._on_focus_event(uia_focus_handler.FocusEvent(sim.room.messages[-1], time.time(), "event"))
+        service._on_focus_event(uia_focus_handler.FocusEvent(menu.children[1], time.time(), "event"))
+
+        assert len(spoken) == 2
+        assert "메시지 10" in spoken[0]
+        assert spoken[1] == "답장"
+
+    def test_speak_last_message_uses_adapter(self, sim, service):
+        service, spoken = service
+        service._message_monitor._list_monitor = None
+        sim.counter.reset()
+        service._speak_last_message(sim.room.message_list)
+
+        assert spoken == [sim.room.messages[-1].name]
+        assert sim.counter.calls["GetChildren"] == 1
+
+
+class TestEventScript:
+    """스크립트 재생."""
+
+    def test_run_in_order(self, sim):
+        order = []
+        script = (EventScript()
+                  .call(order.append, "start")
+                  .post(sim.room, "새 메시지", delay=0.01)
+                  .focus(sim.room.messages[0], delay=0.01)
+                  .call(order.append, "end"))
+
+        assert script.duration == pytest.approx(0.02)
+        assert script.run(sim, speed=None) == 4
+        assert order == ["start", "end"]
+        assert sim.room.messages[-1].name.startswith("홍길동, 새 메시지")
+        assert sim.uia.focused.is_same(sim.room.messages[0])
+
+
+class TestPlatformModules:
+    """Windows 전용 모듈 대역은 블록 동안만 sys.modules에."""
+
+    def test_stand_ins_removed_on_exit(self, monkeypatch):
+        monkeypatch.delitem(sys.modules, "win32con", raising=False)
+        monkeypatch.setattr(importlib, "import_module", _fail_import)
+
+        with platform_modules() as installed:
+            assert "win32con" in installed
+            assert sys.modules["win32con"].__sim__
+
+        assert "win32con" not in sys.modules
+
+
+def _fail_import(name):
+    raise ImportError(name)
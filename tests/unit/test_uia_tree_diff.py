@@ -0,0 +1,148 @@
+# SPDX-License-Identifier: MIT
+"""UIA 트리 비교 단위 테스트."""
+
+import io
+import json
+
+from kakaotalk_a11y_client.utils.uia_tree_diff import (
+    TreeIndex,
+    diff_index,
+    diff_trees,
+    format_tree_diff,
+    iter_keyed_nodes,
+)
+from kakaotalk_a11y_client.utils.uia_tree_dump import stream_tree_dump
+from tests.uia_sim import dump_cache_request
+
+
+def _node(control_type, name="", children=(), runtime_id=None, **extra):
+    node = {"ControlType": control_type, "Name": name, "ClassName": "", "AutomationId": ""}
+    if runtime_id is not None:
+        node["RuntimeId"] = list(runtime_id)
+    node.update(extra)
+    if children:
+        node["Children"] = list(children)
+    return node
+
+
+def _window(*items):
+    return _node("WindowControl", "카카오톡", [_node("ListControl", "채팅", items)])
+
+
+class TestKeys:
+    """노드 키 테스트."""
+
+    def test_path_signature_counts_same_signature_siblings(self):
+        tree = _window(_node("ListItemControl", "a"), _node("ButtonControl", "b"),
+                       _node("ListItemControl", "c"))
+        keys = [key for key, _, _, _ in iter_keyed_nodes(tree)]
+        assert keys[2].endswith("ListItemControl||#0")
+        assert keys[3].endswith("ButtonControl||#0")
+        assert keys[4].endswith("ListItemControl||#1")
+
+    def test_runtime_id_key(self):
+        tree = _node("WindowControl", runtime_id=(42, 1))
+        assert next(iter_keyed_nodes(tree))[0] == "rid:42.1"
+        assert next(iter_keyed_nodes(tree, use_runtime_id=False))[0].startswith("/")
+
+
+class TestDiffTrees:
+    """diff_trees 테스트."""
+
+    def test_identical(self):
+        tree = _window(_node("ListItemControl", "a"), _node("ListItemControl", "b"))
+        diff = diff_trees(tree, json.loads(json.dumps(tree)))
+        assert diff.is_empty
+        assert diff.old_nodes == diff.new_nodes == 4
+
+    def test_changed_name(self):
+        old = _window(_node("ListItemControl", "안 읽은 메시지 1개"))
+        new = _window(_node("ListItemControl", "안 읽은 메시지 2개"))
+        diff = diff_trees(old, new)
+
+        assert len(diff.changed) == 1
+        assert diff.changed[0]["fields"] == {"Name": ["안 읽은 메시지 1개", "안 읽은 메시지 2개"]}
+        assert not (diff.inserted or diff.removed or diff.moved)
+
+    def test_inserted_and_removed_subtrees(self):
+        old = _window(_node("ListItemControl", "a"),
+                      _node("GroupControl", "g", [_node("TextControl", "t")]))
+        new = _window(_node("ListItemControl", "a"), _node("ButtonControl", "새 버튼"))
+        diff = diff_trees(old, new)
+
+        assert [n["Name"] for n in diff.inserted] == ["새 버튼"]
+        assert sorted(n["Name"] for n in diff.removed) == ["g", "t"]
+
+    def test_reorder_detected_as_move(self):
+        items = [_node("ListItemControl", name, runtime_id=(1, i)) for i, name in enumerate("abcd")]
+        old = _window(*items)
+        new = _window(items[3], items[0], items[1], items[2])
+        diff = diff_trees(old, new)
+
+        # d만 앞으로 옮긴 것으로 보고 (LIS로 최소 이동)
+        assert [m["key"] for m in diff.moved] == ["rid:1.3"]
+        assert diff.moved[0]["old_index"] == 3
+        assert diff.moved[0]["new_index"] == 0
+
+    def test_reparent_with_runtime_id(self):
+        child = _node("TextControl", "메시지", runtime_id=(1, 9))
+        old = _node("WindowControl", runtime_id=(1, 0), children=[
+            _node("PaneControl", "p1", [child], runtime_id=(1, 1)),
+            _node("PaneControl", "p2", runtime_id=(1, 2)),
+        ])
+        new = _node("WindowControl", runtime_id=(1, 0), children=[
+            _node("PaneControl", "p1", runtime_id=(1, 1)),
+            _node("PaneControl", "p2", [child], runtime_id=(1, 2)),
+        ])
+        diff = diff_trees(old, new)
+
+        assert diff.moved == [{
+            "key": "rid:1.9", "old_parent": "rid:1.1", "new_parent": "rid:1.2",
+            "old_index": 0, "new_index": 0,
+        }]
+        assert not (diff.inserted or diff.removed)
+
+    def test_jsonl_and_json_files(self, tmp_path, fake_uia_tree):
+        root = fake_uia_tree(breadth=3, depth=3)
+        jsonl_path = tmp_path / "a.jsonl"
+        json_path = tmp_path / "b.json"
+        with open(jsonl_path, "w", encoding="utf-8") as f:
+            stream_tree_dump(root, f, fmt="jsonl", include_coords=True, cache_request=dump_cache_request())
+        with open(json_path, "w", encoding="utf-8") as f:
+            stream_tree_dump(root, f, fmt="json", include_coords=True, cache_request=dump_cache_request())
+
+        diff = diff_trees(jsonl_path, json_path)
+        assert diff.is_empty
+        assert diff.old_nodes == 40
+
+    def test_diff_index_reuses_previous_snapshot(self, fake_uia_tree):
+        root = fake_uia_tree(breadth=2, depth=2)
+        buf = io.StringIO()
+        stream_tree_dump(root, buf, cache_request=dump_cache_request())
+        index = TreeIndex.build(json.loads(buf.getvalue()))
+
+        root.children[0].children[-1].remove()
+        buf = io.StringIO()
+        stream_tree_dump(root, buf, cache_request=dump_cache_request())
+        new_index = TreeIndex.build(json.loads(buf.getvalue()))
+
+        diff = diff_index(index, new_index.nodes())
+        assert len(diff.removed) == 1
+        assert len(new_index) == 6
+
+
+class TestFormatTreeDiff:
+    """format_tree_diff 테스트."""
+
+    def test_no_changes(self):
+        tree = _window()
+        assert "변경 없음" in format_tree_diff(diff_trees(tree, tree))
+
+    def test_inserted_subtree_root_only(self):
+        old = _window()
+        new = _window(_node("GroupControl", "새 그룹", [_node("TextControl", "안쪽")]))
+        report = format_tree_diff(diff_trees(old, new))
+
+        assert "## 삽입 (1)" in report
+        assert "새 그룹" in report
+        assert "안쪽" not in report
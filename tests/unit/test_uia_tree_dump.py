@@ -0,0 +1,172 @@
+# SPDX-License-Identifier: MIT
+"""UIA 트리 스트리밍 덤프 단위 테스트."""
+
+import io
+import json
+
+import pytest
+
+from kakaotalk_a11y_client.utils.uia_tree_dump import (
+    DumpBudget,
+    dump_tree_json,
+    iter_tree_nodes,
+    stream_tree_dump,
+)
+from tests.uia_sim import SimElement, dump_cache_request
+
+SUBTREE_REQUEST = dump_cache_request()
+CHILDREN_REQUEST = dump_cache_request(per_level=True)  # budget 덤프용
+
+
+def _cache_builds(root) -> int:
+    return root.counter.count("BuildUpdatedCache")
+
+
+def _live_calls(root) -> int:
+    """BuildUpdatedCache 외 왕복 (live 속성, GetChildren 등)."""
+    return root.counter.total - _cache_builds(root)
+
+
+def _strip_runtime_id(node):
+    node.pop("RuntimeId", None)
+    for child in node.get("Children", []):
+        _strip_runtime_id(child)
+    return node
+
+
+class TestIterTreeNodes:
+    """iter_tree_nodes 테스트."""
+
+    def test_preorder_with_parent_ids(self, fake_uia_tree):
+        root = fake_uia_tree(breadth=2, depth=2)
+        nodes = list(iter_tree_nodes(root, max_depth=5))
+
+        assert len(nodes) == 7
+        assert [(i, p, d) for i, p, d, _ in nodes] == [
+            (0, -1, 0), (1, 0, 1), (2, 1, 2), (3, 1, 2), (4, 0, 1), (5, 4, 2), (6, 4, 2)
+        ]
+        assert nodes[1][3]["Name"] == "항목 1-0"
+
+    def test_max_depth(self, fake_uia_tree):
+        root = fake_uia_tree(breadth=3, depth=3)
+        assert max(d for _, _, d, _ in iter_tree_nodes(root, max_depth=1)) == 1
+
+    def test_budget_stops_traversal(self, fake_uia_tree):
+        root = fake_uia_tree(breadth=3, depth=3)
+        budget = DumpBudget(max_nodes=5)
+        assert len(list(iter_tree_nodes(root, budget=budget))) == 5
+        assert budget.truncated is True
+
+    def test_cached_traversal_makes_no_live_calls(self, fake_uia_tree):
+        root = fake_uia_tree(breadth=3, depth=3)
+        cached_root = root.BuildUpdatedCache(SUBTREE_REQUEST)
+        nodes = list(iter_tree_nodes(cached_root, include_coords=True, cached=True))
+
+        assert len(nodes) == 40
+        assert _live_calls(root) == 0
+        assert nodes[0][3]["ControlType"] == "WindowControl"
+        assert nodes[0][3]["RuntimeId"] == [42, 7, 1]
+        assert "BoundingRectangle" in nodes[0][3]
+
+    def test_vanished_element_becomes_error_node(self):
+        root = SimElement("창", "WindowControl")
+        root.append("사라짐").node.alive = False
+        root.append("정상", "TextControl")
+
+        props = [p for _, _, _, p in iter_tree_nodes(root)]
+        assert "error" in props[1]
+        assert props[2]["Name"] == "정상"
+
+
+class TestStreamTreeDump:
+    """stream_tree_dump 테스트."""
+
+    def test_json_matches_recursive_dump(self, fake_uia_tree):
+        root = fake_uia_tree(breadth=3, depth=3)
+        expected = dump_tree_json(root, max_depth=2, include_coords=True)
+
+        fp = io.StringIO()
+        stream_tree_dump(root, fp, fmt="json", max_depth=2, include_coords=True,
+                         cache_request=SUBTREE_REQUEST)
+
+        assert _strip_runtime_id(json.loads(fp.getvalue())) == expected
+
+    def test_indented_json_is_valid(self, fake_uia_tree):
+        root = fake_uia_tree(breadth=2, depth=3)
+        fp = io.StringIO()
+        stream_tree_dump(root, fp, fmt="json", indent=2, cache_request=SUBTREE_REQUEST)
+
+        assert _strip_runtime_id(json.loads(fp.getvalue())) == dump_tree_json(root, max_depth=6)
+        # 노드 15개 각각 새 줄 + 끝 줄바꿈
+        assert fp.getvalue().count("\n") == 16
+
+    def test_jsonl_one_line_per_node(self, fake_uia_tree):
+        root = fake_uia_tree(breadth=2, depth=2)
+        fp = io.StringIO()
+        stats = stream_tree_dump(root, fp, fmt="jsonl", cache_request=SUBTREE_REQUEST)
+
+        records = [json.loads(line) for line in fp.getvalue().splitlines()]
+        assert stats["nodes"] == len(records) == 7
+        assert records[0]["parent"] is None
+        assert records[2]["parent"] == records[1]["id"]
+
+    def test_single_cache_build(self, fake_uia_tree):
+        root = fake_uia_tree(breadth=3, depth=3)
+        stats = stream_tree_dump(root, io.StringIO(), cache_request=SUBTREE_REQUEST)
+
+        assert stats["cached"] is True
+        assert _cache_builds(root) == 1
+        assert _live_calls(root) == 0
+
+    def test_live_fallback_without_cache_request(self, fake_uia_tree, monkeypatch):
+        from kakaotalk_a11y_client.utils import uia_tree_dump
+
+        monkeypatch.setattr(uia_tree_dump, "_get_thread_cache_request", lambda _: None)
+        root = fake_uia_tree(breadth=2, depth=2)
+        fp = io.StringIO()
+        stats = stream_tree_dump(root, fp)
+
+        assert stats["cached"] is False
+        assert _live_calls(root) > 0
+        assert json.loads(fp.getvalue()) == dump_tree_json(root, max_depth=6)
+
+    def test_budget_truncated_json_still_valid(self, fake_uia_tree):
+        root = fake_uia_tree(breadth=4, depth=4)
+        fp = io.StringIO()
+        stats = stream_tree_dump(root, fp, budget=DumpBudget(max_nodes=10),
+                                 cache_request=CHILDREN_REQUEST)
+
+        assert stats["nodes"] == 10
+        assert stats["truncated"] is True
+        json.loads(fp.getvalue())
+
+    def test_budget_expands_only_within_limits(self, fake_uia_tree):
+        root = fake_uia_tree(breadth=4, depth=4)  # 341 노드
+        stats = stream_tree_dump(root, io.StringIO(), budget=DumpBudget(max_nodes=10),
+                                 cache_request=CHILDREN_REQUEST)
+
+        assert stats["cached"] is True
+        # 루트 1회 + 상한 전에 펼친 노드만 (하위 트리 전체를 안 가져옴)
+        assert _cache_builds(root) <= 10
+        assert _live_calls(root) == 0
+
+    def test_budget_expands_only_to_max_depth(self, fake_uia_tree):
+        root = fake_uia_tree(breadth=3, depth=4)
+        stats = stream_tree_dump(root, io.StringIO(), max_depth=1,
+                                 budget=DumpBudget(max_nodes=1000), cache_request=CHILDREN_REQUEST)
+
+        assert stats["nodes"] == 4
+        assert stats["truncated"] is False
+        # 루트 캐시 1회 + 루트 펼치기 1회, depth 1 노드는 안 펼침
+        assert _cache_builds(root) == 2
+
+    def test_zero_budget_writes_null(self, fake_uia_tree):
+        budget = DumpBudget(max_nodes=1)
+        budget.take()
+        fp = io.StringIO()
+        stream_tree_dump(fake_uia_tree(1, 1), fp, budget=budget, cache_request=CHILDREN_REQUEST)
+        assert json.loads(fp.getvalue()) is None
+
+    def test_unknown_format(self, fake_uia_tree):
+        with pytest.raises(ValueError):
+            stream_tree_dump(fake_uia_tree(1, 1), io.StringIO(), fmt="xml")
@@ -0,0 +1,167 @@
+# SPDX-License-Identifier: MIT
+"""UIA 래퍼 보유량 추적 (owner별 집계, 누수 의심 판정, tracemalloc 증가) 테스트."""
+
+import gc
+from dataclasses import dataclass
+from operator import attrgetter
+
+from tests.uia_sim import platform_modules
+
+with platform_modules():
+    from kakaotalk_a11y_client.utils.wrapper_tracker import (
+        LIVE_OWNER,
+        WrapperTracker,
+        count_wrappers,
+        is_growing,
+    )
+
+
+class _Wrapper:
+    pass
+
+
+class _Holder:
+    def __init__(self, items=None):
+        self.items = items
+
+
+@dataclass
+class _Event:
+    """eq 데이터클래스 (해시 불가) 등록용."""
+    children: list = None
+
+
+def test_count_wrappers():
+    assert count_wrappers(None) == 0
+    assert count_wrappers(_Wrapper()) == 1
+    assert count_wrappers([_Wrapper(), None, (_Wrapper(), _Wrapper())]) == 3
+    assert count_wrappers({"a": [_Wrapper()], "b": _Wrapper()}) == 2
+
+
+def test_is_growing():
+    assert is_growing([0, 10, 10, 60], 50)
+    assert not is_growing([0, 10, 5, 60], 50)  # 한 번이라도 해제되면 아님
+    assert not is_growing([0, 10, 20], 50)
+    assert not is_growing([100], 50)
+
+
+class TestOwners:
+    """owner 등록 + 샘플."""
+
+    def test_counts_live_instances_only(self):
+        tracker = WrapperTracker()
+        kept = _Holder([_Wrapper(), _Wrapper()])
+        dropped = _Holder([_Wrapper()])
+        tracker.register("holder.items", kept, attrgetter("items"))
+        tracker.register("holder.items", dropped, attrgetter("items"))
+        tracker.register("event.children", _Event([_Wrapper()]), attrgetter("children"))
+
+        del dropped
+        gc.collect()
+        sample = tracker.sample()
+
+        assert sample.owners == {"holder.items": 2, "event.children": 0}
+        assert sample.instances == {"holder.items": 1, "event.children": 0}
+
+    def test_probe_error_ignored(self):
+        tracker = WrapperTracker()
+        holder = _Holder()
+        tracker.register("broken", holder, attrgetter("missing"))
+        assert tracker.sample().owners == {"broken": 0}
+
+    def test_census(self):
+        tracker = WrapperTracker()
+        wrappers = [_Wrapper() for _ in range(5)]
+        tracker.start(census=True, wrapper_types=(_Wrapper,), trace_memory=False, thread=False)
+        try:
+            sample = tracker.sample()
+        finally:
+            tracker.stop()
+        assert sample.live_wrappers >= len(wrappers)
+
+
+class TestLeakDetection:
+    """계속 늘기만 하는 owner 판정."""
+
+    def test_growing_owner_flagged(self):
+        tracker = WrapperTracker(window=4, min_growth=10)
+        leaky, steady = _Holder([]), _Holder([])
+        tracker.register("leaky", leaky, attrgetter("items"))
+        tracker.register("steady", steady, attrgetter("items"))
+
+        for i in range(6):
+            leaky.items.extend(_Wrapper() for _ in range(5))
+            steady.items = [_Wrapper() for _ in range(20 if i % 2 else 5)]
+            tracker.sample()
+
+        assert tracker.suspects == {"leaky"}
+        report = tracker.report()
+        assert report["owners"]["leaky"]["suspect"]
+        assert report["owners"]["leaky"]["peak"] == 30
+        assert report["owners"]["steady"]["peak"] == 20
+
+    def test_per_instance(self):
+        tracker = WrapperTracker(window=3, min_growth=5)
+        holders = []
+        for _ in range(4):
+            holders.append(_Holder([_Wrapper() for _ in range(5)]))  # 인스턴스만 늘어남
+            tracker.register("holder.items", holders[-1], attrgetter("items"))
+            tracker.sample()
+        assert tracker.suspects == set()
+
+    def test_growth_within_baseline_ignored(self):
+        tracker = WrapperTracker()
+        holder = _Holder([])
+        live = []
+        tracker.register("room.messages", holder, attrgetter("items"))
+        tracker.start(census=False, trace_memory=False, thread=False, window=3, min_growth=5,
+                      baseline=lambda: len(live))
+        try:
+            for _ in range(4):
+                live.extend(_Wrapper() for _ in range(10))  # 방에 메시지가 계속 들어옴
+                holder.items = list(live)
+                tracker.sample()
+            assert tracker.suspects == set()
+            for _ in range(3):
+                holder.items.extend(_Wrapper() for _ in range(10))  # 목록에 없는 래퍼를 계속 보유
+                tracker.sample()
+            assert tracker.suspects == {"room.messages"}
+        finally:
+            tracker.stop()
+        assert (tracker.window, tracker.min_growth) == (WrapperTracker().window, WrapperTracker().min_growth)
+
+    def test_metrics(self):
+        tracker = WrapperTracker(window=2, min_growth=1)
+        holder = _Holder([])
+        tracker.register("leaky", holder, attrgetter("items"))
+        tracker.start(census=True, wrapper_types=(_Wrapper,), trace_memory=False, thread=False)
+        try:
+            for _ in range(3):
+                holder.items.append(_Wrapper())
+                tracker.sample()
+            families = {f.name: f for f in tracker.collect_metrics()}
+        finally:
+            tracker.stop()
+
+        retained = {labels["owner"]: value for _, labels, value in families["wrapper_retained"].samples}
+        assert retained["leaky"] == 3
+        assert LIVE_OWNER in retained
+        suspect = {labels["owner"]: value for _, labels, value in families["wrapper_leak_suspect"].samples}
+        assert suspect["leaky"] is True
+
+
+def test_tracemalloc_growth():
+    tracker = WrapperTracker(top=5)
+    tracker.start(census=False, trace_memory=True, thread=False)
+    retained = []
+    try:
+        tracker.sample()
+        retained.append([bytearray(1024) for _ in range(200)])  # 약 200KB
+        tracker.sample()
+        report = tracker.report()
+    finally:
+        tracker.stop()
+
+    assert report["traced_kb"] > 0
+    assert report["top_growth"]
+    assert any("test_wrapper_tracker" in g["location"] for g in report["top_growth"])